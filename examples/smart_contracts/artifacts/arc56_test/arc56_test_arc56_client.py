@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: 4a29ce233d4d7ae2cd860a48ea6564014705ee3ef6f490eb507fd06a7d9bb7a0
 
 # common
 import dataclasses
@@ -20,20 +21,48 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [4, 56], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "((uint64,uint64),(uint64,uint64))", "name": "inputs", "struct": "Inputs"}], "name": "foo", "returns": {"type": "(uint64,uint64)", "struct": "Outputs"}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "optInToApplication", "returns": {"type": "void"}}, {"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "createApplication", "returns": {"type": "void"}}], "name": "ARC56Test", "state": {"keys": {"box": {"boxKey": {"key": "Ym94S2V5", "keyType": "AVMBytes", "valueType": "string"}}, "global": {"globalKey": {"key": "Z2xvYmFsS2V5", "keyType": "AVMBytes", "valueType": "uint64"}}, "local": {"localKey": {"key": "bG9jYWxLZXk=", "keyType": "AVMBytes", "valueType": "uint64"}}}, "maps": {"box": {"boxMap": {"keyType": "Inputs", "valueType": "Outputs", "prefix": "cA=="}}, "global": {"globalMap": {"keyType": "string", "valueType": "{ foo: uint16; bar: uint16 }", "prefix": "cA=="}}, "local": {"localMap": {"keyType": "AVMBytes", "valueType": "string", "prefix": "cA=="}}}, "schema": {"global": {"bytes": 37, "ints": 1}, "local": {"bytes": 13, "ints": 1}}}, "structs": {"{ foo: uint16; bar: uint16 }": [{"name": "foo", "type": "uint16"}, {"name": "bar", "type": "uint16"}], "Outputs": [{"name": "sum", "type": "uint64"}, {"name": "difference", "type": "uint64"}], "Inputs": [{"name": "add", "type": [{"name": "a", "type": "uint64"}, {"name": "b", "type": "uint64"}]}, {"name": "subtract", "type": [{"name": "a", "type": "uint64"}, {"name": "b", "type": "uint64"}]}]}, "compilerInfo": {"compiler": "algod", "compilerVersion": {"commitHash": "0d10b244", "major": 3, "minor": 26, "patch": 0}}, "desc": "", "scratchVariables": {"someNumber": {"slot": 200, "type": "uint64"}}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCmludGNibG9jayAxIFRNUExfc29tZU51bWJlcgpieXRlY2Jsb2NrIDB4NjI2Zjc4NGI2NTc5CgovLyBUaGlzIFRFQUwgd2FzIGdlbmVyYXRlZCBieSBURUFMU2NyaXB0IHYwLjEwNS4zCi8vIGh0dHBzOi8vZ2l0aHViLmNvbS9hbGdvcmFuZGZvdW5kYXRpb24vVEVBTFNjcmlwdAoKLy8gVGhpcyBjb250cmFjdCBpcyBjb21wbGlhbnQgd2l0aCBhbmQvb3IgaW1wbGVtZW50cyB0aGUgZm9sbG93aW5nIEFSQ3M6IFsgQVJDNCBdCgovLyBUaGUgZm9sbG93aW5nIHRlbiBsaW5lcyBvZiBURUFMIGhhbmRsZSBpbml0aWFsIHByb2dyYW0gZmxvdwovLyBUaGlzIHBhdHRlcm4gaXMgdXNlZCB0byBtYWtlIGl0IGVhc3kgZm9yIGFueW9uZSB0byBwYXJzZSB0aGUgc3RhcnQgb2YgdGhlIHByb2dyYW0gYW5kIGRldGVybWluZSBpZiBhIHNwZWNpZmljIGFjdGlvbiBpcyBhbGxvd2VkCi8vIEhlcmUsIGFjdGlvbiByZWZlcnMgdG8gdGhlIE9uQ29tcGxldGUgaW4gY29tYmluYXRpb24gd2l0aCB3aGV0aGVyIHRoZSBhcHAgaXMgYmVpbmcgY3JlYXRlZCBvciBjYWxsZWQKLy8gRXZlcnkgcG9zc2libGUgYWN0aW9uIGZvciB0aGlzIGNvbnRyYWN0IGlzIHJlcHJlc2VudGVkIGluIHRoZSBzd2l0Y2ggc3RhdGVtZW50Ci8vIElmIHRoZSBhY3Rpb24gaXMgbm90IGltcGxlbWVudGVkIGluIHRoZSBjb250cmFjdCwgaXRzIHJlc3BlY3RpdmUgYnJhbmNoIHdpbGwgYmUgIipOT1RfSU1QTEVNRU5URUQiIHdoaWNoIGp1c3QgY29udGFpbnMgImVyciIKdHhuIEFwcGxpY2F0aW9uSUQKIQpwdXNoaW50IDYKKgp0eG4gT25Db21wbGV0aW9uCisKc3dpdGNoICpjYWxsX05vT3AgKmNhbGxfT3B0SW4gKk5PVF9JTVBMRU1FTlRFRCAqTk9UX0lNUExFTUVOVEVEICpOT1RfSU1QTEVNRU5URUQgKk5PVF9JTVBMRU1FTlRFRCAqY3JlYXRlX05vT3AgKk5PVF9JTVBMRU1FTlRFRCAqTk9UX0lNUExFTUVOVEVEICpOT1RfSU1QTEVNRU5URUQgKk5PVF9JTVBMRU1FTlRFRCAqTk9UX0lNUExFTUVOVEVECgoqTk9UX0lNUExFTUVOVEVEOgoJLy8gVGhlIHJlcXVlc3RlZCBhY3Rpb24gaXMgbm90IGltcGxlbWVudGVkIGluIHRoaXMgY29udHJhY3QuIEFyZSB5b3UgdXNpbmcgdGhlIGNvcnJlY3QgT25Db21wbGV0ZT8gRGlkIHlvdSBzZXQgeW91ciBhcHAgSUQ/CgllcnIKCi8vIGZvbygoKHVpbnQ2NCx1aW50NjQpLCh1aW50NjQsdWludDY0KSkpKHVpbnQ2NCx1aW50NjQpCiphYmlfcm91dGVfZm9vOgoJLy8gVGhlIEFCSSByZXR1cm4gcHJlZml4CglwdXNoYnl0ZXMgMHgxNTFmN2M3NQoKCS8vIGlucHV0czogKCh1aW50NjQsdWludDY0KSwodWludDY0LHVpbnQ2NCkpCgl0eG5hIEFwcGxpY2F0aW9uQXJncyAxCglkdXAKCWxlbgoJcHVzaGludCAzMgoJPT0KCgkvLyBhcmd1bWVudCAwIChpbnB1dHMpIGZvciBmb28gbXVzdCBiZSBhICgodWludDY0LHVpbnQ2NCksKHVpbnQ2NCx1aW50NjQpKQoJYXNzZXJ0CgoJLy8gZXhlY3V0ZSBmb28oKCh1aW50NjQsdWludDY0KSwodWludDY0LHVpbnQ2NCkpKSh1aW50NjQsdWludDY0KQoJY2FsbHN1YiBmb28KCWNvbmNhdAoJbG9nCglpbnRjIDAgLy8gMQoJcmV0dXJuCgovLyBmb28oaW5wdXRzOiBJbnB1dHMpOiBPdXRwdXRzCmZvbzoKCXByb3RvIDEgMQoKCS8vICppZjBfY29uZGl0aW9uCgkvLyBleGFtcGxlcy9hcmM1Nl90ZXN0L2FyYzU2X3Rlc3QuYWxnby50czozMAoJLy8gaW5wdXRzLnN1YnRyYWN0LmEgPCBpbnB1dHMuc3VidHJhY3QuYgoJZnJhbWVfZGlnIC0xIC8vIGlucHV0czogSW5wdXRzCglleHRyYWN0IDE2IDgKCWJ0b2kKCWZyYW1lX2RpZyAtMSAvLyBpbnB1dHM6IElucHV0cwoJZXh0cmFjdCAyNCA4CglidG9pCgk8CglieiAqaWYwX2VuZAoKCS8vICppZjBfY29uc2VxdWVudAoJLy8gc3VidHJhY3QuYSBtdXN0IGJlIGdyZWF0ZXIgdGhhbiBzdWJ0cmFjdC5iCgllcnIKCippZjBfZW5kOgoJLy8gZXhhbXBsZXMvYXJjNTZfdGVzdC9hcmM1Nl90ZXN0LmFsZ28udHM6MzIKCS8vIHRoaXMuZ2xvYmFsS2V5LnZhbHVlID0gdGhpcy5zb21lTnVtYmVyCglwdXNoYnl0ZXMgMHg2NzZjNmY2MjYxNmM0YjY1NzkgLy8gImdsb2JhbEtleSIKCWludGMgMSAvLyBUTVBMX3NvbWVOdW1iZXIKCWFwcF9nbG9iYWxfcHV0CgoJLy8gZXhhbXBsZXMvYXJjNTZfdGVzdC9hcmM1Nl90ZXN0LmFsZ28udHM6MzMKCS8vIHRoaXMuZ2xvYmFsTWFwKCdmb28nKS52YWx1ZSA9IHsgZm9vOiAxMywgYmFyOiAzNyB9CglwdXNoYnl0ZXMgMHg3MDAwMDM2NjZmNmYKCXB1c2hieXRlcyAweDAwMGQwMDI1CglhcHBfZ2xvYmFsX3B1dAoKCS8vIGV4YW1wbGVzL2FyYzU2X3Rlc3QvYXJjNTZfdGVzdC5hbGdvLnRzOjM1CgkvLyByZXR1cm4gewoJLy8gICAgICAgc3VtOiBpbnB1dHMuYWRkLmEgKyBpbnB1dHMuYWRkLmIsCgkvLyAgICAgICBkaWZmZXJlbmNlOiBpbnB1dHMuc3VidHJhY3QuYSAtIGlucHV0cy5zdWJ0cmFjdC5iLAoJLy8gICAgIH0KCWZyYW1lX2RpZyAtMSAvLyBpbnB1dHM6IElucHV0cwoJZXh0cmFjdCAwIDgKCWJ0b2kKCWZyYW1lX2RpZyAtMSAvLyBpbnB1dHM6IElucHV0cwoJZXh0cmFjdCA4IDgKCWJ0b2kKCSsKCWl0b2IKCWZyYW1lX2RpZyAtMSAvLyBpbnB1dHM6IElucHV0cwoJZXh0cmFjdCAxNiA4CglidG9pCglmcmFtZV9kaWcgLTEgLy8gaW5wdXRzOiBJbnB1dHMKCWV4dHJhY3QgMjQgOAoJYnRvaQoJLQoJaXRvYgoJY29uY2F0CglyZXRzdWIKCi8vIG9wdEluVG9BcHBsaWNhdGlvbigpdm9pZAoqYWJpX3JvdXRlX29wdEluVG9BcHBsaWNhdGlvbjoKCS8vIGV4ZWN1dGUgb3B0SW5Ub0FwcGxpY2F0aW9uKCl2b2lkCgljYWxsc3ViIG9wdEluVG9BcHBsaWNhdGlvbgoJaW50YyAwIC8vIDEKCXJldHVybgoKLy8gb3B0SW5Ub0FwcGxpY2F0aW9uKCk6IHZvaWQKb3B0SW5Ub0FwcGxpY2F0aW9uOgoJcHJvdG8gMCAwCgoJLy8gZXhhbXBsZXMvYXJjNTZfdGVzdC9hcmM1Nl90ZXN0LmFsZ28udHM6NDIKCS8vIHRoaXMubG9jYWxLZXkodGhpcy50eG4uc2VuZGVyKS52YWx1ZSA9IHRoaXMuc29tZU51bWJlcgoJdHhuIFNlbmRlcgoJcHVzaGJ5dGVzIDB4NmM2ZjYzNjE2YzRiNjU3OSAvLyAibG9jYWxLZXkiCglpbnRjIDEgLy8gVE1QTF9zb21lTnVtYmVyCglhcHBfbG9jYWxfcHV0CgoJLy8gZXhhbXBsZXMvYXJjNTZfdGVzdC9hcmM1Nl90ZXN0LmFsZ28udHM6NDMKCS8vIHRoaXMubG9jYWxNYXAodGhpcy50eG4uc2VuZGVyLCAnZm9vJykudmFsdWUgPSAnYmFyJwoJdHhuIFNlbmRlcgoJcHVzaGJ5dGVzIDB4NzA2NjZmNmYKCXB1c2hieXRlcyAweDAwMDM2MjYxNzIKCWFwcF9sb2NhbF9wdXQKCgkvLyBleGFtcGxlcy9hcmM1Nl90ZXN0L2FyYzU2X3Rlc3QuYWxnby50czo0NAoJLy8gdGhpcy5ib3hLZXkudmFsdWUgPSAnYmF6JwoJYnl0ZWMgMCAvLyAgImJveEtleSIKCWR1cAoJYm94X2RlbAoJcG9wCglwdXNoYnl0ZXMgMHgwMDAzNjI2MTdhCglib3hfcHV0CgoJLy8gZXhhbXBsZXMvYXJjNTZfdGVzdC9hcmM1Nl90ZXN0LmFsZ28udHM6NDUKCS8vIHRoaXMuYm94TWFwKHsgYWRkOiB7IGE6IDEsIGI6IDIgfSwgc3VidHJhY3Q6IHsgYTogNCwgYjogMyB9IH0pLnZhbHVlID0gewoJLy8gICAgICAgc3VtOiAzLAoJLy8gICAgICAgZGlmZmVyZW5jZTogMSwKCS8vICAgICB9CglwdXNoYnl0ZXMgMHg3MDAwMDAwMDAwMDAwMDAwMDEwMDAwMDAwMDAwMDAwMDAyMDAwMDAwMDAwMDAwMDAwNDAwMDAwMDAwMDAwMDAwMDMKCXB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDMwMDAwMDAwMDAwMDAwMDAxCglib3hfcHV0CglyZXRzdWIKCiphYmlfcm91dGVfY3JlYXRlQXBwbGljYXRpb246CglpbnRjIDAgLy8gMQoJcmV0dXJuCgoqY3JlYXRlX05vT3A6CglwdXNoYnl0ZXMgMHhiODQ0N2IzNiAvLyBtZXRob2QgImNyZWF0ZUFwcGxpY2F0aW9uKCl2b2lkIgoJdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAoJbWF0Y2ggKmFiaV9yb3V0ZV9jcmVhdGVBcHBsaWNhdGlvbgoKCS8vIHRoaXMgY29udHJhY3QgZG9lcyBub3QgaW1wbGVtZW50IHRoZSBnaXZlbiBBQkkgbWV0aG9kIGZvciBjcmVhdGUgTm9PcAoJZXJyCgoqY2FsbF9Ob09wOgoJcHVzaGJ5dGVzIDB4Mzk2ZDU1MGUgLy8gbWV0aG9kICJmb28oKCh1aW50NjQsdWludDY0KSwodWludDY0LHVpbnQ2NCkpKSh1aW50NjQsdWludDY0KSIKCXR4bmEgQXBwbGljYXRpb25BcmdzIDAKCW1hdGNoICphYmlfcm91dGVfZm9vCgoJLy8gdGhpcyBjb250cmFjdCBkb2VzIG5vdCBpbXBsZW1lbnQgdGhlIGdpdmVuIEFCSSBtZXRob2QgZm9yIGNhbGwgTm9PcAoJZXJyCgoqY2FsbF9PcHRJbjoKCXB1c2hieXRlcyAweDAxYTNhM2ZmIC8vIG1ldGhvZCAib3B0SW5Ub0FwcGxpY2F0aW9uKCl2b2lkIgoJdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAoJbWF0Y2ggKmFiaV9yb3V0ZV9vcHRJblRvQXBwbGljYXRpb24KCgkvLyB0aGlzIGNvbnRyYWN0IGRvZXMgbm90IGltcGxlbWVudCB0aGUgZ2l2ZW4gQUJJIG1ldGhvZCBmb3IgY2FsbCBPcHRJbgoJZXJy", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEw"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1, 2], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 15}, {"pc": [3], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 16}, {"pc": [4, 5], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 17}, {"pc": [6], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 18}, {"pc": [7, 8], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 19}, {"pc": [9], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 20}, {"pc": [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 21}, {"pc": [36], "errorMessage": "The requested action is not implemented in this contract. Are you using the correct OnComplete? Did you set your app ID?", "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 25}, {"pc": [37, 38, 39, 40, 41, 42], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 30}, {"pc": [43, 44, 45], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 33}, {"pc": [46], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 34}, {"pc": [47], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 35}, {"pc": [48, 49], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 36}, {"pc": [50], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 37}, {"pc": [51], "errorMessage": "argument 0 (inputs) for foo must be a ((uint64,uint64),(uint64,uint64))", "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 40}, {"pc": [52, 53, 54], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 43}, {"pc": [55], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 44}, {"pc": [56], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 45}, {"pc": [57], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 46}, {"pc": [58], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 47}, {"pc": [59, 60, 61], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 51}, {"pc": [62, 63], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 56}, {"pc": [64, 65, 66], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 57}, {"pc": [67], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 58}, {"pc": [68, 69], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 59}, {"pc": [70, 71, 72], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 60}, {"pc": [73], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 61}, {"pc": [74], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 62}, {"pc": [75, 76, 77], "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 63}, {"pc": [78], "errorMessage": "subtract.a must be greater than subtract.b", "source": "examples/arc56_test/arc56_test.algo.ts:30", "teal": 67}, {"pc": [79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89], "source": "examples/arc56_test/arc56_test.algo.ts:32", "teal": 72}, {"pc": [90], "source": "examples/arc56_test/arc56_test.algo.ts:32", "teal": 73}, {"pc": [91], "source": "examples/arc56_test/arc56_test.algo.ts:32", "teal": 74}, {"pc": [92, 93, 94, 95, 96, 97, 98, 99], "source": "examples/arc56_test/arc56_test.algo.ts:33", "teal": 78}, {"pc": [100, 101, 102, 103, 104, 105], "source": "examples/arc56_test/arc56_test.algo.ts:33", "teal": 79}, {"pc": [106], "source": "examples/arc56_test/arc56_test.algo.ts:33", "teal": 80}, {"pc": [107, 108], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 87}, {"pc": [109, 110, 111], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 88}, {"pc": [112], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 89}, {"pc": [113, 114], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 90}, {"pc": [115, 116, 117], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 91}, {"pc": [118], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 92}, {"pc": [119], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 93}, {"pc": [120], "source": "examples/arc56_test/arc56_test.algo.ts:36", "teal": 94}, {"pc": [121, 122], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 95}, {"pc": [123, 124, 125], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 96}, {"pc": [126], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 97}, {"pc": [127, 128], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 98}, {"pc": [129, 130, 131], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 99}, {"pc": [132], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 100}, {"pc": [133], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 101}, {"pc": [134], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 102}, {"pc": [135], "source": "examples/arc56_test/arc56_test.algo.ts:37", "teal": 103}, {"pc": [136], "source": "examples/arc56_test/arc56_test.algo.ts:29", "teal": 104}, {"pc": [137, 138, 139], "source": "examples/arc56_test/arc56_test.algo.ts:41", "teal": 109}, {"pc": [140], "source": "examples/arc56_test/arc56_test.algo.ts:41", "teal": 110}, {"pc": [141], "source": "examples/arc56_test/arc56_test.algo.ts:41", "teal": 111}, {"pc": [142, 143, 144], "source": "examples/arc56_test/arc56_test.algo.ts:41", "teal": 115}, {"pc": [145, 146], "source": "examples/arc56_test/arc56_test.algo.ts:42", "teal": 119}, {"pc": [147, 148, 149, 150, 151, 152, 153, 154, 155, 156], "source": "examples/arc56_test/arc56_test.algo.ts:42", "teal": 120}, {"pc": [157], "source": "examples/arc56_test/arc56_test.algo.ts:42", "teal": 121}, {"pc": [158], "source": "examples/arc56_test/arc56_test.algo.ts:42", "teal": 122}, {"pc": [159, 160], "source": "examples/arc56_test/arc56_test.algo.ts:43", "teal": 126}, {"pc": [161, 162, 163, 164, 165, 166], "source": "examples/arc56_test/arc56_test.algo.ts:43", "teal": 127}, {"pc": [167, 168, 169, 170, 171, 172, 173], "source": "examples/arc56_test/arc56_test.algo.ts:43", "teal": 128}, {"pc": [174], "source": "examples/arc56_test/arc56_test.algo.ts:43", "teal": 129}, {"pc": [175], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 133}, {"pc": [176], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 134}, {"pc": [177], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 135}, {"pc": [178], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 136}, {"pc": [179, 180, 181, 182, 183, 184, 185], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 137}, {"pc": [186], "source": "examples/arc56_test/arc56_test.algo.ts:44", "teal": 138}, {"pc": [187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221], "source": "examples/arc56_test/arc56_test.algo.ts:45", "teal": 145}, {"pc": [222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239], "source": "examples/arc56_test/arc56_test.algo.ts:47", "teal": 146}, {"pc": [240], "source": "examples/arc56_test/arc56_test.algo.ts:45", "teal": 147}, {"pc": [241], "source": "examples/arc56_test/arc56_test.algo.ts:41", "teal": 148}, {"pc": [242], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 151}, {"pc": [243], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 152}, {"pc": [244, 245, 246, 247, 248, 249], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 155}, {"pc": [250, 251, 252], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 156}, {"pc": [253, 254, 255, 256], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 157}, {"pc": [257], "errorMessage": "this contract does not implement the given ABI method for create NoOp", "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 160}, {"pc": [258, 259, 260, 261, 262, 263], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 163}, {"pc": [264, 265, 266], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 164}, {"pc": [267, 268, 269, 270], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 165}, {"pc": [271], "errorMessage": "this contract does not implement the given ABI method for call NoOp", "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 168}, {"pc": [272, 273, 274, 275, 276, 277], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 171}, {"pc": [278, 279, 280], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 172}, {"pc": [281, 282, 283, 284], "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 173}, {"pc": [285], "errorMessage": "this contract does not implement the given ABI method for call OptIn", "source": "examples/arc56_test/arc56_test.algo.ts:11", "teal": 176}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"someNumber": {"type": "uint64"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)": 0,
+    "foo": 0,
+    "optInToApplication()void": 1,
+    "optInToApplication": 1,
+    "createApplication()void": 2,
+    "createApplication": 2,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,59 +72,281 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
 
-@dataclasses.dataclass(frozen=True)
+class _ReadCaches:
+    """The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them"""
+
+    __slots__ = ("state_cache",)
+
+    def __init__(self) -> None:
+        self.state_cache: "_StateCache | None" = None
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        """Evict the enabled caches once transactions with these confirmations are confirmed"""
+        confirmations = list(confirmations)
+        if self.state_cache is not None:
+            self.state_cache.invalidate(confirmations)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class InputsAdd:
     """Struct for InputsAdd"""
     a: int
     b: int
 
-@dataclasses.dataclass(frozen=True)
+
+def _inputs_add_to_tuple(value: object) -> object:
+    """Convert a InputsAdd into the tuple expected by the ABI encoder"""
+    if isinstance(value, InputsAdd):
+        return (value.a, value.b)
+    return _convert_dataclass(value)
+
+
+def _inputs_add_from_dict(data: dict) -> InputsAdd:
+    """Construct a InputsAdd from the dict the app client decodes it into"""
+    return InputsAdd(
+        a=data["a"],
+        b=data["b"],
+    )
+
+
+def _inputs_add_from_tuple(value: tuple | list) -> InputsAdd:
+    """Construct a InputsAdd from the tuple decoded by the ABI decoder"""
+    return InputsAdd(
+        a=value[0],
+        b=value[1],
+    )
+
+
+def _inputs_add_to_bytes(value: InputsAdd) -> bytes:
+    """Encode a InputsAdd into its ABI encoding"""
+    return b"".join((
+        value.a.to_bytes(8, "big"),
+        value.b.to_bytes(8, "big"),
+    ))
+
+
+def _inputs_add_from_bytes(data: bytes) -> InputsAdd:
+    """Construct a InputsAdd from its ABI encoding"""
+    if len(data) != 16:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of InputsAdd")
+    return InputsAdd(
+        a=int.from_bytes(data[0:8], "big"),
+        b=int.from_bytes(data[8:16], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class InputsSubtract:
     """Struct for InputsSubtract"""
     a: int
     b: int
 
-@dataclasses.dataclass(frozen=True)
+
+def _inputs_subtract_to_tuple(value: object) -> object:
+    """Convert a InputsSubtract into the tuple expected by the ABI encoder"""
+    if isinstance(value, InputsSubtract):
+        return (value.a, value.b)
+    return _convert_dataclass(value)
+
+
+def _inputs_subtract_from_dict(data: dict) -> InputsSubtract:
+    """Construct a InputsSubtract from the dict the app client decodes it into"""
+    return InputsSubtract(
+        a=data["a"],
+        b=data["b"],
+    )
+
+
+def _inputs_subtract_from_tuple(value: tuple | list) -> InputsSubtract:
+    """Construct a InputsSubtract from the tuple decoded by the ABI decoder"""
+    return InputsSubtract(
+        a=value[0],
+        b=value[1],
+    )
+
+
+def _inputs_subtract_to_bytes(value: InputsSubtract) -> bytes:
+    """Encode a InputsSubtract into its ABI encoding"""
+    return b"".join((
+        value.a.to_bytes(8, "big"),
+        value.b.to_bytes(8, "big"),
+    ))
+
+
+def _inputs_subtract_from_bytes(data: bytes) -> InputsSubtract:
+    """Construct a InputsSubtract from its ABI encoding"""
+    if len(data) != 16:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of InputsSubtract")
+    return InputsSubtract(
+        a=int.from_bytes(data[0:8], "big"),
+        b=int.from_bytes(data[8:16], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Inputs:
     """Struct for Inputs"""
     add: InputsAdd
     subtract: InputsSubtract
 
-@dataclasses.dataclass(frozen=True)
+
+def _inputs_to_tuple(value: object) -> object:
+    """Convert a Inputs into the tuple expected by the ABI encoder"""
+    if isinstance(value, Inputs):
+        return (_inputs_add_to_tuple(value.add), _inputs_subtract_to_tuple(value.subtract))
+    return _convert_dataclass(value)
+
+
+def _inputs_from_dict(data: dict) -> Inputs:
+    """Construct a Inputs from the dict the app client decodes it into"""
+    return Inputs(
+        add=_inputs_add_from_dict(_add) if isinstance(_add := data["add"], dict) else _add,
+        subtract=_inputs_subtract_from_dict(_subtract) if isinstance(_subtract := data["subtract"], dict) else _subtract,
+    )
+
+
+def _inputs_from_tuple(value: tuple | list) -> Inputs:
+    """Construct a Inputs from the tuple decoded by the ABI decoder"""
+    return Inputs(
+        add=_inputs_add_from_tuple(value[0]) if isinstance(value[0], (tuple, list)) else value[0],
+        subtract=_inputs_subtract_from_tuple(value[1]) if isinstance(value[1], (tuple, list)) else value[1],
+    )
+
+
+def _inputs_to_bytes(value: Inputs) -> bytes:
+    """Encode a Inputs into its ABI encoding"""
+    return b"".join((
+        _inputs_add_to_bytes(value.add),
+        _inputs_subtract_to_bytes(value.subtract),
+    ))
+
+
+def _inputs_from_bytes(data: bytes) -> Inputs:
+    """Construct a Inputs from its ABI encoding"""
+    if len(data) != 32:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Inputs")
+    return Inputs(
+        add=_inputs_add_from_bytes(data[0:16]),
+        subtract=_inputs_subtract_from_bytes(data[16:32]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Outputs:
     """Struct for Outputs"""
     sum: int
     difference: int
 
-@dataclasses.dataclass(frozen=True)
+
+def _outputs_to_tuple(value: object) -> object:
+    """Convert a Outputs into the tuple expected by the ABI encoder"""
+    if isinstance(value, Outputs):
+        return (value.sum, value.difference)
+    return _convert_dataclass(value)
+
+
+def _outputs_from_dict(data: dict) -> Outputs:
+    """Construct a Outputs from the dict the app client decodes it into"""
+    return Outputs(
+        sum=data["sum"],
+        difference=data["difference"],
+    )
+
+
+def _outputs_from_tuple(value: tuple | list) -> Outputs:
+    """Construct a Outputs from the tuple decoded by the ABI decoder"""
+    return Outputs(
+        sum=value[0],
+        difference=value[1],
+    )
+
+
+def _outputs_to_bytes(value: Outputs) -> bytes:
+    """Encode a Outputs into its ABI encoding"""
+    return b"".join((
+        value.sum.to_bytes(8, "big"),
+        value.difference.to_bytes(8, "big"),
+    ))
+
+
+def _outputs_from_bytes(data: bytes) -> Outputs:
+    """Construct a Outputs from its ABI encoding"""
+    if len(data) != 16:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Outputs")
+    return Outputs(
+        sum=int.from_bytes(data[0:8], "big"),
+        difference=int.from_bytes(data[8:16], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class FooUint16BarUint16:
     """Struct for { foo: uint16; bar: uint16 }"""
     foo: int
     bar: int
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+def _foo_uint_16_bar_uint_16_to_tuple(value: object) -> object:
+    """Convert a FooUint16BarUint16 into the tuple expected by the ABI encoder"""
+    if isinstance(value, FooUint16BarUint16):
+        return (value.foo, value.bar)
+    return _convert_dataclass(value)
+
+
+def _foo_uint_16_bar_uint_16_from_dict(data: dict) -> FooUint16BarUint16:
+    """Construct a FooUint16BarUint16 from the dict the app client decodes it into"""
+    return FooUint16BarUint16(
+        foo=data["foo"],
+        bar=data["bar"],
+    )
+
+
+def _foo_uint_16_bar_uint_16_from_tuple(value: tuple | list) -> FooUint16BarUint16:
+    """Construct a FooUint16BarUint16 from the tuple decoded by the ABI decoder"""
+    return FooUint16BarUint16(
+        foo=value[0],
+        bar=value[1],
+    )
+
+
+def _foo_uint_16_bar_uint_16_to_bytes(value: FooUint16BarUint16) -> bytes:
+    """Encode a FooUint16BarUint16 into its ABI encoding"""
+    return b"".join((
+        value.foo.to_bytes(2, "big"),
+        value.bar.to_bytes(2, "big"),
+    ))
+
+
+def _foo_uint_16_bar_uint_16_from_bytes(data: bytes) -> FooUint16BarUint16:
+    """Construct a FooUint16BarUint16 from its ABI encoding"""
+    if len(data) != 4:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of FooUint16BarUint16")
+    return FooUint16BarUint16(
+        foo=int.from_bytes(data[0:2], "big"),
+        bar=int.from_bytes(data[2:4], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class FooArgs:
     """Dataclass for foo arguments"""
     inputs: Inputs
@@ -105,7 +356,261 @@ class FooArgs:
         return "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)"
 
 
+def _foo_args_to_abi(args: tuple[Inputs] | FooArgs) -> list[typing.Any] | None:
+    """Convert foo args into the list of ABI args expected by the app client"""
+    if isinstance(args, FooArgs):
+        return [_inputs_to_tuple(args.inputs)]
+    return _parse_abi_args(args)
+
+
+def _foo_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> FooArgs:
+    """Decode the args of a call of foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64) from its app args"""
+    if len(app_args) != 2:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)")
+    return FooArgs(
+        inputs=_inputs_from_bytes(app_args[1]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateApplicationArgs:
+    """Dataclass for create_application arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "createApplication()void"
+
+
+def _create_application_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateApplicationArgs:
+    """Decode the args of a call of createApplication()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of createApplication()void")
+    return CreateApplicationArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class OptInToApplicationArgs:
+    """Dataclass for opt_in_to_application arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "optInToApplication()void"
+
+
+def _opt_in_to_application_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> OptInToApplicationArgs:
+    """Decode the args of a call of optInToApplication()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of optInToApplication()void")
+    return OptInToApplicationArgs()
+
+
+Arc56TestMethodArgs: typing.TypeAlias = FooArgs | CreateApplicationArgs | OptInToApplicationArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    Arc56TestMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x39\x6d\x55\x0e": _foo_args_from_app_args,  # foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)
+    b"\xb8\x44\x7b\x36": _create_application_args_from_app_args,  # createApplication()void
+    b"\x01\xa3\xa3\xff": _opt_in_to_application_args_from_app_args,  # optInToApplication()void
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> Arc56TestMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Arc56TestAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: Arc56TestMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x39\x6d\x55\x0e": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
+    b"\xb8\x44\x7b\x36": "createApplication()void",
+    b"\x01\xa3\xa3\xff": "optInToApplication()void",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> Arc56TestMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[Arc56TestAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield Arc56TestAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[Arc56TestAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[Arc56TestAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[Arc56TestAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[Arc56TestAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class _Arc56TestOptIn:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -114,44 +619,49 @@ class _Arc56TestOptIn:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="optInToApplication()void",
+        ))
 
 
 class Arc56TestParams:
+    __slots__ = ("app_client", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._opt_in: "_Arc56TestOptIn | None" = None
 
     @property
     def opt_in(self) -> "_Arc56TestOptIn":
-        return _Arc56TestOptIn(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _Arc56TestOptIn(self.app_client)
+        return self._opt_in
 
     def foo(
         self,
         args: tuple[Inputs] | FooArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }))
+        method_args = _foo_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
+            args=method_args,
+        ))
 
     def create_application(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="createApplication()void",
+        ))
 
     def clear_state(
         self,
@@ -165,6 +675,8 @@ class Arc56TestParams:
 
 
 class _Arc56TestOptInTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -173,44 +685,49 @@ class _Arc56TestOptInTransaction:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="optInToApplication()void",
+        ))
 
 
 class Arc56TestCreateTransactionParams:
+    __slots__ = ("app_client", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._opt_in: "_Arc56TestOptInTransaction | None" = None
 
     @property
     def opt_in(self) -> "_Arc56TestOptInTransaction":
-        return _Arc56TestOptInTransaction(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _Arc56TestOptInTransaction(self.app_client)
+        return self._opt_in
 
     def foo(
         self,
         args: tuple[Inputs] | FooArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }))
+        method_args = _foo_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
+            args=method_args,
+        ))
 
     def create_application(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="createApplication()void",
+        ))
 
     def clear_state(
         self,
@@ -224,8 +741,11 @@ class Arc56TestCreateTransactionParams:
 
 
 class _Arc56TestOptInSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def opt_in_to_application(
         self,
@@ -233,22 +753,38 @@ class _Arc56TestOptInSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="optInToApplication()void",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
 
 class Arc56TestSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_client", "_opt_in", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "Arc56TestClient | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._opt_in: "_Arc56TestOptInSend | None" = None
+        self._batch: "_Arc56TestBatchSend | None" = None
 
     @property
     def opt_in(self) -> "_Arc56TestOptInSend":
-        return _Arc56TestOptInSend(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _Arc56TestOptInSend(self.app_client, self._caches)
+        return self._opt_in
+
+    @property
+    def batch(self) -> "_Arc56TestBatchSend":
+        if self._batch is None:
+            self._batch = _Arc56TestBatchSend(self.app_client, self._client)
+        return self._batch
 
     def foo(
         self,
@@ -256,14 +792,16 @@ class Arc56TestSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[Outputs]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Outputs, typing.cast(dict, response.abi_return))) # type: ignore
+        method_args = _foo_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = dataclasses.replace(response, abi_return=_outputs_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[Outputs], parsed_response)
 
     def create_application(
@@ -272,11 +810,13 @@ class Arc56TestSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="createApplication()void",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -285,10 +825,13 @@ class Arc56TestSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
+        response = self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -303,63 +846,187 @@ class BoxStateValue(typing.TypedDict):
     """Shape of box state key values"""
     boxKey: str
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    global_key: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LocalStateSnapshot:
+    """Values of every local_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Round of the ledger the values were read from"""
+    local_key: int
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
 class Arc56TestState:
     """Methods to access state for the current ARC56Test app"""
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_global_state", "_box")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
+        self._box: "_BoxState | None" = None
 
     @property
-    def global_state(
-        self
-    ) -> "_GlobalState":
-            """Methods to access global_state for the current app"""
-            return _GlobalState(self.app_client)
-
-    def local_state(
-        self, address: str
-    ) -> "_LocalState":
-            """Methods to access local_state for the current app"""
-            return _LocalState(self.app_client, address)
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
+    def local_state(self, address: str) -> "_LocalState":
+        """Methods to access local_state for the current app"""
+        return _LocalState(self.app_client, address, self._caches)
 
     @property
-    def box(
-        self
-    ) -> "_BoxState":
-            """Methods to access box for the current app"""
-            return _BoxState(self.app_client)
+    def box(self) -> "_BoxState":
+        """Methods to access box for the current app"""
+        if self._box is None:
+            self._box = _BoxState(self.app_client, self._caches)
+        return self._box
+
 
 class _GlobalState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "{ foo: uint16; bar: uint16 }": FooUint16BarUint16
-        }
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
-        result = self.app_client.state.global_state.get_all()
-        if not result:
-            return typing.cast(GlobalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(GlobalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        return typing.cast(GlobalStateValue, result)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            global_key=typing.cast(int, _decode_state_value(state.get("Z2xvYmFsS2V5"), "uint64")),
+        )
 
     @property
     def global_key(self) -> int:
         """Get the current value of the globalKey key in global_state state"""
-        value = self.app_client.state.global_state.get_value("globalKey")
-        if isinstance(value, dict) and "uint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        value = self._read(("key", "globalKey"), lambda: self.app_client.state.global_state.get_value("globalKey"))
         return typing.cast(int, value)
 
     @property
@@ -368,38 +1035,51 @@ class _GlobalState:
         return _MapState(
             self.app_client.state.global_state,
             "globalMap",
-            self._struct_classes.get("{ foo: uint16; bar: uint16 }")
+            _foo_uint_16_bar_uint_16_from_dict,
+            cached_read=self._read,
         )
 
+
 class _LocalState:
-    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+    __slots__ = ("app_client", "address", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, address: str, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
         self.address = address
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("local_state", self.address, *key), read, round_of)
 
     def get_all(self) -> LocalStateValue:
         """Get all current keyed values from local_state state"""
-        result = self.app_client.state.local_state(self.address).get_all()
-        if not result:
-            return typing.cast(LocalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(LocalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.local_state(self.address).get_all)
+        return typing.cast(LocalStateValue, result)
+
+    def snapshot(self) -> LocalStateSnapshot:
+        """Get the current value of every key in local_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> LocalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        app_info = typing.cast(dict, algod.account_application_info(self.address, self.app_client.app_id))
+        current_round = app_info["round"]
+        key_values = app_info.get("app-local-state", {}).get("key-value", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return LocalStateSnapshot(
+            round=current_round,
+            local_key=typing.cast(int, _decode_state_value(state.get("bG9jYWxLZXk="), "uint64")),
+        )
 
     @property
     def local_key(self) -> int:
         """Get the current value of the localKey key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("localKey")
-        if isinstance(value, dict) and "uint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        value = self._read(("key", "localKey"), lambda: self.app_client.state.local_state(self.address).get_value("localKey"))
         return typing.cast(int, value)
 
     @property
@@ -408,51 +1088,50 @@ class _LocalState:
         return _MapState(
             self.app_client.state.local_state(self.address),
             "localMap",
-            None
+            None,
+            cached_read=self._read,
         )
 
+
 class _BoxState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Outputs": Outputs
-        }
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("box", *key), read, round_of)
 
     def get_all(self) -> BoxStateValue:
         """Get all current keyed values from box state"""
-        result = self.app_client.state.box.get_all()
-        if not result:
-            return typing.cast(BoxStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.box.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(BoxStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.box.get_all)
+        return typing.cast(BoxStateValue, result)
 
     @property
     def box_key(self) -> str:
         """Get the current value of the boxKey key in box state"""
-        value = self.app_client.state.box.get_value("boxKey")
-        if isinstance(value, dict) and "string" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["string"], value)  # type: ignore
+        value = self._read(("key", "boxKey"), lambda: self.app_client.state.box.get_value("boxKey"))
         return typing.cast(str, value)
 
     @property
-    def box_map(self) -> "_MapState[Inputs, Outputs]":
+    def box_map(self) -> "_BoxMapState[Inputs, Outputs]":
         """Get values from the boxMap map in box state"""
-        return _MapState(
-            self.app_client.state.box,
+        return _BoxMapState(
+            self.app_client,
             "boxMap",
-            self._struct_classes.get("Outputs")
+            _outputs_from_dict,
+            key_to_abi=_inputs_to_tuple,
+            key_from_bytes=_inputs_from_bytes,
+            cached_read=self._read,
         )
 
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -465,32 +1144,161 @@ class _AppClientStateMethodsProtocol(typing.Protocol):
 class _MapState(typing.Generic[_KeyType, _ValueType]):
     """Generic class for accessing state maps with strongly typed keys and values"""
 
+    __slots__ = ("_state_accessor", "_map_name", "_struct_from_dict", "_key_to_abi", "_cached_read")
+
     def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
         self._state_accessor = state_accessor
         self._map_name = map_name
-        self._struct_class = struct_class
+        self._struct_from_dict = struct_from_dict
+        self._key_to_abi = key_to_abi
+        self._cached_read = cached_read
+
+    def _cached(self, key: tuple, read: typing.Callable[[], typing.Any]) -> typing.Any:
+        return self._cached_read(("map", self._map_name, *key), read) if self._cached_read else read()
 
     def get_map(self) -> dict[_KeyType, _ValueType]:
         """Get all current values in the map"""
-        result = self._state_accessor.get_map(self._map_name)
-        if self._struct_class and result:
-            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
-                    for k, v in result.items()}  # type: ignore
+        result = self._cached(("get_map",), lambda: self._state_accessor.get_map(self._map_name))
+        if self._struct_from_dict and result:
+            struct_from_dict = self._struct_from_dict
+            return {k: struct_from_dict(v) if isinstance(v, dict) else v
+                    for k, v in result.items()}
         return typing.cast(dict[_KeyType, _ValueType], result or {})
 
     def get_value(self, key: _KeyType) -> _ValueType | None:
         """Get a value from the map by key"""
-        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
-        value = self._state_accessor.get_map_value(self._map_name, key_value)
-        if value is not None and self._struct_class and isinstance(value, dict):
-            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return self._read_value(self._key_to_abi(key) if self._key_to_abi else key)
+
+    def get_values(self, keys: typing.Iterable[_KeyType], *, max_workers: int = 8) -> list[_ValueType | None]:
+        """Get the values of many keys from the map, reading up to max_workers values concurrently
+
+        Values are returned in the order of keys, with None for keys that aren't in the map
+        """
+        # only imported when used, so importing the client stays cheap
+        import concurrent.futures
+
+        key_values = [self._key_to_abi(key) if self._key_to_abi else key for key in keys]
+        if max_workers <= 1 or len(key_values) <= 1:
+            return [self._read_value_or_none(key_value) for key_value in key_values]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(key_values))) as executor:
+            return list(executor.map(self._read_value_or_none, key_values))
+
+    def _read_value(self, key_value: object) -> _ValueType | None:
+        value = self._cached(
+            ("get_value", key_value), lambda: self._state_accessor.get_map_value(self._map_name, key_value)
+        )
+        if value is not None and self._struct_from_dict and isinstance(value, dict):
+            return self._struct_from_dict(value)
         return typing.cast(_ValueType | None, value)
 
+    def _read_value_or_none(self, key_value: object) -> _ValueType | None:
+        try:
+            return self._read_value(key_value)
+        except algosdk.error.AlgodHTTPError as e:
+            # each box map value is stored in its own box, which doesn't exist for keys that aren't in the map
+            if e.code == 404:
+                return None
+            raise
+
+
+class _BoxMapState(_MapState[_KeyType, _ValueType]):
+    """Box map, whose entries can be iterated without reading the whole map into memory"""
+
+    __slots__ = ("_app_client", "_key_from_bytes")
+
+    def __init__(self, app_client: algokit_utils.AppClient, map_name: str,
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                key_from_bytes: typing.Callable[[bytes], _KeyType] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        super().__init__(
+            app_client.state.box, map_name, struct_from_dict, key_to_abi=key_to_abi, cached_read=cached_read
+        )
+        self._app_client = app_client
+        self._key_from_bytes = key_from_bytes
+
+    def iter_items(self, *, prefetch: int = 2, batch_size: int = 16) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """Iterate over the entries of the map, reading values in batches of batch_size
+
+        The box names of the app are listed once, then up to prefetch batches beyond the one being iterated are
+        read in the background, so at most (prefetch + 1) * batch_size values are held in memory. Entries whose box
+        is deleted during iteration are skipped.
+        """
+        # only imported when used, so importing the client stays cheap
+        import base64
+        import collections
+        import concurrent.futures
+
+        metadata = self._app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        boxes = typing.cast(dict, self._app_client.algorand.client.algod.application_boxes(self._app_client.app_id))
+        names = (base64.b64decode(box["name"]) for box in boxes["boxes"])
+        encoded_keys = [name[len(prefix):] for name in names if name.startswith(prefix)]
+
+        batch_size = max(batch_size, 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            pending: collections.deque[list[tuple[bytes, concurrent.futures.Future[_ValueType | None]]]] = (
+                collections.deque()
+            )
+            batches = (encoded_keys[i:i + batch_size] for i in range(0, len(encoded_keys), batch_size))
+            for batch in batches:
+                pending.append([(key, executor.submit(self._read_value_or_none, key)) for key in batch])
+                if len(pending) > prefetch:
+                    yield from self._decode_batch(pending.popleft(), metadata.key_type)
+            while pending:
+                yield from self._decode_batch(pending.popleft(), metadata.key_type)
+
+    def _decode_batch(
+        self, batch: list[tuple[bytes, typing.Any]], key_type: str
+    ) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        structs = self._app_client.app_spec.structs
+        for encoded_key, future in batch:
+            value: _ValueType | None = future.result()
+            if value is None:
+                continue
+            if self._key_from_bytes:
+                yield self._key_from_bytes(encoded_key), value
+            else:
+                key = algokit_utils.get_abi_decoded_value(encoded_key, key_type, structs)
+                yield typing.cast(_KeyType, key), value
+
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)": (APP_SPEC.methods[0], _outputs_from_tuple),
+    "foo": (APP_SPEC.methods[0], _outputs_from_tuple),
+    "createApplication()void": (APP_SPEC.methods[2], None),
+    "createApplication": (APP_SPEC.methods[2], None),
+    "optInToApplication()void": (APP_SPEC.methods[1], None),
+    "optInToApplication": (APP_SPEC.methods[1], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
 
 class Arc56TestClient:
     """Client for interacting with ARC56Test smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state", "_caches")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -537,10 +1345,44 @@ class Arc56TestClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = Arc56TestParams(self.app_client)
-        self.create_transaction = Arc56TestCreateTransactionParams(self.app_client)
-        self.send = Arc56TestSend(self.app_client)
-        self.state = Arc56TestState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: Arc56TestParams | None = None
+        self._create_transaction: Arc56TestCreateTransactionParams | None = None
+        self._send: Arc56TestSend | None = None
+        self._state: "Arc56TestState | None" = None
+        self._caches = _ReadCaches()
+    
+    @property
+    def params(self) -> Arc56TestParams:
+        if self._params is None:
+            self._params = Arc56TestParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> Arc56TestCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = Arc56TestCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> Arc56TestSend:
+        if self._send is None:
+            self._send = Arc56TestSend(self.app_client, self._caches, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "Arc56TestState":
+        if self._state is None:
+            self._state = Arc56TestState(self.app_client, self._caches)
+        return self._state
+
+    def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+        """Cache the state read through `state`, in an LRU of up to max_entries reads
+    
+        Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+        when a transaction sent through `send` or `new_group()` is confirmed
+        """
+        self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
 
     @staticmethod
     def from_creator_and_name(
@@ -665,18 +1507,10 @@ class Arc56TestClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | Outputs, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -820,6 +1654,8 @@ class Arc56TestFactory(algokit_utils.TypedAppFactoryProtocol[Arc56TestMethodCall
 class Arc56TestFactoryParams:
     """Parameters for creating transactions for Arc56Test contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = Arc56TestFactoryCreateParams(app_factory)
@@ -829,6 +1665,8 @@ class Arc56TestFactoryParams:
 class Arc56TestFactoryCreateParams:
     """Parameters for 'create' operations of Arc56Test contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -839,9 +1677,9 @@ class Arc56TestFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def foo(
@@ -852,14 +1690,12 @@ class Arc56TestFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
+                args=_foo_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -871,14 +1707,12 @@ class Arc56TestFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the createApplication()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "createApplication()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="createApplication()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -890,14 +1724,12 @@ class Arc56TestFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the optInToApplication()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "optInToApplication()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="optInToApplication()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -905,6 +1737,8 @@ class Arc56TestFactoryCreateParams:
 class Arc56TestFactoryUpdateParams:
     """Parameters for 'update' operations of Arc56Test contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -915,14 +1749,16 @@ class Arc56TestFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class Arc56TestFactoryDeleteParams:
     """Parameters for 'delete' operations of Arc56Test contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -933,15 +1769,17 @@ class Arc56TestFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class Arc56TestFactoryCreateTransaction:
     """Create transactions for Arc56Test contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = Arc56TestFactoryCreateTransactionCreate(app_factory)
@@ -950,6 +1788,8 @@ class Arc56TestFactoryCreateTransaction:
 class Arc56TestFactoryCreateTransactionCreate:
     """Create new instances of Arc56Test contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -958,15 +1798,17 @@ class Arc56TestFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class Arc56TestFactorySend:
     """Send calls to Arc56Test contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = Arc56TestFactorySendCreate(app_factory)
@@ -975,6 +1817,8 @@ class Arc56TestFactorySend:
 class Arc56TestFactorySendCreate:
     """Send create calls to Arc56Test contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -986,9 +1830,9 @@ class Arc56TestFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[Arc56TestClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -1002,14 +1846,12 @@ class Arc56TestFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[Arc56TestClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the createApplication()void ABI method"""
-            params = params or algokit_utils.CommonAppCallCreateParams()
+            params = params or _DEFAULT_CREATE_PARAMS
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
-                    **{
-                    **dataclasses.asdict(params),
-                    "method": "createApplication()void",
-                    "args": None,
-                    }
+                    **_params_fields(params),
+                    method="createApplication()void",
+                    args=None,
                 ),
                 send_params=send_params,
                 compilation_params=compilation_params
@@ -1033,6 +1875,8 @@ class Arc56TestFactorySendCreate:
 
 
 class _Arc56TestOptInComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "Arc56TestComposer"):
         self.composer = composer
     def opt_in_to_application(
@@ -1046,10 +1890,8 @@ class _Arc56TestOptInComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "optInToApplication()void", v
-            )
+        self.composer._return_decoders.append(
+            ("optInToApplication()void", _RETURN_DECODERS["optInToApplication()void"])
         )
         return self.composer
 
@@ -1057,14 +1899,20 @@ class _Arc56TestOptInComposer:
 class Arc56TestComposer:
     """Composer for creating transaction groups for Arc56Test contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_opt_in")
+
     def __init__(self, client: "Arc56TestClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._opt_in: "_Arc56TestOptInComposer | None" = None
 
     @property
     def opt_in(self) -> "_Arc56TestOptInComposer":
-        return _Arc56TestOptInComposer(self)
+        if self._opt_in is None:
+            self._opt_in = _Arc56TestOptInComposer(self)
+        return self._opt_in
 
     def foo(
         self,
@@ -1077,10 +1925,8 @@ class Arc56TestComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)", v
-            )
+        self._return_decoders.append(
+            ("foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)", _RETURN_DECODERS["foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)"])
         )
         return self
 
@@ -1094,10 +1940,8 @@ class Arc56TestComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "createApplication()void", v
-            )
+        self._return_decoders.append(
+            ("createApplication()void", _RETURN_DECODERS["createApplication()void"])
         )
         return self
 
@@ -1107,15 +1951,10 @@ class Arc56TestComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "Arc56TestComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -1129,6 +1968,25 @@ class Arc56TestComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -1139,18 +1997,94 @@ class Arc56TestComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _Arc56TestBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "Arc56TestClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else Arc56TestClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["Arc56TestComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def foo(
+        self,
+        args: typing.Iterable[tuple[Inputs] | FooArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[Outputs]:
+        return self._send_groups(
+            lambda composer, method_args: composer.foo(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: d7d566d58ae16f08b16f8372dc63400849d34534e73a148f07fcabac2e11986e
 
 # common
 import dataclasses
@@ -20,20 +21,46 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "method_a_that_uses_struct", "returns": {"type": "(uint64,uint64)", "struct": "SomeStruct"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "method_b_that_uses_same_struct", "returns": {"type": "(uint64,uint64)", "struct": "SomeStruct"}, "events": []}], "name": "DuplicateStructs", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"SomeStruct": [{"name": "a", "type": "uint64"}, {"name": "b", "type": "uint64"}]}, "desc": "\n    Used for snapshot testing to ensure no duplicate struct definitions in typed clients.\n    ", "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9kdXBsaWNhdGVfc3RydWN0cy9jb250cmFjdC5weToxMgogICAgLy8gY2xhc3MgRHVwbGljYXRlU3RydWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDcKICAgIHB1c2hieXRlc3MgMHg5ZjcyYWMwZiAweGE4NjE4NDQ5IC8vIG1ldGhvZCAibWV0aG9kX2FfdGhhdF91c2VzX3N0cnVjdCgpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJtZXRob2RfYl90aGF0X3VzZXNfc2FtZV9zdHJ1Y3QoKSh1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fbWV0aG9kX2FfdGhhdF91c2VzX3N0cnVjdF9yb3V0ZUAzIG1haW5fbWV0aG9kX2JfdGhhdF91c2VzX3NhbWVfc3RydWN0X3JvdXRlQDQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9kdXBsaWNhdGVfc3RydWN0cy9jb250cmFjdC5weToxMgogICAgLy8gY2xhc3MgRHVwbGljYXRlU3RydWN0cyhBUkM0Q29udHJhY3QpOgogICAgcHVzaGludCAwIC8vIDAKICAgIHJldHVybgoKbWFpbl9tZXRob2RfYl90aGF0X3VzZXNfc2FtZV9zdHJ1Y3Rfcm91dGVANDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9kdXBsaWNhdGVfc3RydWN0cy9jb250cmFjdC5weToyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMzAwMDAwMDAwMDAwMDAwMDQKICAgIGxvZwogICAgcHVzaGludCAxIC8vIDEKICAgIHJldHVybgoKbWFpbl9tZXRob2RfYV90aGF0X3VzZXNfc3RydWN0X3JvdXRlQDM6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvZHVwbGljYXRlX3N0cnVjdHMvY29udHJhY3QucHk6MTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDEwMDAwMDAwMDAwMDAwMDAyCiAgICBsb2cKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDc6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvZHVwbGljYXRlX3N0cnVjdHMvY29udHJhY3QucHk6MTIKICAgIC8vIGNsYXNzIER1cGxpY2F0ZVN0cnVjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "method_a_that_uses_struct()(uint64,uint64)": 0,
+    "method_a_that_uses_struct": 0,
+    "method_b_that_uses_same_struct()(uint64,uint64)": 1,
+    "method_b_that_uses_same_struct": 1,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,35 +70,305 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
-
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
-
-@dataclasses.dataclass(frozen=True)
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class SomeStruct:
     """Struct for SomeStruct"""
     a: int
     b: int
 
 
+def _some_struct_to_tuple(value: object) -> object:
+    """Convert a SomeStruct into the tuple expected by the ABI encoder"""
+    if isinstance(value, SomeStruct):
+        return (value.a, value.b)
+    return _convert_dataclass(value)
+
+
+def _some_struct_from_dict(data: dict) -> SomeStruct:
+    """Construct a SomeStruct from the dict the app client decodes it into"""
+    return SomeStruct(
+        a=data["a"],
+        b=data["b"],
+    )
+
+
+def _some_struct_from_tuple(value: tuple | list) -> SomeStruct:
+    """Construct a SomeStruct from the tuple decoded by the ABI decoder"""
+    return SomeStruct(
+        a=value[0],
+        b=value[1],
+    )
+
+
+def _some_struct_to_bytes(value: SomeStruct) -> bytes:
+    """Encode a SomeStruct into its ABI encoding"""
+    return b"".join((
+        value.a.to_bytes(8, "big"),
+        value.b.to_bytes(8, "big"),
+    ))
+
+
+def _some_struct_from_bytes(data: bytes) -> SomeStruct:
+    """Construct a SomeStruct from its ABI encoding"""
+    if len(data) != 16:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of SomeStruct")
+    return SomeStruct(
+        a=int.from_bytes(data[0:8], "big"),
+        b=int.from_bytes(data[8:16], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class MethodAThatUsesStructArgs:
+    """Dataclass for method_a_that_uses_struct arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "method_a_that_uses_struct()(uint64,uint64)"
+
+
+def _method_a_that_uses_struct_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> MethodAThatUsesStructArgs:
+    """Decode the args of a call of method_a_that_uses_struct()(uint64,uint64) from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of method_a_that_uses_struct()(uint64,uint64)")
+    return MethodAThatUsesStructArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class MethodBThatUsesSameStructArgs:
+    """Dataclass for method_b_that_uses_same_struct arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "method_b_that_uses_same_struct()(uint64,uint64)"
+
+
+def _method_b_that_uses_same_struct_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> MethodBThatUsesSameStructArgs:
+    """Decode the args of a call of method_b_that_uses_same_struct()(uint64,uint64) from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of method_b_that_uses_same_struct()(uint64,uint64)")
+    return MethodBThatUsesSameStructArgs()
+
+
+DuplicateStructsMethodArgs: typing.TypeAlias = MethodAThatUsesStructArgs | MethodBThatUsesSameStructArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    DuplicateStructsMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x9f\x72\xac\x0f": _method_a_that_uses_struct_args_from_app_args,  # method_a_that_uses_struct()(uint64,uint64)
+    b"\xa8\x61\x84\x49": _method_b_that_uses_same_struct_args_from_app_args,  # method_b_that_uses_same_struct()(uint64,uint64)
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> DuplicateStructsMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DuplicateStructsAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: DuplicateStructsMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x9f\x72\xac\x0f": "method_a_that_uses_struct()(uint64,uint64)",
+    b"\xa8\x61\x84\x49": "method_b_that_uses_same_struct()(uint64,uint64)",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> DuplicateStructsMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[DuplicateStructsAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield DuplicateStructsAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[DuplicateStructsAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[DuplicateStructsAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[DuplicateStructsAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[DuplicateStructsAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class DuplicateStructsParams:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -80,22 +377,22 @@ class DuplicateStructsParams:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_a_that_uses_struct()(uint64,uint64)",
+        ))
 
     def method_b_that_uses_same_struct(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_b_that_uses_same_struct()(uint64,uint64)",
+        ))
 
     def clear_state(
         self,
@@ -109,6 +406,8 @@ class DuplicateStructsParams:
 
 
 class DuplicateStructsCreateTransactionParams:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -117,22 +416,22 @@ class DuplicateStructsCreateTransactionParams:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_a_that_uses_struct()(uint64,uint64)",
+        ))
 
     def method_b_that_uses_same_struct(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_b_that_uses_same_struct()(uint64,uint64)",
+        ))
 
     def clear_state(
         self,
@@ -146,6 +445,8 @@ class DuplicateStructsCreateTransactionParams:
 
 
 class DuplicateStructsSend:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -155,12 +456,12 @@ class DuplicateStructsSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_a_that_uses_struct()(uint64,uint64)",
+        ), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_some_struct_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def method_b_that_uses_same_struct(
@@ -169,12 +470,12 @@ class DuplicateStructsSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="method_b_that_uses_same_struct()(uint64,uint64)",
+        ), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_some_struct_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def clear_state(
@@ -191,12 +492,43 @@ class DuplicateStructsSend:
 class DuplicateStructsState:
     """Methods to access state for the current DuplicateStructs app"""
 
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "method_a_that_uses_struct()(uint64,uint64)": (APP_SPEC.methods[0], _some_struct_from_tuple),
+    "method_a_that_uses_struct": (APP_SPEC.methods[0], _some_struct_from_tuple),
+    "method_b_that_uses_same_struct()(uint64,uint64)": (APP_SPEC.methods[1], _some_struct_from_tuple),
+    "method_b_that_uses_same_struct": (APP_SPEC.methods[1], _some_struct_from_tuple),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
 class DuplicateStructsClient:
     """Client for interacting with DuplicateStructs smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -243,10 +575,35 @@ class DuplicateStructsClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = DuplicateStructsParams(self.app_client)
-        self.create_transaction = DuplicateStructsCreateTransactionParams(self.app_client)
-        self.send = DuplicateStructsSend(self.app_client)
-        self.state = DuplicateStructsState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: DuplicateStructsParams | None = None
+        self._create_transaction: DuplicateStructsCreateTransactionParams | None = None
+        self._send: DuplicateStructsSend | None = None
+        self._state: "DuplicateStructsState | None" = None
+    
+    @property
+    def params(self) -> DuplicateStructsParams:
+        if self._params is None:
+            self._params = DuplicateStructsParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> DuplicateStructsCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = DuplicateStructsCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> DuplicateStructsSend:
+        if self._send is None:
+            self._send = DuplicateStructsSend(self.app_client)
+        return self._send
+    
+    @property
+    def state(self) -> "DuplicateStructsState":
+        if self._state is None:
+            self._state = DuplicateStructsState(self.app_client)
+        return self._state
 
     @staticmethod
     def from_creator_and_name(
@@ -365,18 +722,10 @@ class DuplicateStructsClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | SomeStruct, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -507,6 +856,8 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
 class DuplicateStructsFactoryParams:
     """Parameters for creating transactions for DuplicateStructs contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = DuplicateStructsFactoryCreateParams(app_factory)
@@ -516,6 +867,8 @@ class DuplicateStructsFactoryParams:
 class DuplicateStructsFactoryCreateParams:
     """Parameters for 'create' operations of DuplicateStructs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -526,9 +879,9 @@ class DuplicateStructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def method_a_that_uses_struct(
@@ -538,14 +891,12 @@ class DuplicateStructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the method_a_that_uses_struct()(uint64,uint64) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "method_a_that_uses_struct()(uint64,uint64)",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="method_a_that_uses_struct()(uint64,uint64)",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -557,14 +908,12 @@ class DuplicateStructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the method_b_that_uses_same_struct()(uint64,uint64) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="method_b_that_uses_same_struct()(uint64,uint64)",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -572,6 +921,8 @@ class DuplicateStructsFactoryCreateParams:
 class DuplicateStructsFactoryUpdateParams:
     """Parameters for 'update' operations of DuplicateStructs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -582,14 +933,16 @@ class DuplicateStructsFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class DuplicateStructsFactoryDeleteParams:
     """Parameters for 'delete' operations of DuplicateStructs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -600,15 +953,17 @@ class DuplicateStructsFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class DuplicateStructsFactoryCreateTransaction:
     """Create transactions for DuplicateStructs contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = DuplicateStructsFactoryCreateTransactionCreate(app_factory)
@@ -617,6 +972,8 @@ class DuplicateStructsFactoryCreateTransaction:
 class DuplicateStructsFactoryCreateTransactionCreate:
     """Create new instances of DuplicateStructs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -625,15 +982,17 @@ class DuplicateStructsFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class DuplicateStructsFactorySend:
     """Send calls to DuplicateStructs contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = DuplicateStructsFactorySendCreate(app_factory)
@@ -642,6 +1001,8 @@ class DuplicateStructsFactorySend:
 class DuplicateStructsFactorySendCreate:
     """Send create calls to DuplicateStructs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -653,9 +1014,9 @@ class DuplicateStructsFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[DuplicateStructsClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -665,10 +1026,13 @@ class DuplicateStructsFactorySendCreate:
 class DuplicateStructsComposer:
     """Composer for creating transaction groups for DuplicateStructs contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders")
+
     def __init__(self, client: "DuplicateStructsClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
 
     def method_a_that_uses_struct(
         self,
@@ -680,10 +1044,8 @@ class DuplicateStructsComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "method_a_that_uses_struct()(uint64,uint64)", v
-            )
+        self._return_decoders.append(
+            ("method_a_that_uses_struct()(uint64,uint64)", _RETURN_DECODERS["method_a_that_uses_struct()(uint64,uint64)"])
         )
         return self
 
@@ -697,10 +1059,8 @@ class DuplicateStructsComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "method_b_that_uses_same_struct()(uint64,uint64)", v
-            )
+        self._return_decoders.append(
+            ("method_b_that_uses_same_struct()(uint64,uint64)", _RETURN_DECODERS["method_b_that_uses_same_struct()(uint64,uint64)"])
         )
         return self
 
@@ -710,15 +1070,10 @@ class DuplicateStructsComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "DuplicateStructsComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -732,6 +1087,25 @@ class DuplicateStructsComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -742,18 +1116,20 @@ class DuplicateStructsComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self._decode_returns(self._composer.send(send_params))
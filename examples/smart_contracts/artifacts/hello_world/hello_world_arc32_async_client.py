@@ -0,0 +1,1671 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 029afaa36c7bb4a4bb5206cc57a68fa0701a98034ad151a6c1f3c1829d2b63d6
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+# async
+import asyncio
+import concurrent.futures
+import functools
+
+_APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": ["DeleteApplication", "UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello_world_check", "returns": {"type": "void"}, "events": []}], "name": "HelloWorld", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIFRNUExfVVBEQVRBQkxFIFRNUExfREVMRVRBQkxFCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NgogICAgLy8gY2xhc3MgSGVsbG9Xb3JsZChFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0A3CiAgICBwdXNoYnl0ZXNzIDB4MDJiZWNlMTEgMHhiZjljMWVkZiAvLyBtZXRob2QgImhlbGxvKHN0cmluZylzdHJpbmciLCBtZXRob2QgImhlbGxvX3dvcmxkX2NoZWNrKHN0cmluZyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9oZWxsb19yb3V0ZUAzIG1haW5faGVsbG9fd29ybGRfY2hlY2tfcm91dGVANAoKbWFpbl9hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjYKICAgIC8vIGNsYXNzIEhlbGxvV29ybGQoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDAgLy8gMAogICAgcmV0dXJuCgptYWluX2hlbGxvX3dvcmxkX2NoZWNrX3JvdXRlQDQ6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NgogICAgLy8gY2xhc3MgSGVsbG9Xb3JsZChFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBoZWxsb193b3JsZF9jaGVjawogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oZWxsb19yb3V0ZUAzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NgogICAgLy8gY2xhc3MgSGVsbG9Xb3JsZChFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGhlbGxvCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0A3OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjYKICAgIC8vIGNsYXNzIEhlbGxvV29ybGQoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBzd2l0Y2ggbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUA4IG1haW5fYWZ0ZXJfaWZfZWxzZUAxMyBtYWluX2FmdGVyX2lmX2Vsc2VAMTMgbWFpbl9hZnRlcl9pZl9lbHNlQDEzIG1haW5fdXBkYXRlQDkgbWFpbl9kZWxldGVAMTAKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDEzCgptYWluX2RlbGV0ZUAxMDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVAOToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUA4OgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuaGVsbG9fd29ybGQuY29udHJhY3QuSGVsbG9Xb3JsZC5oZWxsbyhuYW1lOiBieXRlcykgLT4gYnl0ZXM6CmhlbGxvOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2hlbGxvX3dvcmxkL2NvbnRyYWN0LnB5OjctOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgaGVsbG8oc2VsZiwgbmFtZTogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weTo5CiAgICAvLyByZXR1cm4gIkhlbGxvLCAiICsgbmFtZQogICAgcHVzaGJ5dGVzICJIZWxsbywgIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5oZWxsb193b3JsZC5jb250cmFjdC5IZWxsb1dvcmxkLmhlbGxvX3dvcmxkX2NoZWNrKG5hbWU6IGJ5dGVzKSAtPiB2b2lkOgpoZWxsb193b3JsZF9jaGVjazoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9oZWxsb193b3JsZC9jb250cmFjdC5weToxMS0xMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgaGVsbG9fd29ybGRfY2hlY2soc2VsZiwgbmFtZTogU3RyaW5nKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvaGVsbG9fd29ybGQvY29udHJhY3QucHk6MTMKICAgIC8vIGFzc2VydCBuYW1lID09ICJXb3JsZCIKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGJ5dGVzICJXb3JsZCIKICAgID09CiAgICBhc3NlcnQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5iYXNlLmNvbnRyYWN0LkltbXV0YWJpbGl0eUNvbnRyb2xBUkM0Q29udHJhY3QudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MjUKICAgIC8vIGFzc2VydCBUZW1wbGF0ZVZhcltib29sXShVUERBVEFCTEVfVEVNUExBVEVfTkFNRSksICJDaGVjayBhcHAgaXMgdXBkYXRhYmxlIgogICAgaW50Y18xIC8vIFRNUExfVVBEQVRBQkxFCiAgICBhc3NlcnQgLy8gQ2hlY2sgYXBwIGlzIHVwZGF0YWJsZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MjYKICAgIC8vIHNlbGYuYXV0aG9yaXplX2NyZWF0b3IoKQogICAgY2FsbHN1YiBhdXRob3JpemVfY3JlYXRvcgogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuUGVybWFuZW5jZUNvbnRyb2xBUkM0Q29udHJhY3QuZGVsZXRlKCkgLT4gdm9pZDoKZGVsZXRlOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MzIKICAgIC8vIGFzc2VydCBUZW1wbGF0ZVZhcltib29sXShERUxFVEFCTEVfVEVNUExBVEVfTkFNRSksICJDaGVjayBhcHAgaXMgZGVsZXRhYmxlIgogICAgaW50Y18yIC8vIFRNUExfREVMRVRBQkxFCiAgICBhc3NlcnQgLy8gQ2hlY2sgYXBwIGlzIGRlbGV0YWJsZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MzMKICAgIC8vIHNlbGYuYXV0aG9yaXplX2NyZWF0b3IoKQogICAgY2FsbHN1YiBhdXRob3JpemVfY3JlYXRvcgogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuQmFzZUFSQzRDb250cmFjdC5hdXRob3JpemVfY3JlYXRvcigpIC0+IHZvaWQ6CmF1dGhvcml6ZV9jcmVhdG9yOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJ1bmF1dGhvcml6ZWQiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gdW5hdXRob3JpemVkCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "hello(string)string": 0,
+    "hello": 0,
+    "hello_world_check(string)void": 1,
+    "hello_world_check": 1,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloArgs:
+    """Dataclass for hello arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+
+def _hello_args_to_abi(args: tuple[str] | HelloArgs) -> list[typing.Any] | None:
+    """Convert hello args into the list of ABI args expected by the app client"""
+    if isinstance(args, HelloArgs):
+        return [args.name]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloWorldCheckArgs:
+    """Dataclass for hello_world_check arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello_world_check(string)void"
+
+
+def _hello_world_check_args_to_abi(args: tuple[str] | HelloWorldCheckArgs) -> list[typing.Any] | None:
+    """Convert hello_world_check args into the list of ABI args expected by the app client"""
+    if isinstance(args, HelloWorldCheckArgs):
+        return [args.name]
+    return [*args] if args else None
+
+
+def _hello_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloArgs:
+    """Decode the args of a call of hello(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello(string)string")
+    return HelloArgs(
+        name=app_args[1][2:].decode(),
+    )
+
+
+def _hello_world_check_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloWorldCheckArgs:
+    """Decode the args of a call of hello_world_check(string)void from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello_world_check(string)void")
+    return HelloWorldCheckArgs(
+        name=app_args[1][2:].decode(),
+    )
+
+
+HelloWorldMethodArgs: typing.TypeAlias = HelloArgs | HelloWorldCheckArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    HelloWorldMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x02\xbe\xce\x11": _hello_args_from_app_args,  # hello(string)string
+    b"\xbf\x9c\x1e\xdf": _hello_world_check_args_from_app_args,  # hello_world_check(string)void
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> HelloWorldMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HelloWorldAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: HelloWorldMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x02\xbe\xce\x11": "hello(string)string",
+    b"\xbf\x9c\x1e\xdf": "hello_world_check(string)void",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> HelloWorldMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[HelloWorldAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield HelloWorldAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[HelloWorldAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[HelloWorldAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[HelloWorldAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[HelloWorldAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
+class _HelloWorldUpdate:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
+
+
+class _HelloWorldDelete:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.delete(params)
+
+
+class HelloWorldParams:
+    __slots__ = ("app_client", "_update", "_delete")
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        self._update: "_HelloWorldUpdate | None" = None
+        self._delete: "_HelloWorldDelete | None" = None
+
+    @property
+    def update(self) -> "_HelloWorldUpdate":
+        if self._update is None:
+            self._update = _HelloWorldUpdate(self.app_client)
+        return self._update
+
+    @property
+    def delete(self) -> "_HelloWorldDelete":
+        if self._delete is None:
+            self._delete = _HelloWorldDelete(self.app_client)
+        return self._delete
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
+
+    def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _hello_world_check_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello_world_check(string)void",
+            args=method_args,
+        ))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _HelloWorldUpdateTransaction:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
+class _HelloWorldDeleteTransaction:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.delete(params)
+
+
+class HelloWorldCreateTransactionParams:
+    __slots__ = ("app_client", "_update", "_delete")
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        self._update: "_HelloWorldUpdateTransaction | None" = None
+        self._delete: "_HelloWorldDeleteTransaction | None" = None
+
+    @property
+    def update(self) -> "_HelloWorldUpdateTransaction":
+        if self._update is None:
+            self._update = _HelloWorldUpdateTransaction(self.app_client)
+        return self._update
+
+    @property
+    def delete(self) -> "_HelloWorldDeleteTransaction":
+        if self._delete is None:
+            self._delete = _HelloWorldDeleteTransaction(self.app_client)
+        return self._delete
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
+
+    def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _hello_world_check_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello_world_check(string)void",
+            args=method_args,
+        ))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _HelloWorldUpdateSend:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        response = self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return response
+
+
+class _HelloWorldDeleteSend:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        
+    ) -> algokit_utils.SendAppTransactionResult:
+        response = self.app_client.send.bare.delete(
+            params=params,
+            send_params=send_params,
+            
+        )
+        return response
+
+
+class HelloWorldSend:
+    __slots__ = ("app_client", "_client", "_update", "_delete", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "HelloWorldClient | None" = None):
+        self.app_client = app_client
+        self._client = client
+        self._update: "_HelloWorldUpdateSend | None" = None
+        self._delete: "_HelloWorldDeleteSend | None" = None
+        self._batch: "_HelloWorldBatchSend | None" = None
+
+    @property
+    def update(self) -> "_HelloWorldUpdateSend":
+        if self._update is None:
+            self._update = _HelloWorldUpdateSend(self.app_client)
+        return self._update
+
+    @property
+    def delete(self) -> "_HelloWorldDeleteSend":
+        if self._delete is None:
+            self._delete = _HelloWorldDeleteSend(self.app_client)
+        return self._delete
+
+    @property
+    def batch(self) -> "_HelloWorldBatchSend":
+        if self._batch is None:
+            self._batch = _HelloWorldBatchSend(self.app_client, self._client)
+        return self._batch
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _hello_world_check_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello_world_check(string)void",
+            args=method_args,
+        ), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class HelloWorldState:
+    """Methods to access state for the current HelloWorld app"""
+
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "hello(string)string": (APP_SPEC.methods[0], None),
+    "hello": (APP_SPEC.methods[0], None),
+    "hello_world_check(string)void": (APP_SPEC.methods[1], None),
+    "hello_world_check": (APP_SPEC.methods[1], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
+class HelloWorldClient:
+    """Client for interacting with HelloWorld smart contract"""
+
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state")
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: HelloWorldParams | None = None
+        self._create_transaction: HelloWorldCreateTransactionParams | None = None
+        self._send: HelloWorldSend | None = None
+        self._state: "HelloWorldState | None" = None
+    
+    @property
+    def params(self) -> HelloWorldParams:
+        if self._params is None:
+            self._params = HelloWorldParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> HelloWorldCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = HelloWorldCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> HelloWorldSend:
+        if self._send is None:
+            self._send = HelloWorldSend(self.app_client, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "HelloWorldState":
+        if self._state is None:
+            self._state = HelloWorldState(self.app_client)
+        return self._state
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "HelloWorldClient":
+        return HelloWorldClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "HelloWorldClient":
+        return HelloWorldClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "HelloWorldClient":
+        return HelloWorldClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "HelloWorldComposer":
+        return HelloWorldComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello_world_check(string)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | str, _decode_return(return_decoder, return_value, self.app_spec.structs))
+
+
+@dataclasses.dataclass(frozen=True)
+class HelloWorldBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating HelloWorld contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class HelloWorldBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling HelloWorld contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class HelloWorldBareCallDeleteParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling HelloWorld contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.DeleteApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCallCreateParams, HelloWorldBareCallUpdateParams, HelloWorldBareCallDeleteParams]):
+    """Factory for deploying and managing HelloWorldClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = HelloWorldFactoryParams(self.app_factory)
+        self.create_transaction = HelloWorldFactoryCreateTransaction(self.app_factory)
+        self.send = HelloWorldFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: HelloWorldBareCallCreateParams | None = None,
+        update_params: HelloWorldBareCallUpdateParams | None = None,
+        delete_params: HelloWorldBareCallDeleteParams | None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params.to_algokit_utils_params() if delete_params else None,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return HelloWorldClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> HelloWorldClient:
+        """Get an app client by creator address and name"""
+        return HelloWorldClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> HelloWorldClient:
+        """Get an app client by app ID"""
+        return HelloWorldClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class HelloWorldFactoryParams:
+    """Parameters for creating transactions for HelloWorld contract"""
+
+    __slots__ = ("app_factory", "create", "update", "delete")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = HelloWorldFactoryCreateParams(app_factory)
+        self.update = HelloWorldFactoryUpdateParams(app_factory)
+        self.delete = HelloWorldFactoryDeleteParams(app_factory)
+
+class HelloWorldFactoryCreateParams:
+    """Parameters for 'create' operations of HelloWorld contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="hello(string)string",
+                args=_hello_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+    def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello_world_check(string)void ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="hello_world_check(string)void",
+                args=_hello_world_check_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+class HelloWorldFactoryUpdateParams:
+    """Parameters for 'update' operations of HelloWorld contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+class HelloWorldFactoryDeleteParams:
+    """Parameters for 'delete' operations of HelloWorld contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+
+class HelloWorldFactoryCreateTransaction:
+    """Create transactions for HelloWorld contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = HelloWorldFactoryCreateTransactionCreate(app_factory)
+
+
+class HelloWorldFactoryCreateTransactionCreate:
+    """Create new instances of HelloWorld contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+        )
+
+
+class HelloWorldFactorySend:
+    """Send calls to HelloWorld contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = HelloWorldFactorySendCreate(app_factory)
+
+
+class HelloWorldFactorySendCreate:
+    """Send create calls to HelloWorld contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[HelloWorldClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return HelloWorldClient(result[0]), result[1]
+
+
+class _HelloWorldUpdateComposer:
+    __slots__ = ("composer",)
+
+    def __init__(self, composer: "HelloWorldComposer"):
+        self.composer = composer
+
+
+class _HelloWorldDeleteComposer:
+    __slots__ = ("composer",)
+
+    def __init__(self, composer: "HelloWorldComposer"):
+        self.composer = composer
+
+
+class HelloWorldComposer:
+    """Composer for creating transaction groups for HelloWorld contract calls"""
+
+    __slots__ = ("client", "_composer", "_return_decoders", "_update", "_delete")
+
+    def __init__(self, client: "HelloWorldClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._update: "_HelloWorldUpdateComposer | None" = None
+        self._delete: "_HelloWorldDeleteComposer | None" = None
+
+    @property
+    def update(self) -> "_HelloWorldUpdateComposer":
+        if self._update is None:
+            self._update = _HelloWorldUpdateComposer(self)
+        return self._update
+
+    @property
+    def delete(self) -> "_HelloWorldDeleteComposer":
+        if self._delete is None:
+            self._delete = _HelloWorldDeleteComposer(self)
+        return self._delete
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "HelloWorldComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello(
+                args=args,
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("hello(string)string", _RETURN_DECODERS["hello(string)string"])
+        )
+        return self
+
+    def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "HelloWorldComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello_world_check(
+                args=args,
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("hello_world_check(string)void", _RETURN_DECODERS["hello_world_check(string)void"])
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "HelloWorldComposer":
+        params = params or _DEFAULT_PARAMS
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "HelloWorldComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._decode_returns(self._composer.send(send_params))
+
+
+class _HelloWorldBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "HelloWorldClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else HelloWorldClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["HelloWorldComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def hello(
+        self,
+        args: typing.Iterable[tuple[str] | HelloArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.hello(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def hello_world_check(
+        self,
+        args: typing.Iterable[tuple[str] | HelloWorldCheckArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.hello_world_check(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+
+_P = typing.ParamSpec("_P")
+_R = typing.TypeVar("_R")
+_A = typing.TypeVar("_A")
+
+
+class _AsyncRunner:
+    """Runs the blocking calls of a client in a thread pool, with at most max_concurrency calls in flight
+
+    Calls waiting for a slot are held by the runner rather than queued in the executor, so a large fan-out doesn't
+    starve other users of a shared executor
+    """
+
+    __slots__ = ("_executor", "_owns_executor", "_semaphore")
+
+    def __init__(
+        self, *, executor: concurrent.futures.Executor | None, max_workers: int, max_concurrency: int | None
+    ):
+        self._owns_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="algokit-client"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency or max_workers)
+
+    async def run(self, func: typing.Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Shut down the executor if it was created by the runner, calls already running are left to complete"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+
+class _HelloWorldUpdateAsyncSend:
+    __slots__ = ("_send", "_runner")
+
+    def __init__(self, send: "_HelloWorldUpdateSend", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+
+    async def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult:
+        return await self._runner.run(
+            self._send.bare, params=params, send_params=send_params, compilation_params=compilation_params
+        )
+
+
+class _HelloWorldBatchAsyncSend:
+    """Awaitable batches of calls of a method, sent by _HelloWorldBatchSend in a thread of the pool"""
+
+    __slots__ = ("_send", "_runner")
+
+    def __init__(self, send: "_HelloWorldBatchSend", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+
+    async def hello(
+        self,
+        args: typing.Iterable[tuple[str] | HelloArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return await self._runner.run(
+            self._send.hello,
+            args,
+            params=params,
+            send_params=send_params,
+            group_size=group_size,
+            max_in_flight=max_in_flight,
+        )
+
+    async def hello_world_check(
+        self,
+        args: typing.Iterable[tuple[str] | HelloWorldCheckArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return await self._runner.run(
+            self._send.hello_world_check,
+            args,
+            params=params,
+            send_params=send_params,
+            group_size=group_size,
+            max_in_flight=max_in_flight,
+        )
+
+
+class HelloWorldAsyncSend:
+    """Awaitable app calls of the HelloWorld app, sent by HelloWorldSend in a thread
+    pool"""
+
+    __slots__ = ("_send", "_runner", "_update", "_batch")
+
+    def __init__(self, send: "HelloWorldSend", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+        self._update: "_HelloWorldUpdateAsyncSend | None" = None
+        self._batch: "_HelloWorldBatchAsyncSend | None" = None
+
+    @property
+    def update(self) -> "_HelloWorldUpdateAsyncSend":
+        if self._update is None:
+            self._update = _HelloWorldUpdateAsyncSend(self._send.update, self._runner)
+        return self._update
+
+    @property
+    def batch(self) -> "_HelloWorldBatchAsyncSend":
+        if self._batch is None:
+            self._batch = _HelloWorldBatchAsyncSend(self._send.batch, self._runner)
+        return self._batch
+
+    async def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        return await self._runner.run(self._send.hello, args, params=params, send_params=send_params)
+
+    async def hello_world_check(
+        self,
+        args: tuple[str] | HelloWorldCheckArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return await self._runner.run(self._send.hello_world_check, args, params=params, send_params=send_params)
+
+    async def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return await self._runner.run(self._send.clear_state, params, send_params)
+
+
+class HelloWorldAsyncState:
+    """Awaitable state reads of the HelloWorld app, run by HelloWorldState in a thread pool"""
+
+    __slots__ = ("_state", "_runner")
+
+    def __init__(self, state: "HelloWorldState", runner: _AsyncRunner):
+        self._state = state
+        self._runner = runner
+
+    async def read(self, read: typing.Callable[["HelloWorldState"], _R]) -> _R:
+        """Await a read of the app's state in the thread pool, e.g.
+        `await client.state.read(lambda state: state.global_state.get_all())`
+        """
+        return await self._runner.run(read, self._state)
+
+
+class HelloWorldAsyncComposer:
+    """Composer for transaction groups of HelloWorld contract calls that are sent without blocking
+
+    Calls are added with the HelloWorldComposer in `add`, whose methods can be chained, and the group is awaited with
+    `await group.send()`
+    """
+
+    __slots__ = ("add", "_runner")
+
+    def __init__(self, composer: "HelloWorldComposer", runner: _AsyncRunner):
+        self.add = composer
+        self._runner = runner
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self.add.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self.add.send, send_params)
+
+
+class HelloWorldAsyncClient:
+    """Asyncio client for the HelloWorld app, awaiting the blocking calls of HelloWorldClient in a
+    thread pool
+
+    At most max_concurrency calls (max_workers by default) are in flight at once. Pass an executor to share a thread
+    pool between clients, it isn't shut down by the client.
+    """
+
+    __slots__ = ("client", "_runner", "_send", "_state")
+
+    def __init__(
+        self,
+        client: "HelloWorldClient",
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        max_workers: int = 8,
+        max_concurrency: int | None = None,
+    ):
+        self.client = client
+        self._runner = _AsyncRunner(executor=executor, max_workers=max_workers, max_concurrency=max_concurrency)
+        # sub-clients are created on first access, like those of the sync client
+        self._send: "HelloWorldAsyncSend | None" = None
+        self._state: "HelloWorldAsyncState | None" = None
+
+    async def __aenter__(self) -> "HelloWorldAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def send(self) -> "HelloWorldAsyncSend":
+        if self._send is None:
+            self._send = HelloWorldAsyncSend(self.client.send, self._runner)
+        return self._send
+
+    @property
+    def state(self) -> "HelloWorldAsyncState":
+        if self._state is None:
+            self._state = HelloWorldAsyncState(self.client.state, self._runner)
+        return self._state
+
+    def new_group(self) -> "HelloWorldAsyncComposer":
+        return HelloWorldAsyncComposer(self.client.new_group(), self._runner)
+
+    async def run(self, func: typing.Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        """Await any other blocking call in the client's thread pool, e.g. of `client.algorand`"""
+        return await self._runner.run(func, *args, **kwargs)
+
+    async def map(
+        self, call: typing.Callable[[_A], typing.Awaitable[_R]], items: typing.Iterable[_A]
+    ) -> list[_R]:
+        """Await call for each of items concurrently, returning the results in the order of items
+
+        e.g. `await client.map(client.send.hello, [("a",), ("b",)])`, calls beyond max_concurrency wait for a slot
+        """
+        return list(await asyncio.gather(*(call(item) for item in items)))
+
+    def close(self) -> None:
+        """Shut down the thread pool created by the client"""
+        self._runner.shutdown()
@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: 8f4440618fd97c2c387e3a97f264ce5204a4e36816a8896f0bd89bd5d86abe31
 
 # common
 import dataclasses
@@ -20,20 +21,52 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp", "OptIn"]}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "greeting"}], "name": "create", "returns": {"type": "string"}, "events": []}, {"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "greeting"}, {"type": "uint32", "name": "times"}], "name": "create", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "hello", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["CloseOut"], "create": []}, "args": [], "name": "close_out_test", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete_test", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_test", "returns": {"type": "string"}, "events": []}], "name": "LifeCycle", "state": {"keys": {"box": {}, "global": {"greeting": {"key": "Z3JlZXRpbmc=", "keyType": "AVMString", "valueType": "AVMBytes"}, "times": {"key": "dGltZXM=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMubGlmZV9jeWNsZS5jb250cmFjdC5MaWZlQ3ljbGUuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMSAwIDEwIFRNUExfVVBEQVRBQkxFCiAgICBieXRlY2Jsb2NrICJncmVldGluZyIgInRpbWVzIiAiIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToxMQogICAgLy8gc2VsZi5ncmVldGluZyA9IFN0cmluZygiSGVsbG8iKQogICAgYnl0ZWNfMCAvLyAiZ3JlZXRpbmciCiAgICBwdXNoYnl0ZXMgIkhlbGxvIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjEyCiAgICAvLyBzZWxmLnRpbWVzID0gVUludDY0KDEpCiAgICBieXRlY18xIC8vICJ0aW1lcyIKICAgIGludGNfMCAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTo2CiAgICAvLyBjbGFzcyBMaWZlQ3ljbGUoSW1tdXRhYmlsaXR5Q29udHJvbEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTIKICAgIHB1c2hieXRlc3MgMHg5N2YxZmMxMSAweDYwMTkzMjY0IDB4MDJiZWNlMTEgMHhhYjA2YzFhOCAweGEwMjZmOGRkIDB4MWIzYmYyMDMgMHg1M2U2YjhjNyAvLyBtZXRob2QgImNyZWF0ZShzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGUoc3RyaW5nLHVpbnQzMil2b2lkIiwgbWV0aG9kICJoZWxsbyhzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJoZWxsbygpc3RyaW5nIiwgbWV0aG9kICJjbG9zZV9vdXRfdGVzdCgpc3RyaW5nIiwgbWV0aG9kICJkZWxldGVfdGVzdCgpc3RyaW5nIiwgbWV0aG9kICJ1cGRhdGVfdGVzdCgpc3RyaW5nIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfcm91dGVANSBtYWluX2NyZWF0ZV9yb3V0ZUA2IG1haW5faGVsbG9fcm91dGVANyBtYWluX2hlbGxvX3JvdXRlQDggbWFpbl9jbG9zZV9vdXRfdGVzdF9yb3V0ZUA5IG1haW5fZGVsZXRlX3Rlc3Rfcm91dGVAMTAgbWFpbl91cGRhdGVfdGVzdF9yb3V0ZUAxMQoKbWFpbl9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6NgogICAgLy8gY2xhc3MgTGlmZUN5Y2xlKEltbXV0YWJpbGl0eUNvbnRyb2xBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl91cGRhdGVfdGVzdF9yb3V0ZUAxMToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDQgLy8gVXBkYXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBVcGRhdGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMGI3NTcwNjQ2MTc0NjU1Zjc0NjU3Mzc0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX3Rlc3Rfcm91dGVAMTA6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTo0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDBiNjQ2NTZjNjU3NDY1NWY3NDY1NzM3NAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2Nsb3NlX291dF90ZXN0X3JvdXRlQDk6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTo0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJDbG9zZU91dCJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCAyIC8vIENsb3NlT3V0CiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgQ2xvc2VPdXQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDBlNjM2YzZmNzM2NTVmNmY3NTc0NWY3NDY1NzM3NAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2hlbGxvX3JvdXRlQDg6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTozNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKG5hbWU9ImhlbGxvIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBoZWxsb19ub19hcmcKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2hlbGxvX3JvdXRlQDc6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjYKICAgIC8vIGNsYXNzIExpZmVDeWNsZShJbW11dGFiaWxpdHlDb250cm9sQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGhlbGxvCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfcm91dGVANjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QobmFtZT0iY3JlYXRlIiwgY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTo2CiAgICAvLyBjbGFzcyBMaWZlQ3ljbGUoSW1tdXRhYmlsaXR5Q29udHJvbEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChuYW1lPSJjcmVhdGUiLCBjcmVhdGU9InJlcXVpcmUiKQogICAgY2FsbHN1YiBjcmVhdGVfMmFyZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfcm91dGVANToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QobmFtZT0iY3JlYXRlIiwgY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTo2CiAgICAvLyBjbGFzcyBMaWZlQ3ljbGUoSW1tdXRhYmlsaXR5Q29udHJvbEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChuYW1lPSJjcmVhdGUiLCBjcmVhdGU9InJlcXVpcmUiKQogICAgY2FsbHN1YiBjcmVhdGVfMWFyZwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEyOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6NgogICAgLy8gY2xhc3MgTGlmZUN5Y2xlKEltbXV0YWJpbGl0eUNvbnRyb2xBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc3dpdGNoIG1haW5fY3JlYXRlQDEzIG1haW5fY3JlYXRlQDEzIG1haW5fYWZ0ZXJfaWZfZWxzZUAxNSBtYWluX2FmdGVyX2lmX2Vsc2VAMTUgbWFpbl91cGRhdGVAMTQKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDE1CgptYWluX3VwZGF0ZUAxNDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVAMTM6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToxNAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChjcmVhdGU9InJlcXVpcmUiLCBhbGxvd19hY3Rpb25zPVsiTm9PcCIsICJPcHRJbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMubGlmZV9jeWNsZS5jb250cmFjdC5MaWZlQ3ljbGUuY3JlYXRlXzFhcmcoZ3JlZXRpbmc6IGJ5dGVzKSAtPiBieXRlczoKY3JlYXRlXzFhcmc6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToxOC0xOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKG5hbWU9ImNyZWF0ZSIsIGNyZWF0ZT0icmVxdWlyZSIpCiAgICAvLyBkZWYgY3JlYXRlXzFhcmcoc2VsZiwgZ3JlZXRpbmc6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToyMAogICAgLy8gc2VsZi5ncmVldGluZyA9IGdyZWV0aW5nCiAgICBieXRlY18wIC8vICJncmVldGluZyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjIyCiAgICAvLyByZXR1cm4gZ3JlZXRpbmcgKyBTdHJpbmcoIl8iKSArIHNlbGYuaXRvYShzZWxmLnRpbWVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgIl8iCiAgICBjb25jYXQKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJ0aW1lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aW1lcyBleGlzdHMKICAgIGNhbGxzdWIgaXRvYQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMubGlmZV9jeWNsZS5jb250cmFjdC5MaWZlQ3ljbGUuY3JlYXRlXzJhcmcoZ3JlZXRpbmc6IGJ5dGVzLCB0aW1lczogYnl0ZXMpIC0+IHZvaWQ6CmNyZWF0ZV8yYXJnOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MjQtMjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChuYW1lPSJjcmVhdGUiLCBjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGNyZWF0ZV8yYXJnKHNlbGYsIGdyZWV0aW5nOiBTdHJpbmcsIHRpbWVzOiBhcmM0LlVJbnQzMikgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MjYKICAgIC8vIHNlbGYuZ3JlZXRpbmcgPSBncmVldGluZwogICAgYnl0ZWNfMCAvLyAiZ3JlZXRpbmciCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weToyNwogICAgLy8gc2VsZi50aW1lcyA9IHRpbWVzLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBieXRlY18xIC8vICJ0aW1lcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMubGlmZV9jeWNsZS5jb250cmFjdC5MaWZlQ3ljbGUuaGVsbG8obmFtZTogYnl0ZXMpIC0+IGJ5dGVzOgpoZWxsbzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjI5LTMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MzEKICAgIC8vIHJlc3VsdCA9IFN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gIiIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi50aW1lcyk6ICAjIG5vcWE6IEIwMDcKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJ0aW1lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aW1lcyBleGlzdHMKICAgIGludGNfMSAvLyAwCgpoZWxsb19mb3JfaGVhZGVyQDE6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTozMgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYudGltZXMpOiAgIyBub3FhOiBCMDA3CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGhlbGxvX2FmdGVyX2ZvckA0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTozMwogICAgLy8gcmVzdWx0ICs9IHNlbGYuZ3JlZXRpbmcgKyBTdHJpbmcoIiwgIikgKyBuYW1lICsgU3RyaW5nKCJcbiIpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ3JlZXRpbmciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ3JlZXRpbmcgZXhpc3RzCiAgICBwdXNoYnl0ZXMgIiwgIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzICJcbiIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbGlmZV9jeWNsZS9jb250cmFjdC5weTozMgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYudGltZXMpOiAgIyBub3FhOiBCMDA3CiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBoZWxsb19mb3JfaGVhZGVyQDEKCmhlbGxvX2FmdGVyX2ZvckA0OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MzUKICAgIC8vIHJldHVybiByZXN1bHQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5saWZlX2N5Y2xlLmNvbnRyYWN0LkxpZmVDeWNsZS5oZWxsb19ub19hcmcoKSAtPiBieXRlczoKaGVsbG9fbm9fYXJnOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MzctMzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChuYW1lPSJoZWxsbyIpCiAgICAvLyBkZWYgaGVsbG9fbm9fYXJnKHNlbGYpIC0+IFN0cmluZzoKICAgIHByb3RvIDAgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6MzkKICAgIC8vIHJlc3VsdCA9IFN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gIiIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjQwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi50aW1lcyk6ICAjIG5vcWE6IEIwMDcKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJ0aW1lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aW1lcyBleGlzdHMKICAgIGludGNfMSAvLyAwCgpoZWxsb19ub19hcmdfZm9yX2hlYWRlckAxOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2xpZmVfY3ljbGUvY29udHJhY3QucHk6NDAKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLnRpbWVzKTogICMgbm9xYTogQjAwNwogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBoZWxsb19ub19hcmdfYWZ0ZXJfZm9yQDQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjQxCiAgICAvLyByZXN1bHQgKz0gc2VsZi5ncmVldGluZyArIFN0cmluZygiLCBteXN0ZXJ5IHBlcnNvblxuIikKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJncmVldGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ncmVldGluZyBleGlzdHMKICAgIHB1c2hieXRlcyAiLCBteXN0ZXJ5IHBlcnNvblxuIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjQwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi50aW1lcyk6ICAjIG5vcWE6IEIwMDcKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGhlbGxvX25vX2FyZ19mb3JfaGVhZGVyQDEKCmhlbGxvX25vX2FyZ19hZnRlcl9mb3JANDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9saWZlX2N5Y2xlL2NvbnRyYWN0LnB5OjQzCiAgICAvLyByZXR1cm4gcmVzdWx0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuYmFzZS5jb250cmFjdC5JbW11dGFiaWxpdHlDb250cm9sQVJDNENvbnRyYWN0LnVwZGF0ZSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oVVBEQVRBQkxFX1RFTVBMQVRFX05BTUUpLCAiQ2hlY2sgYXBwIGlzIHVwZGF0YWJsZSIKICAgIGludGNfMyAvLyBUTVBMX1VQREFUQUJMRQogICAgYXNzZXJ0IC8vIENoZWNrIGFwcCBpcyB1cGRhdGFibGUKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAidW5hdXRob3JpemVkIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuQmFzZUFSQzRDb250cmFjdC5pdG9hKGk6IHVpbnQ2NCkgLT4gYnl0ZXM6Cml0b2E6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxMi0xMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpdG9hKHNlbGYsIGk6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICBieXRlY18yIC8vICIiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNAogICAgLy8gaWYgaSA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJueiBpdG9hX2Vsc2VfYm9keUAyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNQogICAgLy8gcmV0dXJuIFN0cmluZygiMCIpCiAgICBwdXNoYnl0ZXMgIjAiCiAgICBzd2FwCiAgICByZXRzdWIKCml0b2FfZWxzZV9ib2R5QDI6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNwogICAgLy8gcmV0dXJuIChzZWxmLml0b2EoaSAvLyBVSW50NjQoMTApKSBpZiAoaSAvLyBVSW50NjQoMTApKSA+IFVJbnQ2NCgwKSBlbHNlIFN0cmluZygiIikpICsgU3RyaW5nLmZyb21fYnl0ZXMoCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAxMAogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IGl0b2FfdGVybmFyeV9mYWxzZUA0CiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBpdG9hCgppdG9hX3Rlcm5hcnlfbWVyZ2VANToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBTdHJpbmcoIjAxMjM0NTY3ODkiKS5ieXRlc1tpICUgVUludDY0KDEwKV0KICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDEwCiAgICAlCiAgICBwdXNoYnl0ZXMgIjAxMjM0NTY3ODkiCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3LTE5CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIC8vICAgICBTdHJpbmcoIjAxMjM0NTY3ODkiKS5ieXRlc1tpICUgVUludDY0KDEwKV0KICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgcmV0c3ViCgppdG9hX3Rlcm5hcnlfZmFsc2VANDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGIgaXRvYV90ZXJuYXJ5X21lcmdlQDUK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "create(string)string": 0,
+    "create(string,uint32)void": 1,
+    "hello(string)string": 2,
+    "hello()string": 3,
+    "close_out_test()string": 4,
+    "close_out_test": 4,
+    "delete_test()string": 5,
+    "delete_test": 5,
+    "update_test()string": 6,
+    "update_test": 6,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,28 +76,41 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
+
+class _ReadCaches:
+    """The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them"""
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+    __slots__ = ("state_cache",)
+
+    def __init__(self) -> None:
+        self.state_cache: "_StateCache | None" = None
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        """Evict the enabled caches once transactions with these confirmations are confirmed"""
+        confirmations = list(confirmations)
+        if self.state_cache is not None:
+            self.state_cache.invalidate(confirmations)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class HelloStringStringArgs:
     """Dataclass for hello_string_string arguments"""
     name: str
@@ -73,7 +119,14 @@ class HelloStringStringArgs:
     def abi_method_signature(self) -> str:
         return "hello(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _hello_string_string_args_to_abi(args: tuple[str] | HelloStringStringArgs) -> list[typing.Any] | None:
+    """Convert hello_string_string args into the list of ABI args expected by the app client"""
+    if isinstance(args, HelloStringStringArgs):
+        return [args.name]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateStringStringArgs:
     """Dataclass for create_string_string arguments"""
     greeting: str
@@ -82,7 +135,14 @@ class CreateStringStringArgs:
     def abi_method_signature(self) -> str:
         return "create(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _create_string_string_args_to_abi(args: tuple[str] | CreateStringStringArgs) -> list[typing.Any] | None:
+    """Convert create_string_string args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateStringStringArgs):
+        return [args.greeting]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateStringUint32VoidArgs:
     """Dataclass for create_string_uint32_void arguments"""
     greeting: str
@@ -93,7 +153,346 @@ class CreateStringUint32VoidArgs:
         return "create(string,uint32)void"
 
 
+def _create_string_uint32_void_args_to_abi(args: tuple[str, int] | CreateStringUint32VoidArgs) -> list[typing.Any] | None:
+    """Convert create_string_uint32_void args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateStringUint32VoidArgs):
+        return [args.greeting, args.times]
+    return [*args] if args else None
+
+
+def _hello_string_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloStringStringArgs:
+    """Decode the args of a call of hello(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello(string)string")
+    return HelloStringStringArgs(
+        name=app_args[1][2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloStringArgs:
+    """Dataclass for hello_string arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello()string"
+
+
+def _hello_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloStringArgs:
+    """Decode the args of a call of hello()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello()string")
+    return HelloStringArgs()
+
+
+def _create_string_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateStringStringArgs:
+    """Decode the args of a call of create(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create(string)string")
+    return CreateStringStringArgs(
+        greeting=app_args[1][2:].decode(),
+    )
+
+
+def _create_string_uint32_void_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateStringUint32VoidArgs:
+    """Decode the args of a call of create(string,uint32)void from its app args"""
+    if not (
+        len(app_args) == 3
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+        and len(app_args[2]) == 4
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create(string,uint32)void")
+    return CreateStringUint32VoidArgs(
+        greeting=app_args[1][2:].decode(),
+        times=int.from_bytes(app_args[2], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class UpdateTestArgs:
+    """Dataclass for update_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "update_test()string"
+
+
+def _update_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> UpdateTestArgs:
+    """Decode the args of a call of update_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of update_test()string")
+    return UpdateTestArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DeleteTestArgs:
+    """Dataclass for delete_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "delete_test()string"
+
+
+def _delete_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DeleteTestArgs:
+    """Decode the args of a call of delete_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of delete_test()string")
+    return DeleteTestArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CloseOutTestArgs:
+    """Dataclass for close_out_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_out_test()string"
+
+
+def _close_out_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CloseOutTestArgs:
+    """Decode the args of a call of close_out_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of close_out_test()string")
+    return CloseOutTestArgs()
+
+
+LifeCycleMethodArgs: typing.TypeAlias = HelloStringStringArgs | HelloStringArgs | CreateStringStringArgs | CreateStringUint32VoidArgs | UpdateTestArgs | DeleteTestArgs | CloseOutTestArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    LifeCycleMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x02\xbe\xce\x11": _hello_string_string_args_from_app_args,  # hello(string)string
+    b"\xab\x06\xc1\xa8": _hello_string_args_from_app_args,  # hello()string
+    b"\x97\xf1\xfc\x11": _create_string_string_args_from_app_args,  # create(string)string
+    b"\x60\x19\x32\x64": _create_string_uint32_void_args_from_app_args,  # create(string,uint32)void
+    b"\x53\xe6\xb8\xc7": _update_test_args_from_app_args,  # update_test()string
+    b"\x1b\x3b\xf2\x03": _delete_test_args_from_app_args,  # delete_test()string
+    b"\xa0\x26\xf8\xdd": _close_out_test_args_from_app_args,  # close_out_test()string
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> LifeCycleMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LifeCycleAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: LifeCycleMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x02\xbe\xce\x11": "hello(string)string",
+    b"\xab\x06\xc1\xa8": "hello()string",
+    b"\x97\xf1\xfc\x11": "create(string)string",
+    b"\x60\x19\x32\x64": "create(string,uint32)void",
+    b"\x53\xe6\xb8\xc7": "update_test()string",
+    b"\x1b\x3b\xf2\x03": "delete_test()string",
+    b"\xa0\x26\xf8\xdd": "close_out_test()string",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> LifeCycleMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[LifeCycleAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield LifeCycleAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[LifeCycleAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[LifeCycleAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[LifeCycleAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[LifeCycleAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class _LifeCycleUpdate:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -108,15 +507,17 @@ class _LifeCycleUpdate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppUpdateMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_test()string",
-        }))
+        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_test()string",
+        ))
 
 
 class _LifeCycleDelete:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -125,14 +526,16 @@ class _LifeCycleDelete:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppDeleteMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_test()string",
+        ))
 
 
 class _LifeCycleCloseOut:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -141,78 +544,89 @@ class _LifeCycleCloseOut:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.close_out(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close_out_test()string",
+        ))
 
 
 class LifeCycleParams:
+    __slots__ = ("app_client", "_update", "_delete", "_close_out")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_LifeCycleUpdate | None" = None
+        self._delete: "_LifeCycleDelete | None" = None
+        self._close_out: "_LifeCycleCloseOut | None" = None
 
     @property
     def update(self) -> "_LifeCycleUpdate":
-        return _LifeCycleUpdate(self.app_client)
+        if self._update is None:
+            self._update = _LifeCycleUpdate(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_LifeCycleDelete":
-        return _LifeCycleDelete(self.app_client)
+        if self._delete is None:
+            self._delete = _LifeCycleDelete(self.app_client)
+        return self._delete
 
     @property
     def close_out(self) -> "_LifeCycleCloseOut":
-        return _LifeCycleCloseOut(self.app_client)
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOut(self.app_client)
+        return self._close_out
 
     def hello_string_string(
         self,
         args: tuple[str] | HelloStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        method_args = _hello_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
 
     def hello_string(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello()string",
+        ))
 
     def create_string_string(
         self,
         args: tuple[str] | CreateStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }))
+        method_args = _create_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string)string",
+            args=method_args,
+        ))
 
     def create_string_uint32_void(
         self,
         args: tuple[str, int] | CreateStringUint32VoidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }))
+        method_args = _create_string_uint32_void_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,uint32)void",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -226,6 +640,8 @@ class LifeCycleParams:
 
 
 class _LifeCycleUpdateTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -238,15 +654,17 @@ class _LifeCycleUpdateTransaction:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_test()string",
-        }))
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_test()string",
+        ))
 
 
 class _LifeCycleDeleteTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -255,14 +673,16 @@ class _LifeCycleDeleteTransaction:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_test()string",
+        ))
 
 
 class _LifeCycleCloseOutTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -271,78 +691,89 @@ class _LifeCycleCloseOutTransaction:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close_out_test()string",
+        ))
 
 
 class LifeCycleCreateTransactionParams:
+    __slots__ = ("app_client", "_update", "_delete", "_close_out")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_LifeCycleUpdateTransaction | None" = None
+        self._delete: "_LifeCycleDeleteTransaction | None" = None
+        self._close_out: "_LifeCycleCloseOutTransaction | None" = None
 
     @property
     def update(self) -> "_LifeCycleUpdateTransaction":
-        return _LifeCycleUpdateTransaction(self.app_client)
+        if self._update is None:
+            self._update = _LifeCycleUpdateTransaction(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_LifeCycleDeleteTransaction":
-        return _LifeCycleDeleteTransaction(self.app_client)
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteTransaction(self.app_client)
+        return self._delete
 
     @property
     def close_out(self) -> "_LifeCycleCloseOutTransaction":
-        return _LifeCycleCloseOutTransaction(self.app_client)
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutTransaction(self.app_client)
+        return self._close_out
 
     def hello_string_string(
         self,
         args: tuple[str] | HelloStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        method_args = _hello_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
 
     def hello_string(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello()string",
+        ))
 
     def create_string_string(
         self,
         args: tuple[str] | CreateStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }))
+        method_args = _create_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string)string",
+            args=method_args,
+        ))
 
     def create_string_uint32_void(
         self,
         args: tuple[str, int] | CreateStringUint32VoidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }))
+        method_args = _create_string_uint32_void_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,uint32)void",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -356,8 +787,11 @@ class LifeCycleCreateTransactionParams:
 
 
 class _LifeCycleUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def bare(
         self,
@@ -365,11 +799,14 @@ class _LifeCycleUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.update(
+        response = self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
             compilation_params=compilation_params
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
     def update_test(
         self,
@@ -378,19 +815,24 @@ class _LifeCycleUpdateSend:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
-        params = params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_test()string",
-        }), send_params=send_params, compilation_params=compilation_params)
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_test()string",
+        ), send_params=send_params, compilation_params=compilation_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppUpdateTransactionResult[str], parsed_response)
 
 
 class _LifeCycleDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def delete_test(
         self,
@@ -398,18 +840,23 @@ class _LifeCycleDeleteSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_test()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class _LifeCycleCloseOutSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def close_out_test(
         self,
@@ -417,30 +864,52 @@ class _LifeCycleCloseOutSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close_out_test()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class LifeCycleSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_client", "_update", "_delete", "_close_out", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "LifeCycleClient | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._update: "_LifeCycleUpdateSend | None" = None
+        self._delete: "_LifeCycleDeleteSend | None" = None
+        self._close_out: "_LifeCycleCloseOutSend | None" = None
+        self._batch: "_LifeCycleBatchSend | None" = None
 
     @property
     def update(self) -> "_LifeCycleUpdateSend":
-        return _LifeCycleUpdateSend(self.app_client)
+        if self._update is None:
+            self._update = _LifeCycleUpdateSend(self.app_client, self._caches)
+        return self._update
 
     @property
     def delete(self) -> "_LifeCycleDeleteSend":
-        return _LifeCycleDeleteSend(self.app_client)
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteSend(self.app_client, self._caches)
+        return self._delete
 
     @property
     def close_out(self) -> "_LifeCycleCloseOutSend":
-        return _LifeCycleCloseOutSend(self.app_client)
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutSend(self.app_client, self._caches)
+        return self._close_out
+
+    @property
+    def batch(self) -> "_LifeCycleBatchSend":
+        if self._batch is None:
+            self._batch = _LifeCycleBatchSend(self.app_client, self._client)
+        return self._batch
 
     def hello_string_string(
         self,
@@ -448,13 +917,15 @@ class LifeCycleSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _hello_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -464,11 +935,13 @@ class LifeCycleSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -478,13 +951,15 @@ class LifeCycleSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _create_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -494,13 +969,15 @@ class LifeCycleSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _create_string_uint32_void_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,uint32)void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -509,10 +986,13 @@ class LifeCycleSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
+        response = self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -520,61 +1000,213 @@ class GlobalStateValue(typing.TypedDict):
     greeting: bytes
     times: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    greeting: bytes
+    times: int
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
 class LifeCycleState:
     """Methods to access state for the current LifeCycle app"""
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_global_state")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
 
     @property
-    def global_state(
-        self
-    ) -> "_GlobalState":
-            """Methods to access global_state for the current app"""
-            return _GlobalState(self.app_client)
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
 
 class _GlobalState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
-        result = self.app_client.state.global_state.get_all()
-        if not result:
-            return typing.cast(GlobalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(GlobalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        return typing.cast(GlobalStateValue, result)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            greeting=typing.cast(bytes, _decode_state_value(state.get("Z3JlZXRpbmc="), "AVMBytes")),
+            times=typing.cast(int, _decode_state_value(state.get("dGltZXM="), "AVMUint64")),
+        )
 
     @property
     def greeting(self) -> bytes:
         """Get the current value of the greeting key in global_state state"""
-        value = self.app_client.state.global_state.get_value("greeting")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "greeting"), lambda: self.app_client.state.global_state.get_value("greeting"))
         return typing.cast(bytes, value)
 
     @property
     def times(self) -> int:
         """Get the current value of the times key in global_state state"""
-        value = self.app_client.state.global_state.get_value("times")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "times"), lambda: self.app_client.state.global_state.get_value("times"))
         return typing.cast(int, value)
 
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "hello(string)string": (APP_SPEC.methods[2], None),
+    "hello()string": (APP_SPEC.methods[3], None),
+    "create(string)string": (APP_SPEC.methods[0], None),
+    "create(string,uint32)void": (APP_SPEC.methods[1], None),
+    "update_test()string": (APP_SPEC.methods[6], None),
+    "update_test": (APP_SPEC.methods[6], None),
+    "delete_test()string": (APP_SPEC.methods[5], None),
+    "delete_test": (APP_SPEC.methods[5], None),
+    "close_out_test()string": (APP_SPEC.methods[4], None),
+    "close_out_test": (APP_SPEC.methods[4], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
 class LifeCycleClient:
     """Client for interacting with LifeCycle smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state", "_caches")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -621,10 +1253,44 @@ class LifeCycleClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = LifeCycleParams(self.app_client)
-        self.create_transaction = LifeCycleCreateTransactionParams(self.app_client)
-        self.send = LifeCycleSend(self.app_client)
-        self.state = LifeCycleState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: LifeCycleParams | None = None
+        self._create_transaction: LifeCycleCreateTransactionParams | None = None
+        self._send: LifeCycleSend | None = None
+        self._state: "LifeCycleState | None" = None
+        self._caches = _ReadCaches()
+    
+    @property
+    def params(self) -> LifeCycleParams:
+        if self._params is None:
+            self._params = LifeCycleParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> LifeCycleCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = LifeCycleCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> LifeCycleSend:
+        if self._send is None:
+            self._send = LifeCycleSend(self.app_client, self._caches, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "LifeCycleState":
+        if self._state is None:
+            self._state = LifeCycleState(self.app_client, self._caches)
+        return self._state
+
+    def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+        """Cache the state read through `state`, in an LRU of up to max_entries reads
+    
+        Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+        when a transaction sent through `send` or `new_group()` is confirmed
+        """
+        self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
 
     @staticmethod
     def from_creator_and_name(
@@ -773,18 +1439,10 @@ class LifeCycleClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | str, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -986,6 +1644,8 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
 class LifeCycleFactoryParams:
     """Parameters for creating transactions for LifeCycle contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = LifeCycleFactoryCreateParams(app_factory)
@@ -995,6 +1655,8 @@ class LifeCycleFactoryParams:
 class LifeCycleFactoryCreateParams:
     """Parameters for 'create' operations of LifeCycle contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1005,9 +1667,9 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def hello_string_string(
@@ -1018,14 +1680,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the hello(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "hello(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="hello(string)string",
+                args=_hello_string_string_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1037,14 +1697,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the hello()string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "hello()string",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="hello()string",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1057,14 +1715,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the create(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "create(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="create(string)string",
+                args=_create_string_string_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1077,14 +1733,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the create(string,uint32)void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "create(string,uint32)void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="create(string,uint32)void",
+                args=_create_string_uint32_void_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1096,14 +1750,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the update_test()string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "update_test()string",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="update_test()string",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1115,14 +1767,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the delete_test()string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "delete_test()string",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="delete_test()string",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1134,14 +1784,12 @@ class LifeCycleFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the close_out_test()string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "close_out_test()string",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="close_out_test()string",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1149,6 +1797,8 @@ class LifeCycleFactoryCreateParams:
 class LifeCycleFactoryUpdateParams:
     """Parameters for 'update' operations of LifeCycle contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1159,14 +1809,16 @@ class LifeCycleFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class LifeCycleFactoryDeleteParams:
     """Parameters for 'delete' operations of LifeCycle contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1177,15 +1829,17 @@ class LifeCycleFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class LifeCycleFactoryCreateTransaction:
     """Create transactions for LifeCycle contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = LifeCycleFactoryCreateTransactionCreate(app_factory)
@@ -1194,6 +1848,8 @@ class LifeCycleFactoryCreateTransaction:
 class LifeCycleFactoryCreateTransactionCreate:
     """Create new instances of LifeCycle contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1202,15 +1858,17 @@ class LifeCycleFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class LifeCycleFactorySend:
     """Send calls to LifeCycle contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = LifeCycleFactorySendCreate(app_factory)
@@ -1219,6 +1877,8 @@ class LifeCycleFactorySend:
 class LifeCycleFactorySendCreate:
     """Send create calls to LifeCycle contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1230,9 +1890,9 @@ class LifeCycleFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[LifeCycleClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -1247,14 +1907,12 @@ class LifeCycleFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
             """Creates and sends a transaction using the create(string)string ABI method"""
-            params = params or algokit_utils.CommonAppCallCreateParams()
+            params = params or _DEFAULT_CREATE_PARAMS
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
-                    **{
-                    **dataclasses.asdict(params),
-                    "method": "create(string)string",
-                    "args": _parse_abi_args(args),
-                    }
+                    **_params_fields(params),
+                    method="create(string)string",
+                    args=_create_string_string_args_to_abi(args),
                 ),
                 send_params=send_params,
                 compilation_params=compilation_params
@@ -1285,14 +1943,12 @@ class LifeCycleFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the create(string,uint32)void ABI method"""
-            params = params or algokit_utils.CommonAppCallCreateParams()
+            params = params or _DEFAULT_CREATE_PARAMS
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
-                    **{
-                    **dataclasses.asdict(params),
-                    "method": "create(string,uint32)void",
-                    "args": _parse_abi_args(args),
-                    }
+                    **_params_fields(params),
+                    method="create(string,uint32)void",
+                    args=_create_string_uint32_void_args_to_abi(args),
                 ),
                 send_params=send_params,
                 compilation_params=compilation_params
@@ -1316,6 +1972,8 @@ class LifeCycleFactorySendCreate:
 
 
 class _LifeCycleUpdateComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "LifeCycleComposer"):
         self.composer = composer
     def update_test(
@@ -1330,15 +1988,15 @@ class _LifeCycleUpdateComposer:
                 compilation_params=compilation_params
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "update_test()string", v
-            )
+        self.composer._return_decoders.append(
+            ("update_test()string", _RETURN_DECODERS["update_test()string"])
         )
         return self.composer
 
 
 class _LifeCycleDeleteComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "LifeCycleComposer"):
         self.composer = composer
     def delete_test(
@@ -1352,15 +2010,15 @@ class _LifeCycleDeleteComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "delete_test()string", v
-            )
+        self.composer._return_decoders.append(
+            ("delete_test()string", _RETURN_DECODERS["delete_test()string"])
         )
         return self.composer
 
 
 class _LifeCycleCloseOutComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "LifeCycleComposer"):
         self.composer = composer
     def close_out_test(
@@ -1374,10 +2032,8 @@ class _LifeCycleCloseOutComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "close_out_test()string", v
-            )
+        self.composer._return_decoders.append(
+            ("close_out_test()string", _RETURN_DECODERS["close_out_test()string"])
         )
         return self.composer
 
@@ -1385,22 +2041,34 @@ class _LifeCycleCloseOutComposer:
 class LifeCycleComposer:
     """Composer for creating transaction groups for LifeCycle contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_update", "_delete", "_close_out")
+
     def __init__(self, client: "LifeCycleClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._update: "_LifeCycleUpdateComposer | None" = None
+        self._delete: "_LifeCycleDeleteComposer | None" = None
+        self._close_out: "_LifeCycleCloseOutComposer | None" = None
 
     @property
     def update(self) -> "_LifeCycleUpdateComposer":
-        return _LifeCycleUpdateComposer(self)
+        if self._update is None:
+            self._update = _LifeCycleUpdateComposer(self)
+        return self._update
 
     @property
     def delete(self) -> "_LifeCycleDeleteComposer":
-        return _LifeCycleDeleteComposer(self)
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteComposer(self)
+        return self._delete
 
     @property
     def close_out(self) -> "_LifeCycleCloseOutComposer":
-        return _LifeCycleCloseOutComposer(self)
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutComposer(self)
+        return self._close_out
 
     def hello_string_string(
         self,
@@ -1413,10 +2081,8 @@ class LifeCycleComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "hello(string)string", v
-            )
+        self._return_decoders.append(
+            ("hello(string)string", _RETURN_DECODERS["hello(string)string"])
         )
         return self
 
@@ -1430,10 +2096,8 @@ class LifeCycleComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "hello()string", v
-            )
+        self._return_decoders.append(
+            ("hello()string", _RETURN_DECODERS["hello()string"])
         )
         return self
 
@@ -1448,10 +2112,8 @@ class LifeCycleComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "create(string)string", v
-            )
+        self._return_decoders.append(
+            ("create(string)string", _RETURN_DECODERS["create(string)string"])
         )
         return self
 
@@ -1466,10 +2128,8 @@ class LifeCycleComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "create(string,uint32)void", v
-            )
+        self._return_decoders.append(
+            ("create(string,uint32)void", _RETURN_DECODERS["create(string,uint32)void"])
         )
         return self
 
@@ -1479,15 +2139,10 @@ class LifeCycleComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "LifeCycleComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -1501,6 +2156,25 @@ class LifeCycleComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -1511,18 +2185,128 @@ class LifeCycleComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _LifeCycleBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "LifeCycleClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else LifeCycleClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["LifeCycleComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def hello_string_string(
+        self,
+        args: typing.Iterable[tuple[str] | HelloStringStringArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.hello_string_string(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create_string_string(
+        self,
+        args: typing.Iterable[tuple[str] | CreateStringStringArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create_string_string(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create_string_uint32_void(
+        self,
+        args: typing.Iterable[tuple[str, int] | CreateStringUint32VoidArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create_string_uint32_void(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
@@ -0,0 +1,111 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+import importlib
+import typing
+
+from ._app_spec import (
+    APP_SPEC,
+)
+from .args import (
+    HelloStringStringArgs,
+    CreateStringStringArgs,
+    CreateStringUint32VoidArgs,
+)
+from .params import (
+    LifeCycleParams,
+)
+from .create_transaction import (
+    LifeCycleCreateTransactionParams,
+)
+from .send import (
+    LifeCycleSend,
+)
+from .client import (
+    LifeCycleClient,
+)
+
+__all__ = [
+    "APP_SPEC",
+    "HelloStringStringArgs",
+    "CreateStringStringArgs",
+    "CreateStringUint32VoidArgs",
+    "LifeCycleParams",
+    "LifeCycleCreateTransactionParams",
+    "LifeCycleSend",
+    "GlobalStateValue",
+    "GlobalStateSnapshot",
+    "LifeCycleState",
+    "LifeCycleClient",
+    "LifeCycleMethodCallCreateParams",
+    "LifeCycleBareCallCreateParams",
+    "LifeCycleMethodCallUpdateParams",
+    "LifeCycleBareCallUpdateParams",
+    "LifeCycleMethodCallDeleteParams",
+    "LifeCycleFactory",
+    "LifeCycleFactoryParams",
+    "LifeCycleFactoryCreateParams",
+    "LifeCycleFactoryUpdateParams",
+    "LifeCycleFactoryDeleteParams",
+    "LifeCycleFactoryCreateTransaction",
+    "LifeCycleFactoryCreateTransactionCreate",
+    "LifeCycleFactorySend",
+    "LifeCycleFactorySendCreate",
+    "LifeCycleComposer",
+    "HelloStringArgs",
+    "UpdateTestArgs",
+    "DeleteTestArgs",
+    "CloseOutTestArgs",
+    "LifeCycleMethodArgs",
+    "decode_app_call",
+    "LifeCycleAppCall",
+    "extract_app_calls",
+]
+
+# Symbols that are imported from their module on first access
+_LAZY_IMPORTS = {
+    "GlobalStateValue": ".state",
+    "GlobalStateSnapshot": ".state",
+    "LifeCycleState": ".state",
+    "LifeCycleMethodCallCreateParams": ".factory",
+    "LifeCycleBareCallCreateParams": ".factory",
+    "LifeCycleMethodCallUpdateParams": ".factory",
+    "LifeCycleBareCallUpdateParams": ".factory",
+    "LifeCycleMethodCallDeleteParams": ".factory",
+    "LifeCycleFactory": ".factory",
+    "LifeCycleFactoryParams": ".factory",
+    "LifeCycleFactoryCreateParams": ".factory",
+    "LifeCycleFactoryUpdateParams": ".factory",
+    "LifeCycleFactoryDeleteParams": ".factory",
+    "LifeCycleFactoryCreateTransaction": ".factory",
+    "LifeCycleFactoryCreateTransactionCreate": ".factory",
+    "LifeCycleFactorySend": ".factory",
+    "LifeCycleFactorySendCreate": ".factory",
+    "LifeCycleComposer": ".composer",
+    "HelloStringArgs": ".decoding",
+    "UpdateTestArgs": ".decoding",
+    "DeleteTestArgs": ".decoding",
+    "CloseOutTestArgs": ".decoding",
+    "LifeCycleMethodArgs": ".decoding",
+    "decode_app_call": ".decoding",
+    "LifeCycleAppCall": ".decoding",
+    "extract_app_calls": ".decoding",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_LAZY_IMPORTS]
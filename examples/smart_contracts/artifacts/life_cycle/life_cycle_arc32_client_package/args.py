@@ -0,0 +1,70 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloStringStringArgs:
+    """Dataclass for hello_string_string arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+
+def _hello_string_string_args_to_abi(args: tuple[str] | HelloStringStringArgs) -> list[typing.Any] | None:
+    """Convert hello_string_string args into the list of ABI args expected by the app client"""
+    if isinstance(args, HelloStringStringArgs):
+        return [args.name]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateStringStringArgs:
+    """Dataclass for create_string_string arguments"""
+    greeting: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create(string)string"
+
+
+def _create_string_string_args_to_abi(args: tuple[str] | CreateStringStringArgs) -> list[typing.Any] | None:
+    """Convert create_string_string args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateStringStringArgs):
+        return [args.greeting]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateStringUint32VoidArgs:
+    """Dataclass for create_string_uint32_void arguments"""
+    greeting: str
+    times: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create(string,uint32)void"
+
+
+def _create_string_uint32_void_args_to_abi(args: tuple[str, int] | CreateStringUint32VoidArgs) -> list[typing.Any] | None:
+    """Convert create_string_uint32_void args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateStringUint32VoidArgs):
+        return [args.greeting, args.times]
+    return [*args] if args else None
@@ -0,0 +1,377 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    _DEFAULT_PARAMS,
+    _params_fields,
+)
+from .args import (
+    HelloStringStringArgs,
+    CreateStringStringArgs,
+    CreateStringUint32VoidArgs,
+)
+from .client import (
+    _ReturnDecoder,
+    _RETURN_DECODERS,
+    _decode_return,
+    LifeCycleClient,
+)
+
+class _LifeCycleUpdateComposer:
+    __slots__ = ("composer",)
+
+    def __init__(self, composer: "LifeCycleComposer"):
+        self.composer = composer
+    def update_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "LifeCycleComposer":
+        self.composer._composer.add_app_update_method_call(
+            self.composer.client.params.update.update_test(
+                
+                params=params,
+                compilation_params=compilation_params
+            )
+        )
+        self.composer._return_decoders.append(
+            ("update_test()string", _RETURN_DECODERS["update_test()string"])
+        )
+        return self.composer
+
+
+class _LifeCycleDeleteComposer:
+    __slots__ = ("composer",)
+
+    def __init__(self, composer: "LifeCycleComposer"):
+        self.composer = composer
+    def delete_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self.composer._composer.add_app_delete_method_call(
+            self.composer.client.params.delete.delete_test(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._return_decoders.append(
+            ("delete_test()string", _RETURN_DECODERS["delete_test()string"])
+        )
+        return self.composer
+
+
+class _LifeCycleCloseOutComposer:
+    __slots__ = ("composer",)
+
+    def __init__(self, composer: "LifeCycleComposer"):
+        self.composer = composer
+    def close_out_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.close_out.close_out_test(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._return_decoders.append(
+            ("close_out_test()string", _RETURN_DECODERS["close_out_test()string"])
+        )
+        return self.composer
+
+
+class LifeCycleComposer:
+    """Composer for creating transaction groups for LifeCycle contract calls"""
+
+    __slots__ = ("client", "_composer", "_return_decoders", "_update", "_delete", "_close_out")
+
+    def __init__(self, client: "LifeCycleClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._update: "_LifeCycleUpdateComposer | None" = None
+        self._delete: "_LifeCycleDeleteComposer | None" = None
+        self._close_out: "_LifeCycleCloseOutComposer | None" = None
+
+    @property
+    def update(self) -> "_LifeCycleUpdateComposer":
+        if self._update is None:
+            self._update = _LifeCycleUpdateComposer(self)
+        return self._update
+
+    @property
+    def delete(self) -> "_LifeCycleDeleteComposer":
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteComposer(self)
+        return self._delete
+
+    @property
+    def close_out(self) -> "_LifeCycleCloseOutComposer":
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutComposer(self)
+        return self._close_out
+
+    def hello_string_string(
+        self,
+        args: tuple[str] | HelloStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello_string_string(
+                args=args,
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("hello(string)string", _RETURN_DECODERS["hello(string)string"])
+        )
+        return self
+
+    def hello_string(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello_string(
+                
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("hello()string", _RETURN_DECODERS["hello()string"])
+        )
+        return self
+
+    def create_string_string(
+        self,
+        args: tuple[str] | CreateStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_string_string(
+                args=args,
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("create(string)string", _RETURN_DECODERS["create(string)string"])
+        )
+        return self
+
+    def create_string_uint32_void(
+        self,
+        args: tuple[str, int] | CreateStringUint32VoidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LifeCycleComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_string_uint32_void(
+                args=args,
+                params=params,
+            )
+        )
+        self._return_decoders.append(
+            ("create(string,uint32)void", _RETURN_DECODERS["create(string,uint32)void"])
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "LifeCycleComposer":
+        params = params or _DEFAULT_PARAMS
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "LifeCycleComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _LifeCycleBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "LifeCycleClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else LifeCycleClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["LifeCycleComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def hello_string_string(
+        self,
+        args: typing.Iterable[tuple[str] | HelloStringStringArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.hello_string_string(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create_string_string(
+        self,
+        args: typing.Iterable[tuple[str] | CreateStringStringArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create_string_string(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create_string_uint32_void(
+        self,
+        args: typing.Iterable[tuple[str, int] | CreateStringUint32VoidArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create_string_uint32_void(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
@@ -0,0 +1,180 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    _DEFAULT_PARAMS,
+    _params_fields,
+)
+from .args import (
+    HelloStringStringArgs,
+    _hello_string_string_args_to_abi,
+    CreateStringStringArgs,
+    _create_string_string_args_to_abi,
+    CreateStringUint32VoidArgs,
+    _create_string_uint32_void_args_to_abi,
+)
+
+class _LifeCycleUpdateTransaction:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+    def update_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or _DEFAULT_PARAMS
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_test()string",
+        ))
+
+
+class _LifeCycleDeleteTransaction:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def delete_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_test()string",
+        ))
+
+
+class _LifeCycleCloseOutTransaction:
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def close_out_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close_out_test()string",
+        ))
+
+
+class LifeCycleCreateTransactionParams:
+    __slots__ = ("app_client", "_update", "_delete", "_close_out")
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        self._update: "_LifeCycleUpdateTransaction | None" = None
+        self._delete: "_LifeCycleDeleteTransaction | None" = None
+        self._close_out: "_LifeCycleCloseOutTransaction | None" = None
+
+    @property
+    def update(self) -> "_LifeCycleUpdateTransaction":
+        if self._update is None:
+            self._update = _LifeCycleUpdateTransaction(self.app_client)
+        return self._update
+
+    @property
+    def delete(self) -> "_LifeCycleDeleteTransaction":
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteTransaction(self.app_client)
+        return self._delete
+
+    @property
+    def close_out(self) -> "_LifeCycleCloseOutTransaction":
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutTransaction(self.app_client)
+        return self._close_out
+
+    def hello_string_string(
+        self,
+        args: tuple[str] | HelloStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _hello_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
+
+    def hello_string(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello()string",
+        ))
+
+    def create_string_string(
+        self,
+        args: tuple[str] | CreateStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _create_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string)string",
+            args=method_args,
+        ))
+
+    def create_string_uint32_void(
+        self,
+        args: tuple[str, int] | CreateStringUint32VoidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _create_string_uint32_void_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,uint32)void",
+            args=method_args,
+        ))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
@@ -0,0 +1,356 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from .args import (
+    HelloStringStringArgs,
+    CreateStringStringArgs,
+    CreateStringUint32VoidArgs,
+)
+
+def _hello_string_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloStringStringArgs:
+    """Decode the args of a call of hello(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello(string)string")
+    return HelloStringStringArgs(
+        name=app_args[1][2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloStringArgs:
+    """Dataclass for hello_string arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello()string"
+
+
+def _hello_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloStringArgs:
+    """Decode the args of a call of hello()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello()string")
+    return HelloStringArgs()
+
+
+def _create_string_string_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateStringStringArgs:
+    """Decode the args of a call of create(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create(string)string")
+    return CreateStringStringArgs(
+        greeting=app_args[1][2:].decode(),
+    )
+
+
+def _create_string_uint32_void_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateStringUint32VoidArgs:
+    """Decode the args of a call of create(string,uint32)void from its app args"""
+    if not (
+        len(app_args) == 3
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+        and len(app_args[2]) == 4
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create(string,uint32)void")
+    return CreateStringUint32VoidArgs(
+        greeting=app_args[1][2:].decode(),
+        times=int.from_bytes(app_args[2], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class UpdateTestArgs:
+    """Dataclass for update_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "update_test()string"
+
+
+def _update_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> UpdateTestArgs:
+    """Decode the args of a call of update_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of update_test()string")
+    return UpdateTestArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DeleteTestArgs:
+    """Dataclass for delete_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "delete_test()string"
+
+
+def _delete_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DeleteTestArgs:
+    """Decode the args of a call of delete_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of delete_test()string")
+    return DeleteTestArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CloseOutTestArgs:
+    """Dataclass for close_out_test arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_out_test()string"
+
+
+def _close_out_test_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CloseOutTestArgs:
+    """Decode the args of a call of close_out_test()string from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of close_out_test()string")
+    return CloseOutTestArgs()
+
+
+LifeCycleMethodArgs: typing.TypeAlias = HelloStringStringArgs | HelloStringArgs | CreateStringStringArgs | CreateStringUint32VoidArgs | UpdateTestArgs | DeleteTestArgs | CloseOutTestArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    LifeCycleMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x02\xbe\xce\x11": _hello_string_string_args_from_app_args,  # hello(string)string
+    b"\xab\x06\xc1\xa8": _hello_string_args_from_app_args,  # hello()string
+    b"\x97\xf1\xfc\x11": _create_string_string_args_from_app_args,  # create(string)string
+    b"\x60\x19\x32\x64": _create_string_uint32_void_args_from_app_args,  # create(string,uint32)void
+    b"\x53\xe6\xb8\xc7": _update_test_args_from_app_args,  # update_test()string
+    b"\x1b\x3b\xf2\x03": _delete_test_args_from_app_args,  # delete_test()string
+    b"\xa0\x26\xf8\xdd": _close_out_test_args_from_app_args,  # close_out_test()string
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> LifeCycleMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LifeCycleAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: LifeCycleMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x02\xbe\xce\x11": "hello(string)string",
+    b"\xab\x06\xc1\xa8": "hello()string",
+    b"\x97\xf1\xfc\x11": "create(string)string",
+    b"\x60\x19\x32\x64": "create(string,uint32)void",
+    b"\x53\xe6\xb8\xc7": "update_test()string",
+    b"\x1b\x3b\xf2\x03": "delete_test()string",
+    b"\xa0\x26\xf8\xdd": "close_out_test()string",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> LifeCycleMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[LifeCycleAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield LifeCycleAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[LifeCycleAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[LifeCycleAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[LifeCycleAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[LifeCycleAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
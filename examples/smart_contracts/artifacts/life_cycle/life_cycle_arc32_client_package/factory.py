@@ -0,0 +1,564 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    APP_SPEC,
+    _parse_abi_args,
+    _DEFAULT_CREATE_PARAMS,
+    _params_fields,
+)
+from .args import (
+    HelloStringStringArgs,
+    _hello_string_string_args_to_abi,
+    CreateStringStringArgs,
+    _create_string_string_args_to_abi,
+    CreateStringUint32VoidArgs,
+    _create_string_uint32_void_args_to_abi,
+)
+from .client import (
+    LifeCycleClient,
+)
+
+@dataclasses.dataclass(frozen=True)
+class LifeCycleMethodCallCreateParams(
+    algokit_utils.AppClientCreateSchema, algokit_utils.BaseAppClientMethodCallParams[
+        CreateStringStringArgs | CreateStringUint32VoidArgs,
+        str | None,
+    ]
+):
+    """Parameters for creating LifeCycle contract using ABI"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallCreateParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallCreateParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+@dataclasses.dataclass(frozen=True)
+class LifeCycleBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating LifeCycle contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC, OnComplete.OptInOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class LifeCycleMethodCallUpdateParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling LifeCycle contract using ABI"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+@dataclasses.dataclass(frozen=True)
+class LifeCycleBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling LifeCycle contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class LifeCycleMethodCallDeleteParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling LifeCycle contract using ABI"""
+    on_complete: typing.Literal[OnComplete.DeleteApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCallCreateParams | LifeCycleBareCallCreateParams, LifeCycleMethodCallUpdateParams | LifeCycleBareCallUpdateParams, LifeCycleMethodCallDeleteParams]):
+    """Factory for deploying and managing LifeCycleClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = LifeCycleFactoryParams(self.app_factory)
+        self.create_transaction = LifeCycleFactoryCreateTransaction(self.app_factory)
+        self.send = LifeCycleFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: LifeCycleMethodCallCreateParams | LifeCycleBareCallCreateParams | None = None,
+        update_params: LifeCycleMethodCallUpdateParams | LifeCycleBareCallUpdateParams | None = None,
+        delete_params: LifeCycleMethodCallDeleteParams | None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params.to_algokit_utils_params() if delete_params else None,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return LifeCycleClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> LifeCycleClient:
+        """Get an app client by creator address and name"""
+        return LifeCycleClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> LifeCycleClient:
+        """Get an app client by app ID"""
+        return LifeCycleClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class LifeCycleFactoryParams:
+    """Parameters for creating transactions for LifeCycle contract"""
+
+    __slots__ = ("app_factory", "create", "update", "delete")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = LifeCycleFactoryCreateParams(app_factory)
+        self.update = LifeCycleFactoryUpdateParams(app_factory)
+        self.delete = LifeCycleFactoryDeleteParams(app_factory)
+
+class LifeCycleFactoryCreateParams:
+    """Parameters for 'create' operations of LifeCycle contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            compilation_params=compilation_params)
+
+    def hello_string_string(
+        self,
+        args: tuple[str] | HelloStringStringArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="hello(string)string",
+                args=_hello_string_string_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+    def hello_string(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello()string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="hello()string",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_string_string(
+        self,
+        args: tuple[str] | CreateStringStringArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create(string)string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="create(string)string",
+                args=_create_string_string_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_string_uint32_void(
+        self,
+        args: tuple[str, int] | CreateStringUint32VoidArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create(string,uint32)void ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="create(string,uint32)void",
+                args=_create_string_uint32_void_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+    def update_test(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update_test()string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="update_test()string",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+    def delete_test(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the delete_test()string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="delete_test()string",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_out_test(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_out_test()string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="close_out_test()string",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+class LifeCycleFactoryUpdateParams:
+    """Parameters for 'update' operations of LifeCycle contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+class LifeCycleFactoryDeleteParams:
+    """Parameters for 'delete' operations of LifeCycle contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+
+class LifeCycleFactoryCreateTransaction:
+    """Create transactions for LifeCycle contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = LifeCycleFactoryCreateTransactionCreate(app_factory)
+
+
+class LifeCycleFactoryCreateTransactionCreate:
+    """Create new instances of LifeCycle contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+        )
+
+
+class LifeCycleFactorySend:
+    """Send calls to LifeCycle contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = LifeCycleFactorySendCreate(app_factory)
+
+
+class LifeCycleFactorySendCreate:
+    """Send create calls to LifeCycle contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[LifeCycleClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return LifeCycleClient(result[0]), result[1]
+
+    def create_string_string(
+        self,
+        args: tuple[str] | CreateStringStringArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
+            """Creates and sends a transaction using the create(string)string ABI method"""
+            params = params or _DEFAULT_CREATE_PARAMS
+            client, result = self.app_factory.send.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    **_params_fields(params),
+                    method="create(string)string",
+                    args=_create_string_string_args_to_abi(args),
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params
+            )
+            return_value = None if result.abi_return is None else typing.cast(str, result.abi_return)
+    
+            return LifeCycleClient(client), algokit_utils.AppFactoryCreateMethodCallResult[str](
+                **{
+                    **result.__dict__,
+                    "app_id": result.app_id,
+                    "abi_return": return_value,
+                    "transaction": result.transaction,
+                    "confirmation": result.confirmation,
+                    "group_id": result.group_id,
+                    "tx_ids": result.tx_ids,
+                    "transactions": result.transactions,
+                    "confirmations": result.confirmations,
+                    "app_address": result.app_address,
+                }
+            )
+
+    def create_string_uint32_void(
+        self,
+        args: tuple[str, int] | CreateStringUint32VoidArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
+            """Creates and sends a transaction using the create(string,uint32)void ABI method"""
+            params = params or _DEFAULT_CREATE_PARAMS
+            client, result = self.app_factory.send.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    **_params_fields(params),
+                    method="create(string,uint32)void",
+                    args=_create_string_uint32_void_args_to_abi(args),
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params
+            )
+            return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
+    
+            return LifeCycleClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+                **{
+                    **result.__dict__,
+                    "app_id": result.app_id,
+                    "abi_return": return_value,
+                    "transaction": result.transaction,
+                    "confirmation": result.confirmation,
+                    "group_id": result.group_id,
+                    "tx_ids": result.tx_ids,
+                    "transactions": result.transactions,
+                    "confirmations": result.confirmations,
+                    "app_address": result.app_address,
+                }
+            )
@@ -0,0 +1,251 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    _DEFAULT_PARAMS,
+    _params_fields,
+    _ReadCaches,
+)
+from .args import (
+    HelloStringStringArgs,
+    _hello_string_string_args_to_abi,
+    CreateStringStringArgs,
+    _create_string_string_args_to_abi,
+    CreateStringUint32VoidArgs,
+    _create_string_uint32_void_args_to_abi,
+)
+if typing.TYPE_CHECKING:
+    from .client import (
+        LifeCycleClient,
+    )
+    from .composer import (
+        _LifeCycleBatchSend,
+    )
+
+class _LifeCycleUpdateSend:
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        response = self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
+
+    def update_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or _DEFAULT_PARAMS
+        compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_test()string",
+        ), send_params=send_params, compilation_params=compilation_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppUpdateTransactionResult[str], parsed_response)
+
+
+class _LifeCycleDeleteSend:
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def delete_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_test()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+
+class _LifeCycleCloseOutSend:
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def close_out_test(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close_out_test()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+
+class LifeCycleSend:
+    __slots__ = ("app_client", "_caches", "_client", "_update", "_delete", "_close_out", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "LifeCycleClient | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._update: "_LifeCycleUpdateSend | None" = None
+        self._delete: "_LifeCycleDeleteSend | None" = None
+        self._close_out: "_LifeCycleCloseOutSend | None" = None
+        self._batch: "_LifeCycleBatchSend | None" = None
+
+    @property
+    def update(self) -> "_LifeCycleUpdateSend":
+        if self._update is None:
+            self._update = _LifeCycleUpdateSend(self.app_client, self._caches)
+        return self._update
+
+    @property
+    def delete(self) -> "_LifeCycleDeleteSend":
+        if self._delete is None:
+            self._delete = _LifeCycleDeleteSend(self.app_client, self._caches)
+        return self._delete
+
+    @property
+    def close_out(self) -> "_LifeCycleCloseOutSend":
+        if self._close_out is None:
+            self._close_out = _LifeCycleCloseOutSend(self.app_client, self._caches)
+        return self._close_out
+
+    @property
+    def batch(self) -> "_LifeCycleBatchSend":
+        if self._batch is None:
+            from .composer import _LifeCycleBatchSend
+            self._batch = _LifeCycleBatchSend(self.app_client, self._client)
+        return self._batch
+
+    def hello_string_string(
+        self,
+        args: tuple[str] | HelloStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _hello_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def hello_string(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello()string",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_string_string(
+        self,
+        args: tuple[str] | CreateStringStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _create_string_string_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_string_uint32_void(
+        self,
+        args: tuple[str, int] | CreateStringUint32VoidArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _create_string_uint32_void_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,uint32)void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        response = self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
@@ -0,0 +1,200 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: 3a8fa1195e2b5d5b62a01e8c30fe79c1e62e9602e6b0dca4f97b25bf973c4156
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    APP_SPEC,
+    _ReadCaches,
+)
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    greeting: bytes
+    times: int
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    greeting: bytes
+    times: int
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
+class LifeCycleState:
+    """Methods to access state for the current LifeCycle app"""
+
+    __slots__ = ("app_client", "_caches", "_global_state")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
+
+    @property
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
+
+class _GlobalState:
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        return typing.cast(GlobalStateValue, result)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            greeting=typing.cast(bytes, _decode_state_value(state.get("Z3JlZXRpbmc="), "AVMBytes")),
+            times=typing.cast(int, _decode_state_value(state.get("dGltZXM="), "AVMUint64")),
+        )
+
+    @property
+    def greeting(self) -> bytes:
+        """Get the current value of the greeting key in global_state state"""
+        value = self._read(("key", "greeting"), lambda: self.app_client.state.global_state.get_value("greeting"))
+        return typing.cast(bytes, value)
+
+    @property
+    def times(self) -> int:
+        """Get the current value of the times key in global_state state"""
+        value = self._read(("key", "times"), lambda: self.app_client.state.global_state.get_value("times"))
+        return typing.cast(int, value)
@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: 28a1b3b1c2176c93f41159e18fb0548f3ab0f32a0ccb00d41c82b361e14d0e11
 
 # common
 import dataclasses
@@ -20,20 +21,41 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": ["DeleteApplication", "UpdateApplication"], "create": ["NoOp"]}, "methods": [], "name": "Minimal", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIFRNUExfVVBEQVRBQkxFIFRNUExfREVMRVRBQkxFCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvbWluaW1hbC9jb250cmFjdC5weTo0CiAgICAvLyBjbGFzcyBNaW5pbWFsKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAOQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc3dpdGNoIG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANCBtYWluX2FmdGVyX2lmX2Vsc2VAOSBtYWluX2FmdGVyX2lmX2Vsc2VAOSBtYWluX2FmdGVyX2lmX2Vsc2VAOSBtYWluX3VwZGF0ZUA1IG1haW5fZGVsZXRlQDYKCm1haW5fYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL21pbmltYWwvY29udHJhY3QucHk6NAogICAgLy8gY2xhc3MgTWluaW1hbChFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZGVsZXRlQDY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weTozMAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlQDU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyMwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANDoKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuSW1tdXRhYmlsaXR5Q29udHJvbEFSQzRDb250cmFjdC51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyNQogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKFVQREFUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyB1cGRhdGFibGUiCiAgICBpbnRjXzEgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgdXBkYXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyNgogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuYmFzZS5jb250cmFjdC5QZXJtYW5lbmNlQ29udHJvbEFSQzRDb250cmFjdC5kZWxldGUoKSAtPiB2b2lkOgpkZWxldGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weTozMgogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKERFTEVUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyBkZWxldGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9ERUxFVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgZGVsZXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weTozMwogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuYmFzZS5jb250cmFjdC5CYXNlQVJDNENvbnRyYWN0LmF1dGhvcml6ZV9jcmVhdG9yKCkgLT4gdm9pZDoKYXV0aG9yaXplX2NyZWF0b3I6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgInVuYXV0aG9yaXplZCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,28 +65,27 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
-
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
 
 class _MinimalUpdate:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -75,6 +96,8 @@ class _MinimalUpdate:
 
 
 class _MinimalDelete:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -85,16 +108,24 @@ class _MinimalDelete:
 
 
 class MinimalParams:
+    __slots__ = ("app_client", "_update", "_delete")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_MinimalUpdate | None" = None
+        self._delete: "_MinimalDelete | None" = None
 
     @property
     def update(self) -> "_MinimalUpdate":
-        return _MinimalUpdate(self.app_client)
+        if self._update is None:
+            self._update = _MinimalUpdate(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_MinimalDelete":
-        return _MinimalDelete(self.app_client)
+        if self._delete is None:
+            self._delete = _MinimalDelete(self.app_client)
+        return self._delete
 
     def clear_state(
         self,
@@ -108,6 +139,8 @@ class MinimalParams:
 
 
 class _MinimalUpdateTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -116,6 +149,8 @@ class _MinimalUpdateTransaction:
 
 
 class _MinimalDeleteTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -124,16 +159,24 @@ class _MinimalDeleteTransaction:
 
 
 class MinimalCreateTransactionParams:
+    __slots__ = ("app_client", "_update", "_delete")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_MinimalUpdateTransaction | None" = None
+        self._delete: "_MinimalDeleteTransaction | None" = None
 
     @property
     def update(self) -> "_MinimalUpdateTransaction":
-        return _MinimalUpdateTransaction(self.app_client)
+        if self._update is None:
+            self._update = _MinimalUpdateTransaction(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_MinimalDeleteTransaction":
-        return _MinimalDeleteTransaction(self.app_client)
+        if self._delete is None:
+            self._delete = _MinimalDeleteTransaction(self.app_client)
+        return self._delete
 
     def clear_state(
         self,
@@ -147,6 +190,8 @@ class MinimalCreateTransactionParams:
 
 
 class _MinimalUpdateSend:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -156,14 +201,17 @@ class _MinimalUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.update(
+        response = self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
             compilation_params=compilation_params
         )
+        return response
 
 
 class _MinimalDeleteSend:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -173,24 +221,33 @@ class _MinimalDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.delete(
+        response = self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
             
         )
+        return response
 
 
 class MinimalSend:
+    __slots__ = ("app_client", "_update", "_delete")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_MinimalUpdateSend | None" = None
+        self._delete: "_MinimalDeleteSend | None" = None
 
     @property
     def update(self) -> "_MinimalUpdateSend":
-        return _MinimalUpdateSend(self.app_client)
+        if self._update is None:
+            self._update = _MinimalUpdateSend(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_MinimalDeleteSend":
-        return _MinimalDeleteSend(self.app_client)
+        if self._delete is None:
+            self._delete = _MinimalDeleteSend(self.app_client)
+        return self._delete
 
     def clear_state(
         self,
@@ -206,12 +263,38 @@ class MinimalSend:
 class MinimalState:
     """Methods to access state for the current Minimal app"""
 
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
 class MinimalClient:
     """Client for interacting with Minimal smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -258,10 +341,35 @@ class MinimalClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = MinimalParams(self.app_client)
-        self.create_transaction = MinimalCreateTransactionParams(self.app_client)
-        self.send = MinimalSend(self.app_client)
-        self.state = MinimalState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: MinimalParams | None = None
+        self._create_transaction: MinimalCreateTransactionParams | None = None
+        self._send: MinimalSend | None = None
+        self._state: "MinimalState | None" = None
+    
+    @property
+    def params(self) -> MinimalParams:
+        if self._params is None:
+            self._params = MinimalParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> MinimalCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = MinimalCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> MinimalSend:
+        if self._send is None:
+            self._send = MinimalSend(self.app_client)
+        return self._send
+    
+    @property
+    def state(self) -> "MinimalState":
+        if self._state is None:
+            self._state = MinimalState(self.app_client)
+        return self._state
 
     @staticmethod
     def from_creator_and_name(
@@ -361,18 +469,10 @@ class MinimalClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -519,6 +619,8 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
 class MinimalFactoryParams:
     """Parameters for creating transactions for Minimal contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = MinimalFactoryCreateParams(app_factory)
@@ -528,6 +630,8 @@ class MinimalFactoryParams:
 class MinimalFactoryCreateParams:
     """Parameters for 'create' operations of Minimal contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -538,14 +642,16 @@ class MinimalFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
 class MinimalFactoryUpdateParams:
     """Parameters for 'update' operations of Minimal contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -556,14 +662,16 @@ class MinimalFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class MinimalFactoryDeleteParams:
     """Parameters for 'delete' operations of Minimal contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -574,15 +682,17 @@ class MinimalFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class MinimalFactoryCreateTransaction:
     """Create transactions for Minimal contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = MinimalFactoryCreateTransactionCreate(app_factory)
@@ -591,6 +701,8 @@ class MinimalFactoryCreateTransaction:
 class MinimalFactoryCreateTransactionCreate:
     """Create new instances of Minimal contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -599,15 +711,17 @@ class MinimalFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class MinimalFactorySend:
     """Send calls to Minimal contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = MinimalFactorySendCreate(app_factory)
@@ -616,6 +730,8 @@ class MinimalFactorySend:
 class MinimalFactorySendCreate:
     """Send create calls to Minimal contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -627,9 +743,9 @@ class MinimalFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[MinimalClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -637,11 +753,15 @@ class MinimalFactorySendCreate:
 
 
 class _MinimalUpdateComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "MinimalComposer"):
         self.composer = composer
 
 
 class _MinimalDeleteComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "MinimalComposer"):
         self.composer = composer
 
@@ -649,18 +769,27 @@ class _MinimalDeleteComposer:
 class MinimalComposer:
     """Composer for creating transaction groups for Minimal contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_update", "_delete")
+
     def __init__(self, client: "MinimalClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._update: "_MinimalUpdateComposer | None" = None
+        self._delete: "_MinimalDeleteComposer | None" = None
 
     @property
     def update(self) -> "_MinimalUpdateComposer":
-        return _MinimalUpdateComposer(self)
+        if self._update is None:
+            self._update = _MinimalUpdateComposer(self)
+        return self._update
 
     @property
     def delete(self) -> "_MinimalDeleteComposer":
-        return _MinimalDeleteComposer(self)
+        if self._delete is None:
+            self._delete = _MinimalDeleteComposer(self)
+        return self._delete
 
     def clear_state(
         self,
@@ -668,15 +797,10 @@ class MinimalComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "MinimalComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -690,6 +814,25 @@ class MinimalComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -700,18 +843,20 @@ class MinimalComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self._decode_returns(self._composer.send(send_params))
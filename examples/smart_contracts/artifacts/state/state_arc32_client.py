@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: 5394eb985ba2eb957134b8e9a75efb822795fbcafac959635a0ee012584812f6
 
 # common
 import dataclasses
@@ -20,20 +21,76 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": ["DeleteApplication", "UpdateApplication"], "create": ["NoOp", "OptIn"]}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "input"}], "name": "create_abi", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [{"type": "string", "name": "input"}], "name": "update_abi", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [{"type": "string", "name": "input"}], "name": "delete_abi", "returns": {"type": "string"}, "events": []}, {"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "error", "returns": {"type": "void"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "value"}], "name": "call_abi", "returns": {"type": "string"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "txn"}, {"type": "string", "name": "value"}], "name": "call_abi_txn", "returns": {"type": "string"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "asset"}, {"type": "account", "name": "account"}, {"type": "application", "name": "application"}], "name": "call_with_references", "returns": {"type": "uint64"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "defaultValue": {"data": "ZGVmYXVsdCB2YWx1ZQ==", "source": "literal", "type": "AVMString"}, "name": "arg_with_default"}], "name": "default_value", "returns": {"type": "string"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "defaultValue": {"data": "AAAAAAAAAHs=", "source": "literal", "type": "uint64"}, "name": "arg_with_default"}], "name": "default_value_int", "returns": {"type": "uint64"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "defaultValue": {"data": "ZGVmYXVsdCB2YWx1ZQ==", "source": "literal", "type": "AVMString"}, "name": "arg_with_default"}], "name": "default_value_from_abi", "returns": {"type": "string"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "defaultValue": {"data": "aW50MQ==", "source": "global", "type": "uint64"}, "name": "arg_with_default"}], "name": "default_value_from_global_state", "returns": {"type": "uint64"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "defaultValue": {"data": "bG9jYWxfYnl0ZXMx", "source": "local", "type": "AVMString"}, "name": "arg_with_default"}], "name": "default_value_from_local_state", "returns": {"type": "string"}, "events": [], "readonly": true}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(string,uint64)", "name": "name_age", "struct": "Input"}], "name": "structs", "returns": {"type": "(string,uint64)", "struct": "Output"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "int1"}, {"type": "uint64", "name": "int2"}, {"type": "string", "name": "bytes1"}, {"type": "byte[4]", "name": "bytes2"}], "name": "set_global", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "int1"}, {"type": "uint64", "name": "int2"}, {"type": "string", "name": "bytes1"}, {"type": "byte[4]", "name": "bytes2"}], "name": "set_local", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[4]", "name": "name"}, {"type": "string", "name": "value"}], "name": "set_box", "returns": {"type": "void"}, "events": []}], "name": "State", "state": {"keys": {"box": {}, "global": {"bytes1": {"key": "Ynl0ZXMx", "keyType": "AVMString", "valueType": "AVMBytes"}, "bytes2": {"key": "Ynl0ZXMy", "keyType": "AVMString", "valueType": "AVMBytes"}, "bytesNotInSnakeCase": {"key": "Ynl0ZXNOb3RJblNuYWtlQ2FzZQ==", "keyType": "AVMString", "valueType": "AVMBytes"}, "int1": {"key": "aW50MQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "int2": {"key": "aW50Mg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "value": {"key": "dmFsdWU=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"localBytesNotInSnakeCase": {"key": "bG9jYWxCeXRlc05vdEluU25ha2VDYXNl", "keyType": "AVMString", "valueType": "AVMBytes"}, "local_bytes1": {"key": "bG9jYWxfYnl0ZXMx", "keyType": "AVMString", "valueType": "AVMBytes"}, "local_bytes2": {"key": "bG9jYWxfYnl0ZXMy", "keyType": "AVMString", "valueType": "AVMBytes"}, "local_int1": {"key": "bG9jYWxfaW50MQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "local_int2": {"key": "bG9jYWxfaW50Mg==", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 3}, "local": {"bytes": 3, "ints": 2}}}, "structs": {"Input": [{"name": "name", "type": "string"}, {"name": "age", "type": "uint64"}], "Output": [{"name": "message", "type": "string"}, {"name": "result", "type": "uint64"}]}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMSAwIFRNUExfVVBEQVRBQkxFIFRNUExfREVMRVRBQkxFIFRNUExfVkFMVUUKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAiSGVsbG8sICIgIiIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgU3RhdGUoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMjIKICAgIHB1c2hieXRlc3MgMHg5ZDUyMzA0MCAweDNjYTVjZWI3IDB4MjcxYjRlZTkgMHgzMGM2ZDU4YSAweDQ0ZDBkYTBkIDB4ZjE3ZTgwYTUgMHgwYTkyYTgxZSAweGZlZmRmMTFlIDB4NTc0YjU1YzggMHgzNjAzNjJlOSAweDQ2ZDIxMWEzIDB4MGNmY2JiMDAgMHhkMGYwYmFmOCAweDI0NmJlYjgzIDB4YTRjZjhkZWEgMHhjZWMyODM0YSAweGE0YjRhMjMwIC8vIG1ldGhvZCAiY3JlYXRlX2FiaShzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJ1cGRhdGVfYWJpKHN0cmluZylzdHJpbmciLCBtZXRob2QgImRlbGV0ZV9hYmkoc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAib3B0X2luKCl2b2lkIiwgbWV0aG9kICJlcnJvcigpdm9pZCIsIG1ldGhvZCAiY2FsbF9hYmkoc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiY2FsbF9hYmlfdHhuKHBheSxzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjYWxsX3dpdGhfcmVmZXJlbmNlcyhhc3NldCxhY2NvdW50LGFwcGxpY2F0aW9uKXVpbnQ2NCIsIG1ldGhvZCAiZGVmYXVsdF92YWx1ZShzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJkZWZhdWx0X3ZhbHVlX2ludCh1aW50NjQpdWludDY0IiwgbWV0aG9kICJkZWZhdWx0X3ZhbHVlX2Zyb21fYWJpKHN0cmluZylzdHJpbmciLCBtZXRob2QgImRlZmF1bHRfdmFsdWVfZnJvbV9nbG9iYWxfc3RhdGUodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZGVmYXVsdF92YWx1ZV9mcm9tX2xvY2FsX3N0YXRlKHN0cmluZylzdHJpbmciLCBtZXRob2QgInN0cnVjdHMoKHN0cmluZyx1aW50NjQpKShzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAic2V0X2dsb2JhbCh1aW50NjQsdWludDY0LHN0cmluZyxieXRlWzRdKXZvaWQiLCBtZXRob2QgInNldF9sb2NhbCh1aW50NjQsdWludDY0LHN0cmluZyxieXRlWzRdKXZvaWQiLCBtZXRob2QgInNldF9ib3goYnl0ZVs0XSxzdHJpbmcpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2FiaV9yb3V0ZUA1IG1haW5fdXBkYXRlX2FiaV9yb3V0ZUA2IG1haW5fZGVsZXRlX2FiaV9yb3V0ZUA3IG1haW5fb3B0X2luX3JvdXRlQDggbWFpbl9lcnJvcl9yb3V0ZUA5IG1haW5fY2FsbF9hYmlfcm91dGVAMTAgbWFpbl9jYWxsX2FiaV90eG5fcm91dGVAMTEgbWFpbl9jYWxsX3dpdGhfcmVmZXJlbmNlc19yb3V0ZUAxMiBtYWluX2RlZmF1bHRfdmFsdWVfcm91dGVAMTMgbWFpbl9kZWZhdWx0X3ZhbHVlX2ludF9yb3V0ZUAxNCBtYWluX2RlZmF1bHRfdmFsdWVfZnJvbV9hYmlfcm91dGVAMTUgbWFpbl9kZWZhdWx0X3ZhbHVlX2Zyb21fZ2xvYmFsX3N0YXRlX3JvdXRlQDE2IG1haW5fZGVmYXVsdF92YWx1ZV9mcm9tX2xvY2FsX3N0YXRlX3JvdXRlQDE3IG1haW5fc3RydWN0c19yb3V0ZUAxOCBtYWluX3NldF9nbG9iYWxfcm91dGVAMTkgbWFpbl9zZXRfbG9jYWxfcm91dGVAMjAgbWFpbl9zZXRfYm94X3JvdXRlQDIxCgptYWluX2FmdGVyX2lmX2Vsc2VAMjY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl9zZXRfYm94X3JvdXRlQDIxOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgU3RhdGUoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2JveAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfbG9jYWxfcm91dGVAMjA6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2xvY2FsCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9nbG9iYWxfcm91dGVAMTk6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2dsb2JhbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9zdHJ1Y3RzX3JvdXRlQDE4OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgU3RhdGUoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTI1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc3RydWN0cwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWZhdWx0X3ZhbHVlX2Zyb21fbG9jYWxfc3RhdGVfcm91dGVAMTc6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgZGVmYXVsdF9hcmdzPXsiYXJnX3dpdGhfZGVmYXVsdCI6ICJsb2NhbF9ieXRlczEifSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgZGVmYXVsdF9hcmdzPXsiYXJnX3dpdGhfZGVmYXVsdCI6ICJsb2NhbF9ieXRlczEifSkKICAgIGNhbGxzdWIgZGVmYXVsdF92YWx1ZV9mcm9tX2xvY2FsX3N0YXRlCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2RlZmF1bHRfdmFsdWVfZnJvbV9nbG9iYWxfc3RhdGVfcm91dGVAMTY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgZGVmYXVsdF9hcmdzPXsiYXJnX3dpdGhfZGVmYXVsdCI6ICJpbnQxIn0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCBkZWZhdWx0X2FyZ3M9eyJhcmdfd2l0aF9kZWZhdWx0IjogImludDEifSkKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2RlZmF1bHRfdmFsdWVfZnJvbV9hYmlfcm91dGVAMTU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgZGVmYXVsdF9hcmdzPXsiYXJnX3dpdGhfZGVmYXVsdCI6IGFyYzQuU3RyaW5nKCJkZWZhdWx0IHZhbHVlIil9KQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjExMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIGRlZmF1bHRfYXJncz17ImFyZ193aXRoX2RlZmF1bHQiOiBhcmM0LlN0cmluZygiZGVmYXVsdCB2YWx1ZSIpfSkKICAgIGNhbGxzdWIgZGVmYXVsdF92YWx1ZV9mcm9tX2FiaQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWZhdWx0X3ZhbHVlX2ludF9yb3V0ZUAxNDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCBkZWZhdWx0X2FyZ3M9eyJhcmdfd2l0aF9kZWZhdWx0IjogYXJjNC5VSW50NjQoMTIzKX0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCBkZWZhdWx0X2FyZ3M9eyJhcmdfd2l0aF9kZWZhdWx0IjogYXJjNC5VSW50NjQoMTIzKX0pCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWZhdWx0X3ZhbHVlX3JvdXRlQDEzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIGRlZmF1bHRfYXJncz17ImFyZ193aXRoX2RlZmF1bHQiOiBhcmM0LlN0cmluZygiZGVmYXVsdCB2YWx1ZSIpfSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIGRlZmF1bHRfYXJncz17ImFyZ193aXRoX2RlZmF1bHQiOiBhcmM0LlN0cmluZygiZGVmYXVsdCB2YWx1ZSIpfSkKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbGxfd2l0aF9yZWZlcmVuY2VzX3JvdXRlQDEyOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY2FsbF93aXRoX3JlZmVyZW5jZXMKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FsbF9hYmlfdHhuX3JvdXRlQDExOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGNhbGxfYWJpX3R4bgogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FsbF9hYmlfcm91dGVAMTA6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6OTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGNhbGxfYWJpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9lcnJvcl9yb3V0ZUA5OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBhc3NlcnQgRmFsc2UsICJEZWxpYmVyYXRlIGVycm9yIiAgIyBub3FhOiBQVDAxNSwgQjAxMQogICAgZXJyIC8vIERlbGliZXJhdGUgZXJyb3IKCm1haW5fb3B0X2luX3JvdXRlQDg6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6ODIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMCAvLyBPcHRJbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE9wdEluCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX2FiaV9yb3V0ZUA3OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBEZWxldGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo3NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgY2FsbHN1YiBkZWxldGVfYWJpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVfYWJpX3JvdXRlQDY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6NzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IFVwZGF0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgU3RhdGUoRXhhbXBsZUFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICBjYWxsc3ViIHVwZGF0ZV9hYmkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9hYmlfcm91dGVANToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBTdGF0ZShFeGFtcGxlQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgY2FsbHN1YiBjcmVhdGVfYWJpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMjI6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFN0YXRlKEV4YW1wbGVBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc3dpdGNoIG1haW5fY3JlYXRlQDIzIG1haW5fY3JlYXRlQDIzIG1haW5fYWZ0ZXJfaWZfZWxzZUAyNiBtYWluX2FmdGVyX2lmX2Vsc2VAMjYgbWFpbl91cGRhdGVAMjQgbWFpbl9kZWxldGVAMjUKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDI2CgptYWluX2RlbGV0ZUAyNToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVAMjQ6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyMwogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlQDIzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIsIGFsbG93X2FjdGlvbnM9WyJOb09wIiwgIk9wdEluIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgY2FsbHN1YiBjcmVhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuY3JlYXRlKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLmF1dGhvcml6ZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgYXV0aG9yaXplX2NyZWF0b3IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo2MwogICAgLy8gc2VsZi52YWx1ZSA9IFRlbXBsYXRlVmFyW1VJbnQ2NF0oVkFMVUVfVEVNUExBVEVfTkFNRSkKICAgIHB1c2hieXRlcyAidmFsdWUiCiAgICBpbnRjIDQgLy8gVE1QTF9WQUxVRQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5zdGF0ZS5jb250cmFjdC5TdGF0ZS5jcmVhdGVfYWJpKGlucHV0OiBieXRlcykgLT4gYnl0ZXM6CmNyZWF0ZV9hYmk6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6NjUtNjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGNyZWF0ZV9hYmkoc2VsZiwgaW5wdXQ6IFN0cmluZykgLT4gU3RyaW5nOiAgIyBub3FhOiBBMDAyCiAgICBwcm90byAxIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo2NwogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6NjgKICAgIC8vIHJldHVybiBpbnB1dAogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUudXBkYXRlX2FiaShpbnB1dDogYnl0ZXMpIC0+IGJ5dGVzOgp1cGRhdGVfYWJpOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjcwLTcxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgdXBkYXRlX2FiaShzZWxmLCBpbnB1dDogU3RyaW5nKSAtPiBTdHJpbmc6ICAjIG5vcWE6IEEwMDIKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBzZWxmLmF1dGhvcml6ZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgYXV0aG9yaXplX2NyZWF0b3IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo3MwogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKFVQREFUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyB1cGRhdGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgdXBkYXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6NzQKICAgIC8vIHJldHVybiBpbnB1dAogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuZGVsZXRlX2FiaShpbnB1dDogYnl0ZXMpIC0+IGJ5dGVzOgpkZWxldGVfYWJpOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojc2LTc3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgZGVsZXRlX2FiaShzZWxmLCBpbnB1dDogU3RyaW5nKSAtPiBTdHJpbmc6ICAjIG5vcWE6IEEwMDIKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBzZWxmLmF1dGhvcml6ZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgYXV0aG9yaXplX2NyZWF0b3IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo3OQogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKERFTEVUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyBkZWxldGFibGUiCiAgICBpbnRjXzMgLy8gVE1QTF9ERUxFVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgZGVsZXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBpbnB1dAogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuY2FsbF9hYmkodmFsdWU6IGJ5dGVzKSAtPiBieXRlczoKY2FsbF9hYmk6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6OTAtOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGNhbGxfYWJpKHNlbGYsIHZhbHVlOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjkyCiAgICAvLyByZXR1cm4gU3RyaW5nKCJIZWxsbywgIikgKyB2YWx1ZQogICAgYnl0ZWNfMSAvLyAiSGVsbG8sICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuY2FsbF9hYmlfdHhuKHR4bjogdWludDY0LCB2YWx1ZTogYnl0ZXMpIC0+IGJ5dGVzOgpjYWxsX2FiaV90eG46CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6OTQtOTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGNhbGxfYWJpX3R4bihzZWxmLCB0eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCB2YWx1ZTogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byAyIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weTo5NgogICAgLy8gcmV0dXJuIFN0cmluZygiU2VudCAiKSArIHNlbGYuaXRvYSh0eG4uYW1vdW50KSArIFN0cmluZygiLiAiKSArIHZhbHVlCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgY2FsbHN1YiBpdG9hCiAgICBwdXNoYnl0ZXMgIlNlbnQgIgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgIi4gIgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLnN0YXRlLmNvbnRyYWN0LlN0YXRlLmNhbGxfd2l0aF9yZWZlcmVuY2VzKGFzc2V0OiB1aW50NjQsIGFjY291bnQ6IGJ5dGVzLCBhcHBsaWNhdGlvbjogdWludDY0KSAtPiB1aW50NjQ6CmNhbGxfd2l0aF9yZWZlcmVuY2VzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5Ojk4LTk5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjYWxsX3dpdGhfcmVmZXJlbmNlcyhzZWxmLCBhc3NldDogQXNzZXQsIGFjY291bnQ6IEFjY291bnQsIGFwcGxpY2F0aW9uOiBBcHBsaWNhdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTAwCiAgICAvLyBhc3NlcnQgYXNzZXQsICJhc3NldCBub3QgcHJvdmlkZWQiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFzc2VydCAvLyBhc3NldCBub3QgcHJvdmlkZWQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMDEKICAgIC8vIGFzc2VydCBhY2NvdW50LCAiYWNjb3VudCBub3QgcHJvdmlkZWQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBhY2NvdW50IG5vdCBwcm92aWRlZAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gYXNzZXJ0IGFwcGxpY2F0aW9uLCAiYXBwbGljYXRpb24gbm90IHByb3ZpZGVkIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbm90IHByb3ZpZGVkCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTAzCiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLnN0YXRlLmNvbnRyYWN0LlN0YXRlLmRlZmF1bHRfdmFsdWVfZnJvbV9hYmkoYXJnX3dpdGhfZGVmYXVsdDogYnl0ZXMpIC0+IGJ5dGVzOgpkZWZhdWx0X3ZhbHVlX2Zyb21fYWJpOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjExMy0xMTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCBkZWZhdWx0X2FyZ3M9eyJhcmdfd2l0aF9kZWZhdWx0IjogYXJjNC5TdHJpbmcoImRlZmF1bHQgdmFsdWUiKX0pCiAgICAvLyBkZWYgZGVmYXVsdF92YWx1ZV9mcm9tX2FiaShzZWxmLCBhcmdfd2l0aF9kZWZhdWx0OiBhcmM0LlN0cmluZykgLT4gYXJjNC5TdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMTUKICAgIC8vIHJldHVybiBTdHJpbmcoIkFCSSwgIikgKyBhcmdfd2l0aF9kZWZhdWx0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBwdXNoYnl0ZXMgMHg0MTQyNDkyYzIwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuZGVmYXVsdF92YWx1ZV9mcm9tX2xvY2FsX3N0YXRlKGFyZ193aXRoX2RlZmF1bHQ6IGJ5dGVzKSAtPiBieXRlczoKZGVmYXVsdF92YWx1ZV9mcm9tX2xvY2FsX3N0YXRlOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEyMS0xMjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCBkZWZhdWx0X2FyZ3M9eyJhcmdfd2l0aF9kZWZhdWx0IjogImxvY2FsX2J5dGVzMSJ9KQogICAgLy8gZGVmIGRlZmF1bHRfdmFsdWVfZnJvbV9sb2NhbF9zdGF0ZShzZWxmLCBhcmdfd2l0aF9kZWZhdWx0OiBTdHJpbmcpIC0+IGFyYzQuU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTIzCiAgICAvLyByZXR1cm4gYXJjNC5TdHJpbmcoU3RyaW5nKCJMb2NhbCBzdGF0ZSwgIikgKyBhcmdfd2l0aF9kZWZhdWx0KQogICAgcHVzaGJ5dGVzICJMb2NhbCBzdGF0ZSwgIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuc3RydWN0cyhuYW1lX2FnZTogYnl0ZXMpIC0+IGJ5dGVzOgpzdHJ1Y3RzOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEyNS0xMjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN0cnVjdHMoc2VsZiwgbmFtZV9hZ2U6IElucHV0KSAtPiBPdXRwdXQ6CiAgICBwcm90byAxIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxMjcKICAgIC8vIHJldHVybiBPdXRwdXQoYXJjNC5TdHJpbmcoU3RyaW5nKCJIZWxsbywgIikgKyBuYW1lX2FnZS5uYW1lLm5hdGl2ZSksIGFyYzQuVUludDY0KG5hbWVfYWdlLmFnZS5uYXRpdmUgKiAyKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZnJhbWVfZGlnIC0xCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgYnl0ZWNfMSAvLyAiSGVsbG8sICIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyIC8vIDIKICAgIGV4dHJhY3RfdWludDY0CiAgICBwdXNoaW50IDIgLy8gMgogICAgKgogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4MDAwYQogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5zdGF0ZS5jb250cmFjdC5TdGF0ZS5zZXRfZ2xvYmFsKGludDE6IHVpbnQ2NCwgaW50MjogdWludDY0LCBieXRlczE6IGJ5dGVzLCBieXRlczI6IGJ5dGVzKSAtPiB2b2lkOgpzZXRfZ2xvYmFsOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjEyOS0xMzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9nbG9iYWwoCiAgICAvLyAgICAgc2VsZiwgaW50MTogVUludDY0LCBpbnQyOiBVSW50NjQsIGJ5dGVzMTogU3RyaW5nLCBieXRlczI6IGFyYzQuU3RhdGljQXJyYXlbYXJjNC5CeXRlLCBMaXRlcmFsWzRdXQogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLmludDEgPSBpbnQxCiAgICBwdXNoYnl0ZXMgImludDEiCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM0CiAgICAvLyBzZWxmLmludDIgPSBpbnQyCiAgICBwdXNoYnl0ZXMgImludDIiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM1CiAgICAvLyBzZWxmLmJ5dGVzMSA9IGJ5dGVzMS5ieXRlcwogICAgcHVzaGJ5dGVzICJieXRlczEiCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM2CiAgICAvLyBzZWxmLmJ5dGVzMiA9IGJ5dGVzMi5ieXRlcwogICAgcHVzaGJ5dGVzICJieXRlczIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuc2V0X2xvY2FsKGludDE6IHVpbnQ2NCwgaW50MjogdWludDY0LCBieXRlczE6IGJ5dGVzLCBieXRlczI6IGJ5dGVzKSAtPiB2b2lkOgpzZXRfbG9jYWw6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTM4LTE0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2xvY2FsKAogICAgLy8gICAgIHNlbGYsIGludDE6IFVJbnQ2NCwgaW50MjogVUludDY0LCBieXRlczE6IFN0cmluZywgYnl0ZXMyOiBhcmM0LlN0YXRpY0FycmF5W2FyYzQuQnl0ZSwgTGl0ZXJhbFs0XV0KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gc2VsZi5sb2NhbF9pbnQxW1R4bi5zZW5kZXJdID0gaW50MQogICAgdHhuIFNlbmRlcgogICAgcHVzaGJ5dGVzICJsb2NhbF9pbnQxIgogICAgZnJhbWVfZGlnIC00CiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RhdGUvY29udHJhY3QucHk6MTQzCiAgICAvLyBzZWxmLmxvY2FsX2ludDJbVHhuLnNlbmRlcl0gPSBpbnQyCiAgICB0eG4gU2VuZGVyCiAgICBwdXNoYnl0ZXMgImxvY2FsX2ludDIiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxNDQKICAgIC8vIHNlbGYubG9jYWxfYnl0ZXMxW1R4bi5zZW5kZXJdID0gYnl0ZXMxLmJ5dGVzCiAgICB0eG4gU2VuZGVyCiAgICBwdXNoYnl0ZXMgImxvY2FsX2J5dGVzMSIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gc2VsZi5sb2NhbF9ieXRlczJbVHhuLnNlbmRlcl0gPSBieXRlczIuYnl0ZXMKICAgIHR4biBTZW5kZXIKICAgIHB1c2hieXRlcyAibG9jYWxfYnl0ZXMyIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfbG9jYWxfcHV0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RhdGUuY29udHJhY3QuU3RhdGUuc2V0X2JveChuYW1lOiBieXRlcywgdmFsdWU6IGJ5dGVzKSAtPiB2b2lkOgpzZXRfYm94OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0YXRlL2NvbnRyYWN0LnB5OjE0Ny0xNDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9ib3goc2VsZiwgbmFtZTogYXJjNC5TdGF0aWNBcnJheVthcmM0LkJ5dGUsIExpdGVyYWxbNF1dLCB2YWx1ZTogYXJjNC5TdHJpbmcpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdGF0ZS9jb250cmFjdC5weToxNDkKICAgIC8vIHNlbGYuYm94W25hbWVdID0gdmFsdWUKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuSW1tdXRhYmlsaXR5Q29udHJvbEFSQzRDb250cmFjdC51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyNQogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKFVQREFUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyB1cGRhdGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgdXBkYXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToyNgogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuYmFzZS5jb250cmFjdC5QZXJtYW5lbmNlQ29udHJvbEFSQzRDb250cmFjdC5kZWxldGUoKSAtPiB2b2lkOgpkZWxldGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weTozMgogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKERFTEVUQUJMRV9URU1QTEFURV9OQU1FKSwgIkNoZWNrIGFwcCBpcyBkZWxldGFibGUiCiAgICBpbnRjXzMgLy8gVE1QTF9ERUxFVEFCTEUKICAgIGFzc2VydCAvLyBDaGVjayBhcHAgaXMgZGVsZXRhYmxlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weTozMwogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuYmFzZS5jb250cmFjdC5CYXNlQVJDNENvbnRyYWN0LmF1dGhvcml6ZV9jcmVhdG9yKCkgLT4gdm9pZDoKYXV0aG9yaXplX2NyZWF0b3I6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgInVuYXV0aG9yaXplZCIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5iYXNlLmNvbnRyYWN0LkJhc2VBUkM0Q29udHJhY3QuaXRvYShpOiB1aW50NjQpIC0+IGJ5dGVzOgppdG9hOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTItMTMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgaXRvYShzZWxmLCBpOiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgYnl0ZWNfMiAvLyAiIgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTQKICAgIC8vIGlmIGkgPT0gVUludDY0KDApOgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogaXRvYV9lbHNlX2JvZHlAMgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTUKICAgIC8vIHJldHVybiBTdHJpbmcoIjAiKQogICAgcHVzaGJ5dGVzICIwIgogICAgc3dhcAogICAgcmV0c3ViCgppdG9hX2Vsc2VfYm9keUAyOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTcKICAgIC8vIHJldHVybiAoc2VsZi5pdG9hKGkgLy8gVUludDY0KDEwKSkgaWYgKGkgLy8gVUludDY0KDEwKSkgPiBVSW50NjQoMCkgZWxzZSBTdHJpbmcoIiIpKSArIFN0cmluZy5mcm9tX2J5dGVzKAogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAvCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYnogaXRvYV90ZXJuYXJ5X2ZhbHNlQDQKICAgIGZyYW1lX2RpZyAwCiAgICBjYWxsc3ViIGl0b2EKCml0b2FfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL2Jhc2UvY29udHJhY3QucHk6MTgKICAgIC8vIFN0cmluZygiMDEyMzQ1Njc4OSIpLmJ5dGVzW2kgJSBVSW50NjQoMTApXQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAlCiAgICBwdXNoYnl0ZXMgIjAxMjM0NTY3ODkiCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3LTE5CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIC8vICAgICBTdHJpbmcoIjAxMjM0NTY3ODkiKS5ieXRlc1tpICUgVUludDY0KDEwKV0KICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgcmV0c3ViCgppdG9hX3Rlcm5hcnlfZmFsc2VANDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGIgaXRvYV90ZXJuYXJ5X21lcmdlQDUK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "create_abi(string)string": 0,
+    "create_abi": 0,
+    "update_abi(string)string": 1,
+    "update_abi": 1,
+    "delete_abi(string)string": 2,
+    "delete_abi": 2,
+    "opt_in()void": 3,
+    "opt_in": 3,
+    "error()void": 4,
+    "error": 4,
+    "call_abi(string)string": 5,
+    "call_abi": 5,
+    "call_abi_txn(pay,string)string": 6,
+    "call_abi_txn": 6,
+    "call_with_references(asset,account,application)uint64": 7,
+    "call_with_references": 7,
+    "default_value(string)string": 8,
+    "default_value": 8,
+    "default_value_int(uint64)uint64": 9,
+    "default_value_int": 9,
+    "default_value_from_abi(string)string": 10,
+    "default_value_from_abi": 10,
+    "default_value_from_global_state(uint64)uint64": 11,
+    "default_value_from_global_state": 11,
+    "default_value_from_local_state(string)string": 12,
+    "default_value_from_local_state": 12,
+    "structs((string,uint64))(string,uint64)": 13,
+    "structs": 13,
+    "set_global(uint64,uint64,string,byte[4])void": 14,
+    "set_global": 14,
+    "set_local(uint64,uint64,string,byte[4])void": 15,
+    "set_local": 15,
+    "set_box(byte[4],string)void": 16,
+    "set_box": 16,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,41 +100,165 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
 
-@dataclasses.dataclass(frozen=True)
+class _ReadCaches:
+    """The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them"""
+
+    __slots__ = ("state_cache", "readonly_cache")
+
+    def __init__(self) -> None:
+        self.state_cache: "_StateCache | None" = None
+        self.readonly_cache: "_StateCache | None" = None
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        """Evict the enabled caches once transactions with these confirmations are confirmed"""
+        confirmations = list(confirmations)
+        if self.state_cache is not None:
+            self.state_cache.invalidate(confirmations)
+        if self.readonly_cache is not None:
+            self.readonly_cache.invalidate(confirmations)
+
+
+# ABI types of struct fields encoded by the generic ABI encoder, parsed on first use
+_ABI_TYPES: dict[str, algosdk.abi.ABIType] = {}
+
+
+def _abi_type(type_string: str) -> algosdk.abi.ABIType:
+    abi_type = _ABI_TYPES.get(type_string)
+    if abi_type is None:
+        abi_type = _ABI_TYPES[type_string] = algosdk.abi.ABIType.from_string(type_string)
+    return abi_type
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Input:
     """Struct for Input"""
     name: str
     age: int
 
-@dataclasses.dataclass(frozen=True)
+
+def _input_to_tuple(value: object) -> object:
+    """Convert a Input into the tuple expected by the ABI encoder"""
+    if isinstance(value, Input):
+        return (value.name, value.age)
+    return _convert_dataclass(value)
+
+
+def _input_from_dict(data: dict) -> Input:
+    """Construct a Input from the dict the app client decodes it into"""
+    return Input(
+        name=data["name"],
+        age=data["age"],
+    )
+
+
+def _input_from_tuple(value: tuple | list) -> Input:
+    """Construct a Input from the tuple decoded by the ABI decoder"""
+    return Input(
+        name=value[0],
+        age=value[1],
+    )
+
+
+def _input_to_bytes(value: Input) -> bytes:
+    """Encode a Input into its ABI encoding"""
+    tail_0 = value.name.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    return b"".join((
+        b"\x00\x0a",
+        value.age.to_bytes(8, "big"),
+        tail_0,
+    ))
+
+
+def _input_from_bytes(data: bytes) -> Input:
+    """Construct a Input from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        10 == start_0 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == len(data) - start_0 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Input")
+    return Input(
+        name=data[start_0 + 2:].decode(),
+        age=int.from_bytes(data[2:10], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Output:
     """Struct for Output"""
     message: str
     result: int
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+def _output_to_tuple(value: object) -> object:
+    """Convert a Output into the tuple expected by the ABI encoder"""
+    if isinstance(value, Output):
+        return (value.message, value.result)
+    return _convert_dataclass(value)
+
+
+def _output_from_dict(data: dict) -> Output:
+    """Construct a Output from the dict the app client decodes it into"""
+    return Output(
+        message=data["message"],
+        result=data["result"],
+    )
+
+
+def _output_from_tuple(value: tuple | list) -> Output:
+    """Construct a Output from the tuple decoded by the ABI decoder"""
+    return Output(
+        message=value[0],
+        result=value[1],
+    )
+
+
+def _output_to_bytes(value: Output) -> bytes:
+    """Encode a Output into its ABI encoding"""
+    tail_0 = value.message.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    return b"".join((
+        b"\x00\x0a",
+        value.result.to_bytes(8, "big"),
+        tail_0,
+    ))
+
+
+def _output_from_bytes(data: bytes) -> Output:
+    """Construct a Output from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        10 == start_0 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == len(data) - start_0 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Output")
+    return Output(
+        message=data[start_0 + 2:].decode(),
+        result=int.from_bytes(data[2:10], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CallAbiArgs:
     """Dataclass for call_abi arguments"""
     value: str
@@ -86,7 +267,14 @@ class CallAbiArgs:
     def abi_method_signature(self) -> str:
         return "call_abi(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _call_abi_args_to_abi(args: tuple[str] | CallAbiArgs) -> list[typing.Any] | None:
+    """Convert call_abi args into the list of ABI args expected by the app client"""
+    if isinstance(args, CallAbiArgs):
+        return [args.value]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CallAbiTxnArgs:
     """Dataclass for call_abi_txn arguments"""
     txn: algokit_utils.AppMethodCallTransactionArgument
@@ -96,7 +284,14 @@ class CallAbiTxnArgs:
     def abi_method_signature(self) -> str:
         return "call_abi_txn(pay,string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _call_abi_txn_args_to_abi(args: tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs) -> list[typing.Any] | None:
+    """Convert call_abi_txn args into the list of ABI args expected by the app client"""
+    if isinstance(args, CallAbiTxnArgs):
+        return [args.txn, args.value]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CallWithReferencesArgs:
     """Dataclass for call_with_references arguments"""
     asset: int
@@ -107,7 +302,14 @@ class CallWithReferencesArgs:
     def abi_method_signature(self) -> str:
         return "call_with_references(asset,account,application)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _call_with_references_args_to_abi(args: tuple[int, str | bytes, int] | CallWithReferencesArgs) -> list[typing.Any] | None:
+    """Convert call_with_references args into the list of ABI args expected by the app client"""
+    if isinstance(args, CallWithReferencesArgs):
+        return [args.asset, args.account, args.application]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DefaultValueArgs:
     """Dataclass for default_value arguments"""
     arg_with_default: str | None = None
@@ -116,7 +318,14 @@ class DefaultValueArgs:
     def abi_method_signature(self) -> str:
         return "default_value(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _default_value_args_to_abi(args: tuple[str | None] | DefaultValueArgs | None) -> list[typing.Any] | None:
+    """Convert default_value args into the list of ABI args expected by the app client"""
+    if isinstance(args, DefaultValueArgs):
+        return [args.arg_with_default]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DefaultValueIntArgs:
     """Dataclass for default_value_int arguments"""
     arg_with_default: int | None = None
@@ -125,7 +334,14 @@ class DefaultValueIntArgs:
     def abi_method_signature(self) -> str:
         return "default_value_int(uint64)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _default_value_int_args_to_abi(args: tuple[int | None] | DefaultValueIntArgs | None) -> list[typing.Any] | None:
+    """Convert default_value_int args into the list of ABI args expected by the app client"""
+    if isinstance(args, DefaultValueIntArgs):
+        return [args.arg_with_default]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DefaultValueFromAbiArgs:
     """Dataclass for default_value_from_abi arguments"""
     arg_with_default: str | None = None
@@ -134,7 +350,14 @@ class DefaultValueFromAbiArgs:
     def abi_method_signature(self) -> str:
         return "default_value_from_abi(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _default_value_from_abi_args_to_abi(args: tuple[str | None] | DefaultValueFromAbiArgs | None) -> list[typing.Any] | None:
+    """Convert default_value_from_abi args into the list of ABI args expected by the app client"""
+    if isinstance(args, DefaultValueFromAbiArgs):
+        return [args.arg_with_default]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DefaultValueFromGlobalStateArgs:
     """Dataclass for default_value_from_global_state arguments"""
     arg_with_default: int | None = None
@@ -143,7 +366,14 @@ class DefaultValueFromGlobalStateArgs:
     def abi_method_signature(self) -> str:
         return "default_value_from_global_state(uint64)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _default_value_from_global_state_args_to_abi(args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None) -> list[typing.Any] | None:
+    """Convert default_value_from_global_state args into the list of ABI args expected by the app client"""
+    if isinstance(args, DefaultValueFromGlobalStateArgs):
+        return [args.arg_with_default]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DefaultValueFromLocalStateArgs:
     """Dataclass for default_value_from_local_state arguments"""
     arg_with_default: str | None = None
@@ -152,7 +382,14 @@ class DefaultValueFromLocalStateArgs:
     def abi_method_signature(self) -> str:
         return "default_value_from_local_state(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _default_value_from_local_state_args_to_abi(args: tuple[str | None] | DefaultValueFromLocalStateArgs | None) -> list[typing.Any] | None:
+    """Convert default_value_from_local_state args into the list of ABI args expected by the app client"""
+    if isinstance(args, DefaultValueFromLocalStateArgs):
+        return [args.arg_with_default]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class StructsArgs:
     """Dataclass for structs arguments"""
     name_age: Input
@@ -161,7 +398,14 @@ class StructsArgs:
     def abi_method_signature(self) -> str:
         return "structs((string,uint64))(string,uint64)"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _structs_args_to_abi(args: tuple[Input] | StructsArgs) -> list[typing.Any] | None:
+    """Convert structs args into the list of ABI args expected by the app client"""
+    if isinstance(args, StructsArgs):
+        return [_input_to_tuple(args.name_age)]
+    return _parse_abi_args(args)
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class SetGlobalArgs:
     """Dataclass for set_global arguments"""
     int1: int
@@ -173,7 +417,14 @@ class SetGlobalArgs:
     def abi_method_signature(self) -> str:
         return "set_global(uint64,uint64,string,byte[4])void"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _set_global_args_to_abi(args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs) -> list[typing.Any] | None:
+    """Convert set_global args into the list of ABI args expected by the app client"""
+    if isinstance(args, SetGlobalArgs):
+        return [args.int1, args.int2, args.bytes1, args.bytes2]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class SetLocalArgs:
     """Dataclass for set_local arguments"""
     int1: int
@@ -185,7 +436,14 @@ class SetLocalArgs:
     def abi_method_signature(self) -> str:
         return "set_local(uint64,uint64,string,byte[4])void"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _set_local_args_to_abi(args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs) -> list[typing.Any] | None:
+    """Convert set_local args into the list of ABI args expected by the app client"""
+    if isinstance(args, SetLocalArgs):
+        return [args.int1, args.int2, args.bytes1, args.bytes2]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class SetBoxArgs:
     """Dataclass for set_box arguments"""
     name: bytes | str | tuple[int, int, int, int]
@@ -195,7 +453,14 @@ class SetBoxArgs:
     def abi_method_signature(self) -> str:
         return "set_box(byte[4],string)void"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _set_box_args_to_abi(args: tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs) -> list[typing.Any] | None:
+    """Convert set_box args into the list of ABI args expected by the app client"""
+    if isinstance(args, SetBoxArgs):
+        return [args.name, args.value]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateAbiArgs:
     """Dataclass for create_abi arguments"""
     input: str
@@ -204,7 +469,14 @@ class CreateAbiArgs:
     def abi_method_signature(self) -> str:
         return "create_abi(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _create_abi_args_to_abi(args: tuple[str] | CreateAbiArgs) -> list[typing.Any] | None:
+    """Convert create_abi args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateAbiArgs):
+        return [args.input]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class UpdateAbiArgs:
     """Dataclass for update_abi arguments"""
     input: str
@@ -213,7 +485,14 @@ class UpdateAbiArgs:
     def abi_method_signature(self) -> str:
         return "update_abi(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _update_abi_args_to_abi(args: tuple[str] | UpdateAbiArgs) -> list[typing.Any] | None:
+    """Convert update_abi args into the list of ABI args expected by the app client"""
+    if isinstance(args, UpdateAbiArgs):
+        return [args.input]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DeleteAbiArgs:
     """Dataclass for delete_abi arguments"""
     input: str
@@ -223,7 +502,597 @@ class DeleteAbiArgs:
         return "delete_abi(string)string"
 
 
+def _delete_abi_args_to_abi(args: tuple[str] | DeleteAbiArgs) -> list[typing.Any] | None:
+    """Convert delete_abi args into the list of ABI args expected by the app client"""
+    if isinstance(args, DeleteAbiArgs):
+        return [args.input]
+    return [*args] if args else None
+
+
+def _get_app_call_transaction(
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+) -> algosdk.transaction.ApplicationCallTxn:
+    if transaction is None:
+        raise ValueError("The app call transaction is needed to resolve the reference args of the call")
+    return transaction
+
+
+def _account_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> str:
+    transaction = _get_app_call_transaction(transaction)
+    return transaction.sender if index == 0 else (transaction.accounts or [])[index - 1]
+
+
+def _asset_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> int:
+    return (_get_app_call_transaction(transaction).foreign_assets or [])[index]
+
+
+def _application_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> int:
+    transaction = _get_app_call_transaction(transaction)
+    return transaction.index if index == 0 else (transaction.foreign_apps or [])[index - 1]
+
+
+def _transaction_arg(
+    group: typing.Sequence[algosdk.transaction.Transaction], count: int, position: int
+) -> algosdk.transaction.Transaction:
+    # transaction args are the transactions preceding the app call in its group
+    if len(group) < count:
+        raise ValueError(f"The {count} transactions preceding the app call are needed to resolve its transaction args")
+    return group[len(group) - count + position]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ErrorArgs:
+    """Dataclass for error arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "error()void"
+
+
+def _error_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> ErrorArgs:
+    """Decode the args of a call of error()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of error()void")
+    return ErrorArgs()
+
+
+def _call_abi_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CallAbiArgs:
+    """Decode the args of a call of call_abi(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of call_abi(string)string")
+    return CallAbiArgs(
+        value=app_args[1][2:].decode(),
+    )
+
+
+def _call_abi_txn_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CallAbiTxnArgs:
+    """Decode the args of a call of call_abi_txn(pay,string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of call_abi_txn(pay,string)string")
+    return CallAbiTxnArgs(
+        txn=_transaction_arg(group, 1, 0),
+        value=app_args[1][2:].decode(),
+    )
+
+
+def _call_with_references_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CallWithReferencesArgs:
+    """Decode the args of a call of call_with_references(asset,account,application)uint64 from its app args"""
+    if not (
+        len(app_args) == 4
+        and len(app_args[1]) == 1
+        and len(app_args[2]) == 1
+        and len(app_args[3]) == 1
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of call_with_references(asset,account,application)uint64")
+    return CallWithReferencesArgs(
+        asset=_asset_arg(app_args[1][0], transaction),
+        account=_account_arg(app_args[2][0], transaction),
+        application=_application_arg(app_args[3][0], transaction),
+    )
+
+
+def _default_value_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DefaultValueArgs:
+    """Decode the args of a call of default_value(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of default_value(string)string")
+    return DefaultValueArgs(
+        arg_with_default=app_args[1][2:].decode(),
+    )
+
+
+def _default_value_int_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DefaultValueIntArgs:
+    """Decode the args of a call of default_value_int(uint64)uint64 from its app args"""
+    if not (
+        len(app_args) == 2
+        and len(app_args[1]) == 8
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of default_value_int(uint64)uint64")
+    return DefaultValueIntArgs(
+        arg_with_default=int.from_bytes(app_args[1], "big"),
+    )
+
+
+def _default_value_from_abi_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DefaultValueFromAbiArgs:
+    """Decode the args of a call of default_value_from_abi(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of default_value_from_abi(string)string")
+    return DefaultValueFromAbiArgs(
+        arg_with_default=app_args[1][2:].decode(),
+    )
+
+
+def _default_value_from_global_state_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DefaultValueFromGlobalStateArgs:
+    """Decode the args of a call of default_value_from_global_state(uint64)uint64 from its app args"""
+    if not (
+        len(app_args) == 2
+        and len(app_args[1]) == 8
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of default_value_from_global_state(uint64)uint64")
+    return DefaultValueFromGlobalStateArgs(
+        arg_with_default=int.from_bytes(app_args[1], "big"),
+    )
+
+
+def _default_value_from_local_state_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DefaultValueFromLocalStateArgs:
+    """Decode the args of a call of default_value_from_local_state(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of default_value_from_local_state(string)string")
+    return DefaultValueFromLocalStateArgs(
+        arg_with_default=app_args[1][2:].decode(),
+    )
+
+
+def _structs_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> StructsArgs:
+    """Decode the args of a call of structs((string,uint64))(string,uint64) from its app args"""
+    if len(app_args) != 2:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of structs((string,uint64))(string,uint64)")
+    return StructsArgs(
+        name_age=_input_from_bytes(app_args[1]),
+    )
+
+
+def _set_global_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> SetGlobalArgs:
+    """Decode the args of a call of set_global(uint64,uint64,string,byte[4])void from its app args"""
+    if not (
+        len(app_args) == 5
+        and len(app_args[1]) == 8
+        and len(app_args[2]) == 8
+        and int.from_bytes(app_args[3][:2], "big") == len(app_args[3]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of set_global(uint64,uint64,string,byte[4])void")
+    return SetGlobalArgs(
+        int1=int.from_bytes(app_args[1], "big"),
+        int2=int.from_bytes(app_args[2], "big"),
+        bytes1=app_args[3][2:].decode(),
+        bytes2=_abi_type("byte[4]").decode(app_args[4]),
+    )
+
+
+def _set_local_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> SetLocalArgs:
+    """Decode the args of a call of set_local(uint64,uint64,string,byte[4])void from its app args"""
+    if not (
+        len(app_args) == 5
+        and len(app_args[1]) == 8
+        and len(app_args[2]) == 8
+        and int.from_bytes(app_args[3][:2], "big") == len(app_args[3]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of set_local(uint64,uint64,string,byte[4])void")
+    return SetLocalArgs(
+        int1=int.from_bytes(app_args[1], "big"),
+        int2=int.from_bytes(app_args[2], "big"),
+        bytes1=app_args[3][2:].decode(),
+        bytes2=_abi_type("byte[4]").decode(app_args[4]),
+    )
+
+
+def _set_box_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> SetBoxArgs:
+    """Decode the args of a call of set_box(byte[4],string)void from its app args"""
+    if not (
+        len(app_args) == 3
+        and int.from_bytes(app_args[2][:2], "big") == len(app_args[2]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of set_box(byte[4],string)void")
+    return SetBoxArgs(
+        name=_abi_type("byte[4]").decode(app_args[1]),
+        value=app_args[2][2:].decode(),
+    )
+
+
+def _create_abi_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateAbiArgs:
+    """Decode the args of a call of create_abi(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create_abi(string)string")
+    return CreateAbiArgs(
+        input=app_args[1][2:].decode(),
+    )
+
+
+def _update_abi_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> UpdateAbiArgs:
+    """Decode the args of a call of update_abi(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of update_abi(string)string")
+    return UpdateAbiArgs(
+        input=app_args[1][2:].decode(),
+    )
+
+
+def _delete_abi_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> DeleteAbiArgs:
+    """Decode the args of a call of delete_abi(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of delete_abi(string)string")
+    return DeleteAbiArgs(
+        input=app_args[1][2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class OptInArgs:
+    """Dataclass for opt_in arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "opt_in()void"
+
+
+def _opt_in_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> OptInArgs:
+    """Decode the args of a call of opt_in()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of opt_in()void")
+    return OptInArgs()
+
+
+StateMethodArgs: typing.TypeAlias = ErrorArgs | CallAbiArgs | CallAbiTxnArgs | CallWithReferencesArgs | DefaultValueArgs | DefaultValueIntArgs | DefaultValueFromAbiArgs | DefaultValueFromGlobalStateArgs | DefaultValueFromLocalStateArgs | StructsArgs | SetGlobalArgs | SetLocalArgs | SetBoxArgs | CreateAbiArgs | UpdateAbiArgs | DeleteAbiArgs | OptInArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    StateMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x44\xd0\xda\x0d": _error_args_from_app_args,  # error()void
+    b"\xf1\x7e\x80\xa5": _call_abi_args_from_app_args,  # call_abi(string)string
+    b"\x0a\x92\xa8\x1e": _call_abi_txn_args_from_app_args,  # call_abi_txn(pay,string)string
+    b"\xfe\xfd\xf1\x1e": _call_with_references_args_from_app_args,  # call_with_references(asset,account,application)uint64
+    b"\x57\x4b\x55\xc8": _default_value_args_from_app_args,  # default_value(string)string
+    b"\x36\x03\x62\xe9": _default_value_int_args_from_app_args,  # default_value_int(uint64)uint64
+    b"\x46\xd2\x11\xa3": _default_value_from_abi_args_from_app_args,  # default_value_from_abi(string)string
+    b"\x0c\xfc\xbb\x00": _default_value_from_global_state_args_from_app_args,  # default_value_from_global_state(uint64)uint64
+    b"\xd0\xf0\xba\xf8": _default_value_from_local_state_args_from_app_args,  # default_value_from_local_state(string)string
+    b"\x24\x6b\xeb\x83": _structs_args_from_app_args,  # structs((string,uint64))(string,uint64)
+    b"\xa4\xcf\x8d\xea": _set_global_args_from_app_args,  # set_global(uint64,uint64,string,byte[4])void
+    b"\xce\xc2\x83\x4a": _set_local_args_from_app_args,  # set_local(uint64,uint64,string,byte[4])void
+    b"\xa4\xb4\xa2\x30": _set_box_args_from_app_args,  # set_box(byte[4],string)void
+    b"\x9d\x52\x30\x40": _create_abi_args_from_app_args,  # create_abi(string)string
+    b"\x3c\xa5\xce\xb7": _update_abi_args_from_app_args,  # update_abi(string)string
+    b"\x27\x1b\x4e\xe9": _delete_abi_args_from_app_args,  # delete_abi(string)string
+    b"\x30\xc6\xd5\x8a": _opt_in_args_from_app_args,  # opt_in()void
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> StateMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StateAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: StateMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x44\xd0\xda\x0d": "error()void",
+    b"\xf1\x7e\x80\xa5": "call_abi(string)string",
+    b"\x0a\x92\xa8\x1e": "call_abi_txn(pay,string)string",
+    b"\xfe\xfd\xf1\x1e": "call_with_references(asset,account,application)uint64",
+    b"\x57\x4b\x55\xc8": "default_value(string)string",
+    b"\x36\x03\x62\xe9": "default_value_int(uint64)uint64",
+    b"\x46\xd2\x11\xa3": "default_value_from_abi(string)string",
+    b"\x0c\xfc\xbb\x00": "default_value_from_global_state(uint64)uint64",
+    b"\xd0\xf0\xba\xf8": "default_value_from_local_state(string)string",
+    b"\x24\x6b\xeb\x83": "structs((string,uint64))(string,uint64)",
+    b"\xa4\xcf\x8d\xea": "set_global(uint64,uint64,string,byte[4])void",
+    b"\xce\xc2\x83\x4a": "set_local(uint64,uint64,string,byte[4])void",
+    b"\xa4\xb4\xa2\x30": "set_box(byte[4],string)void",
+    b"\x9d\x52\x30\x40": "create_abi(string)string",
+    b"\x3c\xa5\xce\xb7": "update_abi(string)string",
+    b"\x27\x1b\x4e\xe9": "delete_abi(string)string",
+    b"\x30\xc6\xd5\x8a": "opt_in()void",
+}
+
+
+def _get_preceding_group_transactions(
+    transactions: list[dict[str, typing.Any]], index: int
+) -> list[algosdk.transaction.Transaction]:
+    """Get the transactions preceding a transaction of a block in its group, none for indexer transactions"""
+    group_id = transactions[index].get("txn", {}).get("grp")
+    start = index
+    while group_id is not None and start > 0 and transactions[start - 1].get("txn", {}).get("grp") == group_id:
+        start -= 1
+    # the transactions of a block omit the fields implied by the block, e.g. the genesis hash
+    return [
+        algosdk.transaction.Transaction.undictify({"lv": 0, **transaction["txn"]})
+        for transaction in transactions[start:index]
+    ]
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> StateMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    transaction = transactions[index]
+    if "txn" in transaction:
+        txn = transaction["txn"]
+        sender, app_id = algosdk.encoding.encode_address(txn["snd"]), txn.get("apid") or transaction.get("apid", 0)
+        accounts = [algosdk.encoding.encode_address(account) for account in txn.get("apat") or []]
+        foreign_apps, foreign_assets = txn.get("apfa"), txn.get("apas")
+    else:
+        application = transaction["application-transaction"]
+        sender = transaction["sender"]
+        app_id = application["application-id"] or transaction.get("created-application-index", 0)
+        accounts, foreign_apps = application.get("accounts"), application.get("foreign-apps")
+        foreign_assets = application.get("foreign-assets")
+    # only the sender, app ID and foreign arrays of the app call are read to resolve its reference args
+    app_call_transaction = algosdk.transaction.ApplicationCallTxn(
+        sender,
+        algosdk.transaction.SuggestedParams(0, 0, 0, "", flat_fee=True),
+        app_id,
+        OnComplete.NoOpOC,
+        accounts=accounts,
+        foreign_apps=foreign_apps,
+        foreign_assets=foreign_assets,
+    )
+    try:
+        return decode_app_call(app_args, transaction=app_call_transaction, group=_get_preceding_group_transactions(transactions, index))
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args, or transaction args of indexer transactions
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[StateAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield StateAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[StateAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[StateAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[StateAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[StateAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class _StateUpdate:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -238,17 +1107,19 @@ class _StateUpdate:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppUpdateMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
+        method_args = _update_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
-            "args": method_args,
-        }))
+        return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_abi(string)string",
+            args=method_args,
+        ))
 
 
 class _StateDelete:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -262,16 +1133,18 @@ class _StateDelete:
         args: tuple[str] | DeleteAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppDeleteMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _delete_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_abi(string)string",
+            args=method_args,
+        ))
 
 
 class _StateOptIn:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -280,208 +1153,219 @@ class _StateOptIn:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ))
 
 
 class StateParams:
+    __slots__ = ("app_client", "_update", "_delete", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_StateUpdate | None" = None
+        self._delete: "_StateDelete | None" = None
+        self._opt_in: "_StateOptIn | None" = None
 
     @property
     def update(self) -> "_StateUpdate":
-        return _StateUpdate(self.app_client)
+        if self._update is None:
+            self._update = _StateUpdate(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_StateDelete":
-        return _StateDelete(self.app_client)
+        if self._delete is None:
+            self._delete = _StateDelete(self.app_client)
+        return self._delete
 
     @property
     def opt_in(self) -> "_StateOptIn":
-        return _StateOptIn(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StateOptIn(self.app_client)
+        return self._opt_in
 
     def error(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="error()void",
+        ))
 
     def call_abi(
         self,
         args: tuple[str] | CallAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _call_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi(string)string",
+            args=method_args,
+        ))
 
     def call_abi_txn(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        method_args = _call_abi_txn_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi_txn(pay,string)string",
+            args=method_args,
+        ))
 
     def call_with_references(
         self,
         args: tuple[int, str | bytes, int] | CallWithReferencesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        method_args = _call_with_references_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_with_references(asset,account,application)uint64",
+            args=method_args,
+        ))
 
     def default_value(
         self,
         args: tuple[str | None] | DefaultValueArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value(string)string",
+            args=method_args,
+        ))
 
     def default_value_int(
         self,
         args: tuple[int | None] | DefaultValueIntArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        method_args = _default_value_int_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_int(uint64)uint64",
+            args=method_args,
+        ))
 
     def default_value_from_abi(
         self,
         args: tuple[str | None] | DefaultValueFromAbiArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_abi(string)string",
+            args=method_args,
+        ))
 
     def default_value_from_global_state(
         self,
         args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_global_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_global_state(uint64)uint64",
+            args=method_args,
+        ))
 
     def default_value_from_local_state(
         self,
         args: tuple[str | None] | DefaultValueFromLocalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_local_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_local_state(string)string",
+            args=method_args,
+        ))
 
     def structs(
         self,
         args: tuple[Input] | StructsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        method_args = _structs_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="structs((string,uint64))(string,uint64)",
+            args=method_args,
+        ))
 
     def set_global(
         self,
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        method_args = _set_global_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_global(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ))
 
     def set_local(
         self,
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        method_args = _set_local_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_local(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ))
 
     def set_box(
         self,
         args: tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        method_args = _set_box_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_box(byte[4],string)void",
+            args=method_args,
+        ))
 
     def create_abi(
         self,
         args: tuple[str] | CreateAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _create_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create_abi(string)string",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -495,6 +1379,8 @@ class StateParams:
 
 
 class _StateUpdateTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -507,17 +1393,19 @@ class _StateUpdateTransaction:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
+        method_args = _update_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
-            "args": method_args,
-        }))
+        return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_abi(string)string",
+            args=method_args,
+        ))
 
 
 class _StateDeleteTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -529,16 +1417,18 @@ class _StateDeleteTransaction:
         args: tuple[str] | DeleteAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _delete_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_abi(string)string",
+            args=method_args,
+        ))
 
 
 class _StateOptInTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -547,208 +1437,219 @@ class _StateOptInTransaction:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ))
 
 
 class StateCreateTransactionParams:
+    __slots__ = ("app_client", "_update", "_delete", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._update: "_StateUpdateTransaction | None" = None
+        self._delete: "_StateDeleteTransaction | None" = None
+        self._opt_in: "_StateOptInTransaction | None" = None
 
     @property
     def update(self) -> "_StateUpdateTransaction":
-        return _StateUpdateTransaction(self.app_client)
+        if self._update is None:
+            self._update = _StateUpdateTransaction(self.app_client)
+        return self._update
 
     @property
     def delete(self) -> "_StateDeleteTransaction":
-        return _StateDeleteTransaction(self.app_client)
+        if self._delete is None:
+            self._delete = _StateDeleteTransaction(self.app_client)
+        return self._delete
 
     @property
     def opt_in(self) -> "_StateOptInTransaction":
-        return _StateOptInTransaction(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StateOptInTransaction(self.app_client)
+        return self._opt_in
 
     def error(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="error()void",
+        ))
 
     def call_abi(
         self,
         args: tuple[str] | CallAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _call_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi(string)string",
+            args=method_args,
+        ))
 
     def call_abi_txn(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        method_args = _call_abi_txn_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi_txn(pay,string)string",
+            args=method_args,
+        ))
 
     def call_with_references(
         self,
         args: tuple[int, str | bytes, int] | CallWithReferencesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        method_args = _call_with_references_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_with_references(asset,account,application)uint64",
+            args=method_args,
+        ))
 
     def default_value(
         self,
         args: tuple[str | None] | DefaultValueArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value(string)string",
+            args=method_args,
+        ))
 
     def default_value_int(
         self,
         args: tuple[int | None] | DefaultValueIntArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        method_args = _default_value_int_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_int(uint64)uint64",
+            args=method_args,
+        ))
 
     def default_value_from_abi(
         self,
         args: tuple[str | None] | DefaultValueFromAbiArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_abi(string)string",
+            args=method_args,
+        ))
 
     def default_value_from_global_state(
         self,
         args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_global_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_global_state(uint64)uint64",
+            args=method_args,
+        ))
 
     def default_value_from_local_state(
         self,
         args: tuple[str | None] | DefaultValueFromLocalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        method_args = _default_value_from_local_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_local_state(string)string",
+            args=method_args,
+        ))
 
     def structs(
         self,
         args: tuple[Input] | StructsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        method_args = _structs_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="structs((string,uint64))(string,uint64)",
+            args=method_args,
+        ))
 
     def set_global(
         self,
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        method_args = _set_global_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_global(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ))
 
     def set_local(
         self,
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        method_args = _set_local_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_local(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ))
 
     def set_box(
         self,
         args: tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        method_args = _set_box_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_box(byte[4],string)void",
+            args=method_args,
+        ))
 
     def create_abi(
         self,
         args: tuple[str] | CreateAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }))
+        method_args = _create_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create_abi(string)string",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -762,8 +1663,11 @@ class StateCreateTransactionParams:
 
 
 class _StateUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def bare(
         self,
@@ -771,11 +1675,14 @@ class _StateUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.update(
+        response = self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
             compilation_params=compilation_params
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
     def update_abi(
         self,
@@ -784,21 +1691,26 @@ class _StateUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
+        method_args = _update_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
-        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params, compilation_params=compilation_params)
+        response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="update_abi(string)string",
+            args=method_args,
+        ), send_params=send_params, compilation_params=compilation_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppUpdateTransactionResult[str], parsed_response)
 
 
 class _StateDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def bare(
         self,
@@ -806,11 +1718,14 @@ class _StateDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.delete(
+        response = self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
             
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
     def delete_abi(
         self,
@@ -818,20 +1733,25 @@ class _StateDeleteSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _delete_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="delete_abi(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class _StateOptInSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def opt_in(
         self,
@@ -839,30 +1759,99 @@ class _StateOptInSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
 
+# ABI types canonically encoding the args of each readonly method, parsed on first use
+_READONLY_ARGS_TYPES = {
+    "error()void": "()",
+    "call_abi(string)string": "(string)",
+    "default_value(string)string": "(string)",
+    "default_value_int(uint64)uint64": "(uint64)",
+    "default_value_from_abi(string)string": "(string)",
+    "default_value_from_global_state(uint64)uint64": "(uint64)",
+    "default_value_from_local_state(string)string": "(string)",
+}
+_READONLY_ARGS_CODECS: dict[str, algosdk.abi.ABIType] = {}
+
+
+def _readonly_cache_key(params: algokit_utils.AppClientMethodCallParams) -> typing.Hashable | None:
+    """Key a readonly call by its method signature, canonically encoded args and sender
+
+    Calls with args that can't be encoded, e.g. omitted args filled in with default values by the app client, aren't
+    cached
+    """
+    codec = _READONLY_ARGS_CODECS.get(params.method)
+    if codec is None:
+        codec = _READONLY_ARGS_CODECS[params.method] = algosdk.abi.ABIType.from_string(
+            _READONLY_ARGS_TYPES[params.method]
+        )
+    try:
+        encoded_args = codec.encode(params.args or [])
+    except (algosdk.error.ABIEncodingError, IndexError, TypeError, ValueError):
+        return None
+    return params.method, encoded_args, params.sender
+
+
 class StateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_client", "_update", "_delete", "_opt_in", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "StateClient | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._update: "_StateUpdateSend | None" = None
+        self._delete: "_StateDeleteSend | None" = None
+        self._opt_in: "_StateOptInSend | None" = None
+        self._batch: "_StateBatchSend | None" = None
 
     @property
     def update(self) -> "_StateUpdateSend":
-        return _StateUpdateSend(self.app_client)
+        if self._update is None:
+            self._update = _StateUpdateSend(self.app_client, self._caches)
+        return self._update
 
     @property
     def delete(self) -> "_StateDeleteSend":
-        return _StateDeleteSend(self.app_client)
+        if self._delete is None:
+            self._delete = _StateDeleteSend(self.app_client, self._caches)
+        return self._delete
 
     @property
     def opt_in(self) -> "_StateOptInSend":
-        return _StateOptInSend(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StateOptInSend(self.app_client, self._caches)
+        return self._opt_in
+
+    @property
+    def batch(self) -> "_StateBatchSend":
+        if self._batch is None:
+            self._batch = _StateBatchSend(self.app_client, self._client)
+        return self._batch
+
+    def _call_readonly(
+        self, params: algokit_utils.AppClientMethodCallParams, send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.Arc56ReturnValueType]:
+        """Simulate a readonly call, reusing the result of an earlier call with the same args and sender while it's
+        cached"""
+        cache = self._caches.readonly_cache if self._caches is not None else None
+        key = _readonly_cache_key(params) if cache is not None else None
+        if cache is None or key is None:
+            return self.app_client.send.call(params, send_params=send_params)
+        return cache.get(
+            key,
+            lambda: self.app_client.send.call(params, send_params=send_params),
+            # readonly calls are simulated against the round the transaction is valid from
+            round_of=lambda response: response.transaction.raw.first_valid_round,
+        )
 
     def error(
         self,
@@ -870,11 +1859,11 @@ class StateSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="error()void",
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -884,13 +1873,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _call_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi(string)string",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -900,13 +1889,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _call_abi_txn_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_abi_txn(pay,string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -916,13 +1907,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _call_with_references_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="call_with_references(asset,account,application)uint64",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -932,13 +1925,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _default_value_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value(string)string",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -948,13 +1941,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _default_value_int_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_int(uint64)uint64",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -964,13 +1957,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _default_value_from_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_abi(string)string",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -980,13 +1973,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _default_value_from_global_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_global_state(uint64)uint64",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -996,13 +1989,13 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _default_value_from_local_state_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="default_value_from_local_state(string)string",
+            args=method_args,
+        ), send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -1012,14 +2005,16 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[Output]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Output, typing.cast(dict, response.abi_return))) # type: ignore
+        method_args = _structs_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="structs((string,uint64))(string,uint64)",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = dataclasses.replace(response, abi_return=_output_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[Output], parsed_response)
 
     def set_global(
@@ -1028,13 +2023,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _set_global_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_global(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1044,13 +2041,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _set_local_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_local(uint64,uint64,string,byte[4])void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1060,13 +2059,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _set_box_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="set_box(byte[4],string)void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1076,13 +2077,15 @@ class StateSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _create_abi_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create_abi(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -1091,10 +2094,13 @@ class StateSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
+        response = self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -1114,162 +2120,358 @@ class LocalStateValue(typing.TypedDict):
     local_int1: int
     local_int2: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    bytes1: bytes
+    bytes2: bytes
+    bytes_not_in_snake_case: bytes
+    int1: int
+    int2: int
+    value: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LocalStateSnapshot:
+    """Values of every local_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Round of the ledger the values were read from"""
+    local_bytes_not_in_snake_case: bytes
+    local_bytes1: bytes
+    local_bytes2: bytes
+    local_int1: int
+    local_int2: int
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
 class StateState:
     """Methods to access state for the current State app"""
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_global_state")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
 
     @property
-    def global_state(
-        self
-    ) -> "_GlobalState":
-            """Methods to access global_state for the current app"""
-            return _GlobalState(self.app_client)
-
-    def local_state(
-        self, address: str
-    ) -> "_LocalState":
-            """Methods to access local_state for the current app"""
-            return _LocalState(self.app_client, address)
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
+    def local_state(self, address: str) -> "_LocalState":
+        """Methods to access local_state for the current app"""
+        return _LocalState(self.app_client, address, self._caches)
+
 
 class _GlobalState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
-        result = self.app_client.state.global_state.get_all()
-        if not result:
-            return typing.cast(GlobalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(GlobalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        return typing.cast(GlobalStateValue, result)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            bytes1=typing.cast(bytes, _decode_state_value(state.get("Ynl0ZXMx"), "AVMBytes")),
+            bytes2=typing.cast(bytes, _decode_state_value(state.get("Ynl0ZXMy"), "AVMBytes")),
+            bytes_not_in_snake_case=typing.cast(bytes, _decode_state_value(state.get("Ynl0ZXNOb3RJblNuYWtlQ2FzZQ=="), "AVMBytes")),
+            int1=typing.cast(int, _decode_state_value(state.get("aW50MQ=="), "AVMUint64")),
+            int2=typing.cast(int, _decode_state_value(state.get("aW50Mg=="), "AVMUint64")),
+            value=typing.cast(int, _decode_state_value(state.get("dmFsdWU="), "AVMUint64")),
+        )
 
     @property
     def bytes1(self) -> bytes:
         """Get the current value of the bytes1 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("bytes1")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "bytes1"), lambda: self.app_client.state.global_state.get_value("bytes1"))
         return typing.cast(bytes, value)
 
     @property
     def bytes2(self) -> bytes:
         """Get the current value of the bytes2 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("bytes2")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "bytes2"), lambda: self.app_client.state.global_state.get_value("bytes2"))
         return typing.cast(bytes, value)
 
     @property
     def bytes_not_in_snake_case(self) -> bytes:
         """Get the current value of the bytesNotInSnakeCase key in global_state state"""
-        value = self.app_client.state.global_state.get_value("bytesNotInSnakeCase")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "bytesNotInSnakeCase"), lambda: self.app_client.state.global_state.get_value("bytesNotInSnakeCase"))
         return typing.cast(bytes, value)
 
     @property
     def int1(self) -> int:
         """Get the current value of the int1 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("int1")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "int1"), lambda: self.app_client.state.global_state.get_value("int1"))
         return typing.cast(int, value)
 
     @property
     def int2(self) -> int:
         """Get the current value of the int2 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("int2")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "int2"), lambda: self.app_client.state.global_state.get_value("int2"))
         return typing.cast(int, value)
 
     @property
     def value(self) -> int:
         """Get the current value of the value key in global_state state"""
-        value = self.app_client.state.global_state.get_value("value")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "value"), lambda: self.app_client.state.global_state.get_value("value"))
         return typing.cast(int, value)
 
+
 class _LocalState:
-    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+    __slots__ = ("app_client", "address", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, address: str, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
         self.address = address
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("local_state", self.address, *key), read, round_of)
 
     def get_all(self) -> LocalStateValue:
         """Get all current keyed values from local_state state"""
-        result = self.app_client.state.local_state(self.address).get_all()
-        if not result:
-            return typing.cast(LocalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(LocalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.local_state(self.address).get_all)
+        return typing.cast(LocalStateValue, result)
+
+    def snapshot(self) -> LocalStateSnapshot:
+        """Get the current value of every key in local_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> LocalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        app_info = typing.cast(dict, algod.account_application_info(self.address, self.app_client.app_id))
+        current_round = app_info["round"]
+        key_values = app_info.get("app-local-state", {}).get("key-value", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return LocalStateSnapshot(
+            round=current_round,
+            local_bytes_not_in_snake_case=typing.cast(bytes, _decode_state_value(state.get("bG9jYWxCeXRlc05vdEluU25ha2VDYXNl"), "AVMBytes")),
+            local_bytes1=typing.cast(bytes, _decode_state_value(state.get("bG9jYWxfYnl0ZXMx"), "AVMBytes")),
+            local_bytes2=typing.cast(bytes, _decode_state_value(state.get("bG9jYWxfYnl0ZXMy"), "AVMBytes")),
+            local_int1=typing.cast(int, _decode_state_value(state.get("bG9jYWxfaW50MQ=="), "AVMUint64")),
+            local_int2=typing.cast(int, _decode_state_value(state.get("bG9jYWxfaW50Mg=="), "AVMUint64")),
+        )
 
     @property
     def local_bytes_not_in_snake_case(self) -> bytes:
         """Get the current value of the localBytesNotInSnakeCase key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("localBytesNotInSnakeCase")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "localBytesNotInSnakeCase"), lambda: self.app_client.state.local_state(self.address).get_value("localBytesNotInSnakeCase"))
         return typing.cast(bytes, value)
 
     @property
     def local_bytes1(self) -> bytes:
         """Get the current value of the local_bytes1 key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("local_bytes1")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "local_bytes1"), lambda: self.app_client.state.local_state(self.address).get_value("local_bytes1"))
         return typing.cast(bytes, value)
 
     @property
     def local_bytes2(self) -> bytes:
         """Get the current value of the local_bytes2 key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("local_bytes2")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "local_bytes2"), lambda: self.app_client.state.local_state(self.address).get_value("local_bytes2"))
         return typing.cast(bytes, value)
 
     @property
     def local_int1(self) -> int:
         """Get the current value of the local_int1 key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("local_int1")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "local_int1"), lambda: self.app_client.state.local_state(self.address).get_value("local_int1"))
         return typing.cast(int, value)
 
     @property
     def local_int2(self) -> int:
         """Get the current value of the local_int2 key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("local_int2")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "local_int2"), lambda: self.app_client.state.local_state(self.address).get_value("local_int2"))
         return typing.cast(int, value)
 
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "error()void": (APP_SPEC.methods[4], None),
+    "error": (APP_SPEC.methods[4], None),
+    "call_abi(string)string": (APP_SPEC.methods[5], None),
+    "call_abi": (APP_SPEC.methods[5], None),
+    "call_abi_txn(pay,string)string": (APP_SPEC.methods[6], None),
+    "call_abi_txn": (APP_SPEC.methods[6], None),
+    "call_with_references(asset,account,application)uint64": (APP_SPEC.methods[7], None),
+    "call_with_references": (APP_SPEC.methods[7], None),
+    "default_value(string)string": (APP_SPEC.methods[8], None),
+    "default_value": (APP_SPEC.methods[8], None),
+    "default_value_int(uint64)uint64": (APP_SPEC.methods[9], None),
+    "default_value_int": (APP_SPEC.methods[9], None),
+    "default_value_from_abi(string)string": (APP_SPEC.methods[10], None),
+    "default_value_from_abi": (APP_SPEC.methods[10], None),
+    "default_value_from_global_state(uint64)uint64": (APP_SPEC.methods[11], None),
+    "default_value_from_global_state": (APP_SPEC.methods[11], None),
+    "default_value_from_local_state(string)string": (APP_SPEC.methods[12], None),
+    "default_value_from_local_state": (APP_SPEC.methods[12], None),
+    "structs((string,uint64))(string,uint64)": (APP_SPEC.methods[13], _output_from_tuple),
+    "structs": (APP_SPEC.methods[13], _output_from_tuple),
+    "set_global(uint64,uint64,string,byte[4])void": (APP_SPEC.methods[14], None),
+    "set_global": (APP_SPEC.methods[14], None),
+    "set_local(uint64,uint64,string,byte[4])void": (APP_SPEC.methods[15], None),
+    "set_local": (APP_SPEC.methods[15], None),
+    "set_box(byte[4],string)void": (APP_SPEC.methods[16], None),
+    "set_box": (APP_SPEC.methods[16], None),
+    "create_abi(string)string": (APP_SPEC.methods[0], None),
+    "create_abi": (APP_SPEC.methods[0], None),
+    "update_abi(string)string": (APP_SPEC.methods[1], None),
+    "update_abi": (APP_SPEC.methods[1], None),
+    "delete_abi(string)string": (APP_SPEC.methods[2], None),
+    "delete_abi": (APP_SPEC.methods[2], None),
+    "opt_in()void": (APP_SPEC.methods[3], None),
+    "opt_in": (APP_SPEC.methods[3], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
 class StateClient:
     """Client for interacting with State smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state", "_caches")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -1316,10 +2518,58 @@ class StateClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = StateParams(self.app_client)
-        self.create_transaction = StateCreateTransactionParams(self.app_client)
-        self.send = StateSend(self.app_client)
-        self.state = StateState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: StateParams | None = None
+        self._create_transaction: StateCreateTransactionParams | None = None
+        self._send: StateSend | None = None
+        self._state: "StateState | None" = None
+        self._caches = _ReadCaches()
+    
+    @property
+    def params(self) -> StateParams:
+        if self._params is None:
+            self._params = StateParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> StateCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = StateCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> StateSend:
+        if self._send is None:
+            self._send = StateSend(self.app_client, self._caches, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "StateState":
+        if self._state is None:
+            self._state = StateState(self.app_client, self._caches)
+        return self._state
+
+    def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+        """Cache the state read through `state`, in an LRU of up to max_entries reads
+    
+        Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+        when a transaction sent through `send` or `new_group()` is confirmed
+        """
+        self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+
+    def enable_readonly_cache(self, *, max_entries: int = 256, ttl: float = 60.0) -> None:
+        """Cache the results of readonly methods called through `send`, in an LRU of up to max_entries results
+    
+        Results are keyed by method, args and sender, and are cached for ttl seconds or until a later round is observed.
+        They're evicted when a transaction sent through `send` or `new_group()` is confirmed, or by
+        `readonly_cache.invalidate()`
+        """
+        self._caches.readonly_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+    
+    @property
+    def readonly_cache(self) -> "_StateCache | None":
+        """The cache of readonly method results with its hit and miss counts, if enabled"""
+        return self._caches.readonly_cache
 
     @staticmethod
     def from_creator_and_name(
@@ -1410,6 +2660,9 @@ class StateClient:
     def new_group(self) -> "StateComposer":
         return StateComposer(self)
 
+    def readonly_batch(self) -> "StateReadonlyBatch":
+        return StateReadonlyBatch(self)
+
     @typing.overload
     def decode_return_value(
         self,
@@ -1528,18 +2781,10 @@ class StateClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | Output | int | str, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1749,6 +2994,8 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
 class StateFactoryParams:
     """Parameters for creating transactions for State contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StateFactoryCreateParams(app_factory)
@@ -1758,6 +3005,8 @@ class StateFactoryParams:
 class StateFactoryCreateParams:
     """Parameters for 'create' operations of State contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1768,9 +3017,9 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def error(
@@ -1780,14 +3029,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the error()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "error()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="error()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1800,14 +3047,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the call_abi(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "call_abi(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="call_abi(string)string",
+                args=_call_abi_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1820,14 +3065,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the call_abi_txn(pay,string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "call_abi_txn(pay,string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="call_abi_txn(pay,string)string",
+                args=_call_abi_txn_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1840,14 +3083,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the call_with_references(asset,account,application)uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "call_with_references(asset,account,application)uint64",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="call_with_references(asset,account,application)uint64",
+                args=_call_with_references_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1860,14 +3101,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the default_value(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "default_value(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="default_value(string)string",
+                args=_default_value_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1880,14 +3119,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the default_value_int(uint64)uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "default_value_int(uint64)uint64",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="default_value_int(uint64)uint64",
+                args=_default_value_int_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1900,14 +3137,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the default_value_from_abi(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "default_value_from_abi(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="default_value_from_abi(string)string",
+                args=_default_value_from_abi_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1920,14 +3155,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the default_value_from_global_state(uint64)uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "default_value_from_global_state(uint64)uint64",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="default_value_from_global_state(uint64)uint64",
+                args=_default_value_from_global_state_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1940,14 +3173,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the default_value_from_local_state(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "default_value_from_local_state(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="default_value_from_local_state(string)string",
+                args=_default_value_from_local_state_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1960,14 +3191,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the structs((string,uint64))(string,uint64) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "structs((string,uint64))(string,uint64)",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="structs((string,uint64))(string,uint64)",
+                args=_structs_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1980,14 +3209,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the set_global(uint64,uint64,string,byte[4])void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "set_global(uint64,uint64,string,byte[4])void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="set_global(uint64,uint64,string,byte[4])void",
+                args=_set_global_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2000,14 +3227,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the set_local(uint64,uint64,string,byte[4])void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "set_local(uint64,uint64,string,byte[4])void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="set_local(uint64,uint64,string,byte[4])void",
+                args=_set_local_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2020,14 +3245,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the set_box(byte[4],string)void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "set_box(byte[4],string)void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="set_box(byte[4],string)void",
+                args=_set_box_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2040,14 +3263,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the create_abi(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "create_abi(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="create_abi(string)string",
+                args=_create_abi_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2060,14 +3281,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the update_abi(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "update_abi(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="update_abi(string)string",
+                args=_update_abi_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2080,14 +3299,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the delete_abi(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "delete_abi(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="delete_abi(string)string",
+                args=_delete_abi_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -2099,14 +3316,12 @@ class StateFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the opt_in()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "opt_in()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="opt_in()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -2114,6 +3329,8 @@ class StateFactoryCreateParams:
 class StateFactoryUpdateParams:
     """Parameters for 'update' operations of State contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -2124,14 +3341,16 @@ class StateFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class StateFactoryDeleteParams:
     """Parameters for 'delete' operations of State contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -2142,15 +3361,17 @@ class StateFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class StateFactoryCreateTransaction:
     """Create transactions for State contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StateFactoryCreateTransactionCreate(app_factory)
@@ -2159,6 +3380,8 @@ class StateFactoryCreateTransaction:
 class StateFactoryCreateTransactionCreate:
     """Create new instances of State contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -2167,15 +3390,17 @@ class StateFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class StateFactorySend:
     """Send calls to State contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StateFactorySendCreate(app_factory)
@@ -2184,6 +3409,8 @@ class StateFactorySend:
 class StateFactorySendCreate:
     """Send create calls to State contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -2195,9 +3422,9 @@ class StateFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[StateClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -2212,14 +3439,12 @@ class StateFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[StateClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
             """Creates and sends a transaction using the create_abi(string)string ABI method"""
-            params = params or algokit_utils.CommonAppCallCreateParams()
+            params = params or _DEFAULT_CREATE_PARAMS
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
-                    **{
-                    **dataclasses.asdict(params),
-                    "method": "create_abi(string)string",
-                    "args": _parse_abi_args(args),
-                    }
+                    **_params_fields(params),
+                    method="create_abi(string)string",
+                    args=_create_abi_args_to_abi(args),
                 ),
                 send_params=send_params,
                 compilation_params=compilation_params
@@ -2243,6 +3468,8 @@ class StateFactorySendCreate:
 
 
 class _StateUpdateComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "StateComposer"):
         self.composer = composer
     def update_abi(
@@ -2258,15 +3485,15 @@ class _StateUpdateComposer:
                 compilation_params=compilation_params
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "update_abi(string)string", v
-            )
+        self.composer._return_decoders.append(
+            ("update_abi(string)string", _RETURN_DECODERS["update_abi(string)string"])
         )
         return self.composer
 
 
 class _StateDeleteComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "StateComposer"):
         self.composer = composer
     def delete_abi(
@@ -2281,15 +3508,15 @@ class _StateDeleteComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "delete_abi(string)string", v
-            )
+        self.composer._return_decoders.append(
+            ("delete_abi(string)string", _RETURN_DECODERS["delete_abi(string)string"])
         )
         return self.composer
 
 
 class _StateOptInComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "StateComposer"):
         self.composer = composer
     def opt_in(
@@ -2303,10 +3530,8 @@ class _StateOptInComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "opt_in()void", v
-            )
+        self.composer._return_decoders.append(
+            ("opt_in()void", _RETURN_DECODERS["opt_in()void"])
         )
         return self.composer
 
@@ -2314,22 +3539,34 @@ class _StateOptInComposer:
 class StateComposer:
     """Composer for creating transaction groups for State contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_update", "_delete", "_opt_in")
+
     def __init__(self, client: "StateClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._update: "_StateUpdateComposer | None" = None
+        self._delete: "_StateDeleteComposer | None" = None
+        self._opt_in: "_StateOptInComposer | None" = None
 
     @property
     def update(self) -> "_StateUpdateComposer":
-        return _StateUpdateComposer(self)
+        if self._update is None:
+            self._update = _StateUpdateComposer(self)
+        return self._update
 
     @property
     def delete(self) -> "_StateDeleteComposer":
-        return _StateDeleteComposer(self)
+        if self._delete is None:
+            self._delete = _StateDeleteComposer(self)
+        return self._delete
 
     @property
     def opt_in(self) -> "_StateOptInComposer":
-        return _StateOptInComposer(self)
+        if self._opt_in is None:
+            self._opt_in = _StateOptInComposer(self)
+        return self._opt_in
 
     def error(
         self,
@@ -2341,10 +3578,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "error()void", v
-            )
+        self._return_decoders.append(
+            ("error()void", _RETURN_DECODERS["error()void"])
         )
         return self
 
@@ -2359,10 +3594,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "call_abi(string)string", v
-            )
+        self._return_decoders.append(
+            ("call_abi(string)string", _RETURN_DECODERS["call_abi(string)string"])
         )
         return self
 
@@ -2377,10 +3610,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "call_abi_txn(pay,string)string", v
-            )
+        self._return_decoders.append(
+            ("call_abi_txn(pay,string)string", _RETURN_DECODERS["call_abi_txn(pay,string)string"])
         )
         return self
 
@@ -2395,10 +3626,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "call_with_references(asset,account,application)uint64", v
-            )
+        self._return_decoders.append(
+            ("call_with_references(asset,account,application)uint64", _RETURN_DECODERS["call_with_references(asset,account,application)uint64"])
         )
         return self
 
@@ -2413,10 +3642,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "default_value(string)string", v
-            )
+        self._return_decoders.append(
+            ("default_value(string)string", _RETURN_DECODERS["default_value(string)string"])
         )
         return self
 
@@ -2431,10 +3658,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "default_value_int(uint64)uint64", v
-            )
+        self._return_decoders.append(
+            ("default_value_int(uint64)uint64", _RETURN_DECODERS["default_value_int(uint64)uint64"])
         )
         return self
 
@@ -2449,10 +3674,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "default_value_from_abi(string)string", v
-            )
+        self._return_decoders.append(
+            ("default_value_from_abi(string)string", _RETURN_DECODERS["default_value_from_abi(string)string"])
         )
         return self
 
@@ -2467,10 +3690,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "default_value_from_global_state(uint64)uint64", v
-            )
+        self._return_decoders.append(
+            ("default_value_from_global_state(uint64)uint64", _RETURN_DECODERS["default_value_from_global_state(uint64)uint64"])
         )
         return self
 
@@ -2485,10 +3706,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "default_value_from_local_state(string)string", v
-            )
+        self._return_decoders.append(
+            ("default_value_from_local_state(string)string", _RETURN_DECODERS["default_value_from_local_state(string)string"])
         )
         return self
 
@@ -2503,10 +3722,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "structs((string,uint64))(string,uint64)", v
-            )
+        self._return_decoders.append(
+            ("structs((string,uint64))(string,uint64)", _RETURN_DECODERS["structs((string,uint64))(string,uint64)"])
         )
         return self
 
@@ -2521,10 +3738,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "set_global(uint64,uint64,string,byte[4])void", v
-            )
+        self._return_decoders.append(
+            ("set_global(uint64,uint64,string,byte[4])void", _RETURN_DECODERS["set_global(uint64,uint64,string,byte[4])void"])
         )
         return self
 
@@ -2539,10 +3754,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "set_local(uint64,uint64,string,byte[4])void", v
-            )
+        self._return_decoders.append(
+            ("set_local(uint64,uint64,string,byte[4])void", _RETURN_DECODERS["set_local(uint64,uint64,string,byte[4])void"])
         )
         return self
 
@@ -2557,10 +3770,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "set_box(byte[4],string)void", v
-            )
+        self._return_decoders.append(
+            ("set_box(byte[4],string)void", _RETURN_DECODERS["set_box(byte[4],string)void"])
         )
         return self
 
@@ -2575,10 +3786,8 @@ class StateComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "create_abi(string)string", v
-            )
+        self._return_decoders.append(
+            ("create_abi(string)string", _RETURN_DECODERS["create_abi(string)string"])
         )
         return self
 
@@ -2588,15 +3797,10 @@ class StateComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "StateComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -2610,6 +3814,25 @@ class StateComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -2620,18 +3843,409 @@ class StateComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _StateBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "StateClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else StateClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["StateComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def call_abi(
+        self,
+        args: typing.Iterable[tuple[str] | CallAbiArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.call_abi(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def call_with_references(
+        self,
+        args: typing.Iterable[tuple[int, str | bytes, int] | CallWithReferencesArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[int]:
+        return self._send_groups(
+            lambda composer, method_args: composer.call_with_references(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def default_value(
+        self,
+        args: typing.Iterable[tuple[str | None] | DefaultValueArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.default_value(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def default_value_int(
+        self,
+        args: typing.Iterable[tuple[int | None] | DefaultValueIntArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[int]:
+        return self._send_groups(
+            lambda composer, method_args: composer.default_value_int(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def default_value_from_abi(
+        self,
+        args: typing.Iterable[tuple[str | None] | DefaultValueFromAbiArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.default_value_from_abi(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def default_value_from_global_state(
+        self,
+        args: typing.Iterable[tuple[int | None] | DefaultValueFromGlobalStateArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[int]:
+        return self._send_groups(
+            lambda composer, method_args: composer.default_value_from_global_state(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def default_value_from_local_state(
+        self,
+        args: typing.Iterable[tuple[str | None] | DefaultValueFromLocalStateArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.default_value_from_local_state(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def structs(
+        self,
+        args: typing.Iterable[tuple[Input] | StructsArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[Output]:
+        return self._send_groups(
+            lambda composer, method_args: composer.structs(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def set_global(
+        self,
+        args: typing.Iterable[tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.set_global(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def set_local(
+        self,
+        args: typing.Iterable[tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.set_local(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def set_box(
+        self,
+        args: typing.Iterable[tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.set_box(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create_abi(
+        self,
+        args: typing.Iterable[tuple[str] | CreateAbiArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create_abi(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+
+_ReturnType = typing.TypeVar("_ReturnType")
+
+
+class _ReadonlyResult(typing.Generic[_ReturnType]):
+    """Return value of a call queued in a readonly batch, available once the batch is simulated"""
+
+    __slots__ = ("_value", "_done")
+
+    def __init__(self) -> None:
+        self._value: _ReturnType | None = None
+        self._done = False
+
+    @property
+    def value(self) -> _ReturnType:
+        if not self._done:
+            raise RuntimeError("The readonly batch hasn't been simulated, call simulate() first")
+        return typing.cast(_ReturnType, self._value)
+
+    def _set(self, value: _ReturnType) -> None:
+        self._value = value
+        self._done = True
+
+
+class StateReadonlyBatch:
+    """Readonly calls of the State app, simulated in groups of up to 16 calls
+
+    Each queued call returns a result whose value is available once `simulate()` is called, which sends one simulate
+    request per group rather than one per call
+    """
+
+    __slots__ = ("client", "_calls")
+
+    def __init__(self, client: "StateClient"):
+        self.client = client
+        self._calls: list[
+            tuple[typing.Callable[["StateComposer"], object], _ReadonlyResult[typing.Any]]
+        ] = []
+
+    def _queue(
+        self, add_call: typing.Callable[["StateComposer"], object]
+    ) -> _ReadonlyResult[typing.Any]:
+        result: _ReadonlyResult[typing.Any] = _ReadonlyResult()
+        self._calls.append((add_call, result))
+        return result
+
+    def simulate(self) -> list[typing.Any]:
+        """Simulate the queued calls, returning their decoded return values in the order they were queued"""
+        calls, self._calls = self._calls, []
+        values = []
+        for start in range(0, len(calls), 16):
+            group = calls[start : start + 16]
+            composer = self.client.new_group()
+            for add_call, _ in group:
+                add_call(composer)
+            response = composer.simulate(
+                allow_more_logs=True,
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                skip_signatures=True,
+            )
+            for (_, result), abi_return in zip(group, response.returns, strict=True):
+                result._set(abi_return.value)
+                values.append(result.value)
+        return values
+
+    def error(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[None]:
+        return self._queue(
+            lambda composer: composer.error(params=params),
+        )
+
+    def call_abi(
+        self,
+        args: tuple[str] | CallAbiArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[str]:
+        return self._queue(
+            lambda composer: composer.call_abi(args, params=params),
+        )
+
+    def default_value(
+        self,
+        args: tuple[str | None] | DefaultValueArgs | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[str]:
+        return self._queue(
+            lambda composer: composer.default_value(args, params=params),
+        )
+
+    def default_value_int(
+        self,
+        args: tuple[int | None] | DefaultValueIntArgs | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[int]:
+        return self._queue(
+            lambda composer: composer.default_value_int(args, params=params),
+        )
+
+    def default_value_from_abi(
+        self,
+        args: tuple[str | None] | DefaultValueFromAbiArgs | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[str]:
+        return self._queue(
+            lambda composer: composer.default_value_from_abi(args, params=params),
+        )
+
+    def default_value_from_global_state(
+        self,
+        args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[int]:
+        return self._queue(
+            lambda composer: composer.default_value_from_global_state(args, params=params),
+        )
+
+    def default_value_from_local_state(
+        self,
+        args: tuple[str | None] | DefaultValueFromLocalStateArgs | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[str]:
+        return self._queue(
+            lambda composer: composer.default_value_from_local_state(args, params=params),
+        )
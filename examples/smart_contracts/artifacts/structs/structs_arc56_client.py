@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: e277c9c50468309a7e3d48e32d54ad86972df3531361dd0f8c41aba4fb173a51
 
 # common
 import dataclasses
@@ -20,20 +21,50 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "give_me_root_struct", "returns": {"type": "(((string,string)))", "struct": "RootStruct"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "give_me_struct_with_name_variations", "returns": {"type": "(string,string,string)", "struct": "Struct_WithNameVariations"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Structs", "state": {"keys": {"box": {"my_box_struct": {"key": "bXlfYm94X3N0cnVjdA==", "keyType": "AVMString", "valueType": "Vector"}, "my_nested_box_struct": {"key": "bXlfbmVzdGVkX2JveF9zdHJ1Y3Q=", "keyType": "AVMString", "valueType": "RootStruct"}}, "global": {"my_struct": {"key": "bXlfc3RydWN0", "keyType": "AVMString", "valueType": "Vector"}, "my_nested_struct": {"key": "bXlfbmVzdGVkX3N0cnVjdA==", "keyType": "AVMString", "valueType": "RootStruct"}, "struct_with_name_variations": {"key": "c3RydWN0X3dpdGhfbmFtZV92YXJpYXRpb25z", "keyType": "AVMString", "valueType": "Struct_WithNameVariations"}}, "local": {"my_localstate_struct": {"key": "bXlfbG9jYWxzdGF0ZV9zdHJ1Y3Q=", "keyType": "AVMString", "valueType": "Vector"}, "my_nested_localstate_struct": {"key": "bXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0", "keyType": "AVMString", "valueType": "RootStruct"}}}, "maps": {"box": {"my_boxmap_struct": {"keyType": "uint64", "valueType": "Vector", "prefix": "bXlfYm94bWFwX3N0cnVjdA=="}, "my_nested_boxmap_struct": {"keyType": "uint64", "valueType": "RootStruct", "prefix": "bXlfbmVzdGVkX2JveG1hcF9zdHJ1Y3Q="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 0}, "local": {"bytes": 2, "ints": 0}}}, "structs": {"NestedStruct": [{"name": "content", "type": "Vector"}], "RootStruct": [{"name": "nested", "type": "NestedStruct"}], "Struct_WithNameVariations": [{"name": "first_VariatIon", "type": "string"}, {"name": "secondVariation", "type": "string"}, {"name": "third_variation", "type": "string"}], "Vector": [{"name": "x", "type": "string"}, {"name": "y", "type": "string"}]}, "byteCode": {"approval": "CiABASYGCgAEAAcAATEAATIOAAIAAgAEAAcAATEAATINbXlfYm94X3N0cnVjdBRteV9uZXN0ZWRfYm94X3N0cnVjdBhteV9ib3htYXBfc3RydWN0AAAAAAAAAHsfbXlfbmVzdGVkX2JveG1hcF9zdHJ1Y3QAAAAAAAAAezEYQAAhgAlteV9zdHJ1Y3QoZ4AQbXlfbmVzdGVkX3N0cnVjdClnMRtBAIiCBAQCvs4RBKSjzpoErCB2IQQwxtWKNhoAjgQATQAvABAAA4EAQzEZIhJEMRhEiAB+IkMxGRREMRhEgBMVH3x1AAYACQAMAAExAAEyAAEzsCJDMRkURDEYRIASFR98dQACAAIABAAHAAExAAEysCJDMRkURDEYRDYaAYgAFoAEFR98dUxQsCJDMRlA/5YxGBREIkOKAQGL/1cCAIAHSGVsbG8sIExQSRUWVwYCTFCJKrxIKii/K7xIKym/JwS8SCcEKL8nBbxIJwUpvzEAgBRteV9sb2NhbHN0YXRlX3N0cnVjdChmMQCAG215X25lc3RlZF9sb2NhbHN0YXRlX3N0cnVjdClmiQ==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 4, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMuc3RydWN0cy5jb250cmFjdC5TdHJ1Y3RzLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEKICAgIGJ5dGVjYmxvY2sgMHgwMDA0MDAwNzAwMDEzMTAwMDEzMiAweDAwMDIwMDAyMDAwNDAwMDcwMDAxMzEwMDAxMzIgIm15X2JveF9zdHJ1Y3QiICJteV9uZXN0ZWRfYm94X3N0cnVjdCIgMHg2ZDc5NWY2MjZmNzg2ZDYxNzA1ZjczNzQ3Mjc1NjM3NDAwMDAwMDAwMDAwMDAwN2IgMHg2ZDc5NWY2ZTY1NzM3NDY1NjQ1ZjYyNmY3ODZkNjE3MDVmNzM3NDcyNzU2Mzc0MDAwMDAwMDAwMDAwMDA3YgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYubXlfc3RydWN0ID0gR2xvYmFsU3RhdGUoVmVjdG9yKHg9YXJjNC5TdHJpbmcoIjEiKSwgeT1hcmM0LlN0cmluZygiMiIpKSkKICAgIHB1c2hieXRlcyAibXlfc3RydWN0IgogICAgYnl0ZWNfMCAvLyAweDAwMDQwMDA3MDAwMTMxMDAwMTMyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6MjgKICAgIC8vIHNlbGYubXlfbmVzdGVkX3N0cnVjdCA9IEdsb2JhbFN0YXRlKAogICAgcHVzaGJ5dGVzICJteV9uZXN0ZWRfc3RydWN0IgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6MjkKICAgIC8vIFJvb3RTdHJ1Y3QobmVzdGVkPU5lc3RlZFN0cnVjdChjb250ZW50PVZlY3Rvcih4PWFyYzQuU3RyaW5nKCIxIiksIHk9YXJjNC5TdHJpbmcoIjIiKSkpKQogICAgYnl0ZWNfMSAvLyAweDAwMDIwMDAyMDAwNDAwMDcwMDAxMzEwMDAxMzIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjI4LTMwCiAgICAvLyBzZWxmLm15X25lc3RlZF9zdHJ1Y3QgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBSb290U3RydWN0KG5lc3RlZD1OZXN0ZWRTdHJ1Y3QoY29udGVudD1WZWN0b3IoeD1hcmM0LlN0cmluZygiMSIpLCB5PWFyYzQuU3RyaW5nKCIyIikpKSkKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBjbGFzcyBTdHJ1Y3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAOQogICAgcHVzaGJ5dGVzcyAweDAyYmVjZTExIDB4YTRhM2NlOWEgMHhhYzIwNzYyMSAweDMwYzZkNThhIC8vIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2l2ZV9tZV9yb290X3N0cnVjdCgpKCgoc3RyaW5nLHN0cmluZykpKSIsIG1ldGhvZCAiZ2l2ZV9tZV9zdHJ1Y3Rfd2l0aF9uYW1lX3ZhcmlhdGlvbnMoKShzdHJpbmcsc3RyaW5nLHN0cmluZykiLCBtZXRob2QgIm9wdF9pbigpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5faGVsbG9fcm91dGVANSBtYWluX2dpdmVfbWVfcm9vdF9zdHJ1Y3Rfcm91dGVANiBtYWluX2dpdmVfbWVfc3RydWN0X3dpdGhfbmFtZV92YXJpYXRpb25zX3JvdXRlQDcgbWFpbl9vcHRfaW5fcm91dGVAOAoKbWFpbl9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6MjUKICAgIC8vIGNsYXNzIFN0cnVjdHMoQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgMCAvLyAwCiAgICByZXR1cm4KCm1haW5fb3B0X2luX3JvdXRlQDg6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RydWN0cy9jb250cmFjdC5weTo1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18wIC8vIE9wdEluCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgT3B0SW4KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBvcHRfaW4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2l2ZV9tZV9zdHJ1Y3Rfd2l0aF9uYW1lX3ZhcmlhdGlvbnNfcm91dGVANzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMDYwMDA5MDAwYzAwMDEzMTAwMDEzMjAwMDEzMwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dpdmVfbWVfcm9vdF9zdHJ1Y3Rfcm91dGVANjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMDIwMDAyMDAwNDAwMDcwMDAxMzEwMDAxMzIKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oZWxsb19yb3V0ZUA1OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBjbGFzcyBTdHJ1Y3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RydWN0cy9jb250cmFjdC5weTozOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAOToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBjbGFzcyBTdHJ1Y3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDExCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5zdHJ1Y3RzLmNvbnRyYWN0LlN0cnVjdHMuaGVsbG8obmFtZTogYnl0ZXMpIC0+IGJ5dGVzOgpoZWxsbzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjM5LTQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IGFyYzQuU3RyaW5nKSAtPiBhcmM0LlN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NDEKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBwdXNoYnl0ZXMgMHg0ODY1NmM2YzZmMmMyMAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLnN0cnVjdHMuY29udHJhY3QuU3RydWN0cy5vcHRfaW4oKSAtPiB2b2lkOgpvcHRfaW46CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RydWN0cy9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5teV9ib3hfc3RydWN0LnZhbHVlID0gVmVjdG9yKHg9YXJjNC5TdHJpbmcoIjEiKSwgeT1hcmM0LlN0cmluZygiMiIpKQogICAgYnl0ZWNfMiAvLyAibXlfYm94X3N0cnVjdCIKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMiAvLyAibXlfYm94X3N0cnVjdCIKICAgIGJ5dGVjXzAgLy8gMHgwMDA0MDAwNzAwMDEzMTAwMDEzMgogICAgYm94X3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NTQKICAgIC8vIHNlbGYubXlfbmVzdGVkX2JveF9zdHJ1Y3QudmFsdWUgPSBSb290U3RydWN0KAogICAgYnl0ZWNfMyAvLyAibXlfbmVzdGVkX2JveF9zdHJ1Y3QiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RydWN0cy9jb250cmFjdC5weTo1NC01NgogICAgLy8gc2VsZi5teV9uZXN0ZWRfYm94X3N0cnVjdC52YWx1ZSA9IFJvb3RTdHJ1Y3QoCiAgICAvLyAgICAgbmVzdGVkPU5lc3RlZFN0cnVjdChjb250ZW50PVZlY3Rvcih4PWFyYzQuU3RyaW5nKCIxIiksIHk9YXJjNC5TdHJpbmcoIjIiKSkpCiAgICAvLyApCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBzZWxmLm15X25lc3RlZF9ib3hfc3RydWN0LnZhbHVlID0gUm9vdFN0cnVjdCgKICAgIGJ5dGVjXzMgLy8gIm15X25lc3RlZF9ib3hfc3RydWN0IgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NTQtNTYKICAgIC8vIHNlbGYubXlfbmVzdGVkX2JveF9zdHJ1Y3QudmFsdWUgPSBSb290U3RydWN0KAogICAgLy8gICAgIG5lc3RlZD1OZXN0ZWRTdHJ1Y3QoY29udGVudD1WZWN0b3IoeD1hcmM0LlN0cmluZygiMSIpLCB5PWFyYzQuU3RyaW5nKCIyIikpKQogICAgLy8gKQogICAgYnl0ZWNfMSAvLyAweDAwMDIwMDAyMDAwNDAwMDcwMDAxMzEwMDAxMzIKICAgIGJveF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLm15X2JveG1hcF9zdHJ1Y3RbYXJjNC5VSW50NjQoMTIzKV0gPSBWZWN0b3IoeD1hcmM0LlN0cmluZygiMSIpLCB5PWFyYzQuU3RyaW5nKCIyIikpCiAgICBieXRlYyA0IC8vIDB4NmQ3OTVmNjI2Zjc4NmQ2MTcwNWY3Mzc0NzI3NTYzNzQwMDAwMDAwMDAwMDAwMDdiCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjIDQgLy8gMHg2ZDc5NWY2MjZmNzg2ZDYxNzA1ZjczNzQ3Mjc1NjM3NDAwMDAwMDAwMDAwMDAwN2IKICAgIGJ5dGVjXzAgLy8gMHgwMDA0MDAwNzAwMDEzMTAwMDEzMgogICAgYm94X3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NTgKICAgIC8vIHNlbGYubXlfbmVzdGVkX2JveG1hcF9zdHJ1Y3RbYXJjNC5VSW50NjQoMTIzKV0gPSBSb290U3RydWN0KAogICAgYnl0ZWMgNSAvLyAweDZkNzk1ZjZlNjU3Mzc0NjU2NDVmNjI2Zjc4NmQ2MTcwNWY3Mzc0NzI3NTYzNzQwMDAwMDAwMDAwMDAwMDdiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvc3RydWN0cy9jb250cmFjdC5weTo1OC02MAogICAgLy8gc2VsZi5teV9uZXN0ZWRfYm94bWFwX3N0cnVjdFthcmM0LlVJbnQ2NCgxMjMpXSA9IFJvb3RTdHJ1Y3QoCiAgICAvLyAgICAgbmVzdGVkPU5lc3RlZFN0cnVjdChjb250ZW50PVZlY3Rvcih4PWFyYzQuU3RyaW5nKCIxIiksIHk9YXJjNC5TdHJpbmcoIjIiKSkpCiAgICAvLyApCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBzZWxmLm15X25lc3RlZF9ib3htYXBfc3RydWN0W2FyYzQuVUludDY0KDEyMyldID0gUm9vdFN0cnVjdCgKICAgIGJ5dGVjIDUgLy8gMHg2ZDc5NWY2ZTY1NzM3NDY1NjQ1ZjYyNmY3ODZkNjE3MDVmNzM3NDcyNzU2Mzc0MDAwMDAwMDAwMDAwMDA3YgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NTgtNjAKICAgIC8vIHNlbGYubXlfbmVzdGVkX2JveG1hcF9zdHJ1Y3RbYXJjNC5VSW50NjQoMTIzKV0gPSBSb290U3RydWN0KAogICAgLy8gICAgIG5lc3RlZD1OZXN0ZWRTdHJ1Y3QoY29udGVudD1WZWN0b3IoeD1hcmM0LlN0cmluZygiMSIpLCB5PWFyYzQuU3RyaW5nKCIyIikpKQogICAgLy8gKQogICAgYnl0ZWNfMSAvLyAweDAwMDIwMDAyMDAwNDAwMDcwMDAxMzEwMDAxMzIKICAgIGJveF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9zdHJ1Y3RzL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBzZWxmLm15X2xvY2Fsc3RhdGVfc3RydWN0W1R4bi5zZW5kZXJdID0gVmVjdG9yKHg9YXJjNC5TdHJpbmcoIjEiKSwgeT1hcmM0LlN0cmluZygiMiIpKQogICAgdHhuIFNlbmRlcgogICAgcHVzaGJ5dGVzICJteV9sb2NhbHN0YXRlX3N0cnVjdCIKICAgIGJ5dGVjXzAgLy8gMHgwMDA0MDAwNzAwMDEzMTAwMDEzMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYubXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0W1R4bi5zZW5kZXJdID0gUm9vdFN0cnVjdCgKICAgIHR4biBTZW5kZXIKICAgIHB1c2hieXRlcyAibXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0IgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3N0cnVjdHMvY29udHJhY3QucHk6NjItNjQKICAgIC8vIHNlbGYubXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0W1R4bi5zZW5kZXJdID0gUm9vdFN0cnVjdCgKICAgIC8vICAgICBuZXN0ZWQ9TmVzdGVkU3RydWN0KGNvbnRlbnQ9VmVjdG9yKHg9YXJjNC5TdHJpbmcoIjEiKSwgeT1hcmM0LlN0cmluZygiMiIpKSkKICAgIC8vICkKICAgIGJ5dGVjXzEgLy8gMHgwMDAyMDAwMjAwMDQwMDA3MDAwMTMxMDAwMTMyCiAgICBhcHBfbG9jYWxfcHV0CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [221, 252, 282], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [209], "errorMessage": "OnCompletion is not OptIn"}, {"pc": [311], "errorMessage": "can only call when creating"}, {"pc": [212, 224, 255, 285], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "hello(string)string": 0,
+    "hello": 0,
+    "give_me_root_struct()(((string,string)))": 1,
+    "give_me_root_struct": 1,
+    "give_me_struct_with_name_variations()(string,string,string)": 2,
+    "give_me_struct_with_name_variations": 2,
+    "opt_in()void": 3,
+    "opt_in": 3,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,44 +74,197 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
 
-@dataclasses.dataclass(frozen=True)
+class _ReadCaches:
+    """The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them"""
+
+    __slots__ = ("state_cache",)
+
+    def __init__(self) -> None:
+        self.state_cache: "_StateCache | None" = None
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        """Evict the enabled caches once transactions with these confirmations are confirmed"""
+        confirmations = list(confirmations)
+        if self.state_cache is not None:
+            self.state_cache.invalidate(confirmations)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Vector:
     """Struct for Vector"""
     x: str
     y: str
 
-@dataclasses.dataclass(frozen=True)
+
+def _vector_to_tuple(value: object) -> object:
+    """Convert a Vector into the tuple expected by the ABI encoder"""
+    if isinstance(value, Vector):
+        return (value.x, value.y)
+    return _convert_dataclass(value)
+
+
+def _vector_from_dict(data: dict) -> Vector:
+    """Construct a Vector from the dict the app client decodes it into"""
+    return Vector(
+        x=data["x"],
+        y=data["y"],
+    )
+
+
+def _vector_from_tuple(value: tuple | list) -> Vector:
+    """Construct a Vector from the tuple decoded by the ABI decoder"""
+    return Vector(
+        x=value[0],
+        y=value[1],
+    )
+
+
+def _vector_to_bytes(value: Vector) -> bytes:
+    """Encode a Vector into its ABI encoding"""
+    tail_0 = value.x.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    tail_1 = value.y.encode()
+    tail_1 = len(tail_1).to_bytes(2, "big") + tail_1
+    return b"".join((
+        b"\x00\x04",
+        (4 + len(tail_0)).to_bytes(2, "big"),
+        tail_0,
+        tail_1,
+    ))
+
+
+def _vector_from_bytes(data: bytes) -> Vector:
+    """Construct a Vector from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    start_1 = int.from_bytes(data[2:4], "big")
+    if not (
+        4 == start_0 <= start_1 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == start_1 - start_0 - 2
+        and int.from_bytes(data[start_1:start_1 + 2], "big") == len(data) - start_1 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Vector")
+    return Vector(
+        x=data[start_0 + 2:start_1].decode(),
+        y=data[start_1 + 2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class NestedStruct:
     """Struct for NestedStruct"""
     content: Vector
 
-@dataclasses.dataclass(frozen=True)
+
+def _nested_struct_to_tuple(value: object) -> object:
+    """Convert a NestedStruct into the tuple expected by the ABI encoder"""
+    if isinstance(value, NestedStruct):
+        return (_vector_to_tuple(value.content),)
+    return _convert_dataclass(value)
+
+
+def _nested_struct_from_dict(data: dict) -> NestedStruct:
+    """Construct a NestedStruct from the dict the app client decodes it into"""
+    return NestedStruct(
+        content=_vector_from_dict(_content) if isinstance(_content := data["content"], dict) else _content,
+    )
+
+
+def _nested_struct_from_tuple(value: tuple | list) -> NestedStruct:
+    """Construct a NestedStruct from the tuple decoded by the ABI decoder"""
+    return NestedStruct(
+        content=_vector_from_tuple(value[0]) if isinstance(value[0], (tuple, list)) else value[0],
+    )
+
+
+def _nested_struct_to_bytes(value: NestedStruct) -> bytes:
+    """Encode a NestedStruct into its ABI encoding"""
+    tail_0 = _vector_to_bytes(value.content)
+    return b"".join((
+        b"\x00\x02",
+        tail_0,
+    ))
+
+
+def _nested_struct_from_bytes(data: bytes) -> NestedStruct:
+    """Construct a NestedStruct from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        2 == start_0 <= len(data)
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of NestedStruct")
+    return NestedStruct(
+        content=_vector_from_bytes(data[start_0:]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class RootStruct:
     """Struct for RootStruct"""
     nested: NestedStruct
 
-@dataclasses.dataclass(frozen=True)
+
+def _root_struct_to_tuple(value: object) -> object:
+    """Convert a RootStruct into the tuple expected by the ABI encoder"""
+    if isinstance(value, RootStruct):
+        return (_nested_struct_to_tuple(value.nested),)
+    return _convert_dataclass(value)
+
+
+def _root_struct_from_dict(data: dict) -> RootStruct:
+    """Construct a RootStruct from the dict the app client decodes it into"""
+    return RootStruct(
+        nested=_nested_struct_from_dict(_nested) if isinstance(_nested := data["nested"], dict) else _nested,
+    )
+
+
+def _root_struct_from_tuple(value: tuple | list) -> RootStruct:
+    """Construct a RootStruct from the tuple decoded by the ABI decoder"""
+    return RootStruct(
+        nested=_nested_struct_from_tuple(value[0]) if isinstance(value[0], (tuple, list)) else value[0],
+    )
+
+
+def _root_struct_to_bytes(value: RootStruct) -> bytes:
+    """Encode a RootStruct into its ABI encoding"""
+    tail_0 = _nested_struct_to_bytes(value.nested)
+    return b"".join((
+        b"\x00\x02",
+        tail_0,
+    ))
+
+
+def _root_struct_from_bytes(data: bytes) -> RootStruct:
+    """Construct a RootStruct from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        2 == start_0 <= len(data)
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of RootStruct")
+    return RootStruct(
+        nested=_nested_struct_from_bytes(data[start_0:]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class StructWithNameVariations:
     """Struct for Struct_WithNameVariations"""
     first_VariatIon: str
@@ -88,7 +272,69 @@ class StructWithNameVariations:
     third_variation: str
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+def _struct_with_name_variations_to_tuple(value: object) -> object:
+    """Convert a StructWithNameVariations into the tuple expected by the ABI encoder"""
+    if isinstance(value, StructWithNameVariations):
+        return (value.first_VariatIon, value.secondVariation, value.third_variation)
+    return _convert_dataclass(value)
+
+
+def _struct_with_name_variations_from_dict(data: dict) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from the dict the app client decodes it into"""
+    return StructWithNameVariations(
+        first_VariatIon=data["first_VariatIon"],
+        secondVariation=data["secondVariation"],
+        third_variation=data["third_variation"],
+    )
+
+
+def _struct_with_name_variations_from_tuple(value: tuple | list) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from the tuple decoded by the ABI decoder"""
+    return StructWithNameVariations(
+        first_VariatIon=value[0],
+        secondVariation=value[1],
+        third_variation=value[2],
+    )
+
+
+def _struct_with_name_variations_to_bytes(value: StructWithNameVariations) -> bytes:
+    """Encode a StructWithNameVariations into its ABI encoding"""
+    tail_0 = value.first_VariatIon.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    tail_1 = value.secondVariation.encode()
+    tail_1 = len(tail_1).to_bytes(2, "big") + tail_1
+    tail_2 = value.third_variation.encode()
+    tail_2 = len(tail_2).to_bytes(2, "big") + tail_2
+    return b"".join((
+        b"\x00\x06",
+        (6 + len(tail_0)).to_bytes(2, "big"),
+        (6 + len(tail_0) + len(tail_1)).to_bytes(2, "big"),
+        tail_0,
+        tail_1,
+        tail_2,
+    ))
+
+
+def _struct_with_name_variations_from_bytes(data: bytes) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    start_1 = int.from_bytes(data[2:4], "big")
+    start_2 = int.from_bytes(data[4:6], "big")
+    if not (
+        6 == start_0 <= start_1 <= start_2 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == start_1 - start_0 - 2
+        and int.from_bytes(data[start_1:start_1 + 2], "big") == start_2 - start_1 - 2
+        and int.from_bytes(data[start_2:start_2 + 2], "big") == len(data) - start_2 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of StructWithNameVariations")
+    return StructWithNameVariations(
+        first_VariatIon=data[start_0 + 2:start_1].decode(),
+        secondVariation=data[start_1 + 2:start_2].decode(),
+        third_variation=data[start_2 + 2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class HelloArgs:
     """Dataclass for hello arguments"""
     name: str
@@ -98,7 +344,286 @@ class HelloArgs:
         return "hello(string)string"
 
 
+def _hello_args_to_abi(args: tuple[str] | HelloArgs) -> list[typing.Any] | None:
+    """Convert hello args into the list of ABI args expected by the app client"""
+    if isinstance(args, HelloArgs):
+        return [args.name]
+    return [*args] if args else None
+
+
+def _hello_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> HelloArgs:
+    """Decode the args of a call of hello(string)string from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of hello(string)string")
+    return HelloArgs(
+        name=app_args[1][2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GiveMeRootStructArgs:
+    """Dataclass for give_me_root_struct arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "give_me_root_struct()(((string,string)))"
+
+
+def _give_me_root_struct_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> GiveMeRootStructArgs:
+    """Decode the args of a call of give_me_root_struct()(((string,string))) from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of give_me_root_struct()(((string,string)))")
+    return GiveMeRootStructArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GiveMeStructWithNameVariationsArgs:
+    """Dataclass for give_me_struct_with_name_variations arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "give_me_struct_with_name_variations()(string,string,string)"
+
+
+def _give_me_struct_with_name_variations_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> GiveMeStructWithNameVariationsArgs:
+    """Decode the args of a call of give_me_struct_with_name_variations()(string,string,string) from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of give_me_struct_with_name_variations()(string,string,string)")
+    return GiveMeStructWithNameVariationsArgs()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class OptInArgs:
+    """Dataclass for opt_in arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "opt_in()void"
+
+
+def _opt_in_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> OptInArgs:
+    """Decode the args of a call of opt_in()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of opt_in()void")
+    return OptInArgs()
+
+
+StructsMethodArgs: typing.TypeAlias = HelloArgs | GiveMeRootStructArgs | GiveMeStructWithNameVariationsArgs | OptInArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    StructsMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\x02\xbe\xce\x11": _hello_args_from_app_args,  # hello(string)string
+    b"\xa4\xa3\xce\x9a": _give_me_root_struct_args_from_app_args,  # give_me_root_struct()(((string,string)))
+    b"\xac\x20\x76\x21": _give_me_struct_with_name_variations_args_from_app_args,  # give_me_struct_with_name_variations()(string,string,string)
+    b"\x30\xc6\xd5\x8a": _opt_in_args_from_app_args,  # opt_in()void
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> StructsMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StructsAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: StructsMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\x02\xbe\xce\x11": "hello(string)string",
+    b"\xa4\xa3\xce\x9a": "give_me_root_struct()(((string,string)))",
+    b"\xac\x20\x76\x21": "give_me_struct_with_name_variations()(string,string,string)",
+    b"\x30\xc6\xd5\x8a": "opt_in()void",
+}
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> StructsMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args)
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[StructsAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield StructsAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[StructsAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[StructsAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[StructsAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[StructsAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class _StructsOptIn:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -107,55 +632,60 @@ class _StructsOptIn:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ))
 
 
 class StructsParams:
+    __slots__ = ("app_client", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._opt_in: "_StructsOptIn | None" = None
 
     @property
     def opt_in(self) -> "_StructsOptIn":
-        return _StructsOptIn(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StructsOptIn(self.app_client)
+        return self._opt_in
 
     def hello(
         self,
         args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
 
     def give_me_root_struct(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_root_struct()(((string,string)))",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_root_struct()(((string,string)))",
+        ))
 
     def give_me_struct_with_name_variations(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_struct_with_name_variations()(string,string,string)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_struct_with_name_variations()(string,string,string)",
+        ))
 
     def clear_state(
         self,
@@ -169,6 +699,8 @@ class StructsParams:
 
 
 class _StructsOptInTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -177,55 +709,60 @@ class _StructsOptInTransaction:
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ))
 
 
 class StructsCreateTransactionParams:
+    __slots__ = ("app_client", "_opt_in")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._opt_in: "_StructsOptInTransaction | None" = None
 
     @property
     def opt_in(self) -> "_StructsOptInTransaction":
-        return _StructsOptInTransaction(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StructsOptInTransaction(self.app_client)
+        return self._opt_in
 
     def hello(
         self,
         args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ))
 
     def give_me_root_struct(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_root_struct()(((string,string)))",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_root_struct()(((string,string)))",
+        ))
 
     def give_me_struct_with_name_variations(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_struct_with_name_variations()(string,string,string)",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_struct_with_name_variations()(string,string,string)",
+        ))
 
     def clear_state(
         self,
@@ -239,8 +776,11 @@ class StructsCreateTransactionParams:
 
 
 class _StructsOptInSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def opt_in(
         self,
@@ -248,22 +788,38 @@ class _StructsOptInSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="opt_in()void",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
 
 class StructsSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_client", "_opt_in", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "StructsClient | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._opt_in: "_StructsOptInSend | None" = None
+        self._batch: "_StructsBatchSend | None" = None
 
     @property
     def opt_in(self) -> "_StructsOptInSend":
-        return _StructsOptInSend(self.app_client)
+        if self._opt_in is None:
+            self._opt_in = _StructsOptInSend(self.app_client, self._caches)
+        return self._opt_in
+
+    @property
+    def batch(self) -> "_StructsBatchSend":
+        if self._batch is None:
+            self._batch = _StructsBatchSend(self.app_client, self._client)
+        return self._batch
 
     def hello(
         self,
@@ -271,13 +827,15 @@ class StructsSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _hello_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="hello(string)string",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -287,12 +845,14 @@ class StructsSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[RootStruct]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_root_struct()(((string,string)))",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(RootStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_root_struct()(((string,string)))",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = dataclasses.replace(response, abi_return=_root_struct_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[RootStruct], parsed_response)
 
     def give_me_struct_with_name_variations(
@@ -301,12 +861,14 @@ class StructsSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[StructWithNameVariations]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "give_me_struct_with_name_variations()(string,string,string)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(StructWithNameVariations, typing.cast(dict, response.abi_return))) # type: ignore
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="give_me_struct_with_name_variations()(string,string,string)",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        parsed_response = dataclasses.replace(response, abi_return=_struct_with_name_variations_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[StructWithNameVariations], parsed_response)
 
     def clear_state(
@@ -314,10 +876,13 @@ class StructsSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
+        response = self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -336,185 +901,367 @@ class BoxStateValue(typing.TypedDict):
     my_box_struct: Vector
     my_nested_box_struct: RootStruct
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    my_struct: Vector
+    my_nested_struct: RootStruct
+    struct_with_name_variations: StructWithNameVariations
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LocalStateSnapshot:
+    """Values of every local_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Round of the ledger the values were read from"""
+    my_localstate_struct: Vector
+    my_nested_localstate_struct: RootStruct
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
 class StructsState:
     """Methods to access state for the current Structs app"""
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_global_state", "_box")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
+        self._box: "_BoxState | None" = None
 
     @property
-    def global_state(
-        self
-    ) -> "_GlobalState":
-            """Methods to access global_state for the current app"""
-            return _GlobalState(self.app_client)
-
-    def local_state(
-        self, address: str
-    ) -> "_LocalState":
-            """Methods to access local_state for the current app"""
-            return _LocalState(self.app_client, address)
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
+    def local_state(self, address: str) -> "_LocalState":
+        """Methods to access local_state for the current app"""
+        return _LocalState(self.app_client, address, self._caches)
 
     @property
-    def box(
-        self
-    ) -> "_BoxState":
-            """Methods to access box for the current app"""
-            return _BoxState(self.app_client)
+    def box(self) -> "_BoxState":
+        """Methods to access box for the current app"""
+        if self._box is None:
+            self._box = _BoxState(self.app_client, self._caches)
+        return self._box
+
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_GLOBAL_STATE_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_struct": _vector_from_dict,
+    "my_nested_struct": _root_struct_from_dict,
+    "struct_with_name_variations": _struct_with_name_variations_from_dict,
+}
+
 
 class _GlobalState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Vector": Vector,
-            "RootStruct": RootStruct,
-            "Struct_WithNameVariations": StructWithNameVariations
-        }
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
-        result = self.app_client.state.global_state.get_all()
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
         if not result:
             return typing.cast(GlobalStateValue, {})
 
         converted = {}
         for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
+            struct_from_dict = _GLOBAL_STATE_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
         return typing.cast(GlobalStateValue, converted)
 
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            my_struct=typing.cast(Vector, _decode_state_value(state.get("bXlfc3RydWN0"), "Vector", _vector_from_bytes)),
+            my_nested_struct=typing.cast(RootStruct, _decode_state_value(state.get("bXlfbmVzdGVkX3N0cnVjdA=="), "RootStruct", _root_struct_from_bytes)),
+            struct_with_name_variations=typing.cast(StructWithNameVariations, _decode_state_value(state.get("c3RydWN0X3dpdGhfbmFtZV92YXJpYXRpb25z"), "Struct_WithNameVariations", _struct_with_name_variations_from_bytes)),
+        )
+
     @property
     def my_struct(self) -> Vector:
         """Get the current value of the my_struct key in global_state state"""
-        value = self.app_client.state.global_state.get_value("my_struct")
-        if isinstance(value, dict) and "Vector" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["Vector"], value)  # type: ignore
+        value = self._read(("key", "my_struct"), lambda: self.app_client.state.global_state.get_value("my_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
         return typing.cast(Vector, value)
 
     @property
     def my_nested_struct(self) -> RootStruct:
         """Get the current value of the my_nested_struct key in global_state state"""
-        value = self.app_client.state.global_state.get_value("my_nested_struct")
-        if isinstance(value, dict) and "RootStruct" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["RootStruct"], value)  # type: ignore
+        value = self._read(("key", "my_nested_struct"), lambda: self.app_client.state.global_state.get_value("my_nested_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
         return typing.cast(RootStruct, value)
 
     @property
     def struct_with_name_variations(self) -> StructWithNameVariations:
         """Get the current value of the struct_with_name_variations key in global_state state"""
-        value = self.app_client.state.global_state.get_value("struct_with_name_variations")
-        if isinstance(value, dict) and "Struct_WithNameVariations" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["Struct_WithNameVariations"], value)  # type: ignore
+        value = self._read(("key", "struct_with_name_variations"), lambda: self.app_client.state.global_state.get_value("struct_with_name_variations"))
+        if isinstance(value, dict):
+            return _struct_with_name_variations_from_dict(value)
         return typing.cast(StructWithNameVariations, value)
 
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_LOCAL_STATE_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_localstate_struct": _vector_from_dict,
+    "my_nested_localstate_struct": _root_struct_from_dict,
+}
+
+
 class _LocalState:
-    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+    __slots__ = ("app_client", "address", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, address: str, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
         self.address = address
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Vector": Vector,
-            "RootStruct": RootStruct
-        }
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("local_state", self.address, *key), read, round_of)
 
     def get_all(self) -> LocalStateValue:
         """Get all current keyed values from local_state state"""
-        result = self.app_client.state.local_state(self.address).get_all()
+        result = self._read(("get_all",), self.app_client.state.local_state(self.address).get_all)
         if not result:
             return typing.cast(LocalStateValue, {})
 
         converted = {}
         for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
+            struct_from_dict = _LOCAL_STATE_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
         return typing.cast(LocalStateValue, converted)
 
+    def snapshot(self) -> LocalStateSnapshot:
+        """Get the current value of every key in local_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> LocalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        app_info = typing.cast(dict, algod.account_application_info(self.address, self.app_client.app_id))
+        current_round = app_info["round"]
+        key_values = app_info.get("app-local-state", {}).get("key-value", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return LocalStateSnapshot(
+            round=current_round,
+            my_localstate_struct=typing.cast(Vector, _decode_state_value(state.get("bXlfbG9jYWxzdGF0ZV9zdHJ1Y3Q="), "Vector", _vector_from_bytes)),
+            my_nested_localstate_struct=typing.cast(RootStruct, _decode_state_value(state.get("bXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0"), "RootStruct", _root_struct_from_bytes)),
+        )
+
     @property
     def my_localstate_struct(self) -> Vector:
         """Get the current value of the my_localstate_struct key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("my_localstate_struct")
-        if isinstance(value, dict) and "Vector" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["Vector"], value)  # type: ignore
+        value = self._read(("key", "my_localstate_struct"), lambda: self.app_client.state.local_state(self.address).get_value("my_localstate_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
         return typing.cast(Vector, value)
 
     @property
     def my_nested_localstate_struct(self) -> RootStruct:
         """Get the current value of the my_nested_localstate_struct key in local_state state"""
-        value = self.app_client.state.local_state(self.address).get_value("my_nested_localstate_struct")
-        if isinstance(value, dict) and "RootStruct" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["RootStruct"], value)  # type: ignore
+        value = self._read(("key", "my_nested_localstate_struct"), lambda: self.app_client.state.local_state(self.address).get_value("my_nested_localstate_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
         return typing.cast(RootStruct, value)
 
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_BOX_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_box_struct": _vector_from_dict,
+    "my_nested_box_struct": _root_struct_from_dict,
+}
+
+
 class _BoxState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Vector": Vector,
-            "RootStruct": RootStruct
-        }
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("box", *key), read, round_of)
 
     def get_all(self) -> BoxStateValue:
         """Get all current keyed values from box state"""
-        result = self.app_client.state.box.get_all()
+        result = self._read(("get_all",), self.app_client.state.box.get_all)
         if not result:
             return typing.cast(BoxStateValue, {})
 
         converted = {}
         for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.box.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
+            struct_from_dict = _BOX_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
         return typing.cast(BoxStateValue, converted)
 
     @property
     def my_box_struct(self) -> Vector:
         """Get the current value of the my_box_struct key in box state"""
-        value = self.app_client.state.box.get_value("my_box_struct")
-        if isinstance(value, dict) and "Vector" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["Vector"], value)  # type: ignore
+        value = self._read(("key", "my_box_struct"), lambda: self.app_client.state.box.get_value("my_box_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
         return typing.cast(Vector, value)
 
     @property
     def my_nested_box_struct(self) -> RootStruct:
         """Get the current value of the my_nested_box_struct key in box state"""
-        value = self.app_client.state.box.get_value("my_nested_box_struct")
-        if isinstance(value, dict) and "RootStruct" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["RootStruct"], value)  # type: ignore
+        value = self._read(("key", "my_nested_box_struct"), lambda: self.app_client.state.box.get_value("my_nested_box_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
         return typing.cast(RootStruct, value)
 
     @property
-    def my_boxmap_struct(self) -> "_MapState[int, Vector]":
+    def my_boxmap_struct(self) -> "_BoxMapState[int, Vector]":
         """Get values from the my_boxmap_struct map in box state"""
-        return _MapState(
-            self.app_client.state.box,
+        return _BoxMapState(
+            self.app_client,
             "my_boxmap_struct",
-            self._struct_classes.get("Vector")
+            _vector_from_dict,
+            cached_read=self._read,
         )
 
     @property
-    def my_nested_boxmap_struct(self) -> "_MapState[int, RootStruct]":
+    def my_nested_boxmap_struct(self) -> "_BoxMapState[int, RootStruct]":
         """Get values from the my_nested_boxmap_struct map in box state"""
-        return _MapState(
-            self.app_client.state.box,
+        return _BoxMapState(
+            self.app_client,
             "my_nested_boxmap_struct",
-            self._struct_classes.get("RootStruct")
+            _root_struct_from_dict,
+            cached_read=self._read,
         )
 
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -527,32 +1274,163 @@ class _AppClientStateMethodsProtocol(typing.Protocol):
 class _MapState(typing.Generic[_KeyType, _ValueType]):
     """Generic class for accessing state maps with strongly typed keys and values"""
 
+    __slots__ = ("_state_accessor", "_map_name", "_struct_from_dict", "_key_to_abi", "_cached_read")
+
     def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
         self._state_accessor = state_accessor
         self._map_name = map_name
-        self._struct_class = struct_class
+        self._struct_from_dict = struct_from_dict
+        self._key_to_abi = key_to_abi
+        self._cached_read = cached_read
+
+    def _cached(self, key: tuple, read: typing.Callable[[], typing.Any]) -> typing.Any:
+        return self._cached_read(("map", self._map_name, *key), read) if self._cached_read else read()
 
     def get_map(self) -> dict[_KeyType, _ValueType]:
         """Get all current values in the map"""
-        result = self._state_accessor.get_map(self._map_name)
-        if self._struct_class and result:
-            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
-                    for k, v in result.items()}  # type: ignore
+        result = self._cached(("get_map",), lambda: self._state_accessor.get_map(self._map_name))
+        if self._struct_from_dict and result:
+            struct_from_dict = self._struct_from_dict
+            return {k: struct_from_dict(v) if isinstance(v, dict) else v
+                    for k, v in result.items()}
         return typing.cast(dict[_KeyType, _ValueType], result or {})
 
     def get_value(self, key: _KeyType) -> _ValueType | None:
         """Get a value from the map by key"""
-        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
-        value = self._state_accessor.get_map_value(self._map_name, key_value)
-        if value is not None and self._struct_class and isinstance(value, dict):
-            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return self._read_value(self._key_to_abi(key) if self._key_to_abi else key)
+
+    def get_values(self, keys: typing.Iterable[_KeyType], *, max_workers: int = 8) -> list[_ValueType | None]:
+        """Get the values of many keys from the map, reading up to max_workers values concurrently
+
+        Values are returned in the order of keys, with None for keys that aren't in the map
+        """
+        # only imported when used, so importing the client stays cheap
+        import concurrent.futures
+
+        key_values = [self._key_to_abi(key) if self._key_to_abi else key for key in keys]
+        if max_workers <= 1 or len(key_values) <= 1:
+            return [self._read_value_or_none(key_value) for key_value in key_values]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(key_values))) as executor:
+            return list(executor.map(self._read_value_or_none, key_values))
+
+    def _read_value(self, key_value: object) -> _ValueType | None:
+        value = self._cached(
+            ("get_value", key_value), lambda: self._state_accessor.get_map_value(self._map_name, key_value)
+        )
+        if value is not None and self._struct_from_dict and isinstance(value, dict):
+            return self._struct_from_dict(value)
         return typing.cast(_ValueType | None, value)
 
+    def _read_value_or_none(self, key_value: object) -> _ValueType | None:
+        try:
+            return self._read_value(key_value)
+        except algosdk.error.AlgodHTTPError as e:
+            # each box map value is stored in its own box, which doesn't exist for keys that aren't in the map
+            if e.code == 404:
+                return None
+            raise
+
+
+class _BoxMapState(_MapState[_KeyType, _ValueType]):
+    """Box map, whose entries can be iterated without reading the whole map into memory"""
+
+    __slots__ = ("_app_client", "_key_from_bytes")
+
+    def __init__(self, app_client: algokit_utils.AppClient, map_name: str,
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                key_from_bytes: typing.Callable[[bytes], _KeyType] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        super().__init__(
+            app_client.state.box, map_name, struct_from_dict, key_to_abi=key_to_abi, cached_read=cached_read
+        )
+        self._app_client = app_client
+        self._key_from_bytes = key_from_bytes
+
+    def iter_items(self, *, prefetch: int = 2, batch_size: int = 16) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """Iterate over the entries of the map, reading values in batches of batch_size
+
+        The box names of the app are listed once, then up to prefetch batches beyond the one being iterated are
+        read in the background, so at most (prefetch + 1) * batch_size values are held in memory. Entries whose box
+        is deleted during iteration are skipped.
+        """
+        # only imported when used, so importing the client stays cheap
+        import base64
+        import collections
+        import concurrent.futures
+
+        metadata = self._app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        boxes = typing.cast(dict, self._app_client.algorand.client.algod.application_boxes(self._app_client.app_id))
+        names = (base64.b64decode(box["name"]) for box in boxes["boxes"])
+        encoded_keys = [name[len(prefix):] for name in names if name.startswith(prefix)]
+
+        batch_size = max(batch_size, 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            pending: collections.deque[list[tuple[bytes, concurrent.futures.Future[_ValueType | None]]]] = (
+                collections.deque()
+            )
+            batches = (encoded_keys[i:i + batch_size] for i in range(0, len(encoded_keys), batch_size))
+            for batch in batches:
+                pending.append([(key, executor.submit(self._read_value_or_none, key)) for key in batch])
+                if len(pending) > prefetch:
+                    yield from self._decode_batch(pending.popleft(), metadata.key_type)
+            while pending:
+                yield from self._decode_batch(pending.popleft(), metadata.key_type)
+
+    def _decode_batch(
+        self, batch: list[tuple[bytes, typing.Any]], key_type: str
+    ) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        structs = self._app_client.app_spec.structs
+        for encoded_key, future in batch:
+            value: _ValueType | None = future.result()
+            if value is None:
+                continue
+            if self._key_from_bytes:
+                yield self._key_from_bytes(encoded_key), value
+            else:
+                key = algokit_utils.get_abi_decoded_value(encoded_key, key_type, structs)
+                yield typing.cast(_KeyType, key), value
+
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "hello(string)string": (APP_SPEC.methods[0], None),
+    "hello": (APP_SPEC.methods[0], None),
+    "give_me_root_struct()(((string,string)))": (APP_SPEC.methods[1], _root_struct_from_tuple),
+    "give_me_root_struct": (APP_SPEC.methods[1], _root_struct_from_tuple),
+    "give_me_struct_with_name_variations()(string,string,string)": (APP_SPEC.methods[2], _struct_with_name_variations_from_tuple),
+    "give_me_struct_with_name_variations": (APP_SPEC.methods[2], _struct_with_name_variations_from_tuple),
+    "opt_in()void": (APP_SPEC.methods[3], None),
+    "opt_in": (APP_SPEC.methods[3], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
 
 class StructsClient:
     """Client for interacting with Structs smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state", "_caches")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -599,10 +1477,44 @@ class StructsClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = StructsParams(self.app_client)
-        self.create_transaction = StructsCreateTransactionParams(self.app_client)
-        self.send = StructsSend(self.app_client)
-        self.state = StructsState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: StructsParams | None = None
+        self._create_transaction: StructsCreateTransactionParams | None = None
+        self._send: StructsSend | None = None
+        self._state: "StructsState | None" = None
+        self._caches = _ReadCaches()
+    
+    @property
+    def params(self) -> StructsParams:
+        if self._params is None:
+            self._params = StructsParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> StructsCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = StructsCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> StructsSend:
+        if self._send is None:
+            self._send = StructsSend(self.app_client, self._caches, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "StructsState":
+        if self._state is None:
+            self._state = StructsState(self.app_client, self._caches)
+        return self._state
+
+    def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+        """Cache the state read through `state`, in an LRU of up to max_entries reads
+    
+        Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+        when a transaction sent through `send` or `new_group()` is confirmed
+        """
+        self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
 
     @staticmethod
     def from_creator_and_name(
@@ -733,18 +1645,10 @@ class StructsClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | RootStruct | StructWithNameVariations | str, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -875,6 +1779,8 @@ class StructsFactory(algokit_utils.TypedAppFactoryProtocol[StructsBareCallCreate
 class StructsFactoryParams:
     """Parameters for creating transactions for Structs contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StructsFactoryCreateParams(app_factory)
@@ -884,6 +1790,8 @@ class StructsFactoryParams:
 class StructsFactoryCreateParams:
     """Parameters for 'create' operations of Structs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -894,9 +1802,9 @@ class StructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def hello(
@@ -907,14 +1815,12 @@ class StructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the hello(string)string ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "hello(string)string",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="hello(string)string",
+                args=_hello_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -926,14 +1832,12 @@ class StructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the give_me_root_struct()(((string,string))) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "give_me_root_struct()(((string,string)))",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="give_me_root_struct()(((string,string)))",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -945,14 +1849,12 @@ class StructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the give_me_struct_with_name_variations()(string,string,string) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "give_me_struct_with_name_variations()(string,string,string)",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="give_me_struct_with_name_variations()(string,string,string)",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -964,14 +1866,12 @@ class StructsFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the opt_in()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "opt_in()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="opt_in()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -979,6 +1879,8 @@ class StructsFactoryCreateParams:
 class StructsFactoryUpdateParams:
     """Parameters for 'update' operations of Structs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -989,14 +1891,16 @@ class StructsFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class StructsFactoryDeleteParams:
     """Parameters for 'delete' operations of Structs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1007,15 +1911,17 @@ class StructsFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class StructsFactoryCreateTransaction:
     """Create transactions for Structs contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StructsFactoryCreateTransactionCreate(app_factory)
@@ -1024,6 +1930,8 @@ class StructsFactoryCreateTransaction:
 class StructsFactoryCreateTransactionCreate:
     """Create new instances of Structs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1032,15 +1940,17 @@ class StructsFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class StructsFactorySend:
     """Send calls to Structs contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = StructsFactorySendCreate(app_factory)
@@ -1049,6 +1959,8 @@ class StructsFactorySend:
 class StructsFactorySendCreate:
     """Send create calls to Structs contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1060,9 +1972,9 @@ class StructsFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[StructsClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -1070,6 +1982,8 @@ class StructsFactorySendCreate:
 
 
 class _StructsOptInComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "StructsComposer"):
         self.composer = composer
     def opt_in(
@@ -1083,10 +1997,8 @@ class _StructsOptInComposer:
                 
             )
         )
-        self.composer._result_mappers.append(
-            lambda v: self.composer.client.decode_return_value(
-                "opt_in()void", v
-            )
+        self.composer._return_decoders.append(
+            ("opt_in()void", _RETURN_DECODERS["opt_in()void"])
         )
         return self.composer
 
@@ -1094,14 +2006,20 @@ class _StructsOptInComposer:
 class StructsComposer:
     """Composer for creating transaction groups for Structs contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_opt_in")
+
     def __init__(self, client: "StructsClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._opt_in: "_StructsOptInComposer | None" = None
 
     @property
     def opt_in(self) -> "_StructsOptInComposer":
-        return _StructsOptInComposer(self)
+        if self._opt_in is None:
+            self._opt_in = _StructsOptInComposer(self)
+        return self._opt_in
 
     def hello(
         self,
@@ -1114,10 +2032,8 @@ class StructsComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "hello(string)string", v
-            )
+        self._return_decoders.append(
+            ("hello(string)string", _RETURN_DECODERS["hello(string)string"])
         )
         return self
 
@@ -1131,10 +2047,8 @@ class StructsComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "give_me_root_struct()(((string,string)))", v
-            )
+        self._return_decoders.append(
+            ("give_me_root_struct()(((string,string)))", _RETURN_DECODERS["give_me_root_struct()(((string,string)))"])
         )
         return self
 
@@ -1148,10 +2062,8 @@ class StructsComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "give_me_struct_with_name_variations()(string,string,string)", v
-            )
+        self._return_decoders.append(
+            ("give_me_struct_with_name_variations()(string,string,string)", _RETURN_DECODERS["give_me_struct_with_name_variations()(string,string,string)"])
         )
         return self
 
@@ -1161,15 +2073,10 @@ class StructsComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "StructsComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -1183,6 +2090,25 @@ class StructsComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -1193,18 +2119,94 @@ class StructsComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _StructsBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "StructsClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else StructsClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["StructsComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def hello(
+        self,
+        args: typing.Iterable[tuple[str] | HelloArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[str]:
+        return self._send_groups(
+            lambda composer, method_args: composer.hello(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
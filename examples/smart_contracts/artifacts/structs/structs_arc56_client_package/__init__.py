@@ -0,0 +1,113 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: ad3d8480fc6f8adeab5e1a870500543199a2377f6837e89d98410a0dae441ca6
+
+import importlib
+import typing
+
+from ._app_spec import (
+    APP_SPEC,
+)
+from .structs import (
+    Vector,
+    NestedStruct,
+    RootStruct,
+    StructWithNameVariations,
+)
+from .args import (
+    HelloArgs,
+)
+from .params import (
+    StructsParams,
+)
+from .create_transaction import (
+    StructsCreateTransactionParams,
+)
+from .send import (
+    StructsSend,
+)
+from .client import (
+    StructsClient,
+)
+
+__all__ = [
+    "APP_SPEC",
+    "Vector",
+    "NestedStruct",
+    "RootStruct",
+    "StructWithNameVariations",
+    "HelloArgs",
+    "StructsParams",
+    "StructsCreateTransactionParams",
+    "StructsSend",
+    "GlobalStateValue",
+    "LocalStateValue",
+    "BoxStateValue",
+    "GlobalStateSnapshot",
+    "LocalStateSnapshot",
+    "StructsState",
+    "StructsClient",
+    "StructsBareCallCreateParams",
+    "StructsFactory",
+    "StructsFactoryParams",
+    "StructsFactoryCreateParams",
+    "StructsFactoryUpdateParams",
+    "StructsFactoryDeleteParams",
+    "StructsFactoryCreateTransaction",
+    "StructsFactoryCreateTransactionCreate",
+    "StructsFactorySend",
+    "StructsFactorySendCreate",
+    "StructsComposer",
+    "GiveMeRootStructArgs",
+    "GiveMeStructWithNameVariationsArgs",
+    "OptInArgs",
+    "StructsMethodArgs",
+    "decode_app_call",
+    "StructsAppCall",
+    "extract_app_calls",
+]
+
+# Symbols that are imported from their module on first access
+_LAZY_IMPORTS = {
+    "GlobalStateValue": ".state",
+    "LocalStateValue": ".state",
+    "BoxStateValue": ".state",
+    "GlobalStateSnapshot": ".state",
+    "LocalStateSnapshot": ".state",
+    "StructsState": ".state",
+    "StructsBareCallCreateParams": ".factory",
+    "StructsFactory": ".factory",
+    "StructsFactoryParams": ".factory",
+    "StructsFactoryCreateParams": ".factory",
+    "StructsFactoryUpdateParams": ".factory",
+    "StructsFactoryDeleteParams": ".factory",
+    "StructsFactoryCreateTransaction": ".factory",
+    "StructsFactoryCreateTransactionCreate": ".factory",
+    "StructsFactorySend": ".factory",
+    "StructsFactorySendCreate": ".factory",
+    "StructsComposer": ".composer",
+    "GiveMeRootStructArgs": ".decoding",
+    "GiveMeStructWithNameVariationsArgs": ".decoding",
+    "OptInArgs": ".decoding",
+    "StructsMethodArgs": ".decoding",
+    "decode_app_call": ".decoding",
+    "StructsAppCall": ".decoding",
+    "extract_app_calls": ".decoding",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_LAZY_IMPORTS]
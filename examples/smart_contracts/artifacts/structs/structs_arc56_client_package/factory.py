@@ -0,0 +1,363 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: ad3d8480fc6f8adeab5e1a870500543199a2377f6837e89d98410a0dae441ca6
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    APP_SPEC,
+    _DEFAULT_CREATE_PARAMS,
+    _params_fields,
+)
+from .args import (
+    HelloArgs,
+    _hello_args_to_abi,
+)
+from .client import (
+    StructsClient,
+)
+
+@dataclasses.dataclass(frozen=True)
+class StructsBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating Structs contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class StructsFactory(algokit_utils.TypedAppFactoryProtocol[StructsBareCallCreateParams, None, None]):
+    """Factory for deploying and managing StructsClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = StructsFactoryParams(self.app_factory)
+        self.create_transaction = StructsFactoryCreateTransaction(self.app_factory)
+        self.send = StructsFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: StructsBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[StructsClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return StructsClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> StructsClient:
+        """Get an app client by creator address and name"""
+        return StructsClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> StructsClient:
+        """Get an app client by app ID"""
+        return StructsClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class StructsFactoryParams:
+    """Parameters for creating transactions for Structs contract"""
+
+    __slots__ = ("app_factory", "create", "update", "delete")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StructsFactoryCreateParams(app_factory)
+        self.update = StructsFactoryUpdateParams(app_factory)
+        self.delete = StructsFactoryDeleteParams(app_factory)
+
+class StructsFactoryCreateParams:
+    """Parameters for 'create' operations of Structs contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="hello(string)string",
+                args=_hello_args_to_abi(args),
+            ),
+            compilation_params=compilation_params
+        )
+
+    def give_me_root_struct(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the give_me_root_struct()(((string,string))) ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="give_me_root_struct()(((string,string)))",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+    def give_me_struct_with_name_variations(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the give_me_struct_with_name_variations()(string,string,string) ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="give_me_struct_with_name_variations()(string,string,string)",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+    def opt_in(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opt_in()void ABI method"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **_params_fields(params),
+                method="opt_in()void",
+                args=None,
+            ),
+            compilation_params=compilation_params
+        )
+
+class StructsFactoryUpdateParams:
+    """Parameters for 'update' operations of Structs contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+class StructsFactoryDeleteParams:
+    """Parameters for 'delete' operations of Structs contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
+            )
+
+
+class StructsFactoryCreateTransaction:
+    """Create transactions for Structs contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StructsFactoryCreateTransactionCreate(app_factory)
+
+
+class StructsFactoryCreateTransactionCreate:
+    """Create new instances of Structs contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+        )
+
+
+class StructsFactorySend:
+    """Send calls to Structs contract"""
+
+    __slots__ = ("app_factory", "create")
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = StructsFactorySendCreate(app_factory)
+
+
+class StructsFactorySendCreate:
+    """Send create calls to Structs contract"""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[StructsClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or _DEFAULT_CREATE_PARAMS
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return StructsClient(result[0]), result[1]
@@ -0,0 +1,547 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: ad3d8480fc6f8adeab5e1a870500543199a2377f6837e89d98410a0dae441ca6
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    APP_SPEC,
+    _ReadCaches,
+)
+from .structs import (
+    Vector,
+    _vector_from_dict,
+    _vector_from_bytes,
+    RootStruct,
+    _root_struct_from_dict,
+    _root_struct_from_bytes,
+    StructWithNameVariations,
+    _struct_with_name_variations_from_dict,
+    _struct_with_name_variations_from_bytes,
+)
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    my_struct: Vector
+    my_nested_struct: RootStruct
+    struct_with_name_variations: StructWithNameVariations
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    my_localstate_struct: Vector
+    my_nested_localstate_struct: RootStruct
+
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    my_box_struct: Vector
+    my_nested_box_struct: RootStruct
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    my_struct: Vector
+    my_nested_struct: RootStruct
+    struct_with_name_variations: StructWithNameVariations
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LocalStateSnapshot:
+    """Values of every local_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Round of the ledger the values were read from"""
+    my_localstate_struct: Vector
+    my_nested_localstate_struct: RootStruct
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
+class StructsState:
+    """Methods to access state for the current Structs app"""
+
+    __slots__ = ("app_client", "_caches", "_global_state", "_box")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
+        self._box: "_BoxState | None" = None
+
+    @property
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
+    def local_state(self, address: str) -> "_LocalState":
+        """Methods to access local_state for the current app"""
+        return _LocalState(self.app_client, address, self._caches)
+
+    @property
+    def box(self) -> "_BoxState":
+        """Methods to access box for the current app"""
+        if self._box is None:
+            self._box = _BoxState(self.app_client, self._caches)
+        return self._box
+
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_GLOBAL_STATE_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_struct": _vector_from_dict,
+    "my_nested_struct": _root_struct_from_dict,
+    "struct_with_name_variations": _struct_with_name_variations_from_dict,
+}
+
+
+class _GlobalState:
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            struct_from_dict = _GLOBAL_STATE_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
+        return typing.cast(GlobalStateValue, converted)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            my_struct=typing.cast(Vector, _decode_state_value(state.get("bXlfc3RydWN0"), "Vector", _vector_from_bytes)),
+            my_nested_struct=typing.cast(RootStruct, _decode_state_value(state.get("bXlfbmVzdGVkX3N0cnVjdA=="), "RootStruct", _root_struct_from_bytes)),
+            struct_with_name_variations=typing.cast(StructWithNameVariations, _decode_state_value(state.get("c3RydWN0X3dpdGhfbmFtZV92YXJpYXRpb25z"), "Struct_WithNameVariations", _struct_with_name_variations_from_bytes)),
+        )
+
+    @property
+    def my_struct(self) -> Vector:
+        """Get the current value of the my_struct key in global_state state"""
+        value = self._read(("key", "my_struct"), lambda: self.app_client.state.global_state.get_value("my_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
+        return typing.cast(Vector, value)
+
+    @property
+    def my_nested_struct(self) -> RootStruct:
+        """Get the current value of the my_nested_struct key in global_state state"""
+        value = self._read(("key", "my_nested_struct"), lambda: self.app_client.state.global_state.get_value("my_nested_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
+        return typing.cast(RootStruct, value)
+
+    @property
+    def struct_with_name_variations(self) -> StructWithNameVariations:
+        """Get the current value of the struct_with_name_variations key in global_state state"""
+        value = self._read(("key", "struct_with_name_variations"), lambda: self.app_client.state.global_state.get_value("struct_with_name_variations"))
+        if isinstance(value, dict):
+            return _struct_with_name_variations_from_dict(value)
+        return typing.cast(StructWithNameVariations, value)
+
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_LOCAL_STATE_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_localstate_struct": _vector_from_dict,
+    "my_nested_localstate_struct": _root_struct_from_dict,
+}
+
+
+class _LocalState:
+    __slots__ = ("app_client", "address", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, address: str, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self.address = address
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("local_state", self.address, *key), read, round_of)
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self._read(("get_all",), self.app_client.state.local_state(self.address).get_all)
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            struct_from_dict = _LOCAL_STATE_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
+        return typing.cast(LocalStateValue, converted)
+
+    def snapshot(self) -> LocalStateSnapshot:
+        """Get the current value of every key in local_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> LocalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        app_info = typing.cast(dict, algod.account_application_info(self.address, self.app_client.app_id))
+        current_round = app_info["round"]
+        key_values = app_info.get("app-local-state", {}).get("key-value", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return LocalStateSnapshot(
+            round=current_round,
+            my_localstate_struct=typing.cast(Vector, _decode_state_value(state.get("bXlfbG9jYWxzdGF0ZV9zdHJ1Y3Q="), "Vector", _vector_from_bytes)),
+            my_nested_localstate_struct=typing.cast(RootStruct, _decode_state_value(state.get("bXlfbmVzdGVkX2xvY2Fsc3RhdGVfc3RydWN0"), "RootStruct", _root_struct_from_bytes)),
+        )
+
+    @property
+    def my_localstate_struct(self) -> Vector:
+        """Get the current value of the my_localstate_struct key in local_state state"""
+        value = self._read(("key", "my_localstate_struct"), lambda: self.app_client.state.local_state(self.address).get_value("my_localstate_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
+        return typing.cast(Vector, value)
+
+    @property
+    def my_nested_localstate_struct(self) -> RootStruct:
+        """Get the current value of the my_nested_localstate_struct key in local_state state"""
+        value = self._read(("key", "my_nested_localstate_struct"), lambda: self.app_client.state.local_state(self.address).get_value("my_nested_localstate_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
+        return typing.cast(RootStruct, value)
+
+
+# Mapping of keys with struct values to the function constructing them from their decoded value
+_BOX_KEY_DECODERS: dict[str, typing.Callable[[dict], typing.Any]] = {
+    "my_box_struct": _vector_from_dict,
+    "my_nested_box_struct": _root_struct_from_dict,
+}
+
+
+class _BoxState:
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("box", *key), read, round_of)
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self._read(("get_all",), self.app_client.state.box.get_all)
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            struct_from_dict = _BOX_KEY_DECODERS.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def my_box_struct(self) -> Vector:
+        """Get the current value of the my_box_struct key in box state"""
+        value = self._read(("key", "my_box_struct"), lambda: self.app_client.state.box.get_value("my_box_struct"))
+        if isinstance(value, dict):
+            return _vector_from_dict(value)
+        return typing.cast(Vector, value)
+
+    @property
+    def my_nested_box_struct(self) -> RootStruct:
+        """Get the current value of the my_nested_box_struct key in box state"""
+        value = self._read(("key", "my_nested_box_struct"), lambda: self.app_client.state.box.get_value("my_nested_box_struct"))
+        if isinstance(value, dict):
+            return _root_struct_from_dict(value)
+        return typing.cast(RootStruct, value)
+
+    @property
+    def my_boxmap_struct(self) -> "_BoxMapState[int, Vector]":
+        """Get values from the my_boxmap_struct map in box state"""
+        return _BoxMapState(
+            self.app_client,
+            "my_boxmap_struct",
+            _vector_from_dict,
+            cached_read=self._read,
+        )
+
+    @property
+    def my_nested_boxmap_struct(self) -> "_BoxMapState[int, RootStruct]":
+        """Get values from the my_nested_boxmap_struct map in box state"""
+        return _BoxMapState(
+            self.app_client,
+            "my_nested_boxmap_struct",
+            _root_struct_from_dict,
+            cached_read=self._read,
+        )
+
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    __slots__ = ("_state_accessor", "_map_name", "_struct_from_dict", "_key_to_abi", "_cached_read")
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_from_dict = struct_from_dict
+        self._key_to_abi = key_to_abi
+        self._cached_read = cached_read
+
+    def _cached(self, key: tuple, read: typing.Callable[[], typing.Any]) -> typing.Any:
+        return self._cached_read(("map", self._map_name, *key), read) if self._cached_read else read()
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._cached(("get_map",), lambda: self._state_accessor.get_map(self._map_name))
+        if self._struct_from_dict and result:
+            struct_from_dict = self._struct_from_dict
+            return {k: struct_from_dict(v) if isinstance(v, dict) else v
+                    for k, v in result.items()}
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        return self._read_value(self._key_to_abi(key) if self._key_to_abi else key)
+
+    def get_values(self, keys: typing.Iterable[_KeyType], *, max_workers: int = 8) -> list[_ValueType | None]:
+        """Get the values of many keys from the map, reading up to max_workers values concurrently
+
+        Values are returned in the order of keys, with None for keys that aren't in the map
+        """
+        # only imported when used, so importing the client stays cheap
+        import concurrent.futures
+
+        key_values = [self._key_to_abi(key) if self._key_to_abi else key for key in keys]
+        if max_workers <= 1 or len(key_values) <= 1:
+            return [self._read_value_or_none(key_value) for key_value in key_values]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(key_values))) as executor:
+            return list(executor.map(self._read_value_or_none, key_values))
+
+    def _read_value(self, key_value: object) -> _ValueType | None:
+        value = self._cached(
+            ("get_value", key_value), lambda: self._state_accessor.get_map_value(self._map_name, key_value)
+        )
+        if value is not None and self._struct_from_dict and isinstance(value, dict):
+            return self._struct_from_dict(value)
+        return typing.cast(_ValueType | None, value)
+
+    def _read_value_or_none(self, key_value: object) -> _ValueType | None:
+        try:
+            return self._read_value(key_value)
+        except algosdk.error.AlgodHTTPError as e:
+            # each box map value is stored in its own box, which doesn't exist for keys that aren't in the map
+            if e.code == 404:
+                return None
+            raise
+
+
+class _BoxMapState(_MapState[_KeyType, _ValueType]):
+    """Box map, whose entries can be iterated without reading the whole map into memory"""
+
+    __slots__ = ("_app_client", "_key_from_bytes")
+
+    def __init__(self, app_client: algokit_utils.AppClient, map_name: str,
+                struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                *, key_to_abi: typing.Callable[[object], object] | None = None,
+                key_from_bytes: typing.Callable[[bytes], _KeyType] | None = None,
+                cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        super().__init__(
+            app_client.state.box, map_name, struct_from_dict, key_to_abi=key_to_abi, cached_read=cached_read
+        )
+        self._app_client = app_client
+        self._key_from_bytes = key_from_bytes
+
+    def iter_items(self, *, prefetch: int = 2, batch_size: int = 16) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """Iterate over the entries of the map, reading values in batches of batch_size
+
+        The box names of the app are listed once, then up to prefetch batches beyond the one being iterated are
+        read in the background, so at most (prefetch + 1) * batch_size values are held in memory. Entries whose box
+        is deleted during iteration are skipped.
+        """
+        # only imported when used, so importing the client stays cheap
+        import base64
+        import collections
+        import concurrent.futures
+
+        metadata = self._app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        boxes = typing.cast(dict, self._app_client.algorand.client.algod.application_boxes(self._app_client.app_id))
+        names = (base64.b64decode(box["name"]) for box in boxes["boxes"])
+        encoded_keys = [name[len(prefix):] for name in names if name.startswith(prefix)]
+
+        batch_size = max(batch_size, 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            pending: collections.deque[list[tuple[bytes, concurrent.futures.Future[_ValueType | None]]]] = (
+                collections.deque()
+            )
+            batches = (encoded_keys[i:i + batch_size] for i in range(0, len(encoded_keys), batch_size))
+            for batch in batches:
+                pending.append([(key, executor.submit(self._read_value_or_none, key)) for key in batch])
+                if len(pending) > prefetch:
+                    yield from self._decode_batch(pending.popleft(), metadata.key_type)
+            while pending:
+                yield from self._decode_batch(pending.popleft(), metadata.key_type)
+
+    def _decode_batch(
+        self, batch: list[tuple[bytes, typing.Any]], key_type: str
+    ) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        structs = self._app_client.app_spec.structs
+        for encoded_key, future in batch:
+            value: _ValueType | None = future.result()
+            if value is None:
+                continue
+            if self._key_from_bytes:
+                yield self._key_from_bytes(encoded_key), value
+            else:
+                key = algokit_utils.get_abi_decoded_value(encoded_key, key_type, structs)
+                yield typing.cast(_KeyType, key), value
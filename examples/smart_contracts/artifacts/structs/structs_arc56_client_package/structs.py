@@ -0,0 +1,250 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# spec-hash: ad3d8480fc6f8adeab5e1a870500543199a2377f6837e89d98410a0dae441ca6
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+from ._app_spec import (
+    _convert_dataclass,
+)
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Vector:
+    """Struct for Vector"""
+    x: str
+    y: str
+
+
+def _vector_to_tuple(value: object) -> object:
+    """Convert a Vector into the tuple expected by the ABI encoder"""
+    if isinstance(value, Vector):
+        return (value.x, value.y)
+    return _convert_dataclass(value)
+
+
+def _vector_from_dict(data: dict) -> Vector:
+    """Construct a Vector from the dict the app client decodes it into"""
+    return Vector(
+        x=data["x"],
+        y=data["y"],
+    )
+
+
+def _vector_from_tuple(value: tuple | list) -> Vector:
+    """Construct a Vector from the tuple decoded by the ABI decoder"""
+    return Vector(
+        x=value[0],
+        y=value[1],
+    )
+
+
+def _vector_to_bytes(value: Vector) -> bytes:
+    """Encode a Vector into its ABI encoding"""
+    tail_0 = value.x.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    tail_1 = value.y.encode()
+    tail_1 = len(tail_1).to_bytes(2, "big") + tail_1
+    return b"".join((
+        b"\x00\x04",
+        (4 + len(tail_0)).to_bytes(2, "big"),
+        tail_0,
+        tail_1,
+    ))
+
+
+def _vector_from_bytes(data: bytes) -> Vector:
+    """Construct a Vector from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    start_1 = int.from_bytes(data[2:4], "big")
+    if not (
+        4 == start_0 <= start_1 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == start_1 - start_0 - 2
+        and int.from_bytes(data[start_1:start_1 + 2], "big") == len(data) - start_1 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of Vector")
+    return Vector(
+        x=data[start_0 + 2:start_1].decode(),
+        y=data[start_1 + 2:].decode(),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class NestedStruct:
+    """Struct for NestedStruct"""
+    content: Vector
+
+
+def _nested_struct_to_tuple(value: object) -> object:
+    """Convert a NestedStruct into the tuple expected by the ABI encoder"""
+    if isinstance(value, NestedStruct):
+        return (_vector_to_tuple(value.content),)
+    return _convert_dataclass(value)
+
+
+def _nested_struct_from_dict(data: dict) -> NestedStruct:
+    """Construct a NestedStruct from the dict the app client decodes it into"""
+    return NestedStruct(
+        content=_vector_from_dict(_content) if isinstance(_content := data["content"], dict) else _content,
+    )
+
+
+def _nested_struct_from_tuple(value: tuple | list) -> NestedStruct:
+    """Construct a NestedStruct from the tuple decoded by the ABI decoder"""
+    return NestedStruct(
+        content=_vector_from_tuple(value[0]) if isinstance(value[0], (tuple, list)) else value[0],
+    )
+
+
+def _nested_struct_to_bytes(value: NestedStruct) -> bytes:
+    """Encode a NestedStruct into its ABI encoding"""
+    tail_0 = _vector_to_bytes(value.content)
+    return b"".join((
+        b"\x00\x02",
+        tail_0,
+    ))
+
+
+def _nested_struct_from_bytes(data: bytes) -> NestedStruct:
+    """Construct a NestedStruct from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        2 == start_0 <= len(data)
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of NestedStruct")
+    return NestedStruct(
+        content=_vector_from_bytes(data[start_0:]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RootStruct:
+    """Struct for RootStruct"""
+    nested: NestedStruct
+
+
+def _root_struct_to_tuple(value: object) -> object:
+    """Convert a RootStruct into the tuple expected by the ABI encoder"""
+    if isinstance(value, RootStruct):
+        return (_nested_struct_to_tuple(value.nested),)
+    return _convert_dataclass(value)
+
+
+def _root_struct_from_dict(data: dict) -> RootStruct:
+    """Construct a RootStruct from the dict the app client decodes it into"""
+    return RootStruct(
+        nested=_nested_struct_from_dict(_nested) if isinstance(_nested := data["nested"], dict) else _nested,
+    )
+
+
+def _root_struct_from_tuple(value: tuple | list) -> RootStruct:
+    """Construct a RootStruct from the tuple decoded by the ABI decoder"""
+    return RootStruct(
+        nested=_nested_struct_from_tuple(value[0]) if isinstance(value[0], (tuple, list)) else value[0],
+    )
+
+
+def _root_struct_to_bytes(value: RootStruct) -> bytes:
+    """Encode a RootStruct into its ABI encoding"""
+    tail_0 = _nested_struct_to_bytes(value.nested)
+    return b"".join((
+        b"\x00\x02",
+        tail_0,
+    ))
+
+
+def _root_struct_from_bytes(data: bytes) -> RootStruct:
+    """Construct a RootStruct from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    if not (
+        2 == start_0 <= len(data)
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of RootStruct")
+    return RootStruct(
+        nested=_nested_struct_from_bytes(data[start_0:]),
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StructWithNameVariations:
+    """Struct for Struct_WithNameVariations"""
+    first_VariatIon: str
+    secondVariation: str
+    third_variation: str
+
+
+def _struct_with_name_variations_to_tuple(value: object) -> object:
+    """Convert a StructWithNameVariations into the tuple expected by the ABI encoder"""
+    if isinstance(value, StructWithNameVariations):
+        return (value.first_VariatIon, value.secondVariation, value.third_variation)
+    return _convert_dataclass(value)
+
+
+def _struct_with_name_variations_from_dict(data: dict) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from the dict the app client decodes it into"""
+    return StructWithNameVariations(
+        first_VariatIon=data["first_VariatIon"],
+        secondVariation=data["secondVariation"],
+        third_variation=data["third_variation"],
+    )
+
+
+def _struct_with_name_variations_from_tuple(value: tuple | list) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from the tuple decoded by the ABI decoder"""
+    return StructWithNameVariations(
+        first_VariatIon=value[0],
+        secondVariation=value[1],
+        third_variation=value[2],
+    )
+
+
+def _struct_with_name_variations_to_bytes(value: StructWithNameVariations) -> bytes:
+    """Encode a StructWithNameVariations into its ABI encoding"""
+    tail_0 = value.first_VariatIon.encode()
+    tail_0 = len(tail_0).to_bytes(2, "big") + tail_0
+    tail_1 = value.secondVariation.encode()
+    tail_1 = len(tail_1).to_bytes(2, "big") + tail_1
+    tail_2 = value.third_variation.encode()
+    tail_2 = len(tail_2).to_bytes(2, "big") + tail_2
+    return b"".join((
+        b"\x00\x06",
+        (6 + len(tail_0)).to_bytes(2, "big"),
+        (6 + len(tail_0) + len(tail_1)).to_bytes(2, "big"),
+        tail_0,
+        tail_1,
+        tail_2,
+    ))
+
+
+def _struct_with_name_variations_from_bytes(data: bytes) -> StructWithNameVariations:
+    """Construct a StructWithNameVariations from its ABI encoding"""
+    start_0 = int.from_bytes(data[0:2], "big")
+    start_1 = int.from_bytes(data[2:4], "big")
+    start_2 = int.from_bytes(data[4:6], "big")
+    if not (
+        6 == start_0 <= start_1 <= start_2 <= len(data)
+        and int.from_bytes(data[start_0:start_0 + 2], "big") == start_1 - start_0 - 2
+        and int.from_bytes(data[start_1:start_1 + 2], "big") == start_2 - start_1 - 2
+        and int.from_bytes(data[start_2:start_2 + 2], "big") == len(data) - start_2 - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of StructWithNameVariations")
+    return StructWithNameVariations(
+        first_VariatIon=data[start_0 + 2:start_1].decode(),
+        secondVariation=data[start_1 + 2:start_2].decode(),
+        third_variation=data[start_2 + 2:].decode(),
+    )
@@ -4,6 +4,7 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# spec-hash: 7b884ccd56dd21dd3f9d130c952667877c0f19b25c61f5cbe2ed71e363f415e3
 
 # common
 import dataclasses
@@ -20,20 +21,52 @@ import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
 _APP_SPEC_JSON = r"""{"arcs": [], "bareActions": {"call": ["DeleteApplication"], "create": []}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "signature"}], "name": "get_preconditions", "returns": {"type": "(uint64,uint64,uint64,uint64)", "struct": "VotingPreconditions"}, "events": [], "readonly": true}, {"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "vote_id"}, {"type": "byte[]", "name": "snapshot_public_key"}, {"type": "string", "name": "metadata_ipfs_cid"}, {"type": "uint64", "name": "start_time"}, {"type": "uint64", "name": "end_time"}, {"type": "uint8[]", "name": "option_counts"}, {"type": "uint64", "name": "quorum"}, {"type": "string", "name": "nft_image_url"}], "name": "create", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "fund_min_bal_req"}], "name": "bootstrap", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "close", "returns": {"type": "void"}, "events": []}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "fund_min_bal_req"}, {"type": "byte[]", "name": "signature"}, {"type": "uint8[]", "name": "answer_ids"}], "name": "vote", "returns": {"type": "void"}, "events": []}], "name": "VotingRound", "state": {"keys": {"box": {}, "global": {"close_time": {"key": "Y2xvc2VfdGltZQ==", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The unix timestamp of the time the vote was closed"}, "end_time": {"key": "ZW5kX3RpbWU=", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The unix timestamp of the ending time of voting_round"}, "is_bootstrapped": {"key": "aXNfYm9vdHN0cmFwcGVk", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "Whether or not the contract has been bootstrapped with answers"}, "metadata_ipfs_cid": {"key": "bWV0YWRhdGFfaXBmc19jaWQ=", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "The IPFS content ID of the voting_round metadata file"}, "nft_asset_id": {"key": "bmZ0X2Fzc2V0X2lk", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The asset ID of a result NFT if one has been created"}, "nft_image_url": {"key": "bmZ0X2ltYWdlX3VybA==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "The IPFS URL of the default image to use as the media of the result NFT"}, "option_counts": {"key": "b3B0aW9uX2NvdW50cw==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "The number of options for each question"}, "quorum": {"key": "cXVvcnVt", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The minimum number of voters to reach quorum"}, "snapshot_public_key": {"key": "c25hcHNob3RfcHVibGljX2tleQ==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "The public key of the Ed25519 compatible private key that was used to encrypt entries in the vote gating snapshot"}, "start_time": {"key": "c3RhcnRfdGltZQ==", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The unix timestamp of the starting time of voting_round"}, "total_options": {"key": "dG90YWxfb3B0aW9ucw==", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The total number of options"}, "vote_id": {"key": "dm90ZV9pZA==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "The identifier of this voting_round round"}, "voter_count": {"key": "dm90ZXJfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64", "desc": "The minimum number of voters who have voted"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 5, "ints": 8}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"VotingPreconditions": [{"name": "is_voting_open", "type": "uint64"}, {"name": "is_allowed_to_vote", "type": "uint64"}, {"name": "has_already_voted", "type": "uint64"}, {"name": "current_time", "type": "uint64"}]}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMudm90aW5nX3JvdW5kLmNvbnRyYWN0LlZvdGluZ1JvdW5kLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSA4IDEwIDQwMCBUTVBMX0RFTEVUQUJMRQogICAgYnl0ZWNibG9jayAib3B0aW9uX2NvdW50cyIgIiIgMHg1NiAiaXNfYm9vdHN0cmFwcGVkIiAiY2xvc2VfdGltZSIgInZvdGVfaWQiICJ2b3Rlcl9jb3VudCIgInRvdGFsX29wdGlvbnMiIDB4MDY4MTAxICJzbmFwc2hvdF9wdWJsaWNfa2V5IiAic3RhcnRfdGltZSIgImVuZF90aW1lIiAibWV0YWRhdGFfaXBmc19jaWQiICJxdW9ydW0iICJuZnRfaW1hZ2VfdXJsIiAibmZ0X2Fzc2V0X2lkIgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgVm90aW5nUm91bmQoUGVybWFuZW5jZUNvbnRyb2xBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEwCiAgICBwdXNoYnl0ZXNzIDB4YmNiMTU4OTYgMHhhZTg5N2Y2YiAweGE0ZThkMTY0IDB4OTY1NjA0N2EgMHg4NGE1M2M2ZSAvLyBtZXRob2QgImdldF9wcmVjb25kaXRpb25zKGJ5dGVbXSkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiY3JlYXRlKHN0cmluZyxieXRlW10sc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDhbXSx1aW50NjQsc3RyaW5nKXZvaWQiLCBtZXRob2QgImJvb3RzdHJhcChwYXkpdm9pZCIsIG1ldGhvZCAiY2xvc2UoKXZvaWQiLCBtZXRob2QgInZvdGUocGF5LGJ5dGVbXSx1aW50OFtdKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2dldF9wcmVjb25kaXRpb25zX3JvdXRlQDUgbWFpbl9jcmVhdGVfcm91dGVANiBtYWluX2Jvb3RzdHJhcF9yb3V0ZUA3IG1haW5fY2xvc2Vfcm91dGVAOCBtYWluX3ZvdGVfcm91dGVAOQoKbWFpbl9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgVm90aW5nUm91bmQoUGVybWFuZW5jZUNvbnRyb2xBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl92b3RlX3JvdXRlQDk6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFZvdGluZ1JvdW5kKFBlcm1hbmVuY2VDb250cm9sQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB2b3RlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2Nsb3NlX3JvdXRlQDg6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xvc2UKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYm9vdHN0cmFwX3JvdXRlQDc6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MzQKICAgIC8vIGNsYXNzIFZvdGluZ1JvdW5kKFBlcm1hbmVuY2VDb250cm9sQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBib290c3RyYXAKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3JvdXRlQDY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTozNAogICAgLy8gY2xhc3MgVm90aW5nUm91bmQoUGVybWFuZW5jZUNvbnRyb2xBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxMzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgY2FsbHN1YiBjcmVhdGUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3ByZWNvbmRpdGlvbnNfcm91dGVANToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6ODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBWb3RpbmdSb3VuZChQZXJtYW5lbmNlQ29udHJvbEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3ByZWNvbmRpdGlvbnMKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTA6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBjbGFzcyBWb3RpbmdSb3VuZChQZXJtYW5lbmNlQ29udHJvbEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDUgLy8gNQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgbWF0Y2ggbWFpbl9kZWxldGVAMTEKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDEyCgptYWluX2RlbGV0ZUAxMToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi51dGlsLmVuc3VyZV9idWRnZXQocmVxdWlyZWRfYnVkZ2V0OiB1aW50NjQsIGZlZV9zb3VyY2U6IHVpbnQ2NCkgLT4gdm9pZDoKZW5zdXJlX2J1ZGdldDoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzMgLy8gMTAKICAgICsKCmVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDE6CiAgICBmcmFtZV9kaWcgMAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogZW5zdXJlX2J1ZGdldF9hZnRlcl93aGlsZUA3CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgOCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDggLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANjoKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDEKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDYKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzOgogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2CgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDc6CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMudm90aW5nX3JvdW5kLmNvbnRyYWN0LlZvdGluZ1JvdW5kLmFsbG93ZWRfdG9fdm90ZShzaWduYXR1cmU6IGJ5dGVzKSAtPiB1aW50NjQ6CmFsbG93ZWRfdG9fdm90ZToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NzAtNzEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYWxsb3dlZF90b192b3RlKHNlbGYsIHNpZ25hdHVyZTogQnl0ZXMpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NzIKICAgIC8vIGVuc3VyZV9idWRnZXQoVUludDY0KDIwMDApKQogICAgcHVzaGludCAyMDAwIC8vIDIwMDAKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NzMKICAgIC8vIHJldHVybiBvcC5lZDI1NTE5dmVyaWZ5X2JhcmUoVHhuLnNlbmRlci5ieXRlcywgc2lnbmF0dXJlLCBzZWxmLnNuYXBzaG90X3B1YmxpY19rZXkudmFsdWUpCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAic25hcHNob3RfcHVibGljX2tleSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zbmFwc2hvdF9wdWJsaWNfa2V5IGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBlZDI1NTE5dmVyaWZ5X2JhcmUKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy52b3Rpbmdfcm91bmQuY29udHJhY3QuVm90aW5nUm91bmQudm90aW5nX29wZW4oKSAtPiB1aW50NjQ6CnZvdGluZ19vcGVuOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo3NS03NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB2b3Rpbmdfb3BlbihzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBzZWxmLmlzX2Jvb3RzdHJhcHBlZC52YWx1ZSA9PSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJpc19ib290c3RyYXBwZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfYm9vdHN0cmFwcGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojc4LTgwCiAgICAvLyBzZWxmLmlzX2Jvb3RzdHJhcHBlZC52YWx1ZSA9PSBVSW50NjQoMSkKICAgIC8vIGFuZCBzZWxmLmNsb3NlX3RpbWUudmFsdWUgPT0gMAogICAgLy8gYW5kIHNlbGYuc3RhcnRfdGltZS52YWx1ZSA8PSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IHNlbGYuZW5kX3RpbWUudmFsdWUKICAgIGJ6IHZvdGluZ19vcGVuX2Jvb2xfZmFsc2VANQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo3OQogICAgLy8gYW5kIHNlbGYuY2xvc2VfdGltZS52YWx1ZSA9PSAwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY2xvc2VfdGltZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbG9zZV90aW1lIGV4aXN0cwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo3OC04MAogICAgLy8gc2VsZi5pc19ib290c3RyYXBwZWQudmFsdWUgPT0gVUludDY0KDEpCiAgICAvLyBhbmQgc2VsZi5jbG9zZV90aW1lLnZhbHVlID09IDAKICAgIC8vIGFuZCBzZWxmLnN0YXJ0X3RpbWUudmFsdWUgPD0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLmVuZF90aW1lLnZhbHVlCiAgICBibnogdm90aW5nX29wZW5fYm9vbF9mYWxzZUA1CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBhbmQgc2VsZi5zdGFydF90aW1lLnZhbHVlIDw9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDwgc2VsZi5lbmRfdGltZS52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJzdGFydF90aW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXJ0X3RpbWUgZXhpc3RzCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgPD0KICAgIGJ6IHZvdGluZ19vcGVuX2Jvb2xfZmFsc2VANQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJlbmRfdGltZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lbmRfdGltZSBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICA+CiAgICBieiB2b3Rpbmdfb3Blbl9ib29sX2ZhbHNlQDUKICAgIGludGNfMSAvLyAxCgp2b3Rpbmdfb3Blbl9ib29sX21lcmdlQDY6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojc3LTgxCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHNlbGYuaXNfYm9vdHN0cmFwcGVkLnZhbHVlID09IFVJbnQ2NCgxKQogICAgLy8gICAgIGFuZCBzZWxmLmNsb3NlX3RpbWUudmFsdWUgPT0gMAogICAgLy8gICAgIGFuZCBzZWxmLnN0YXJ0X3RpbWUudmFsdWUgPD0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLmVuZF90aW1lLnZhbHVlCiAgICAvLyApCiAgICBzd2FwCiAgICByZXRzdWIKCnZvdGluZ19vcGVuX2Jvb2xfZmFsc2VANToKICAgIGludGNfMCAvLyAwCiAgICBiIHZvdGluZ19vcGVuX2Jvb2xfbWVyZ2VANgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy52b3Rpbmdfcm91bmQuY29udHJhY3QuVm90aW5nUm91bmQuZ2V0X3ByZWNvbmRpdGlvbnMoc2lnbmF0dXJlOiBieXRlcykgLT4gYnl0ZXM6CmdldF9wcmVjb25kaXRpb25zOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo4Ny04OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3ByZWNvbmRpdGlvbnMoc2VsZiwgc2lnbmF0dXJlOiBhcmM0LkR5bmFtaWNCeXRlcykgLT4gVm90aW5nUHJlY29uZGl0aW9uczoKICAgIHByb3RvIDEgMQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo5MAogICAgLy8gYXJjNC5VSW50NjQoc2VsZi52b3Rpbmdfb3BlbigpKSwKICAgIGNhbGxzdWIgdm90aW5nX29wZW4KICAgIGl0b2IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6OTEKICAgIC8vIGFyYzQuVUludDY0KHNlbGYuYWxsb3dlZF90b192b3RlKHNpZ25hdHVyZS5uYXRpdmUpKSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgYWxsb3dlZF90b192b3RlCiAgICBpdG9iCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyByZXR1cm4gc2VsZi52b3Rlcy5tYXliZShhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpWzFdCiAgICB0eG4gU2VuZGVyCiAgICBib3hfZ2V0CiAgICBidXJ5IDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6OTIKICAgIC8vIGFyYzQuVUludDY0KHNlbGYuYWxyZWFkeV92b3RlZCgpKSwKICAgIGl0b2IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6OTMKICAgIC8vIGFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6ODktOTQKICAgIC8vIHJldHVybiBWb3RpbmdQcmVjb25kaXRpb25zKAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudm90aW5nX29wZW4oKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi5hbGxvd2VkX3RvX3ZvdGUoc2lnbmF0dXJlLm5hdGl2ZSkpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuYWxyZWFkeV92b3RlZCgpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBleGFtcGxlcy5zbWFydF9jb250cmFjdHMudm90aW5nX3JvdW5kLmNvbnRyYWN0LlZvdGluZ1JvdW5kLmNyZWF0ZSh2b3RlX2lkOiBieXRlcywgc25hcHNob3RfcHVibGljX2tleTogYnl0ZXMsIG1ldGFkYXRhX2lwZnNfY2lkOiBieXRlcywgc3RhcnRfdGltZTogYnl0ZXMsIGVuZF90aW1lOiBieXRlcywgb3B0aW9uX2NvdW50czogYnl0ZXMsIHF1b3J1bTogYnl0ZXMsIG5mdF9pbWFnZV91cmw6IGJ5dGVzKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjEzMy0xNDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGNyZWF0ZSggICMgbm9xYTogUExSMDkxMwogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdm90ZV9pZDogYXJjNC5TdHJpbmcsCiAgICAvLyAgICAgc25hcHNob3RfcHVibGljX2tleTogYXJjNC5EeW5hbWljQnl0ZXMsCiAgICAvLyAgICAgbWV0YWRhdGFfaXBmc19jaWQ6IGFyYzQuU3RyaW5nLAogICAgLy8gICAgIHN0YXJ0X3RpbWU6IGFyYzQuVUludDY0LAogICAgLy8gICAgIGVuZF90aW1lOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBvcHRpb25fY291bnRzOiBWb3RlSW5kZXhBcnJheSwKICAgIC8vICAgICBxdW9ydW06IGFyYzQuVUludDY0LAogICAgLy8gICAgIG5mdF9pbWFnZV91cmw6IGFyYzQuU3RyaW5nLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gOCAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE0NS0xNDYKICAgIC8vICMgc3RvcmVfb3B0aW9uX2NvdW50cyB3aGVuIHRoZXJlIGlzIGEgbWF4ICMgb2Ygb3B0aW9ucyBuZWVkcyB+MjYwMCBidWRnZXQKICAgIC8vIGVuc3VyZV9idWRnZXQoVUludDY0KDI4MDApKQogICAgcHVzaGludCAyODAwIC8vIDI4MDAKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTQ4CiAgICAvLyBhc3NlcnQgc3RhcnRfdGltZS5uYXRpdmUgPD0gZW5kX3RpbWUubmF0aXZlLCAiRW5kIHRpbWUgc2hvdWxkIGJlIGFmdGVyIHN0YXJ0IHRpbWUiCiAgICBmcmFtZV9kaWcgLTUKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtNAogICAgYnRvaQogICAgZHVwMgogICAgPD0KICAgIGFzc2VydCAvLyBFbmQgdGltZSBzaG91bGQgYmUgYWZ0ZXIgc3RhcnQgdGltZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNDkKICAgIC8vIGFzc2VydCBlbmRfdGltZS5uYXRpdmUgPj0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAsICJFbmQgdGltZSBzaG91bGQgYmUgaW4gdGhlIGZ1dHVyZSIKICAgIGR1cAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgPj0KICAgIGFzc2VydCAvLyBFbmQgdGltZSBzaG91bGQgYmUgaW4gdGhlIGZ1dHVyZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYudm90ZV9pZC52YWx1ZSA9IHZvdGVfaWQKICAgIGJ5dGVjIDUgLy8gInZvdGVfaWQiCiAgICBmcmFtZV9kaWcgLTgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gc2VsZi5zbmFwc2hvdF9wdWJsaWNfa2V5LnZhbHVlID0gc25hcHNob3RfcHVibGljX2tleS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtNwogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDkgLy8gInNuYXBzaG90X3B1YmxpY19rZXkiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNTMKICAgIC8vIHNlbGYubWV0YWRhdGFfaXBmc19jaWQudmFsdWUgPSBtZXRhZGF0YV9pcGZzX2NpZC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtNgogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDEyIC8vICJtZXRhZGF0YV9pcGZzX2NpZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gc2VsZi5zdGFydF90aW1lLnZhbHVlID0gc3RhcnRfdGltZS5uYXRpdmUKICAgIGJ5dGVjIDEwIC8vICJzdGFydF90aW1lIgogICAgdW5jb3ZlciAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNTUKICAgIC8vIHNlbGYuZW5kX3RpbWUudmFsdWUgPSBlbmRfdGltZS5uYXRpdmUKICAgIGJ5dGVjIDExIC8vICJlbmRfdGltZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gc2VsZi5xdW9ydW0udmFsdWUgPSBxdW9ydW0ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGJ5dGVjIDEzIC8vICJxdW9ydW0iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNTcKICAgIC8vIHNlbGYuaXNfYm9vdHN0cmFwcGVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJpc19ib290c3RyYXBwZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTU4CiAgICAvLyBzZWxmLnZvdGVyX2NvdW50LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA2IC8vICJ2b3Rlcl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuY2xvc2VfdGltZS52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNCAvLyAiY2xvc2VfdGltZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNjAKICAgIC8vIHNlbGYubmZ0X2ltYWdlX3VybC52YWx1ZSA9IG5mdF9pbWFnZV91cmwubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxNCAvLyAibmZ0X2ltYWdlX3VybCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gc2VsZi5uZnRfYXNzZXRfaWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE1IC8vICJuZnRfYXNzZXRfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NTQKICAgIC8vIGFzc2VydCBkYXRhLCAib3B0aW9uX2NvdW50cyBzaG91bGQgYmUgbm9uLWVtcHR5IgogICAgZnJhbWVfZGlnIC0zCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIG9wdGlvbl9jb3VudHMgc2hvdWxkIGJlIG5vbi1lbXB0eQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo1NQogICAgLy8gYXNzZXJ0IGRhdGEubGVuZ3RoIDw9IDExMiwgIkNhbid0IGhhdmUgbW9yZSB0aGFuIDExMiBxdWVzdGlvbnMiCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgcHVzaGludCAxMTIgLy8gMTEyCiAgICA8PQogICAgYXNzZXJ0IC8vIENhbid0IGhhdmUgbW9yZSB0aGFuIDExMiBxdWVzdGlvbnMKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NTYKICAgIC8vIHNlbGYub3B0aW9uX2NvdW50cy52YWx1ZSA9IGRhdGEuY29weSgpCiAgICBieXRlY18wIC8vICJvcHRpb25fY291bnRzIgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo2NAogICAgLy8gdG90YWxfY291bnQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjY1CiAgICAvLyBmb3IgY291bnQgaW4gc2VsZi5vcHRpb25fY291bnRzLnZhbHVlOgogICAgZHVwCiAgICBieXRlY18wIC8vICJvcHRpb25fY291bnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fY291bnRzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKY3JlYXRlX2Zvcl9oZWFkZXJAMjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6NjUKICAgIC8vIGZvciBjb3VudCBpbiBzZWxmLm9wdGlvbl9jb3VudHMudmFsdWU6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGNyZWF0ZV9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjY2CiAgICAvLyB0b3RhbF9jb3VudCArPSBjb3VudC5uYXRpdmUKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGdldGJ5dGUKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgY3JlYXRlX2Zvcl9oZWFkZXJAMgoKY3JlYXRlX2FmdGVyX2ZvckA0OgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weTo1OQogICAgLy8gYXNzZXJ0IHRvdGFsX29wdGlvbnMgPD0gMTI4LCAiQ2FuJ3QgaGF2ZSBtb3JlIHRoYW4gMTI4IHZvdGUgb3B0aW9ucyIKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHB1c2hpbnQgMTI4IC8vIDEyOAogICAgPD0KICAgIGFzc2VydCAvLyBDYW4ndCBoYXZlIG1vcmUgdGhhbiAxMjggdm90ZSBvcHRpb25zCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLnRvdGFsX29wdGlvbnMudmFsdWUgPSB0b3RhbF9vcHRpb25zCiAgICBieXRlYyA3IC8vICJ0b3RhbF9vcHRpb25zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy52b3Rpbmdfcm91bmQuY29udHJhY3QuVm90aW5nUm91bmQuYm9vdHN0cmFwKGZ1bmRfbWluX2JhbF9yZXE6IHVpbnQ2NCkgLT4gdm9pZDoKYm9vdHN0cmFwOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNjQtMTY1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBib290c3RyYXAoc2VsZiwgZnVuZF9taW5fYmFsX3JlcTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTY2CiAgICAvLyBzZWxmLmF1dGhvcml6ZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgYXV0aG9yaXplX2NyZWF0b3IKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTY3CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfYm9vdHN0cmFwcGVkLnZhbHVlLCAiQWxyZWFkeSBib290c3RyYXBwZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfYm9vdHN0cmFwcGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX2Jvb3RzdHJhcHBlZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGJvb3RzdHJhcHBlZAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNjkKICAgIC8vIHNlbGYuaXNfYm9vdHN0cmFwcGVkLnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlY18zIC8vICJpc19ib290c3RyYXBwZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTcxLTE3MgogICAgLy8gIyBtaW5pbXVtIGJhbGFuY2UgcmVxIGZvcjogQUxHT3MgKyBWb3RlIHJlc3VsdCBORlQgYXNzZXQKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTczCiAgICAvLyArIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxNzEtMTczCiAgICAvLyAjIG1pbmltdW0gYmFsYW5jZSByZXEgZm9yOiBBTEdPcyArIFZvdGUgcmVzdWx0IE5GVCBhc3NldAogICAgLy8gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyArIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgICsKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTc1LTE3NgogICAgLy8gIyBDcmVhdGUgTkZUIGZlZQogICAgLy8gVUludDY0KDFfMDAwKQogICAgcHVzaGludCAxMDAwIC8vIDEwMDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTcxLTE3NgogICAgLy8gIyBtaW5pbXVtIGJhbGFuY2UgcmVxIGZvcjogQUxHT3MgKyBWb3RlIHJlc3VsdCBORlQgYXNzZXQKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICAvLyArCiAgICAvLyAjIENyZWF0ZSBORlQgZmVlCiAgICAvLyBVSW50NjQoMV8wMDApCiAgICArCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE3OC0xNzkKICAgIC8vICMgVGFsbHlCb3ggRmxhdCArIEtleQogICAgLy8gVUludDY0KDJfNTAwKQogICAgcHVzaGludCAyNTAwIC8vIDI1MDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTcxLTE3OQogICAgLy8gIyBtaW5pbXVtIGJhbGFuY2UgcmVxIGZvcjogQUxHT3MgKyBWb3RlIHJlc3VsdCBORlQgYXNzZXQKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICAvLyArCiAgICAvLyAjIENyZWF0ZSBORlQgZmVlCiAgICAvLyBVSW50NjQoMV8wMDApCiAgICAvLyArCiAgICAvLyAjIFRhbGx5Qm94IEZsYXQgKyBLZXkKICAgIC8vIFVJbnQ2NCgyXzUwMCkKICAgICsKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTgwCiAgICAvLyArIFVJbnQ2NCg0MDApCiAgICBpbnRjIDQgLy8gNDAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE3MS0xODAKICAgIC8vICMgbWluaW11bSBiYWxhbmNlIHJlcSBmb3I6IEFMR09zICsgVm90ZSByZXN1bHQgTkZUIGFzc2V0CiAgICAvLyBHbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICsgR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZQogICAgLy8gKwogICAgLy8gIyBDcmVhdGUgTkZUIGZlZQogICAgLy8gVUludDY0KDFfMDAwKQogICAgLy8gKwogICAgLy8gIyBUYWxseUJveCBGbGF0ICsgS2V5CiAgICAvLyBVSW50NjQoMl81MDApCiAgICAvLyArIFVJbnQ2NCg0MDApCiAgICArCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE4Mi0xODMKICAgIC8vICMgVGFsbHlCb3ggVmFsdWUKICAgIC8vIHNlbGYudG90YWxfb3B0aW9ucy52YWx1ZSAqIFVJbnQ2NCg4KSAqIFVJbnQ2NCg0MDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfb3B0aW9ucyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9vcHRpb25zIGV4aXN0cwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGludGMgNCAvLyA0MDAKICAgICoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTcxLTE4MwogICAgLy8gIyBtaW5pbXVtIGJhbGFuY2UgcmVxIGZvcjogQUxHT3MgKyBWb3RlIHJlc3VsdCBORlQgYXNzZXQKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICAvLyArCiAgICAvLyAjIENyZWF0ZSBORlQgZmVlCiAgICAvLyBVSW50NjQoMV8wMDApCiAgICAvLyArCiAgICAvLyAjIFRhbGx5Qm94IEZsYXQgKyBLZXkKICAgIC8vIFVJbnQ2NCgyXzUwMCkKICAgIC8vICsgVUludDY0KDQwMCkKICAgIC8vICsKICAgIC8vICMgVGFsbHlCb3ggVmFsdWUKICAgIC8vIHNlbGYudG90YWxfb3B0aW9ucy52YWx1ZSAqIFVJbnQ2NCg4KSAqIFVJbnQ2NCg0MDApCiAgICArCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gYXNzZXJ0IGZ1bmRfbWluX2JhbF9yZXEucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBhcHAgYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSB0byBhcHAgYWRkcmVzcwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxODcKICAgIC8vIGxvZyhtaW5fYmFsX3JlcSkKICAgIGR1cAogICAgaXRvYgogICAgbG9nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gYXNzZXJ0IGZ1bmRfbWluX2JhbF9yZXEuYW1vdW50ID09IG1pbl9iYWxfcmVxLCAiUGF5bWVudCBtdXN0IGJlIGZvciB0aGUgZXhhY3QgbWluIGJhbGFuY2UgcmVxdWlyZW1lbnQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgZm9yIHRoZSBleGFjdCBtaW4gYmFsYW5jZSByZXF1aXJlbWVudAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToxOTAKICAgIC8vIHNlbGYudGFsbGllcy52YWx1ZSA9IG9wLmJ6ZXJvKHNlbGYudG90YWxfb3B0aW9ucy52YWx1ZSAqIFVJbnQ2NCg4KSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9vcHRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX29wdGlvbnMgZXhpc3RzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgYnplcm8KICAgIGJ5dGVjXzIgLy8gMHg1NgogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18yIC8vIDB4NTYKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy52b3Rpbmdfcm91bmQuY29udHJhY3QuVm90aW5nUm91bmQuY2xvc2UoKSAtPiB2b2lkOgpjbG9zZToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTkyLTE5MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xvc2Uoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gc2VsZi5hdXRob3JpemVfY3JlYXRvcigpCiAgICBjYWxsc3ViIGF1dGhvcml6ZV9jcmVhdG9yCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gZW5zdXJlX2J1ZGdldChVSW50NjQoMjBfMDAwKSkKICAgIHB1c2hpbnQgMjAwMDAgLy8gMjAwMDAKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTk3CiAgICAvLyBhc3NlcnQgc2VsZi5jbG9zZV90aW1lLnZhbHVlID09IDAsICJBbHJlYWR5IGNsb3NlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJjbG9zZV90aW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNsb3NlX3RpbWUgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBjbG9zZWQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MTk4CiAgICAvLyBzZWxmLmNsb3NlX3RpbWUudmFsdWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgNCAvLyAiY2xvc2VfdGltZSIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gKyBzZWxmLnZvdGVfaWQudmFsdWUubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAidm90ZV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX2lkIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjAwLTIwMgogICAgLy8gU3RyaW5nKAogICAgLy8gICAgICd7InN0YW5kYXJkIjoiYXJjNjkiLCJkZXNjcmlwdGlvbiI6IlRoaXMgaXMgYSB2b3Rpbmdfcm91bmQgcmVzdWx0IE5GVCBmb3Igdm90aW5nX3JvdW5kIHJvdW5kIHdpdGggSUQgJwogICAgLy8gKQogICAgcHVzaGJ5dGVzICJ7XCJzdGFuZGFyZFwiOlwiYXJjNjlcIixcImRlc2NyaXB0aW9uXCI6XCJUaGlzIGlzIGEgdm90aW5nX3JvdW5kIHJlc3VsdCBORlQgZm9yIHZvdGluZ19yb3VuZCByb3VuZCB3aXRoIElEICIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjAwLTIwMwogICAgLy8gU3RyaW5nKAogICAgLy8gICAgICd7InN0YW5kYXJkIjoiYXJjNjkiLCJkZXNjcmlwdGlvbiI6IlRoaXMgaXMgYSB2b3Rpbmdfcm91bmQgcmVzdWx0IE5GVCBmb3Igdm90aW5nX3JvdW5kIHJvdW5kIHdpdGggSUQgJwogICAgLy8gKQogICAgLy8gKyBzZWxmLnZvdGVfaWQudmFsdWUubmF0aXZlCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjA0CiAgICAvLyArIFN0cmluZygnLiIsInByb3BlcnRpZXMiOnsibWV0YWRhdGEiOiJpcGZzOi8vJykKICAgIHB1c2hieXRlcyAiLlwiLFwicHJvcGVydGllc1wiOntcIm1ldGFkYXRhXCI6XCJpcGZzOi8vIgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMDAtMjA0CiAgICAvLyBTdHJpbmcoCiAgICAvLyAgICAgJ3sic3RhbmRhcmQiOiJhcmM2OSIsImRlc2NyaXB0aW9uIjoiVGhpcyBpcyBhIHZvdGluZ19yb3VuZCByZXN1bHQgTkZUIGZvciB2b3Rpbmdfcm91bmQgcm91bmQgd2l0aCBJRCAnCiAgICAvLyApCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCcuIiwicHJvcGVydGllcyI6eyJtZXRhZGF0YSI6ImlwZnM6Ly8nKQogICAgY29uY2F0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwNQogICAgLy8gKyBzZWxmLm1ldGFkYXRhX2lwZnNfY2lkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gIm1ldGFkYXRhX2lwZnNfY2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1ldGFkYXRhX2lwZnNfY2lkIGV4aXN0cwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMDAtMjA1CiAgICAvLyBTdHJpbmcoCiAgICAvLyAgICAgJ3sic3RhbmRhcmQiOiJhcmM2OSIsImRlc2NyaXB0aW9uIjoiVGhpcyBpcyBhIHZvdGluZ19yb3VuZCByZXN1bHQgTkZUIGZvciB2b3Rpbmdfcm91bmQgcm91bmQgd2l0aCBJRCAnCiAgICAvLyApCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCcuIiwicHJvcGVydGllcyI6eyJtZXRhZGF0YSI6ImlwZnM6Ly8nKQogICAgLy8gKyBzZWxmLm1ldGFkYXRhX2lwZnNfY2lkLnZhbHVlCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjA2CiAgICAvLyArIFN0cmluZygnIiwiaWQiOiInKQogICAgcHVzaGJ5dGVzICJcIixcImlkXCI6XCIiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwMC0yMDYKICAgIC8vIFN0cmluZygKICAgIC8vICAgICAneyJzdGFuZGFyZCI6ImFyYzY5IiwiZGVzY3JpcHRpb24iOiJUaGlzIGlzIGEgdm90aW5nX3JvdW5kIHJlc3VsdCBORlQgZm9yIHZvdGluZ19yb3VuZCByb3VuZCB3aXRoIElEICcKICAgIC8vICkKICAgIC8vICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZQogICAgLy8gKyBTdHJpbmcoJy4iLCJwcm9wZXJ0aWVzIjp7Im1ldGFkYXRhIjoiaXBmczovLycpCiAgICAvLyArIHNlbGYubWV0YWRhdGFfaXBmc19jaWQudmFsdWUKICAgIC8vICsgU3RyaW5nKCciLCJpZCI6IicpCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjA3CiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJ2b3RlX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfaWQgZXhpc3RzCiAgICBleHRyYWN0IDIgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMDAtMjA3CiAgICAvLyBTdHJpbmcoCiAgICAvLyAgICAgJ3sic3RhbmRhcmQiOiJhcmM2OSIsImRlc2NyaXB0aW9uIjoiVGhpcyBpcyBhIHZvdGluZ19yb3VuZCByZXN1bHQgTkZUIGZvciB2b3Rpbmdfcm91bmQgcm91bmQgd2l0aCBJRCAnCiAgICAvLyApCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCcuIiwicHJvcGVydGllcyI6eyJtZXRhZGF0YSI6ImlwZnM6Ly8nKQogICAgLy8gKyBzZWxmLm1ldGFkYXRhX2lwZnNfY2lkLnZhbHVlCiAgICAvLyArIFN0cmluZygnIiwiaWQiOiInKQogICAgLy8gKyBzZWxmLnZvdGVfaWQudmFsdWUubmF0aXZlCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjA4CiAgICAvLyArIFN0cmluZygnIiwicXVvcnVtIjonKQogICAgcHVzaGJ5dGVzICJcIixcInF1b3J1bVwiOiIKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjAwLTIwOAogICAgLy8gU3RyaW5nKAogICAgLy8gICAgICd7InN0YW5kYXJkIjoiYXJjNjkiLCJkZXNjcmlwdGlvbiI6IlRoaXMgaXMgYSB2b3Rpbmdfcm91bmQgcmVzdWx0IE5GVCBmb3Igdm90aW5nX3JvdW5kIHJvdW5kIHdpdGggSUQgJwogICAgLy8gKQogICAgLy8gKyBzZWxmLnZvdGVfaWQudmFsdWUubmF0aXZlCiAgICAvLyArIFN0cmluZygnLiIsInByb3BlcnRpZXMiOnsibWV0YWRhdGEiOiJpcGZzOi8vJykKICAgIC8vICsgc2VsZi5tZXRhZGF0YV9pcGZzX2NpZC52YWx1ZQogICAgLy8gKyBTdHJpbmcoJyIsImlkIjoiJykKICAgIC8vICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZQogICAgLy8gKyBTdHJpbmcoJyIsInF1b3J1bSI6JykKICAgIGNvbmNhdAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMDkKICAgIC8vICsgc2VsZi5pdG9hKHNlbGYucXVvcnVtLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJxdW9ydW0iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtIGV4aXN0cwogICAgY2FsbHN1YiBpdG9hCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwMC0yMDkKICAgIC8vIFN0cmluZygKICAgIC8vICAgICAneyJzdGFuZGFyZCI6ImFyYzY5IiwiZGVzY3JpcHRpb24iOiJUaGlzIGlzIGEgdm90aW5nX3JvdW5kIHJlc3VsdCBORlQgZm9yIHZvdGluZ19yb3VuZCByb3VuZCB3aXRoIElEICcKICAgIC8vICkKICAgIC8vICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZQogICAgLy8gKyBTdHJpbmcoJy4iLCJwcm9wZXJ0aWVzIjp7Im1ldGFkYXRhIjoiaXBmczovLycpCiAgICAvLyArIHNlbGYubWV0YWRhdGFfaXBmc19jaWQudmFsdWUKICAgIC8vICsgU3RyaW5nKCciLCJpZCI6IicpCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCciLCJxdW9ydW0iOicpCiAgICAvLyArIHNlbGYuaXRvYShzZWxmLnF1b3J1bS52YWx1ZSkKICAgIGNvbmNhdAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMTAKICAgIC8vICsgU3RyaW5nKCcsInZvdGVyQ291bnQiOicpCiAgICBwdXNoYnl0ZXMgIixcInZvdGVyQ291bnRcIjoiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwMC0yMTAKICAgIC8vIFN0cmluZygKICAgIC8vICAgICAneyJzdGFuZGFyZCI6ImFyYzY5IiwiZGVzY3JpcHRpb24iOiJUaGlzIGlzIGEgdm90aW5nX3JvdW5kIHJlc3VsdCBORlQgZm9yIHZvdGluZ19yb3VuZCByb3VuZCB3aXRoIElEICcKICAgIC8vICkKICAgIC8vICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZQogICAgLy8gKyBTdHJpbmcoJy4iLCJwcm9wZXJ0aWVzIjp7Im1ldGFkYXRhIjoiaXBmczovLycpCiAgICAvLyArIHNlbGYubWV0YWRhdGFfaXBmc19jaWQudmFsdWUKICAgIC8vICsgU3RyaW5nKCciLCJpZCI6IicpCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCciLCJxdW9ydW0iOicpCiAgICAvLyArIHNlbGYuaXRvYShzZWxmLnF1b3J1bS52YWx1ZSkKICAgIC8vICsgU3RyaW5nKCcsInZvdGVyQ291bnQiOicpCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjExCiAgICAvLyArIHNlbGYuaXRvYShzZWxmLnZvdGVyX2NvdW50LnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInZvdGVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVyX2NvdW50IGV4aXN0cwogICAgY2FsbHN1YiBpdG9hCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIwMC0yMTEKICAgIC8vIFN0cmluZygKICAgIC8vICAgICAneyJzdGFuZGFyZCI6ImFyYzY5IiwiZGVzY3JpcHRpb24iOiJUaGlzIGlzIGEgdm90aW5nX3JvdW5kIHJlc3VsdCBORlQgZm9yIHZvdGluZ19yb3VuZCByb3VuZCB3aXRoIElEICcKICAgIC8vICkKICAgIC8vICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZQogICAgLy8gKyBTdHJpbmcoJy4iLCJwcm9wZXJ0aWVzIjp7Im1ldGFkYXRhIjoiaXBmczovLycpCiAgICAvLyArIHNlbGYubWV0YWRhdGFfaXBmc19jaWQudmFsdWUKICAgIC8vICsgU3RyaW5nKCciLCJpZCI6IicpCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCciLCJxdW9ydW0iOicpCiAgICAvLyArIHNlbGYuaXRvYShzZWxmLnF1b3J1bS52YWx1ZSkKICAgIC8vICsgU3RyaW5nKCcsInZvdGVyQ291bnQiOicpCiAgICAvLyArIHNlbGYuaXRvYShzZWxmLnZvdGVyX2NvdW50LnZhbHVlKQogICAgY29uY2F0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gKyBTdHJpbmcoJywidGFsbGllcyI6WycpCiAgICBwdXNoYnl0ZXMgIixcInRhbGxpZXNcIjpbIgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMDAtMjEyCiAgICAvLyBTdHJpbmcoCiAgICAvLyAgICAgJ3sic3RhbmRhcmQiOiJhcmM2OSIsImRlc2NyaXB0aW9uIjoiVGhpcyBpcyBhIHZvdGluZ19yb3VuZCByZXN1bHQgTkZUIGZvciB2b3Rpbmdfcm91bmQgcm91bmQgd2l0aCBJRCAnCiAgICAvLyApCiAgICAvLyArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUKICAgIC8vICsgU3RyaW5nKCcuIiwicHJvcGVydGllcyI6eyJtZXRhZGF0YSI6ImlwZnM6Ly8nKQogICAgLy8gKyBzZWxmLm1ldGFkYXRhX2lwZnNfY2lkLnZhbHVlCiAgICAvLyArIFN0cmluZygnIiwiaWQiOiInKQogICAgLy8gKyBzZWxmLnZvdGVfaWQudmFsdWUubmF0aXZlCiAgICAvLyArIFN0cmluZygnIiwicXVvcnVtIjonKQogICAgLy8gKyBzZWxmLml0b2Eoc2VsZi5xdW9ydW0udmFsdWUpCiAgICAvLyArIFN0cmluZygnLCJ2b3RlckNvdW50IjonKQogICAgLy8gKyBzZWxmLml0b2Eoc2VsZi52b3Rlcl9jb3VudC52YWx1ZSkKICAgIC8vICsgU3RyaW5nKCcsInRhbGxpZXMiOlsnKQogICAgY29uY2F0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIxNAogICAgLy8gZm9yIGNvdW50IGluIHNlbGYub3B0aW9uX2NvdW50cy52YWx1ZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvcHRpb25fY291bnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fY291bnRzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKY2xvc2VfZm9yX2hlYWRlckAxOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMTQKICAgIC8vIGZvciBjb3VudCBpbiBzZWxmLm9wdGlvbl9jb3VudHMudmFsdWU6CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IGNsb3NlX2FmdGVyX2ZvckAxNwogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gZm9yIGogaW4gdXJhbmdlKGNvdW50Lm5hdGl2ZSk6CiAgICBmcmFtZV9kaWcgNgogICAgZ2V0Ynl0ZQogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCgpjbG9zZV9mb3JfaGVhZGVyQDM6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gZm9yIGogaW4gdXJhbmdlKGNvdW50Lm5hdGl2ZSk6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGNsb3NlX2FmdGVyX2ZvckAxNQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMTYKICAgIC8vIG5vdGUgKz0gU3RyaW5nKCJbIikgaWYgaiA9PSAwIGVsc2UgU3RyaW5nKCIiKQogICAgZnJhbWVfZGlnIDAKICAgIGJueiBjbG9zZV90ZXJuYXJ5X2ZhbHNlQDYKICAgIHB1c2hieXRlcyAiWyIKCmNsb3NlX3Rlcm5hcnlfbWVyZ2VANzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE2CiAgICAvLyBub3RlICs9IFN0cmluZygiWyIpIGlmIGogPT0gMCBlbHNlIFN0cmluZygiIikKICAgIGZyYW1lX2RpZyAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE3CiAgICAvLyBub3RlICs9IHNlbGYuaXRvYShvcC5idG9pKHNlbGYudGFsbGllcy52YWx1ZVtqIDogaiArIDhdKSkKICAgIGJ5dGVjXzIgLy8gMHg1NgogICAgYm94X2xlbgogICAgcG9wCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgPAogICAgZGlnIDEKICAgIGRpZyAzCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDIKICAgIGludGNfMiAvLyA4CiAgICArCiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICB1bmNvdmVyIDMKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEKICAgIC0KICAgIGJ5dGVjXzIgLy8gMHg1NgogICAgY292ZXIgMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGNhbGxzdWIgaXRvYQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMjAKICAgIC8vIGlmIGogPT0gY291bnQubmF0aXZlIC0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgIC0KICAgID09CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMTktMjIxCiAgICAvLyAoU3RyaW5nKCJdIikgKyAoU3RyaW5nKCIiKSBpZiBqID09IGNvdW50Lm5hdGl2ZSAtIFVJbnQ2NCgxKSBlbHNlIFN0cmluZygiLCIpKSkKICAgIC8vIGlmIGogPT0gY291bnQubmF0aXZlIC0gVUludDY0KDEpCiAgICAvLyBlbHNlIFN0cmluZygiLCIpCiAgICBieiBjbG9zZV90ZXJuYXJ5X2ZhbHNlQDEyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gKFN0cmluZygiXSIpICsgKFN0cmluZygiIikgaWYgaiA9PSBjb3VudC5uYXRpdmUgLSBVSW50NjQoMSkgZWxzZSBTdHJpbmcoIiwiKSkpCiAgICBmcmFtZV9kaWcgMgogICAgYnogY2xvc2VfdGVybmFyeV9mYWxzZUAxMAogICAgYnl0ZWNfMSAvLyAiIgoKY2xvc2VfdGVybmFyeV9tZXJnZUAxMToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE5CiAgICAvLyAoU3RyaW5nKCJdIikgKyAoU3RyaW5nKCIiKSBpZiBqID09IGNvdW50Lm5hdGl2ZSAtIFVJbnQ2NCgxKSBlbHNlIFN0cmluZygiLCIpKSkKICAgIHB1c2hieXRlcyAiXSIKICAgIHN3YXAKICAgIGNvbmNhdAoKY2xvc2VfdGVybmFyeV9tZXJnZUAxMzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE4LTIyMgogICAgLy8gbm90ZSArPSAoCiAgICAvLyAgICAgKFN0cmluZygiXSIpICsgKFN0cmluZygiIikgaWYgaiA9PSBjb3VudC5uYXRpdmUgLSBVSW50NjQoMSkgZWxzZSBTdHJpbmcoIiwiKSkpCiAgICAvLyAgICAgaWYgaiA9PSBjb3VudC5uYXRpdmUgLSBVSW50NjQoMSkKICAgIC8vICAgICBlbHNlIFN0cmluZygiLCIpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMwogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE1CiAgICAvLyBmb3IgaiBpbiB1cmFuZ2UoY291bnQubmF0aXZlKToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGNsb3NlX2Zvcl9oZWFkZXJAMwoKY2xvc2VfdGVybmFyeV9mYWxzZUAxMDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE5CiAgICAvLyAoU3RyaW5nKCJdIikgKyAoU3RyaW5nKCIiKSBpZiBqID09IGNvdW50Lm5hdGl2ZSAtIFVJbnQ2NCgxKSBlbHNlIFN0cmluZygiLCIpKSkKICAgIHB1c2hieXRlcyAiLCIKICAgIGIgY2xvc2VfdGVybmFyeV9tZXJnZUAxMQoKY2xvc2VfdGVybmFyeV9mYWxzZUAxMjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjIxCiAgICAvLyBlbHNlIFN0cmluZygiLCIpCiAgICBwdXNoYnl0ZXMgIiwiCiAgICBiIGNsb3NlX3Rlcm5hcnlfbWVyZ2VAMTMKCmNsb3NlX3Rlcm5hcnlfZmFsc2VANjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjE2CiAgICAvLyBub3RlICs9IFN0cmluZygiWyIpIGlmIGogPT0gMCBlbHNlIFN0cmluZygiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGIgY2xvc2VfdGVybmFyeV9tZXJnZUA3CgpjbG9zZV9hZnRlcl9mb3JAMTU6CiAgICBmcmFtZV9kaWcgNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgYiBjbG9zZV9mb3JfaGVhZGVyQDEKCmNsb3NlX2FmdGVyX2ZvckAxNzoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjIzLTIzMQogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIGFzc2V0X25hbWU9U3RyaW5nKCJbVk9URSBSRVNVTFRdICIpICsgc2VsZi52b3RlX2lkLnZhbHVlLm5hdGl2ZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJWT1RFUlNMVCIpLAogICAgLy8gICAgIHVybD1zZWxmLm5mdF9pbWFnZV91cmwudmFsdWUsCiAgICAvLyAgICAgbm90ZT1ub3RlICsgU3RyaW5nKCJdfX0iKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjI3CiAgICAvLyBhc3NldF9uYW1lPVN0cmluZygiW1ZPVEUgUkVTVUxUXSAiKSArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAidm90ZV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX2lkIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIHB1c2hieXRlcyAiW1ZPVEUgUkVTVUxUXSAiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjI5CiAgICAvLyB1cmw9c2VsZi5uZnRfaW1hZ2VfdXJsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJuZnRfaW1hZ2VfdXJsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5mdF9pbWFnZV91cmwgZXhpc3RzCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gbm90ZT1ub3RlICsgU3RyaW5nKCJdfX0iKSwKICAgIGZyYW1lX2RpZyAzCiAgICBwdXNoYnl0ZXMgIl19fSIKICAgIGNvbmNhdAogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gdW5pdF9uYW1lPVN0cmluZygiVk9URVJTTFQiKSwKICAgIHB1c2hieXRlcyAiVk9URVJTTFQiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjI1CiAgICAvLyBkZWNpbWFscz1VSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gdG90YWw9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMjMKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIyMy0yMzEKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBhc3NldF9uYW1lPVN0cmluZygiW1ZPVEUgUkVTVUxUXSAiKSArIHNlbGYudm90ZV9pZC52YWx1ZS5uYXRpdmUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiVk9URVJTTFQiKSwKICAgIC8vICAgICB1cmw9c2VsZi5uZnRfaW1hZ2VfdXJsLnZhbHVlLAogICAgLy8gICAgIG5vdGU9bm90ZSArIFN0cmluZygiXX19IiksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyMzMKICAgIC8vIHNlbGYubmZ0X2Fzc2V0X2lkLnZhbHVlID0gcmVzdWx0LmNyZWF0ZWRfYXNzZXQuaWQKICAgIGJ5dGVjIDE1IC8vICJuZnRfYXNzZXRfaWQiCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLnZvdGluZ19yb3VuZC5jb250cmFjdC5Wb3RpbmdSb3VuZC52b3RlKGZ1bmRfbWluX2JhbF9yZXE6IHVpbnQ2NCwgc2lnbmF0dXJlOiBieXRlcywgYW5zd2VyX2lkczogYnl0ZXMpIC0+IHZvaWQ6CnZvdGU6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjIzNS0yMzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHZvdGUoCiAgICAvLyAgICAgc2VsZiwgZnVuZF9taW5fYmFsX3JlcTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sIHNpZ25hdHVyZTogYXJjNC5EeW5hbWljQnl0ZXMsIGFuc3dlcl9pZHM6IFZvdGVJbmRleEFycmF5CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjM5CiAgICAvLyBlbnN1cmVfYnVkZ2V0KFVJbnQ2NCg3NzAwKSkKICAgIHB1c2hpbnQgNzcwMCAvLyA3NzAwCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gYXNzZXJ0IHNlbGYuYWxsb3dlZF90b192b3RlKHNpZ25hdHVyZS5uYXRpdmUpLCAiTm90IGFsbG93ZWQgdG8gdm90ZSIKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgYWxsb3dlZF90b192b3RlCiAgICBhc3NlcnQgLy8gTm90IGFsbG93ZWQgdG8gdm90ZQogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNDIKICAgIC8vIGFzc2VydCBzZWxmLnZvdGluZ19vcGVuKCksICJWb3Rpbmcgbm90IG9wZW4iCiAgICBjYWxsc3ViIHZvdGluZ19vcGVuCiAgICBhc3NlcnQgLy8gVm90aW5nIG5vdCBvcGVuCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyByZXR1cm4gc2VsZi52b3Rlcy5tYXliZShhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpWzFdCiAgICB0eG4gU2VuZGVyCiAgICBib3hfZ2V0CiAgICBidXJ5IDEKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjQzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuYWxyZWFkeV92b3RlZCgpLCAiQWxyZWFkeSB2b3RlZCIKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IHZvdGVkCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gYXNzZXJ0IGFuc3dlcl9pZHMubGVuZ3RoID09IHNlbGYub3B0aW9uX2NvdW50cy52YWx1ZS5sZW5ndGgsICJOdW1iZXIgb2YgYW5zd2VycyBpbmNvcnJlY3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm9wdGlvbl9jb3VudHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3B0aW9uX2NvdW50cyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gTnVtYmVyIG9mIGFuc3dlcnMgaW5jb3JyZWN0CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gbWluX2JhbF9yZXEgPSBVSW50NjQoMl81MDApICsgKFVJbnQ2NCgzMiArIDIpICsgYW5zd2VyX2lkcy5sZW5ndGgpICogVUludDY0KDQwMCkKICAgIHB1c2hpbnQgMzQgLy8gMzQKICAgICsKICAgIGludGMgNCAvLyA0MDAKICAgICoKICAgIHB1c2hpbnQgMjUwMCAvLyAyNTAwCiAgICArCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gYXNzZXJ0IGZ1bmRfbWluX2JhbF9yZXEucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBhcHAgYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSB0byBhcHAgYWRkcmVzcwogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNDkKICAgIC8vIGxvZyhtaW5fYmFsX3JlcSkKICAgIGR1cAogICAgaXRvYgogICAgbG9nCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI1MAogICAgLy8gYXNzZXJ0IGZ1bmRfbWluX2JhbF9yZXEuYW1vdW50ID09IG1pbl9iYWxfcmVxLCAiUGF5bWVudCBtdXN0IGJlIHRoZSBleGFjdCBtaW4gYmFsYW5jZSByZXF1aXJlbWVudCIKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSB0aGUgZXhhY3QgbWluIGJhbGFuY2UgcmVxdWlyZW1lbnQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjUyCiAgICAvLyBjdW11bGF0aXZlX29mZnNldCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjUzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcHRpb25fY291bnRzLnZhbHVlLmxlbmd0aCk6CiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIm9wdGlvbl9jb3VudHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3B0aW9uX2NvdW50cyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCnZvdGVfZm9yX2hlYWRlckAxOgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNTMKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9wdGlvbl9jb3VudHMudmFsdWUubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogdm90ZV9hZnRlcl9mb3JANAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNTQKICAgIC8vIGFzc2VydCBhbnN3ZXJfaWRzW2ldIDwgc2VsZi5vcHRpb25fY291bnRzLnZhbHVlW2ldLCAiQW5zd2VyIG9wdGlvbiBpbmRleCBpbnZhbGlkIgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZHVwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3B0aW9uX2NvdW50cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fY291bnRzIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBiPAogICAgYXNzZXJ0IC8vIEFuc3dlciBvcHRpb24gaW5kZXggaW52YWxpZAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNTYKICAgIC8vIHF1ZXN0aW9uX29mZnNldCA9IGN1bXVsYXRpdmVfb2Zmc2V0ICsgYW5zd2VyX2lkc1tpXS5uYXRpdmUKICAgIHN3YXAKICAgIGRpZyAxCiAgICBnZXRieXRlCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAzCiAgICArCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI2MAogICAgLy8gb3AuaXRvYihvcC5idG9pKG9wLkJveC5leHRyYWN0KHNlbGYudGFsbGllcy5rZXksIHF1ZXN0aW9uX29mZnNldCwgVUludDY0KDgpKSkgKyBVSW50NjQoMSkpLAogICAgYnl0ZWNfMiAvLyAweDU2CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNTgKICAgIC8vIHNlbGYudGFsbGllcy5rZXksCiAgICBieXRlY18yIC8vIDB4NTYKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjU3LTI2MQogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgc2VsZi50YWxsaWVzLmtleSwKICAgIC8vICAgICBxdWVzdGlvbl9vZmZzZXQsCiAgICAvLyAgICAgb3AuaXRvYihvcC5idG9pKG9wLkJveC5leHRyYWN0KHNlbGYudGFsbGllcy5rZXksIHF1ZXN0aW9uX29mZnNldCwgVUludDY0KDgpKSkgKyBVSW50NjQoMSkpLAogICAgLy8gKQogICAgY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjYzCiAgICAvLyBjdW11bGF0aXZlX29mZnNldCArPSBzZWxmLm9wdGlvbl9jb3VudHMudmFsdWVbaV0ubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3B0aW9uX2NvdW50cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fY291bnRzIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBnZXRieXRlCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gZXhhbXBsZXMvc21hcnRfY29udHJhY3RzL3ZvdGluZ19yb3VuZC9jb250cmFjdC5weToyNTMKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9wdGlvbl9jb3VudHMudmFsdWUubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgdm90ZV9mb3JfaGVhZGVyQDEKCnZvdGVfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvdm90aW5nX3JvdW5kL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gc2VsZi52b3Rlc1thcmM0LkFkZHJlc3MoVHhuLnNlbmRlcildID0gYW5zd2VyX2lkcy5jb3B5KCkKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9wdXQKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy92b3Rpbmdfcm91bmQvY29udHJhY3QucHk6MjY2CiAgICAvLyBzZWxmLnZvdGVyX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInZvdGVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gInZvdGVyX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5iYXNlLmNvbnRyYWN0LlBlcm1hbmVuY2VDb250cm9sQVJDNENvbnRyYWN0LmRlbGV0ZSgpIC0+IHZvaWQ6CmRlbGV0ZToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oREVMRVRBQkxFX1RFTVBMQVRFX05BTUUpLCAiQ2hlY2sgYXBwIGlzIGRlbGV0YWJsZSIKICAgIGludGMgNSAvLyBUTVBMX0RFTEVUQUJMRQogICAgYXNzZXJ0IC8vIENoZWNrIGFwcCBpcyBkZWxldGFibGUKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBzZWxmLmF1dGhvcml6ZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgYXV0aG9yaXplX2NyZWF0b3IKICAgIHJldHN1YgoKCi8vIGV4YW1wbGVzLnNtYXJ0X2NvbnRyYWN0cy5iYXNlLmNvbnRyYWN0LkJhc2VBUkM0Q29udHJhY3QuYXV0aG9yaXplX2NyZWF0b3IoKSAtPiB2b2lkOgphdXRob3JpemVfY3JlYXRvcjoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAidW5hdXRob3JpemVkIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZAogICAgcmV0c3ViCgoKLy8gZXhhbXBsZXMuc21hcnRfY29udHJhY3RzLmJhc2UuY29udHJhY3QuQmFzZUFSQzRDb250cmFjdC5pdG9hKGk6IHVpbnQ2NCkgLT4gYnl0ZXM6Cml0b2E6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxMi0xMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBpdG9hKHNlbGYsIGk6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNAogICAgLy8gaWYgaSA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJueiBpdG9hX2Vsc2VfYm9keUAyCiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNQogICAgLy8gcmV0dXJuIFN0cmluZygiMCIpCiAgICBwdXNoYnl0ZXMgIjAiCiAgICBzd2FwCiAgICByZXRzdWIKCml0b2FfZWxzZV9ib2R5QDI6CiAgICAvLyBleGFtcGxlcy9zbWFydF9jb250cmFjdHMvYmFzZS9jb250cmFjdC5weToxNwogICAgLy8gcmV0dXJuIChzZWxmLml0b2EoaSAvLyBVSW50NjQoMTApKSBpZiAoaSAvLyBVSW50NjQoMTApKSA+IFVJbnQ2NCgwKSBlbHNlIFN0cmluZygiIikpICsgU3RyaW5nLmZyb21fYnl0ZXMoCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMyAvLyAxMAogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IGl0b2FfdGVybmFyeV9mYWxzZUA0CiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBpdG9hCgppdG9hX3Rlcm5hcnlfbWVyZ2VANToKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBTdHJpbmcoIjAxMjM0NTY3ODkiKS5ieXRlc1tpICUgVUludDY0KDEwKV0KICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18zIC8vIDEwCiAgICAlCiAgICBwdXNoYnl0ZXMgIjAxMjM0NTY3ODkiCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3LTE5CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIC8vICAgICBTdHJpbmcoIjAxMjM0NTY3ODkiKS5ieXRlc1tpICUgVUludDY0KDEwKV0KICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgcmV0c3ViCgppdG9hX3Rlcm5hcnlfZmFsc2VANDoKICAgIC8vIGV4YW1wbGVzL3NtYXJ0X2NvbnRyYWN0cy9iYXNlL2NvbnRyYWN0LnB5OjE3CiAgICAvLyByZXR1cm4gKHNlbGYuaXRvYShpIC8vIFVJbnQ2NCgxMCkpIGlmIChpIC8vIFVJbnQ2NCgxMCkpID4gVUludDY0KDApIGVsc2UgU3RyaW5nKCIiKSkgKyBTdHJpbmcuZnJvbV9ieXRlcygKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGIgaXRvYV90ZXJuYXJ5X21lcmdlQDUK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {
+    "get_preconditions(byte[])(uint64,uint64,uint64,uint64)": 0,
+    "get_preconditions": 0,
+    "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void": 1,
+    "create": 1,
+    "bootstrap(pay)void": 2,
+    "bootstrap": 2,
+    "close()void": 3,
+    "close": 3,
+    "vote(pay,byte[],uint8[])void": 4,
+    "vote": 4,
+}
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature"""
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+
+def _convert_dataclass(value: object) -> object:
+    """Helper to recursively convert dataclasses into the tuples expected by the ABI encoder"""
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -43,28 +76,55 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    """Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied"""
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
 
-@dataclasses.dataclass(frozen=True)
+class _ReadCaches:
+    """The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them"""
+
+    __slots__ = ("state_cache", "readonly_cache")
+
+    def __init__(self) -> None:
+        self.state_cache: "_StateCache | None" = None
+        self.readonly_cache: "_StateCache | None" = None
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        """Evict the enabled caches once transactions with these confirmations are confirmed"""
+        confirmations = list(confirmations)
+        if self.state_cache is not None:
+            self.state_cache.invalidate(confirmations)
+        if self.readonly_cache is not None:
+            self.readonly_cache.invalidate(confirmations)
+
+
+# ABI types of struct fields encoded by the generic ABI encoder, parsed on first use
+_ABI_TYPES: dict[str, algosdk.abi.ABIType] = {}
+
+
+def _abi_type(type_string: str) -> algosdk.abi.ABIType:
+    abi_type = _ABI_TYPES.get(type_string)
+    if abi_type is None:
+        abi_type = _ABI_TYPES[type_string] = algosdk.abi.ABIType.from_string(type_string)
+    return abi_type
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class VotingPreconditions:
     """Struct for VotingPreconditions"""
     is_voting_open: int
@@ -73,7 +133,56 @@ class VotingPreconditions:
     current_time: int
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+def _voting_preconditions_to_tuple(value: object) -> object:
+    """Convert a VotingPreconditions into the tuple expected by the ABI encoder"""
+    if isinstance(value, VotingPreconditions):
+        return (value.is_voting_open, value.is_allowed_to_vote, value.has_already_voted, value.current_time)
+    return _convert_dataclass(value)
+
+
+def _voting_preconditions_from_dict(data: dict) -> VotingPreconditions:
+    """Construct a VotingPreconditions from the dict the app client decodes it into"""
+    return VotingPreconditions(
+        is_voting_open=data["is_voting_open"],
+        is_allowed_to_vote=data["is_allowed_to_vote"],
+        has_already_voted=data["has_already_voted"],
+        current_time=data["current_time"],
+    )
+
+
+def _voting_preconditions_from_tuple(value: tuple | list) -> VotingPreconditions:
+    """Construct a VotingPreconditions from the tuple decoded by the ABI decoder"""
+    return VotingPreconditions(
+        is_voting_open=value[0],
+        is_allowed_to_vote=value[1],
+        has_already_voted=value[2],
+        current_time=value[3],
+    )
+
+
+def _voting_preconditions_to_bytes(value: VotingPreconditions) -> bytes:
+    """Encode a VotingPreconditions into its ABI encoding"""
+    return b"".join((
+        value.is_voting_open.to_bytes(8, "big"),
+        value.is_allowed_to_vote.to_bytes(8, "big"),
+        value.has_already_voted.to_bytes(8, "big"),
+        value.current_time.to_bytes(8, "big"),
+    ))
+
+
+def _voting_preconditions_from_bytes(data: bytes) -> VotingPreconditions:
+    """Construct a VotingPreconditions from its ABI encoding"""
+    if len(data) != 32:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of VotingPreconditions")
+    return VotingPreconditions(
+        is_voting_open=int.from_bytes(data[0:8], "big"),
+        is_allowed_to_vote=int.from_bytes(data[8:16], "big"),
+        has_already_voted=int.from_bytes(data[16:24], "big"),
+        current_time=int.from_bytes(data[24:32], "big"),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class GetPreconditionsArgs:
     """Dataclass for get_preconditions arguments"""
     signature: bytes | str
@@ -82,7 +191,14 @@ class GetPreconditionsArgs:
     def abi_method_signature(self) -> str:
         return "get_preconditions(byte[])(uint64,uint64,uint64,uint64)"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _get_preconditions_args_to_abi(args: tuple[bytes | str] | GetPreconditionsArgs) -> list[typing.Any] | None:
+    """Convert get_preconditions args into the list of ABI args expected by the app client"""
+    if isinstance(args, GetPreconditionsArgs):
+        return [args.signature]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class BootstrapArgs:
     """Dataclass for bootstrap arguments"""
     fund_min_bal_req: algokit_utils.AppMethodCallTransactionArgument
@@ -91,7 +207,14 @@ class BootstrapArgs:
     def abi_method_signature(self) -> str:
         return "bootstrap(pay)void"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _bootstrap_args_to_abi(args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BootstrapArgs) -> list[typing.Any] | None:
+    """Convert bootstrap args into the list of ABI args expected by the app client"""
+    if isinstance(args, BootstrapArgs):
+        return [args.fund_min_bal_req]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class VoteArgs:
     """Dataclass for vote arguments"""
     fund_min_bal_req: algokit_utils.AppMethodCallTransactionArgument
@@ -102,7 +225,14 @@ class VoteArgs:
     def abi_method_signature(self) -> str:
         return "vote(pay,byte[],uint8[])void"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+
+def _vote_args_to_abi(args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str, list[int]] | VoteArgs) -> list[typing.Any] | None:
+    """Convert vote args into the list of ABI args expected by the app client"""
+    if isinstance(args, VoteArgs):
+        return [args.fund_min_bal_req, args.signature, args.answer_ids]
+    return [*args] if args else None
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateArgs:
     """Dataclass for create arguments"""
     vote_id: str
@@ -119,7 +249,332 @@ class CreateArgs:
         return "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void"
 
 
+def _create_args_to_abi(args: tuple[str, bytes | str, str, int, int, list[int], int, str] | CreateArgs) -> list[typing.Any] | None:
+    """Convert create args into the list of ABI args expected by the app client"""
+    if isinstance(args, CreateArgs):
+        return [args.vote_id, args.snapshot_public_key, args.metadata_ipfs_cid, args.start_time, args.end_time, args.option_counts, args.quorum, args.nft_image_url]
+    return [*args] if args else None
+
+
+def _transaction_arg(
+    group: typing.Sequence[algosdk.transaction.Transaction], count: int, position: int
+) -> algosdk.transaction.Transaction:
+    # transaction args are the transactions preceding the app call in its group
+    if len(group) < count:
+        raise ValueError(f"The {count} transactions preceding the app call are needed to resolve its transaction args")
+    return group[len(group) - count + position]
+
+
+def _get_preconditions_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> GetPreconditionsArgs:
+    """Decode the args of a call of get_preconditions(byte[])(uint64,uint64,uint64,uint64) from its app args"""
+    if not (
+        len(app_args) == 2
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of get_preconditions(byte[])(uint64,uint64,uint64,uint64)")
+    return GetPreconditionsArgs(
+        signature=app_args[1][2:],
+    )
+
+
+def _bootstrap_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> BootstrapArgs:
+    """Decode the args of a call of bootstrap(pay)void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of bootstrap(pay)void")
+    return BootstrapArgs(
+        fund_min_bal_req=_transaction_arg(group, 1, 0),
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CloseArgs:
+    """Dataclass for close arguments, of which it has none"""
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close()void"
+
+
+def _close_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CloseArgs:
+    """Decode the args of a call of close()void from its app args"""
+    if len(app_args) != 1:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of close()void")
+    return CloseArgs()
+
+
+def _vote_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> VoteArgs:
+    """Decode the args of a call of vote(pay,byte[],uint8[])void from its app args"""
+    if not (
+        len(app_args) == 3
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of vote(pay,byte[],uint8[])void")
+    return VoteArgs(
+        fund_min_bal_req=_transaction_arg(group, 1, 0),
+        signature=app_args[1][2:],
+        answer_ids=_abi_type("uint8[]").decode(app_args[2]),
+    )
+
+
+def _create_args_from_app_args(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> CreateArgs:
+    """Decode the args of a call of create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void from its app args"""
+    if not (
+        len(app_args) == 9
+        and int.from_bytes(app_args[1][:2], "big") == len(app_args[1]) - 2
+        and int.from_bytes(app_args[2][:2], "big") == len(app_args[2]) - 2
+        and int.from_bytes(app_args[3][:2], "big") == len(app_args[3]) - 2
+        and len(app_args[4]) == 8
+        and len(app_args[5]) == 8
+        and len(app_args[7]) == 8
+        and int.from_bytes(app_args[8][:2], "big") == len(app_args[8]) - 2
+    ):
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void")
+    return CreateArgs(
+        vote_id=app_args[1][2:].decode(),
+        snapshot_public_key=app_args[2][2:],
+        metadata_ipfs_cid=app_args[3][2:].decode(),
+        start_time=int.from_bytes(app_args[4], "big"),
+        end_time=int.from_bytes(app_args[5], "big"),
+        option_counts=_abi_type("uint8[]").decode(app_args[6]),
+        quorum=int.from_bytes(app_args[7], "big"),
+        nft_image_url=app_args[8][2:].decode(),
+    )
+
+
+VotingRoundMethodArgs: typing.TypeAlias = GetPreconditionsArgs | BootstrapArgs | CloseArgs | VoteArgs | CreateArgs
+
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    VotingRoundMethodArgs,
+]
+
+# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg
+_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {
+    b"\xbc\xb1\x58\x96": _get_preconditions_args_from_app_args,  # get_preconditions(byte[])(uint64,uint64,uint64,uint64)
+    b"\xa4\xe8\xd1\x64": _bootstrap_args_from_app_args,  # bootstrap(pay)void
+    b"\x96\x56\x04\x7a": _close_args_from_app_args,  # close()void
+    b"\x84\xa5\x3c\x6e": _vote_args_from_app_args,  # vote(pay,byte[],uint8[])void
+    b"\xae\x89\x7f\x6b": _create_args_from_app_args,  # create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void
+}
+
+
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> VotingRoundMethodArgs | None:
+    """Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    """
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class VotingRoundAppCall:
+    """A call of the app extracted from a block or the transactions of the indexer"""
+    confirmed_round: int | None
+    tx_id: str | None
+    """ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks"""
+    sender: str
+    method: str | None
+    """Signature of the called ABI method, or None for bare calls"""
+    app_args: list[bytes]
+    args: VotingRoundMethodArgs | None
+    """Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+    calls read from the indexer, whose group isn't converted into algosdk transactions"""
+
+
+# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls
+_METHOD_SIGNATURES: dict[bytes, str] = {
+    b"\xbc\xb1\x58\x96": "get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
+    b"\xa4\xe8\xd1\x64": "bootstrap(pay)void",
+    b"\x96\x56\x04\x7a": "close()void",
+    b"\x84\xa5\x3c\x6e": "vote(pay,byte[],uint8[])void",
+    b"\xae\x89\x7f\x6b": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+}
+
+
+def _get_preceding_group_transactions(
+    transactions: list[dict[str, typing.Any]], index: int
+) -> list[algosdk.transaction.Transaction]:
+    """Get the transactions preceding a transaction of a block in its group, none for indexer transactions"""
+    group_id = transactions[index].get("txn", {}).get("grp")
+    start = index
+    while group_id is not None and start > 0 and transactions[start - 1].get("txn", {}).get("grp") == group_id:
+        start -= 1
+    # the transactions of a block omit the fields implied by the block, e.g. the genesis hash
+    return [
+        algosdk.transaction.Transaction.undictify({"lv": 0, **transaction["txn"]})
+        for transaction in transactions[start:index]
+    ]
+
+
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> VotingRoundMethodArgs | None:
+    """Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be"""
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    try:
+        return decode_app_call(app_args, group=_get_preceding_group_transactions(transactions, index))
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args, or transaction args of indexer transactions
+        return None
+
+
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[VotingRoundAppCall]:
+    """Get the calls of the app by a transaction of a block or the indexer, including its inner transactions"""
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield VotingRoundAppCall(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[VotingRoundAppCall]:
+    """Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction"""
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[VotingRoundAppCall]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[VotingRoundAppCall]:
+    """Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    """
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[VotingRoundAppCall]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class _VotingRoundDelete:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -130,75 +585,80 @@ class _VotingRoundDelete:
 
 
 class VotingRoundParams:
+    __slots__ = ("app_client", "_delete")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._delete: "_VotingRoundDelete | None" = None
 
     @property
     def delete(self) -> "_VotingRoundDelete":
-        return _VotingRoundDelete(self.app_client)
+        if self._delete is None:
+            self._delete = _VotingRoundDelete(self.app_client)
+        return self._delete
 
     def get_preconditions(
         self,
         args: tuple[bytes | str] | GetPreconditionsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        method_args = _get_preconditions_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
+            args=method_args,
+        ))
 
     def bootstrap(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BootstrapArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "bootstrap(pay)void",
-            "args": method_args,
-        }))
+        method_args = _bootstrap_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="bootstrap(pay)void",
+            args=method_args,
+        ))
 
     def close(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close()void",
+        ))
 
     def vote(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str, list[int]] | VoteArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vote(pay,byte[],uint8[])void",
-            "args": method_args,
-        }))
+        method_args = _vote_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="vote(pay,byte[],uint8[])void",
+            args=method_args,
+        ))
 
     def create(
         self,
         args: tuple[str, bytes | str, str, int, int, list[int], int, str] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
-            "args": method_args,
-        }))
+        method_args = _create_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -212,6 +672,8 @@ class VotingRoundParams:
 
 
 class _VotingRoundDeleteTransaction:
+    __slots__ = ("app_client",)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
@@ -220,75 +682,80 @@ class _VotingRoundDeleteTransaction:
 
 
 class VotingRoundCreateTransactionParams:
+    __slots__ = ("app_client", "_delete")
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
+        self._delete: "_VotingRoundDeleteTransaction | None" = None
 
     @property
     def delete(self) -> "_VotingRoundDeleteTransaction":
-        return _VotingRoundDeleteTransaction(self.app_client)
+        if self._delete is None:
+            self._delete = _VotingRoundDeleteTransaction(self.app_client)
+        return self._delete
 
     def get_preconditions(
         self,
         args: tuple[bytes | str] | GetPreconditionsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        method_args = _get_preconditions_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
+            args=method_args,
+        ))
 
     def bootstrap(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BootstrapArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "bootstrap(pay)void",
-            "args": method_args,
-        }))
+        method_args = _bootstrap_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="bootstrap(pay)void",
+            args=method_args,
+        ))
 
     def close(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close()void",
-        }))
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close()void",
+        ))
 
     def vote(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str, list[int]] | VoteArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vote(pay,byte[],uint8[])void",
-            "args": method_args,
-        }))
+        method_args = _vote_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="vote(pay,byte[],uint8[])void",
+            args=method_args,
+        ))
 
     def create(
         self,
         args: tuple[str, bytes | str, str, int, int, list[int], int, str] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
-            "args": method_args,
-        }))
+        method_args = _create_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+            args=method_args,
+        ))
 
     def clear_state(
         self,
@@ -302,8 +769,11 @@ class VotingRoundCreateTransactionParams:
 
 
 class _VotingRoundDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
 
     def bare(
         self,
@@ -311,20 +781,78 @@ class _VotingRoundDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
-        return self.app_client.send.bare.delete(
+        response = self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
             
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
+
+
+# ABI types canonically encoding the args of each readonly method, parsed on first use
+_READONLY_ARGS_TYPES = {
+    "get_preconditions(byte[])(uint64,uint64,uint64,uint64)": "(byte[])",
+}
+_READONLY_ARGS_CODECS: dict[str, algosdk.abi.ABIType] = {}
+
+
+def _readonly_cache_key(params: algokit_utils.AppClientMethodCallParams) -> typing.Hashable | None:
+    """Key a readonly call by its method signature, canonically encoded args and sender
+
+    Calls with args that can't be encoded, e.g. omitted args filled in with default values by the app client, aren't
+    cached
+    """
+    codec = _READONLY_ARGS_CODECS.get(params.method)
+    if codec is None:
+        codec = _READONLY_ARGS_CODECS[params.method] = algosdk.abi.ABIType.from_string(
+            _READONLY_ARGS_TYPES[params.method]
+        )
+    try:
+        encoded_args = codec.encode(params.args or [])
+    except (algosdk.error.ABIEncodingError, IndexError, TypeError, ValueError):
+        return None
+    return params.method, encoded_args, params.sender
 
 
 class VotingRoundSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_client", "_delete", "_batch")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None, client: "VotingRoundClient | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._client = client
+        self._delete: "_VotingRoundDeleteSend | None" = None
+        self._batch: "_VotingRoundBatchSend | None" = None
 
     @property
     def delete(self) -> "_VotingRoundDeleteSend":
-        return _VotingRoundDeleteSend(self.app_client)
+        if self._delete is None:
+            self._delete = _VotingRoundDeleteSend(self.app_client, self._caches)
+        return self._delete
+
+    @property
+    def batch(self) -> "_VotingRoundBatchSend":
+        if self._batch is None:
+            self._batch = _VotingRoundBatchSend(self.app_client, self._client)
+        return self._batch
+
+    def _call_readonly(
+        self, params: algokit_utils.AppClientMethodCallParams, send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.Arc56ReturnValueType]:
+        """Simulate a readonly call, reusing the result of an earlier call with the same args and sender while it's
+        cached"""
+        cache = self._caches.readonly_cache if self._caches is not None else None
+        key = _readonly_cache_key(params) if cache is not None else None
+        if cache is None or key is None:
+            return self.app_client.send.call(params, send_params=send_params)
+        return cache.get(
+            key,
+            lambda: self.app_client.send.call(params, send_params=send_params),
+            # readonly calls are simulated against the round the transaction is valid from
+            round_of=lambda response: response.transaction.raw.first_valid_round,
+        )
 
     def get_preconditions(
         self,
@@ -332,14 +860,14 @@ class VotingRoundSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[VotingPreconditions]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(VotingPreconditions, typing.cast(dict, response.abi_return))) # type: ignore
+        method_args = _get_preconditions_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self._call_readonly(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
+            args=method_args,
+        ), send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_voting_preconditions_from_dict(typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[VotingPreconditions], parsed_response)
 
     def bootstrap(
@@ -348,13 +876,15 @@ class VotingRoundSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "bootstrap(pay)void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _bootstrap_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="bootstrap(pay)void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -364,11 +894,13 @@ class VotingRoundSend:
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close()void",
-        }), send_params=send_params)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="close()void",
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -378,13 +910,15 @@ class VotingRoundSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vote(pay,byte[],uint8[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _vote_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="vote(pay,byte[],uint8[])void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -394,13 +928,15 @@ class VotingRoundSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        method_args = _create_args_to_abi(args)
+        params = params or _DEFAULT_PARAMS
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(
+            **_params_fields(params),
+            method="create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+            args=method_args,
+        ), send_params=send_params)
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -409,10 +945,13 @@ class VotingRoundSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
+        response = self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
+        if self._caches is not None:
+            self._caches.invalidate(response.confirmations)
+        return response
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -431,149 +970,301 @@ class GlobalStateValue(typing.TypedDict):
     vote_id: bytes
     voter_count: int
 
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GlobalStateSnapshot:
+    """Values of every global_state state key read from a single response of algod, along with a round they are
+    at least as recent as"""
+
+    round: int
+    """Latest round before the values were read, they include every transaction confirmed by then"""
+    close_time: int
+    end_time: int
+    is_bootstrapped: int
+    metadata_ipfs_cid: bytes
+    nft_asset_id: int
+    nft_image_url: bytes
+    option_counts: bytes
+    quorum: int
+    snapshot_public_key: bytes
+    start_time: int
+    total_options: int
+    vote_id: bytes
+    voter_count: int
+
+
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    """Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding"""
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+
+
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    """Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed"""
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        """Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        """Evict every entry if round_number is later than the latest round observed so far"""
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        """Evict every entry, as confirmed transactions may have changed the app's state"""
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
+
+
 class VotingRoundState:
     """Methods to access state for the current VotingRound app"""
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches", "_global_state")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
+        self._caches = caches
+        self._global_state: "_GlobalState | None" = None
 
     @property
-    def global_state(
-        self
-    ) -> "_GlobalState":
-            """Methods to access global_state for the current app"""
-            return _GlobalState(self.app_client)
+    def global_state(self) -> "_GlobalState":
+        """Methods to access global_state for the current app"""
+        if self._global_state is None:
+            self._global_state = _GlobalState(self.app_client, self._caches)
+        return self._global_state
+
 
 class _GlobalState:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ("app_client", "_caches")
+
+    def __init__(self, app_client: algokit_utils.AppClient, caches: "_ReadCaches | None" = None):
         self.app_client = app_client
-        
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._caches = caches
+
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("global_state", *key), read, round_of)
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
-        result = self.app_client.state.global_state.get_all()
-        if not result:
-            return typing.cast(GlobalStateValue, {})
-
-        converted = {}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return typing.cast(GlobalStateValue, converted)
+        result = self._read(("get_all",), self.app_client.state.global_state.get_all)
+        return typing.cast(GlobalStateValue, result)
+
+    def snapshot(self) -> GlobalStateSnapshot:
+        """Get the current value of every key in global_state state, all read from the same response of algod"""
+        return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+    
+    def _read_snapshot(self) -> GlobalStateSnapshot:
+        algod = self.app_client.algorand.client.algod
+        current_round = typing.cast(dict, algod.status())["last-round"]
+        app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+        key_values = app_info["params"].get("global-state", [])
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        return GlobalStateSnapshot(
+            round=current_round,
+            close_time=typing.cast(int, _decode_state_value(state.get("Y2xvc2VfdGltZQ=="), "AVMUint64")),
+            end_time=typing.cast(int, _decode_state_value(state.get("ZW5kX3RpbWU="), "AVMUint64")),
+            is_bootstrapped=typing.cast(int, _decode_state_value(state.get("aXNfYm9vdHN0cmFwcGVk"), "AVMUint64")),
+            metadata_ipfs_cid=typing.cast(bytes, _decode_state_value(state.get("bWV0YWRhdGFfaXBmc19jaWQ="), "AVMBytes")),
+            nft_asset_id=typing.cast(int, _decode_state_value(state.get("bmZ0X2Fzc2V0X2lk"), "AVMUint64")),
+            nft_image_url=typing.cast(bytes, _decode_state_value(state.get("bmZ0X2ltYWdlX3VybA=="), "AVMBytes")),
+            option_counts=typing.cast(bytes, _decode_state_value(state.get("b3B0aW9uX2NvdW50cw=="), "AVMBytes")),
+            quorum=typing.cast(int, _decode_state_value(state.get("cXVvcnVt"), "AVMUint64")),
+            snapshot_public_key=typing.cast(bytes, _decode_state_value(state.get("c25hcHNob3RfcHVibGljX2tleQ=="), "AVMBytes")),
+            start_time=typing.cast(int, _decode_state_value(state.get("c3RhcnRfdGltZQ=="), "AVMUint64")),
+            total_options=typing.cast(int, _decode_state_value(state.get("dG90YWxfb3B0aW9ucw=="), "AVMUint64")),
+            vote_id=typing.cast(bytes, _decode_state_value(state.get("dm90ZV9pZA=="), "AVMBytes")),
+            voter_count=typing.cast(int, _decode_state_value(state.get("dm90ZXJfY291bnQ="), "AVMUint64")),
+        )
 
     @property
     def close_time(self) -> int:
         """Get the current value of the close_time key in global_state state"""
-        value = self.app_client.state.global_state.get_value("close_time")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "close_time"), lambda: self.app_client.state.global_state.get_value("close_time"))
         return typing.cast(int, value)
 
     @property
     def end_time(self) -> int:
         """Get the current value of the end_time key in global_state state"""
-        value = self.app_client.state.global_state.get_value("end_time")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "end_time"), lambda: self.app_client.state.global_state.get_value("end_time"))
         return typing.cast(int, value)
 
     @property
     def is_bootstrapped(self) -> int:
         """Get the current value of the is_bootstrapped key in global_state state"""
-        value = self.app_client.state.global_state.get_value("is_bootstrapped")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "is_bootstrapped"), lambda: self.app_client.state.global_state.get_value("is_bootstrapped"))
         return typing.cast(int, value)
 
     @property
     def metadata_ipfs_cid(self) -> bytes:
         """Get the current value of the metadata_ipfs_cid key in global_state state"""
-        value = self.app_client.state.global_state.get_value("metadata_ipfs_cid")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "metadata_ipfs_cid"), lambda: self.app_client.state.global_state.get_value("metadata_ipfs_cid"))
         return typing.cast(bytes, value)
 
     @property
     def nft_asset_id(self) -> int:
         """Get the current value of the nft_asset_id key in global_state state"""
-        value = self.app_client.state.global_state.get_value("nft_asset_id")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "nft_asset_id"), lambda: self.app_client.state.global_state.get_value("nft_asset_id"))
         return typing.cast(int, value)
 
     @property
     def nft_image_url(self) -> bytes:
         """Get the current value of the nft_image_url key in global_state state"""
-        value = self.app_client.state.global_state.get_value("nft_image_url")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "nft_image_url"), lambda: self.app_client.state.global_state.get_value("nft_image_url"))
         return typing.cast(bytes, value)
 
     @property
     def option_counts(self) -> bytes:
         """Get the current value of the option_counts key in global_state state"""
-        value = self.app_client.state.global_state.get_value("option_counts")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "option_counts"), lambda: self.app_client.state.global_state.get_value("option_counts"))
         return typing.cast(bytes, value)
 
     @property
     def quorum(self) -> int:
         """Get the current value of the quorum key in global_state state"""
-        value = self.app_client.state.global_state.get_value("quorum")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "quorum"), lambda: self.app_client.state.global_state.get_value("quorum"))
         return typing.cast(int, value)
 
     @property
     def snapshot_public_key(self) -> bytes:
         """Get the current value of the snapshot_public_key key in global_state state"""
-        value = self.app_client.state.global_state.get_value("snapshot_public_key")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "snapshot_public_key"), lambda: self.app_client.state.global_state.get_value("snapshot_public_key"))
         return typing.cast(bytes, value)
 
     @property
     def start_time(self) -> int:
         """Get the current value of the start_time key in global_state state"""
-        value = self.app_client.state.global_state.get_value("start_time")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "start_time"), lambda: self.app_client.state.global_state.get_value("start_time"))
         return typing.cast(int, value)
 
     @property
     def total_options(self) -> int:
         """Get the current value of the total_options key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_options")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "total_options"), lambda: self.app_client.state.global_state.get_value("total_options"))
         return typing.cast(int, value)
 
     @property
     def vote_id(self) -> bytes:
         """Get the current value of the vote_id key in global_state state"""
-        value = self.app_client.state.global_state.get_value("vote_id")
-        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        value = self._read(("key", "vote_id"), lambda: self.app_client.state.global_state.get_value("vote_id"))
         return typing.cast(bytes, value)
 
     @property
     def voter_count(self) -> int:
         """Get the current value of the voter_count key in global_state state"""
-        value = self.app_client.state.global_state.get_value("voter_count")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        value = self._read(("key", "voter_count"), lambda: self.app_client.state.global_state.get_value("voter_count"))
         return typing.cast(int, value)
 
+
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {
+    "get_preconditions(byte[])(uint64,uint64,uint64,uint64)": (APP_SPEC.methods[0], _voting_preconditions_from_tuple),
+    "get_preconditions": (APP_SPEC.methods[0], _voting_preconditions_from_tuple),
+    "bootstrap(pay)void": (APP_SPEC.methods[2], None),
+    "bootstrap": (APP_SPEC.methods[2], None),
+    "close()void": (APP_SPEC.methods[3], None),
+    "close": (APP_SPEC.methods[3], None),
+    "vote(pay,byte[],uint8[])void": (APP_SPEC.methods[4], None),
+    "vote": (APP_SPEC.methods[4], None),
+    "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void": (APP_SPEC.methods[1], None),
+    "create": (APP_SPEC.methods[1], None),
+}
+
+
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+
+
 class VotingRoundClient:
     """Client for interacting with VotingRound smart contract"""
 
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state", "_caches")
+
     @typing.overload
     def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
     
@@ -620,10 +1311,58 @@ class VotingRoundClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
-        self.params = VotingRoundParams(self.app_client)
-        self.create_transaction = VotingRoundCreateTransactionParams(self.app_client)
-        self.send = VotingRoundSend(self.app_client)
-        self.state = VotingRoundState(self.app_client)
+        # sub-clients are created on first access, as most clients only use some of them
+        self._params: VotingRoundParams | None = None
+        self._create_transaction: VotingRoundCreateTransactionParams | None = None
+        self._send: VotingRoundSend | None = None
+        self._state: "VotingRoundState | None" = None
+        self._caches = _ReadCaches()
+    
+    @property
+    def params(self) -> VotingRoundParams:
+        if self._params is None:
+            self._params = VotingRoundParams(self.app_client)
+        return self._params
+    
+    @property
+    def create_transaction(self) -> VotingRoundCreateTransactionParams:
+        if self._create_transaction is None:
+            self._create_transaction = VotingRoundCreateTransactionParams(self.app_client)
+        return self._create_transaction
+    
+    @property
+    def send(self) -> VotingRoundSend:
+        if self._send is None:
+            self._send = VotingRoundSend(self.app_client, self._caches, client=self)
+        return self._send
+    
+    @property
+    def state(self) -> "VotingRoundState":
+        if self._state is None:
+            self._state = VotingRoundState(self.app_client, self._caches)
+        return self._state
+
+    def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+        """Cache the state read through `state`, in an LRU of up to max_entries reads
+    
+        Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+        when a transaction sent through `send` or `new_group()` is confirmed
+        """
+        self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+
+    def enable_readonly_cache(self, *, max_entries: int = 256, ttl: float = 60.0) -> None:
+        """Cache the results of readonly methods called through `send`, in an LRU of up to max_entries results
+    
+        Results are keyed by method, args and sender, and are cached for ttl seconds or until a later round is observed.
+        They're evicted when a transaction sent through `send` or `new_group()` is confirmed, or by
+        `readonly_cache.invalidate()`
+        """
+        self._caches.readonly_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+    
+    @property
+    def readonly_cache(self) -> "_StateCache | None":
+        """The cache of readonly method results with its hit and miss counts, if enabled"""
+        return self._caches.readonly_cache
 
     @staticmethod
     def from_creator_and_name(
@@ -714,6 +1453,9 @@ class VotingRoundClient:
     def new_group(self) -> "VotingRoundComposer":
         return VotingRoundComposer(self)
 
+    def readonly_batch(self) -> "VotingRoundReadonlyBatch":
+        return VotingRoundReadonlyBatch(self)
+
     @typing.overload
     def decode_return_value(
         self,
@@ -760,18 +1502,10 @@ class VotingRoundClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return_decoder = _RETURN_DECODERS.get(method)
+        if return_decoder is None:
+            return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+        return typing.cast(algokit_utils.ABIValue | algokit_utils.ABIStruct | None | VotingPreconditions, _decode_return(return_decoder, return_value, self.app_spec.structs))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -923,6 +1657,8 @@ class VotingRoundFactory(algokit_utils.TypedAppFactoryProtocol[VotingRoundMethod
 class VotingRoundFactoryParams:
     """Parameters for creating transactions for VotingRound contract"""
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = VotingRoundFactoryCreateParams(app_factory)
@@ -932,6 +1668,8 @@ class VotingRoundFactoryParams:
 class VotingRoundFactoryCreateParams:
     """Parameters for 'create' operations of VotingRound contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -942,9 +1680,9 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             compilation_params=compilation_params)
 
     def get_preconditions(
@@ -955,14 +1693,12 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the get_preconditions(byte[])(uint64,uint64,uint64,uint64) ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="get_preconditions(byte[])(uint64,uint64,uint64,uint64)",
+                args=_get_preconditions_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -975,14 +1711,12 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the bootstrap(pay)void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "bootstrap(pay)void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="bootstrap(pay)void",
+                args=_bootstrap_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -994,14 +1728,12 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the close()void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "close()void",
-                "args": None,
-                }
+                **_params_fields(params),
+                method="close()void",
+                args=None,
             ),
             compilation_params=compilation_params
         )
@@ -1014,14 +1746,12 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the vote(pay,byte[],uint8[])void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "vote(pay,byte[],uint8[])void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="vote(pay,byte[],uint8[])void",
+                args=_vote_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1034,14 +1764,12 @@ class VotingRoundFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
-                "args": _parse_abi_args(args),
-                }
+                **_params_fields(params),
+                method="create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+                args=_create_args_to_abi(args),
             ),
             compilation_params=compilation_params
         )
@@ -1049,6 +1777,8 @@ class VotingRoundFactoryCreateParams:
 class VotingRoundFactoryUpdateParams:
     """Parameters for 'update' operations of VotingRound contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1059,14 +1789,16 @@ class VotingRoundFactoryUpdateParams:
         
     ) -> algokit_utils.AppUpdateParams:
         """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 class VotingRoundFactoryDeleteParams:
     """Parameters for 'delete' operations of VotingRound contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1077,15 +1809,17 @@ class VotingRoundFactoryDeleteParams:
         
     ) -> algokit_utils.AppDeleteParams:
         """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            algokit_utils.AppClientBareCallParams(**_params_fields(params)),
             )
 
 
 class VotingRoundFactoryCreateTransaction:
     """Create transactions for VotingRound contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = VotingRoundFactoryCreateTransactionCreate(app_factory)
@@ -1094,6 +1828,8 @@ class VotingRoundFactoryCreateTransaction:
 class VotingRoundFactoryCreateTransactionCreate:
     """Create new instances of VotingRound contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1102,15 +1838,17 @@ class VotingRoundFactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 
 
 class VotingRoundFactorySend:
     """Send calls to VotingRound contract"""
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = VotingRoundFactorySendCreate(app_factory)
@@ -1119,6 +1857,8 @@ class VotingRoundFactorySend:
 class VotingRoundFactorySendCreate:
     """Send create calls to VotingRound contract"""
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -1130,9 +1870,9 @@ class VotingRoundFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[VotingRoundClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -1147,14 +1887,12 @@ class VotingRoundFactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[VotingRoundClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void ABI method"""
-            params = params or algokit_utils.CommonAppCallCreateParams()
+            params = params or _DEFAULT_CREATE_PARAMS
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
-                    **{
-                    **dataclasses.asdict(params),
-                    "method": "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
-                    "args": _parse_abi_args(args),
-                    }
+                    **_params_fields(params),
+                    method="create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void",
+                    args=_create_args_to_abi(args),
                 ),
                 send_params=send_params,
                 compilation_params=compilation_params
@@ -1178,6 +1916,8 @@ class VotingRoundFactorySendCreate:
 
 
 class _VotingRoundDeleteComposer:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: "VotingRoundComposer"):
         self.composer = composer
 
@@ -1185,14 +1925,20 @@ class _VotingRoundDeleteComposer:
 class VotingRoundComposer:
     """Composer for creating transaction groups for VotingRound contract calls"""
 
+    __slots__ = ("client", "_composer", "_return_decoders", "_delete")
+
     def __init__(self, client: "VotingRoundClient"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
+        self._delete: "_VotingRoundDeleteComposer | None" = None
 
     @property
     def delete(self) -> "_VotingRoundDeleteComposer":
-        return _VotingRoundDeleteComposer(self)
+        if self._delete is None:
+            self._delete = _VotingRoundDeleteComposer(self)
+        return self._delete
 
     def get_preconditions(
         self,
@@ -1205,10 +1951,8 @@ class VotingRoundComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "get_preconditions(byte[])(uint64,uint64,uint64,uint64)", v
-            )
+        self._return_decoders.append(
+            ("get_preconditions(byte[])(uint64,uint64,uint64,uint64)", _RETURN_DECODERS["get_preconditions(byte[])(uint64,uint64,uint64,uint64)"])
         )
         return self
 
@@ -1223,10 +1967,8 @@ class VotingRoundComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "bootstrap(pay)void", v
-            )
+        self._return_decoders.append(
+            ("bootstrap(pay)void", _RETURN_DECODERS["bootstrap(pay)void"])
         )
         return self
 
@@ -1240,10 +1982,8 @@ class VotingRoundComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "close()void", v
-            )
+        self._return_decoders.append(
+            ("close()void", _RETURN_DECODERS["close()void"])
         )
         return self
 
@@ -1258,10 +1998,8 @@ class VotingRoundComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "vote(pay,byte[],uint8[])void", v
-            )
+        self._return_decoders.append(
+            ("vote(pay,byte[],uint8[])void", _RETURN_DECODERS["vote(pay,byte[],uint8[])void"])
         )
         return self
 
@@ -1276,10 +2014,8 @@ class VotingRoundComposer:
                 params=params,
             )
         )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void", v
-            )
+        self._return_decoders.append(
+            ("create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void", _RETURN_DECODERS["create(string,byte[],string,uint64,uint64,uint8[],uint64,string)void"])
         )
         return self
 
@@ -1289,15 +2025,10 @@ class VotingRoundComposer:
         args: list[bytes] | None = None,
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "VotingRoundComposer":
-        params=params or algokit_utils.CommonAppCallParams()
+        params = params or _DEFAULT_PARAMS
         self._composer.add_app_call(
             self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+                algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
             )
         )
         return self
@@ -1311,6 +2042,25 @@ class VotingRoundComposer:
     def composer(self) -> algokit_utils.TransactionComposer:
         return self._composer
     
+    def _decode_returns(
+        self, result: algokit_utils.SendAtomicTransactionComposerResults
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Decode the return values of the queued method calls into their typed values in place, in one pass"""
+        return_decoders = iter(self._return_decoders)
+        queued = next(return_decoders, None)
+        structs = self.client.app_spec.structs
+        for abi_return in result.returns:
+            if queued is None:
+                break
+            # returns of method calls passed as args of the queued calls precede their return, and are matched by
+            # signature as they may be calls of a method with the same name of another app
+            if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+                continue
+            if abi_return.decode_error is None:
+                abi_return.value = _decode_return(queued[1], abi_return, structs)
+            queued = next(return_decoders, None)
+        return result
+    
     def simulate(
         self,
         allow_more_logs: bool | None = None,
@@ -1321,18 +2071,186 @@ class VotingRoundComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
+        return self._decode_returns(
+            self._composer.simulate(
+                allow_more_logs=allow_more_logs,
+                allow_empty_signatures=allow_empty_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                exec_trace_config=exec_trace_config,
+                simulation_round=simulation_round,
+                skip_signatures=skip_signatures,
+            )
         )
     
     def send(
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        result = self._decode_returns(self._composer.send(send_params))
+        if self.client._caches is not None:
+            self.client._caches.invalidate(result.confirmations)
+        return result
+
+
+class _VotingRoundBatchSend:
+    """Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "VotingRoundClient | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else VotingRoundClient(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["VotingRoundComposer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= 16:
+            raise ValueError(f"group_size must be between 1 and 16, got {group_size}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+
+    def get_preconditions(
+        self,
+        args: typing.Iterable[tuple[bytes | str] | GetPreconditionsArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[VotingPreconditions]:
+        return self._send_groups(
+            lambda composer, method_args: composer.get_preconditions(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+    def create(
+        self,
+        args: typing.Iterable[tuple[str, bytes | str, str, int, int, list[int], int, str] | CreateArgs],
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        group_size: int = 16,
+        max_in_flight: int = 2,
+    ) -> list[None]:
+        return self._send_groups(
+            lambda composer, method_args: composer.create(method_args, params=params),
+            args,
+            send_params,
+            group_size,
+            max_in_flight,
+        )
+
+
+_ReturnType = typing.TypeVar("_ReturnType")
+
+
+class _ReadonlyResult(typing.Generic[_ReturnType]):
+    """Return value of a call queued in a readonly batch, available once the batch is simulated"""
+
+    __slots__ = ("_value", "_done")
+
+    def __init__(self) -> None:
+        self._value: _ReturnType | None = None
+        self._done = False
+
+    @property
+    def value(self) -> _ReturnType:
+        if not self._done:
+            raise RuntimeError("The readonly batch hasn't been simulated, call simulate() first")
+        return typing.cast(_ReturnType, self._value)
+
+    def _set(self, value: _ReturnType) -> None:
+        self._value = value
+        self._done = True
+
+
+class VotingRoundReadonlyBatch:
+    """Readonly calls of the VotingRound app, simulated in groups of up to 16 calls
+
+    Each queued call returns a result whose value is available once `simulate()` is called, which sends one simulate
+    request per group rather than one per call
+    """
+
+    __slots__ = ("client", "_calls")
+
+    def __init__(self, client: "VotingRoundClient"):
+        self.client = client
+        self._calls: list[
+            tuple[typing.Callable[["VotingRoundComposer"], object], _ReadonlyResult[typing.Any]]
+        ] = []
+
+    def _queue(
+        self, add_call: typing.Callable[["VotingRoundComposer"], object]
+    ) -> _ReadonlyResult[typing.Any]:
+        result: _ReadonlyResult[typing.Any] = _ReadonlyResult()
+        self._calls.append((add_call, result))
+        return result
+
+    def simulate(self) -> list[typing.Any]:
+        """Simulate the queued calls, returning their decoded return values in the order they were queued"""
+        calls, self._calls = self._calls, []
+        values = []
+        for start in range(0, len(calls), 16):
+            group = calls[start : start + 16]
+            composer = self.client.new_group()
+            for add_call, _ in group:
+                add_call(composer)
+            response = composer.simulate(
+                allow_more_logs=True,
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                skip_signatures=True,
+            )
+            for (_, result), abi_return in zip(group, response.returns, strict=True):
+                result._set(abi_return.value)
+                values.append(result.value)
+        return values
+
+    def get_preconditions(
+        self,
+        args: tuple[bytes | str] | GetPreconditionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> _ReadonlyResult[VotingPreconditions]:
+        return self._queue(
+            lambda composer: composer.get_preconditions(args, params=params),
+        )
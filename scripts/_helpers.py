@@ -1,5 +1,8 @@
 import pathlib
 
+# the approved clients are generated as if by an unreleased generator, so a release doesn't change their spec hashes
+APPROVED_GENERATOR_VERSION = "0.0.0"
+
 
 def enable_mypy(approved_path: pathlib.Path) -> None:
     """
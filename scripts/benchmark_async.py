@@ -0,0 +1,174 @@
+"""Benchmark the throughput of the asyncio variant of a generated client.
+
+A stand-in algod is served on localhost, answering each request after a fixed latency (``--latency-ms``) as a remote
+algod would. ``hello`` calls of the approved HelloWorld client are sent one after the other with ``HelloWorldClient``,
+and fanned out with ``HelloWorldAsyncClient.map`` for each of the given concurrency limits. The calls per second and
+speedup over the sync client are reported.
+"""
+
+import argparse
+import asyncio
+import base64
+import dataclasses
+import http.server
+import json
+import pathlib
+import sys
+import threading
+import time
+import typing
+
+import algokit_utils
+import algosdk
+
+from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_async_client import (
+    HelloWorldAsyncClient,
+    HelloWorldClient,
+)
+
+# ABI return of "Hello, World", logged by the confirmed transaction
+_RETURN_LOG = b"\x15\x1f\x7c\x75" + len(b"Hello, World").to_bytes(2, "big") + b"Hello, World"
+
+
+@dataclasses.dataclass(kw_only=True)
+class ThroughputMeasurement:
+    client: str
+    concurrency: int
+    calls: int
+    calls_per_second: float
+    speedup: float
+
+
+def _get_response(method: str, path: str) -> dict[str, typing.Any]:
+    """Get the response of the stand-in algod to the requests made when sending an app call"""
+    if method == "POST" and path.startswith("/v2/transactions/simulate"):
+        return {"txn-groups": [{"txn-results": [{"txn-result": {"txn": {}}}]}], "last-round": 10, "version": 2}
+    if method == "POST":
+        return {"txId": "stand-in"}
+    if path.startswith("/v2/transactions/params"):
+        return {
+            "consensus-version": "future",
+            "fee": 0,
+            "genesis-hash": base64.b64encode(bytes(32)).decode(),
+            "genesis-id": "stand-in",
+            "last-round": 10,
+            "min-fee": 1000,
+        }
+    if path.startswith("/v2/transactions/pending/"):
+        return {"confirmed-round": 11, "logs": [base64.b64encode(_RETURN_LOG).decode()], "pool-error": "", "txn": {}}
+    if path.startswith("/v2/status"):
+        return {"last-round": 11}
+    return {}
+
+
+class _AlgodServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # concurrent calls would otherwise overflow the default backlog of 5 connections and wait for SYN retries
+    request_queue_size = 128
+
+
+def start_algod(latency: float) -> http.server.ThreadingHTTPServer:
+    """Serve a stand-in algod on a free port, answering each request after latency seconds"""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+        def _reply(self, method: str) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+            body = json.dumps(_get_response(method, self.path)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._reply("GET")
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._reply("POST")
+
+    server = _AlgodServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_client(server: http.server.ThreadingHTTPServer) -> HelloWorldClient:
+    host, port = server.server_address[:2]
+    algod = algosdk.v2client.algod.AlgodClient("a" * 64, f"http://{host!s}:{port}")
+    algorand = algokit_utils.AlgorandClient.from_clients(algod=algod)
+    sender = algorand.account.random()
+    return HelloWorldClient(algorand=algorand, app_id=1, default_sender=sender.address)
+
+
+def measure_sync(client: HelloWorldClient, *, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        client.send.hello(("World",))
+    return calls / (time.perf_counter() - start)
+
+
+def measure_async(client: HelloWorldClient, *, calls: int, concurrency: int) -> float:
+    async def fan_out() -> float:
+        async with HelloWorldAsyncClient(client, max_workers=concurrency) as async_client:
+            start = time.perf_counter()
+            await async_client.map(async_client.send.hello, [("World",)] * calls)
+            return calls / (time.perf_counter() - start)
+
+    return asyncio.run(fan_out())
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=64, help="Number of calls per measurement")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Concurrency limits of the async client"
+    )
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Latency of each request to the stand-in algod")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_async() -> int:
+    args = get_args_parser().parse_args()
+    server = start_algod(args.latency_ms / 1000)
+    try:
+        client = create_client(server)
+        client.send.hello(("World",))  # warm up
+        sync_calls_per_second = measure_sync(client, calls=args.calls)
+        measurements = [
+            ThroughputMeasurement(
+                client="HelloWorldClient",
+                concurrency=1,
+                calls=args.calls,
+                calls_per_second=sync_calls_per_second,
+                speedup=1.0,
+            )
+        ]
+        for concurrency in args.concurrency:
+            calls_per_second = measure_async(client, calls=args.calls, concurrency=concurrency)
+            measurements.append(
+                ThroughputMeasurement(
+                    client="HelloWorldAsyncClient",
+                    concurrency=concurrency,
+                    calls=args.calls,
+                    calls_per_second=calls_per_second,
+                    speedup=calls_per_second / sync_calls_per_second,
+                )
+            )
+    finally:
+        server.shutdown()
+
+    print(f"{'client':<24} {'concurrency':>12} {'calls':>6} {'calls/s':>9} {'speedup':>8}")
+    for m in measurements:
+        print(f"{m.client:<24} {m.concurrency:>12} {m.calls:>6} {m.calls_per_second:>9.1f} {m.speedup:>7.1f}x")
+
+    if args.json:
+        args.json.write_text(json.dumps([dataclasses.asdict(m) for m in measurements], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_async())
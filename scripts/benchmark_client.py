@@ -0,0 +1,153 @@
+"""Benchmark the cost of constructing each generated client.
+
+Each approved client is constructed from an existing ``AppClient`` and the construction time (with and without
+first use of ``send``), the time to access an attribute of a sub-client, the memory retained per client instance (with
+and without ``send`` having been used) and the time and memory allocated per access of the operation (e.g.
+``client.send.opt_in``), state (e.g. ``client.state.global_state``) and composer accessors are reported.
+"""
+
+import argparse
+import dataclasses
+import functools
+import importlib
+import itertools
+import json
+import pathlib
+import statistics
+import sys
+import timeit
+import tracemalloc
+import typing
+from types import ModuleType
+
+import algokit_utils
+from algosdk.constants import ZERO_ADDRESS
+
+from scripts.benchmark_imports import ARTIFACTS, find_clients, module_name
+
+
+@dataclasses.dataclass(kw_only=True)
+class ConstructionMeasurement:
+    module: str
+    construct_us: float
+    construct_and_send_us: float
+    attribute_access_ns: float
+    instance_bytes: float
+    instance_with_send_bytes: float
+    accessor_ns: float | None
+    accessor_bytes: float | None
+
+
+def get_client_class(module: ModuleType) -> type:
+    return next(
+        value
+        for name, value in vars(module).items()
+        if name.endswith("Client") and isinstance(value, type) and value.__module__ == module.__name__
+    )
+
+
+def measure_client(client_path: pathlib.Path, *, number: int, repeat: int, instances: int) -> ConstructionMeasurement:
+    module = importlib.import_module(module_name(client_path))
+    client_class = get_client_class(module)
+    app_client = client_class(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    ).app_client
+
+    construct = timeit.repeat(lambda: client_class(app_client), number=number, repeat=repeat)
+    construct_and_send = timeit.repeat(lambda: client_class(app_client).send, number=number, repeat=repeat)
+    client = client_class(app_client)
+    attribute_access = timeit.repeat(lambda: client.send.app_client, number=number, repeat=repeat)
+
+    instance_bytes = get_instance_bytes(lambda: client_class(app_client), instances)
+    instance_with_send_bytes = get_instance_bytes(lambda: _construct_with_send(client_class, app_client), instances)
+
+    accessors = get_accessors(client)
+    accessor_ns = accessor_bytes = None
+    if accessors:
+        next_accessor = itertools.cycle(accessors).__next__
+        access = timeit.repeat(lambda: next_accessor()(), number=number, repeat=repeat)
+        accessor_ns = statistics.median(access) / number * 1_000_000_000
+        accessor_bytes = get_instance_bytes(lambda: next_accessor()(), instances)
+
+    return ConstructionMeasurement(
+        module=module.__name__,
+        construct_us=statistics.median(construct) / number * 1_000_000,
+        construct_and_send_us=statistics.median(construct_and_send) / number * 1_000_000,
+        attribute_access_ns=statistics.median(attribute_access) / number * 1_000_000_000,
+        instance_bytes=instance_bytes,
+        instance_with_send_bytes=instance_with_send_bytes,
+        accessor_ns=accessor_ns,
+        accessor_bytes=accessor_bytes,
+    )
+
+
+def get_accessors(client: typing.Any) -> list[typing.Callable[[], object]]:  # noqa: ANN401
+    """Get the properties of the client's sub-clients and composer that return operation or state accessors"""
+    sub_clients = [client.params, client.create_transaction, client.send, client.state, client.new_group()]
+    return [
+        functools.partial(getattr, sub_client, name)
+        for sub_client in sub_clients
+        for name, value in vars(type(sub_client)).items()
+        if isinstance(value, property)
+    ]
+
+
+def _construct_with_send(client_class: type, app_client: algokit_utils.AppClient) -> object:
+    client = client_class(app_client)
+    _ = client.send
+    return client
+
+
+def get_instance_bytes(create: typing.Callable[[], object], instances: int) -> float:
+    """Get the memory retained per call of create when holding the results of many calls"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [create() for _ in range(instances)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / instances
+
+
+def _format_optional(value: float | None, format_spec: str) -> str:
+    return "-" if value is None else format(value, format_spec)
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("apps", nargs="*", help="Only benchmark these apps, defaults to all example artifacts")
+    parser.add_argument("--number", type=int, default=10_000, help="Number of clients constructed per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per client")
+    parser.add_argument("--instances", type=int, default=1_000, help="Number of clients used to measure memory")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_client() -> int:
+    args = get_args_parser().parse_args()
+    clients = [c for c in find_clients() if not args.apps or c.parent.name in args.apps]
+
+    print(
+        f"{'client':<50} {'construct us':>13} {'+ send us':>10} {'access ns':>10} "
+        f"{'bytes/client':>13} {'+ send bytes':>13} {'accessor ns':>12} {'accessor bytes':>15}"
+    )
+    measurements = []
+    for client_path in clients:
+        measurement = measure_client(client_path, number=args.number, repeat=args.repeat, instances=args.instances)
+        measurements.append(measurement)
+        print(
+            f"{measurement.module.removeprefix(module_name(ARTIFACTS) + '.'):<50} "
+            f"{measurement.construct_us:>13.2f} {measurement.construct_and_send_us:>10.2f} "
+            f"{measurement.attribute_access_ns:>10.1f} {measurement.instance_bytes:>13.0f} "
+            f"{measurement.instance_with_send_bytes:>13.0f} "
+            f"{_format_optional(measurement.accessor_ns, '.1f'):>12} "
+            f"{_format_optional(measurement.accessor_bytes, '.0f'):>15}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps([dataclasses.asdict(m) for m in measurements], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_client())
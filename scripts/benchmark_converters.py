@@ -0,0 +1,148 @@
+"""Benchmark the generated args converters and struct constructors against generic reflective helpers.
+
+For each approved client the generated ``_<method>_args_to_abi`` converters and ``_parse_abi_args`` are timed converting
+an instance of each args dataclass, and the generated ``_<struct>_from_dict`` constructors and ``_init_dataclass`` (the
+reflective constructor clients used to be generated with) are timed constructing each struct from its decoded dict. The
+median time per call and speedup across the client's methods and structs are reported.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import json
+import pathlib
+import statistics
+import sys
+import timeit
+import typing
+
+from scripts.benchmark_imports import ARTIFACTS, find_clients, module_name
+from tests.helpers import build_dataclass, get_args_converters, get_struct_converters
+
+
+@dataclasses.dataclass(kw_only=True)
+class ConverterMeasurement:
+    module: str
+    methods: int
+    generated_ns: float | None
+    parse_abi_args_ns: float | None
+    structs: int
+    from_dict_ns: float | None
+    init_dataclass_ns: float | None
+
+    @property
+    def args_speedup(self) -> float | None:
+        if self.generated_ns is None or self.parse_abi_args_ns is None:
+            return None
+        return self.parse_abi_args_ns / self.generated_ns
+
+    @property
+    def struct_speedup(self) -> float | None:
+        if self.from_dict_ns is None or self.init_dataclass_ns is None:
+            return None
+        return self.init_dataclass_ns / self.from_dict_ns
+
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """Baseline reflective constructor, as previously generated into each client"""
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+
+def time_call_ns(func: object, *args: object, number: int, repeat: int) -> float:
+    timings = timeit.repeat("func(*args)", globals={"func": func, "args": args}, number=number, repeat=repeat)
+    return statistics.median(timings) / number * 1_000_000_000
+
+
+def _median(timings: list[float]) -> float | None:
+    return statistics.median(timings) if timings else None
+
+
+def _format_optional(value: float | None, format_spec: str) -> str:
+    return "-" if value is None else format(value, format_spec)
+
+
+def _format_speedup(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}x"
+
+
+def measure_client(client_path: pathlib.Path, *, number: int, repeat: int) -> ConverterMeasurement | None:
+    module = importlib.import_module(module_name(client_path))
+    parse_abi_args = vars(module)["_parse_abi_args"]
+    generated, generic = [], []
+    for to_abi, args_class in get_args_converters(module):
+        args = build_dataclass(args_class)
+        generated.append(time_call_ns(to_abi, args, number=number, repeat=repeat))
+        generic.append(time_call_ns(parse_abi_args, args, number=number, repeat=repeat))
+    from_dict, init_dataclass = [], []
+    for struct_from_dict, struct_class in get_struct_converters(module, "from_dict"):
+        data = dataclasses.asdict(build_dataclass(struct_class))
+        from_dict.append(time_call_ns(struct_from_dict, data, number=number, repeat=repeat))
+        init_dataclass.append(time_call_ns(_init_dataclass, struct_class, data, number=number, repeat=repeat))
+    if not generated and not from_dict:
+        return None
+    return ConverterMeasurement(
+        module=module.__name__,
+        methods=len(generated),
+        generated_ns=_median(generated),
+        parse_abi_args_ns=_median(generic),
+        structs=len(from_dict),
+        from_dict_ns=_median(from_dict),
+        init_dataclass_ns=_median(init_dataclass),
+    )
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("apps", nargs="*", help="Only benchmark these apps, defaults to all example artifacts")
+    parser.add_argument("--number", type=int, default=10_000, help="Number of conversions per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per converter")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_converters() -> int:
+    args = get_args_parser().parse_args()
+    clients = [c for c in find_clients() if not args.apps or c.parent.name in args.apps]
+
+    print(
+        f"{'client':<50} {'methods':>8} {'args_to_abi ns':>15} {'_parse_abi_args ns':>19} {'speedup':>8} "
+        f"{'structs':>8} {'from_dict ns':>13} {'_init_dataclass ns':>19} {'speedup':>8}"
+    )
+    measurements = []
+    for client_path in clients:
+        measurement = measure_client(client_path, number=args.number, repeat=args.repeat)
+        if measurement is None:
+            continue
+        measurements.append(measurement)
+        print(
+            f"{measurement.module.removeprefix(module_name(ARTIFACTS) + '.'):<50} {measurement.methods:>8} "
+            f"{_format_optional(measurement.generated_ns, '.1f'):>15} "
+            f"{_format_optional(measurement.parse_abi_args_ns, '.1f'):>19} "
+            f"{_format_speedup(measurement.args_speedup):>8} {measurement.structs:>8} "
+            f"{_format_optional(measurement.from_dict_ns, '.1f'):>13} "
+            f"{_format_optional(measurement.init_dataclass_ns, '.1f'):>19} "
+            f"{_format_speedup(measurement.struct_speedup):>8}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                [
+                    {**dataclasses.asdict(m), "args_speedup": m.args_speedup, "struct_speedup": m.struct_speedup}
+                    for m in measurements
+                ],
+                indent=2,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_converters())
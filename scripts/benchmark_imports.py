@@ -0,0 +1,159 @@
+"""Benchmark the cold-start cost of importing each generated client.
+
+Each client is imported in a fresh interpreter with ``-X importtime`` and the import time, resident memory and
+compiled ``.pyc`` size are reported. The process exits with a non-zero code if any client exceeds the budget.
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import pathlib
+import py_compile
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = pathlib.Path(__file__).parent.parent
+ARTIFACTS = ROOT / "examples" / "smart_contracts" / "artifacts"
+
+# Runs in the child interpreter, dependencies are imported first so only the generated client is measured
+_PROBE = """
+import json, resource, sys, time
+{preload}
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {module}
+wall_ms = (time.perf_counter() - start) * 1000
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS and KiB on Linux
+print(json.dumps({{"wall_ms": wall_ms, "rss_kb": (rss_after - rss_before) * scale / 1024}}))
+"""
+_PRELOAD = "import algosdk, algokit_utils"
+
+
+@dataclasses.dataclass(kw_only=True)
+class ImportMeasurement:
+    module: str
+    import_ms: float
+    wall_ms: float
+    rss_kb: float
+    pyc_kb: float
+
+
+@dataclasses.dataclass(kw_only=True)
+class Budget:
+    import_ms: float
+    rss_kb: float
+    pyc_kb: float
+
+
+def find_clients(artifacts: pathlib.Path = ARTIFACTS) -> list[pathlib.Path]:
+    return sorted(artifacts.glob("*/*_client.py"))
+
+
+def module_name(client_path: pathlib.Path) -> str:
+    return ".".join(client_path.relative_to(ROOT).with_suffix("").parts)
+
+
+def parse_import_time(stderr: str, module: str) -> float:
+    """Get the cumulative import time in ms of module from -X importtime output"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise ValueError(f"{module} not found in -X importtime output")
+
+
+def get_pyc_size_kb(client_path: pathlib.Path) -> float:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pyc_path = pathlib.Path(py_compile.compile(str(client_path), cfile=str(pathlib.Path(temp_dir) / "client.pyc")))
+        return pyc_path.stat().st_size / 1024
+
+
+def measure_client(client_path: pathlib.Path, *, repeat: int, include_dependencies: bool) -> ImportMeasurement:
+    module = module_name(client_path)
+    probe = _PROBE.format(module=module, preload="" if include_dependencies else _PRELOAD)
+    import_times, wall_times, rss_sizes = [], [], []
+    # the first run is discarded as it also writes the .pyc for the client, which is written even when the environment
+    # disables bytecode so the client isn't compiled from source on every run
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    for _ in range(repeat + 1):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", probe],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probe_result = json.loads(result.stdout)
+        import_times.append(parse_import_time(result.stderr, module))
+        wall_times.append(probe_result["wall_ms"])
+        rss_sizes.append(probe_result["rss_kb"])
+
+    return ImportMeasurement(
+        module=module,
+        import_ms=statistics.median(import_times[1:]),
+        wall_ms=statistics.median(wall_times[1:]),
+        rss_kb=statistics.median(rss_sizes[1:]),
+        pyc_kb=get_pyc_size_kb(client_path),
+    )
+
+
+def get_budget_violations(measurement: ImportMeasurement, budget: Budget) -> list[str]:
+    violations = []
+    if measurement.import_ms > budget.import_ms:
+        violations.append(f"import time {measurement.import_ms:.1f}ms > {budget.import_ms:.1f}ms")
+    if measurement.rss_kb > budget.rss_kb:
+        violations.append(f"resident memory {measurement.rss_kb:.0f}KiB > {budget.rss_kb:.0f}KiB")
+    if measurement.pyc_kb > budget.pyc_kb:
+        violations.append(f".pyc size {measurement.pyc_kb:.0f}KiB > {budget.pyc_kb:.0f}KiB")
+    return violations
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("apps", nargs="*", help="Only benchmark these apps, defaults to all example artifacts")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measured imports per client")
+    parser.add_argument("--max-import-ms", type=float, default=250, help="Import time budget per client")
+    parser.add_argument("--max-rss-kb", type=float, default=16 * 1024, help="Resident memory budget per client")
+    parser.add_argument("--max-pyc-kb", type=float, default=1024, help=".pyc size budget per client")
+    parser.add_argument(
+        "--include-dependencies",
+        action="store_true",
+        help="Include the cost of importing algosdk and algokit_utils in the measurements",
+    )
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_imports() -> int:
+    args = get_args_parser().parse_args()
+    budget = Budget(import_ms=args.max_import_ms, rss_kb=args.max_rss_kb, pyc_kb=args.max_pyc_kb)
+    clients = [c for c in find_clients() if not args.apps or c.parent.name in args.apps]
+
+    print(f"{'client':<60} {'import ms':>10} {'wall ms':>10} {'rss KiB':>10} {'pyc KiB':>10}")
+    measurements, failures = [], 0
+    for client_path in clients:
+        measurement = measure_client(client_path, repeat=args.repeat, include_dependencies=args.include_dependencies)
+        measurements.append(measurement)
+        print(
+            f"{measurement.module.removeprefix('examples.smart_contracts.artifacts.'):<60} "
+            f"{measurement.import_ms:>10.1f} {measurement.wall_ms:>10.1f} "
+            f"{measurement.rss_kb:>10.0f} {measurement.pyc_kb:>10.0f}"
+        )
+        for violation in get_budget_violations(measurement, budget):
+            failures += 1
+            print(f"  over budget: {violation}")
+
+    if args.json:
+        args.json.write_text(json.dumps([dataclasses.asdict(m) for m in measurements], indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_imports())
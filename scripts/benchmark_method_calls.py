@@ -0,0 +1,133 @@
+"""Benchmark the per-call overhead of resolving methods against the app spec.
+
+The app client resolves the method of every call by name or signature against its app spec. For each approved client
+the time to build the params of each ABI method (e.g. ``client.params.hello(args)``) is measured with the generated app
+spec, which resolves methods with a dict lookup, and with a plain ``Arc56Contract`` parsed from the same JSON, which
+compares against the signature of every method. The median time per call and speedup across the client's methods are
+reported.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import inspect
+import json
+import pathlib
+import statistics
+import sys
+import timeit
+import typing
+
+import algokit_utils
+from algosdk.constants import ZERO_ADDRESS
+
+from scripts.benchmark_client import get_client_class
+from scripts.benchmark_imports import ARTIFACTS, find_clients, module_name
+from tests.helpers import build_dataclass
+
+
+@dataclasses.dataclass(kw_only=True)
+class MethodCallMeasurement:
+    module: str
+    methods: int
+    generated_spec_us: float
+    plain_spec_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.plain_spec_us / self.generated_spec_us
+
+
+def get_method_calls(client: typing.Any) -> dict[str, typing.Callable[[], object]]:  # noqa: ANN401
+    """Get a call building the params of each method of the client, keyed by method name"""
+    calls = {}
+    for name, value in vars(type(client.params)).items():
+        if name.startswith("_") or not inspect.isfunction(value):
+            continue
+        method = getattr(client.params, name)
+        args_type = typing.get_type_hints(method).get("args")
+        if args_type is None:
+            calls[name] = method
+            continue
+        args_class = next(t for t in typing.get_args(args_type) if isinstance(t, type) and dataclasses.is_dataclass(t))
+        calls[name] = _bind_args(method, build_dataclass(args_class))
+    return calls
+
+
+def _bind_args(method: typing.Callable[[object], object], args: object) -> typing.Callable[[], object]:
+    return lambda: method(args)
+
+
+def time_call_us(call: typing.Callable[[], object], *, number: int, repeat: int) -> float:
+    return statistics.median(timeit.repeat(call, number=number, repeat=repeat)) / number * 1_000_000
+
+
+def measure_client(client_path: pathlib.Path, *, number: int, repeat: int) -> MethodCallMeasurement | None:
+    module = importlib.import_module(module_name(client_path))
+    client_class = get_client_class(module)
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    generated_client = client_class(algorand=algorand, app_id=1, default_sender=ZERO_ADDRESS)
+    plain_app_spec = algokit_utils.Arc56Contract.from_json(vars(module)["_APP_SPEC_JSON"])
+    plain_client = client_class(
+        algokit_utils.AppClient(
+            algokit_utils.AppClientParams(
+                app_spec=plain_app_spec, algorand=algorand, app_id=1, default_sender=ZERO_ADDRESS
+            )
+        )
+    )
+
+    generated_calls = get_method_calls(generated_client)
+    plain_calls = get_method_calls(plain_client)
+    generated, plain = [], []
+    for name, generated_call in generated_calls.items():
+        try:
+            generated_call()
+        except Exception:
+            # methods needing the network, e.g. to resolve default values, can't be measured
+            continue
+        generated.append(time_call_us(generated_call, number=number, repeat=repeat))
+        plain.append(time_call_us(plain_calls[name], number=number, repeat=repeat))
+    if not generated:
+        return None
+    return MethodCallMeasurement(
+        module=module.__name__,
+        methods=len(generated),
+        generated_spec_us=statistics.median(generated),
+        plain_spec_us=statistics.median(plain),
+    )
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("apps", nargs="*", help="Only benchmark these apps, defaults to all example artifacts")
+    parser.add_argument("--number", type=int, default=100, help="Number of calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per method")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_method_calls() -> int:
+    args = get_args_parser().parse_args()
+    clients = [c for c in find_clients() if not args.apps or c.parent.name in args.apps]
+
+    print(f"{'client':<50} {'methods':>8} {'generated spec us':>18} {'plain spec us':>14} {'speedup':>8}")
+    measurements = []
+    for client_path in clients:
+        measurement = measure_client(client_path, number=args.number, repeat=args.repeat)
+        if measurement is None:
+            continue
+        measurements.append(measurement)
+        print(
+            f"{measurement.module.removeprefix(module_name(ARTIFACTS) + '.'):<50} {measurement.methods:>8} "
+            f"{measurement.generated_spec_us:>18.1f} {measurement.plain_spec_us:>14.1f} {measurement.speedup:>7.1f}x"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([{**dataclasses.asdict(m), "speedup": m.speedup} for m in measurements], indent=2)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_method_calls())
@@ -0,0 +1,125 @@
+"""Benchmark the generated struct codecs against encoding and decoding structs by their ABI tuple type.
+
+For each approved client the generated ``_<struct>_to_bytes`` encoders are timed encoding a random value of each struct,
+against ``ABIType.encode`` of the ``_<struct>_to_tuple`` tuple, and the generated ``_<struct>_from_bytes`` decoders are
+timed decoding it, against ``_<struct>_from_tuple`` of the ``ABIType.decode`` tuple. The ABI types are parsed once
+ahead of timing. The median time per call and speedup across the client's structs are reported.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import json
+import pathlib
+import random
+import statistics
+import sys
+import typing
+
+from algosdk.abi import ABIType
+
+from algokit_client_generator.utils import to_snake_case
+from scripts.benchmark_converters import time_call_ns
+from scripts.benchmark_imports import ARTIFACTS, find_clients, module_name
+from tests.helpers import get_struct_codecs, random_abi_value
+
+
+@dataclasses.dataclass(kw_only=True)
+class CodecMeasurement:
+    module: str
+    structs: int
+    to_bytes_ns: float
+    abi_encode_ns: float
+    from_bytes_ns: float
+    abi_decode_ns: float
+
+    @property
+    def encode_speedup(self) -> float:
+        return self.abi_encode_ns / self.to_bytes_ns
+
+    @property
+    def decode_speedup(self) -> float:
+        return self.abi_decode_ns / self.from_bytes_ns
+
+
+def _encode_generic(value: object, struct_to_tuple: typing.Callable[[object], object], abi_type: ABIType) -> bytes:
+    return abi_type.encode(struct_to_tuple(value))
+
+
+def _decode_generic(data: bytes, struct_from_tuple: typing.Callable[[object], object], abi_type: ABIType) -> object:
+    return struct_from_tuple(abi_type.decode(data))
+
+
+def measure_client(client_path: pathlib.Path, *, number: int, repeat: int) -> CodecMeasurement | None:
+    module = importlib.import_module(module_name(client_path))
+    rng = random.Random(module.__name__)
+    to_bytes, abi_encode, from_bytes, abi_decode = [], [], [], []
+    for struct_class, abi_type in get_struct_codecs(module):
+        name = to_snake_case(struct_class.__name__)
+        struct_to_bytes, struct_from_bytes = vars(module)[f"_{name}_to_bytes"], vars(module)[f"_{name}_from_bytes"]
+        struct_to_tuple, struct_from_tuple = vars(module)[f"_{name}_to_tuple"], vars(module)[f"_{name}_from_tuple"]
+        encoded = abi_type.encode(random_abi_value(abi_type, rng))
+        value = struct_from_bytes(encoded)
+        to_bytes.append(time_call_ns(struct_to_bytes, value, number=number, repeat=repeat))
+        abi_encode.append(time_call_ns(_encode_generic, value, struct_to_tuple, abi_type, number=number, repeat=repeat))
+        from_bytes.append(time_call_ns(struct_from_bytes, encoded, number=number, repeat=repeat))
+        abi_decode.append(
+            time_call_ns(_decode_generic, encoded, struct_from_tuple, abi_type, number=number, repeat=repeat)
+        )
+    if not to_bytes:
+        return None
+    return CodecMeasurement(
+        module=module.__name__,
+        structs=len(to_bytes),
+        to_bytes_ns=statistics.median(to_bytes),
+        abi_encode_ns=statistics.median(abi_encode),
+        from_bytes_ns=statistics.median(from_bytes),
+        abi_decode_ns=statistics.median(abi_decode),
+    )
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("apps", nargs="*", help="Only benchmark these apps, defaults to all example artifacts")
+    parser.add_argument("--number", type=int, default=10_000, help="Number of conversions per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per codec")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the measurements to this file")
+    return parser
+
+
+def benchmark_struct_codecs() -> int:
+    args = get_args_parser().parse_args()
+    clients = [c for c in find_clients() if not args.apps or c.parent.name in args.apps]
+
+    print(
+        f"{'client':<50} {'structs':>8} {'to_bytes ns':>12} {'encode ns':>10} {'speedup':>8} "
+        f"{'from_bytes ns':>14} {'decode ns':>10} {'speedup':>8}"
+    )
+    measurements = []
+    for client_path in clients:
+        measurement = measure_client(client_path, number=args.number, repeat=args.repeat)
+        if measurement is None:
+            continue
+        measurements.append(measurement)
+        print(
+            f"{measurement.module.removeprefix(module_name(ARTIFACTS) + '.'):<50} {measurement.structs:>8} "
+            f"{measurement.to_bytes_ns:>12.1f} {measurement.abi_encode_ns:>10.1f} "
+            f"{measurement.encode_speedup:>7.1f}x {measurement.from_bytes_ns:>14.1f} "
+            f"{measurement.abi_decode_ns:>10.1f} {measurement.decode_speedup:>7.1f}x"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                [
+                    {**dataclasses.asdict(m), "encode_speedup": m.encode_speedup, "decode_speedup": m.decode_speedup}
+                    for m in measurements
+                ],
+                indent=2,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark_struct_codecs())
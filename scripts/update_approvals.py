@@ -1,12 +1,13 @@
 import pathlib
 from itertools import chain, product
 
-from algokit_client_generator import generate_client
+from algokit_client_generator import generate_client, writer
 from algokit_client_generator.utils import to_pascal_case, to_snake_case
-from scripts._helpers import enable_mypy
+from scripts._helpers import APPROVED_GENERATOR_VERSION, enable_mypy
 
 
 def update_approvals() -> None:
+    writer.GENERATOR_VERSION = APPROVED_GENERATOR_VERSION
     artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
     arc32_apps = [
         "duplicate_structs",
@@ -25,6 +26,8 @@ def update_approvals() -> None:
         "reti",
         "zero_coupon_bond",
     ]
+    package_apps = [("life_cycle", "arc32"), ("structs", "arc56")]
+    async_apps = [("hello_world", "arc32"), ("state", "arc56")]
 
     for app, extension in chain(product(arc32_apps, ["arc32"]), product(arc56_apps, ["arc56"])):
         app_path = artifacts / app
@@ -36,6 +39,27 @@ def update_approvals() -> None:
         except Exception as e:
             print(f"Error generating client for {app}: {e}")
 
+    for app, extension in package_apps:
+        app_path = artifacts / app
+        app_spec = app_path / f"{to_pascal_case(app)}.{extension}.json"
+        approved_path = app_path / f"{to_snake_case(app)}_{extension}_client_package"
+        try:
+            generate_client(app_spec, approved_path, package=True)
+            for module_path in approved_path.glob("*.py"):
+                enable_mypy(module_path)
+        except Exception as e:
+            print(f"Error generating client package for {app}: {e}")
+
+    for app, extension in async_apps:
+        app_path = artifacts / app
+        app_spec = app_path / f"{to_pascal_case(app)}.{extension}.json"
+        approved_path = app_path / f"{to_snake_case(app)}_{extension}_async_client.py"
+        try:
+            generate_client(app_spec, approved_path, async_client=True)
+            enable_mypy(approved_path)
+        except Exception as e:
+            print(f"Error generating async client for {app}: {e}")
+
 
 if __name__ == "__main__":
     update_approvals()
@@ -3,7 +3,7 @@ import logging
 import sys
 from pathlib import Path
 
-from algokit_client_generator.writer import generate_client
+from algokit_client_generator.writer import check_client, generate_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,26 @@ def get_args_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Preserve original names for structs and methods",
     )
+    parser.add_argument(
+        "-c",
+        "--check",
+        action="store_true",
+        help="Check the output clients are up-to-date without writing them, exits with a non-zero code if not. "
+        "When used with --walk, clients with a matching spec hash are not regenerated",
+    )
+    parser.add_argument(
+        "--package",
+        action="store_true",
+        help="Output each client as a package (the output path without its .py suffix) instead of a single module, "
+        "the state, factory and composer modules of the package are only imported when first used",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_client",
+        action="store_true",
+        help="Also output an asyncio variant of the client (e.g. HelloWorldAsyncClient), which awaits the calls of the "
+        "client in a bounded thread pool",
+    )
     return parser
 
 
@@ -47,15 +67,25 @@ def configure_logging() -> None:
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
-def walk_dir(path: Path, output: Path) -> None:
+def walk_dir(
+    path: Path, output: Path, *, check: bool = False, package: bool = False, async_client: bool = False
+) -> list[Path]:
+    """Generate (or check) a client for each application.json under path, returning any out-of-date clients"""
+    out_of_date: list[Path] = []
     for child in path.iterdir():
         if child.is_dir():
-            walk_dir(child, output)
+            out_of_date.extend(walk_dir(child, output, check=check, package=package, async_client=async_client))
         elif child.name.lower() == "application.json":
-            generate_client(child, child.parent / output)
+            output_path = child.parent / output
+            if not check:
+                generate_client(child, output_path, package=package, async_client=async_client)
+            elif not check_client(child, output_path, use_spec_hash=True, package=package, async_client=async_client):
+                out_of_date.append(output_path)
+    return out_of_date
 
 
-def process(parser: argparse.ArgumentParser) -> None:
+def process(parser: argparse.ArgumentParser) -> list[Path]:
+    """Process the command line arguments, returning any out-of-date clients when using --check"""
     args = parser.parse_args()
     app_spec: Path = args.app_spec
     output: Path = args.output
@@ -69,19 +99,38 @@ def process(parser: argparse.ArgumentParser) -> None:
             )
         if output.is_absolute():
             raise ArgumentError(f"Output must be a relative path when using the --walk option: {output}")
-        walk_dir(args.app_spec, args.output)
+        return walk_dir(
+            args.app_spec, args.output, check=args.check, package=args.package, async_client=args.async_client
+        )
     elif len(sys.argv) == 1:  # if user invokes with no arguments display help
         parser.print_usage()
     else:
         if not app_spec.is_file():
             raise ArgumentError(f"Application Specification must be a path to an application.json: {app_spec}")
-        generate_client(app_spec, output, preserve_names=args.preserve_names)
+        if not args.check:
+            generate_client(
+                app_spec,
+                output,
+                preserve_names=args.preserve_names,
+                package=args.package,
+                async_client=args.async_client,
+            )
+        elif not check_client(
+            app_spec, output, preserve_names=args.preserve_names, package=args.package, async_client=args.async_client
+        ):
+            return [output]
+    return []
 
 
 def main() -> None:
     configure_logging()
     parser = get_args_parser()
     try:
-        process(parser)
+        out_of_date = process(parser)
     except ArgumentError as ex:
         logger.error(ex.message)
+        return
+    for output in out_of_date:
+        logger.error(f"Generated client is out-of-date: {output}")
+    if out_of_date:
+        sys.exit(1)
@@ -1,12 +1,25 @@
 import algokit_utils
 
 from algokit_client_generator import utils
-from algokit_client_generator.spec import ABIStruct, get_all_structs, get_contract_methods
+from algokit_client_generator.spec import ABIEvent, ABIStruct, get_all_events, get_all_structs, get_contract_methods
 
 
 class GeneratorContext:
-    def __init__(self, app_spec: algokit_utils.Arc56Contract, *, preserve_names: bool = False):
+    def __init__(
+        self,
+        app_spec: algokit_utils.Arc56Contract,
+        *,
+        preserve_names: bool = False,
+        spec_hash: str | None = None,
+        package: bool = False,
+        async_client: bool = False,
+    ):
         self.app_spec = app_spec
+        self.spec_hash = spec_hash
+        # Generate a package of lazily imported modules instead of a single module
+        self.package = package
+        # Also generate the asyncio variant of the client
+        self.async_client = async_client
         self.structs: dict[str, ABIStruct] = {}
         self.sanitizer = utils.get_sanitizer(preserve_names=preserve_names)
 
@@ -35,6 +48,7 @@ class GeneratorContext:
             "clone",  # Method in typed_client.py for cloning client instance
             "decode_return_value",  # Method in typed_client.py for ABI return value decoding
             "new_group",  # Method in typed_client.py for creating transaction groups
+            "readonly_batch",  # Method in typed_client.py for simulating readonly calls in groups
         }
 
         self.contract_name = utils.get_unique_symbol_by_incrementing(
@@ -45,4 +59,17 @@ class GeneratorContext:
         self.methods = get_contract_methods(
             self.app_spec, self.structs, self.used_module_symbols, self.used_client_symbols
         )
+        self.events: list[ABIEvent] = get_all_events(self.app_spec, self.structs, self.used_module_symbols)
+        # Union of the event dataclasses, returned when decoding the events of the app
+        self.event_type_name = utils.get_unique_symbol_by_incrementing(
+            self.used_module_symbols, f"{self.contract_name}Event"
+        )
+        # Union of the args dataclasses of the methods of the app, returned when decoding its calls
+        self.method_args_type_name = utils.get_unique_symbol_by_incrementing(
+            self.used_module_symbols, f"{self.contract_name}MethodArgs"
+        )
+        # Calls of the app extracted from blocks or indexer transactions
+        self.app_call_type_name = utils.get_unique_symbol_by_incrementing(
+            self.used_module_symbols, f"{self.contract_name}AppCall"
+        )
         self.disable_linting = True
@@ -3,11 +3,29 @@ import dataclasses
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
 from algokit_client_generator.generators.app_spec import generate_app_spec
-from algokit_client_generator.generators.composer import generate_composer
+from algokit_client_generator.generators.async_client import generate_async_client
+from algokit_client_generator.generators.composer import (
+    generate_batch_send,
+    generate_composer,
+    generate_readonly_batch,
+)
+from algokit_client_generator.generators.decoding import generate_decoding
 from algokit_client_generator.generators.header_comments import generate_header_comments
 from algokit_client_generator.generators.helpers import generate_helpers
-from algokit_client_generator.generators.imports import generate_imports
-from algokit_client_generator.generators.typed_client import generate_typed_client
+from algokit_client_generator.generators.imports import ASYNC_IMPORTS, generate_imports
+from algokit_client_generator.generators.package import PackageModule
+from algokit_client_generator.generators.typed_client import (
+    generate_client_class,
+    generate_create_transaction_classes,
+    generate_params_classes,
+    generate_send_classes,
+    generate_state_methods,
+    generate_structs,
+    generate_structs_for_args,
+    generate_typed_client,
+    get_batch_methods,
+    get_readonly_methods,
+)
 from algokit_client_generator.generators.typed_factory import generate_typed_factory
 
 ESCAPED_QUOTE = r"\""
@@ -35,4 +53,49 @@ def generate(context: GeneratorContext) -> DocumentParts:
     yield Part.Gap2
     yield generate_typed_factory(context)
     yield Part.Gap2
+    yield generate_composer_module(context)
+    if context.async_client:
+        yield Part.Gap2
+        yield generate_async_client(context)
+
+
+def generate_app_spec_module(context: GeneratorContext) -> DocumentParts:
+    yield generate_app_spec(context)
+    yield Part.Gap1
+    yield generate_helpers(context)
+
+
+def generate_composer_module(context: GeneratorContext) -> DocumentParts:
     yield generate_composer(context)
+    if get_batch_methods(context):
+        yield Part.Gap2
+        yield generate_batch_send(context)
+    if get_readonly_methods(context):
+        yield Part.Gap2
+        yield generate_readonly_batch(context)
+
+
+# Modules of a generated package, in dependency order
+PACKAGE_MODULES = [
+    PackageModule(name="_app_spec", generate=generate_app_spec_module),
+    PackageModule(name="structs", generate=generate_structs),
+    PackageModule(name="args", generate=generate_structs_for_args),
+    PackageModule(name="params", generate=generate_params_classes),
+    PackageModule(name="create_transaction", generate=generate_create_transaction_classes),
+    PackageModule(name="send", generate=generate_send_classes),
+    PackageModule(name="state", generate=generate_state_methods, lazy=True),
+    PackageModule(name="client", generate=generate_client_class),
+    PackageModule(name="factory", generate=generate_typed_factory, lazy=True),
+    PackageModule(name="composer", generate=generate_composer_module, lazy=True),
+    PackageModule(name="decoding", generate=generate_decoding, lazy=True),
+]
+
+
+def get_package_modules(context: GeneratorContext) -> list[PackageModule]:
+    """Get the modules of a generated package, the asyncio variant of the client is only included when enabled"""
+    if not context.async_client:
+        return PACKAGE_MODULES
+    return [
+        *PACKAGE_MODULES,
+        PackageModule(name="async_client", generate=generate_async_client, lazy=True, imports=ASYNC_IMPORTS),
+    ]
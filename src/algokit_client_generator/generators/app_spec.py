@@ -1,11 +1,54 @@
+from collections import Counter
+
+from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
 
 
+def get_method_indexes(context: GeneratorContext) -> dict[str, int]:
+    """Get the index of each method in the app spec by signature and, when unique, by name"""
+    name_counts = Counter(method.name for method in context.app_spec.methods)
+    indexes = {}
+    for index, method in enumerate(context.app_spec.methods):
+        indexes[method.to_abi_method().get_signature()] = index
+        if name_counts[method.name] == 1:
+            indexes[method.name] = index
+    return indexes
+
+
 def generate_app_spec(context: GeneratorContext) -> DocumentParts:
     yield Part.InlineMode
     yield '_APP_SPEC_JSON = r"""'
     yield context.app_spec.to_json(indent=None)
     yield '"""'
     yield Part.RestoreLineMode
-    yield "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)"
+    method_indexes = get_method_indexes(context)
+    yield utils.indented(f"""
+# Index of each method in the app spec by signature (and name, when unique)
+_METHOD_INDEXES: dict[str, int] = {{{"" if method_indexes else "}"}""")
+    if method_indexes:
+        yield Part.IncIndent
+        for method_name_or_signature, index in method_indexes.items():
+            yield f'"{method_name_or_signature}": {index},'
+        yield Part.DecIndent
+        yield "}"
+    yield Part.Gap2
+    yield utils.indented("""
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    \"\"\"App spec resolving methods with a dict lookup, the app client resolves the method of every call by name or
+    signature\"\"\"
+
+    def get_arc56_method(self, method_name_or_signature: str) -> algokit_utils.applications.Method:
+        index = _METHOD_INDEXES.get(method_name_or_signature)
+        if index is None:
+            return super().get_arc56_method(method_name_or_signature)
+        return self.methods[index]
+
+
+def _load_app_spec() -> _Arc56Contract:
+    app_spec = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+    return _Arc56Contract(**{field.name: getattr(app_spec, field.name) for field in dataclasses.fields(app_spec)})
+
+
+APP_SPEC = _load_app_spec()
+""")
@@ -0,0 +1,426 @@
+from collections.abc import Iterator
+
+from algokit_client_generator import utils
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.typed_client import (
+    CLEAR_STATE_PROPERTY_TO_RETURN_CLASS,
+    MAX_GROUP_SIZE,
+    SNAPSHOT_STATE_TYPES,
+    PropertyType,
+    _generate_common_method_params,
+    _get_args_type,
+    get_batch_methods,
+    get_batch_send_class_name,
+    get_readonly_methods,
+)
+from algokit_client_generator.spec import ContractMethod
+
+
+def get_async_operation_class_name(context: GeneratorContext, operation: str) -> str:
+    """Name of the generated class awaiting the send methods of an operation, e.g. opt_in"""
+    return f"_{context.contract_name}{context.sanitizer.make_safe_type_identifier(operation)}AsyncSend"
+
+
+def _generate_async_runner() -> DocumentParts:
+    yield utils.indented("""
+_P = typing.ParamSpec("_P")
+_R = typing.TypeVar("_R")
+_A = typing.TypeVar("_A")
+
+
+class _AsyncRunner:
+    \"\"\"Runs the blocking calls of a client in a thread pool, with at most max_concurrency calls in flight
+
+    Calls waiting for a slot are held by the runner rather than queued in the executor, so a large fan-out doesn't
+    starve other users of a shared executor
+    \"\"\"
+
+    __slots__ = ("_executor", "_owns_executor", "_semaphore")
+
+    def __init__(
+        self, *, executor: concurrent.futures.Executor | None, max_workers: int, max_concurrency: int | None
+    ):
+        self._owns_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="algokit-client"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency or max_workers)
+
+    async def run(self, func: typing.Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        \"\"\"Shut down the executor if it was created by the runner, calls already running are left to complete\"\"\"
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+""")
+
+
+def _get_operations(context: GeneratorContext) -> dict[str, list[ContractMethod]]:
+    methods = context.methods.all_methods
+    operations = {
+        "update": [m for m in methods if m.call_config == "call" and "update_application" in m.on_complete],
+        "delete": [m for m in methods if m.call_config == "call" and "delete_application" in m.on_complete],
+        "opt_in": [m for m in methods if m.call_config == "call" and "opt_in" in m.on_complete],
+        "close_out": [m for m in methods if m.call_config == "call" and "close_out" in m.on_complete],
+    }
+    return {operation: methods for operation, methods in operations.items() if methods}
+
+
+def _generate_async_send_method(context: GeneratorContext, method: ContractMethod, operation: str) -> DocumentParts:
+    """Generate a method awaiting the matching method of the sync send class, with the same signature"""
+    assert method.abi
+    method_params, include_args = _generate_common_method_params(
+        context, method, PropertyType.SEND, operation=None if operation == "call" else operation
+    )
+    call_args = [
+        f"self._send.{method.abi.client_method_name}",
+        *(["args"] if include_args else []),
+        "params=params",
+        "send_params=send_params",
+        *(["compilation_params=compilation_params"] if operation == "update" else []),
+    ]
+    yield utils.indented(f"""
+{method_params.replace("def ", "async def ", 1)}
+    return await self._runner.run({", ".join(call_args)})
+""")
+
+
+def _generate_async_operation_class(
+    context: GeneratorContext, operation: str, methods: list[ContractMethod]
+) -> DocumentParts:
+    sync_class_name = f"_{context.contract_name}{context.sanitizer.make_safe_type_identifier(operation)}Send"
+    yield utils.indented(f"""
+class {get_async_operation_class_name(context, operation)}:
+    __slots__ = ("_send", "_runner")
+
+    def __init__(self, send: "{sync_class_name}", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+""")
+    yield Part.IncIndent
+    if any(not method.abi for method in methods):
+        compilation_params = (
+            "\n    compilation_params: algokit_utils.AppClientCompilationParams | None = None,"
+            if operation == "update"
+            else ""
+        )
+        compilation_arg = ", compilation_params=compilation_params" if operation == "update" else ""
+        yield Part.Gap1
+        yield utils.indented(f"""
+async def bare(
+    self,
+    params: algokit_utils.AppClientBareCallParams | None = None,
+    send_params: algokit_utils.SendParams | None = None,{compilation_params}
+) -> algokit_utils.SendAppTransactionResult:
+    return await self._runner.run(
+        self._send.bare, params=params, send_params=send_params{compilation_arg}
+    )
+""")
+    for method in methods:
+        if method.abi:
+            yield Part.Gap1
+            yield _generate_async_send_method(context, method, operation)
+    yield Part.DecIndent
+
+
+def _generate_async_batch_send_class(context: GeneratorContext) -> DocumentParts:
+    batch_class = get_batch_send_class_name(context)
+    yield utils.indented(f"""
+class {get_async_operation_class_name(context, "batch")}:
+    \"\"\"Awaitable batches of calls of a method, sent by {batch_class} in a thread of the pool\"\"\"
+
+    __slots__ = ("_send", "_runner")
+
+    def __init__(self, send: "{batch_class}", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+""")
+    yield Part.IncIndent
+    for method in get_batch_methods(context):
+        assert method.abi
+        method_name = method.abi.client_method_name
+        yield Part.Gap1
+        yield utils.indented(f"""
+async def {method_name}(
+    self,
+    args: typing.Iterable[{_get_args_type(context, method)}],
+    params: algokit_utils.CommonAppCallParams | None = None,
+    send_params: algokit_utils.SendParams | None = None,
+    *,
+    group_size: int = {MAX_GROUP_SIZE},
+    max_in_flight: int = 2,
+) -> list[{method.abi.python_type}]:
+    return await self._runner.run(
+        self._send.{method_name},
+        args,
+        params=params,
+        send_params=send_params,
+        group_size=group_size,
+        max_in_flight=max_in_flight,
+    )
+""")
+    yield Part.DecIndent
+
+
+def _generate_async_send(context: GeneratorContext) -> DocumentParts:
+    operations = _get_operations(context)
+    for operation, methods in operations.items():
+        yield _generate_async_operation_class(context, operation, methods)
+        yield Part.Gap2
+    # batches are sent in a single thread of the pool, which pipelines their groups in threads of its own
+    if get_batch_methods(context):
+        yield _generate_async_batch_send_class(context)
+        yield Part.Gap2
+        operations = {**operations, "batch": []}
+
+    slots = "".join(f', "_{operation}"' for operation in operations)
+    yield utils.indented(f"""
+class {context.contract_name}AsyncSend:
+    \"\"\"Awaitable app calls of the {context.app_spec.name} app, sent by {context.contract_name}Send in a thread
+    pool\"\"\"
+
+    __slots__ = ("_send", "_runner"{slots})
+
+    def __init__(self, send: "{context.contract_name}Send", runner: _AsyncRunner):
+        self._send = send
+        self._runner = runner
+""")
+    yield Part.IncIndent
+    yield Part.IncIndent
+    for operation in operations:
+        yield f'self._{operation}: "{get_async_operation_class_name(context, operation)} | None" = None'
+    yield Part.DecIndent
+
+    for operation in operations:
+        class_name = get_async_operation_class_name(context, operation)
+        yield Part.Gap1
+        yield utils.indented(f"""
+@property
+def {operation}(self) -> "{class_name}":
+    if self._{operation} is None:
+        self._{operation} = {class_name}(self._send.{operation}, self._runner)
+    return self._{operation}
+""")
+
+    for method in context.methods.all_abi_methods:
+        if method.abi and "no_op" in method.on_complete:
+            yield Part.Gap1
+            yield _generate_async_send_method(context, method, "call")
+
+    yield Part.Gap1
+    yield utils.indented(f"""
+async def clear_state(
+    self,
+    params: algokit_utils.AppClientBareCallParams | None = None,
+    send_params: algokit_utils.SendParams | None = None,
+) -> {CLEAR_STATE_PROPERTY_TO_RETURN_CLASS[PropertyType.SEND]}:
+    return await self._runner.run(self._send.clear_state, params, send_params)
+""")
+    yield Part.DecIndent
+
+
+def _generate_async_state(context: GeneratorContext) -> Iterator[DocumentParts]:
+    state_class = f"{context.contract_name}State"
+    yield utils.indented(f"""
+class {context.contract_name}AsyncState:
+    \"\"\"Awaitable state reads of the {context.app_spec.name} app, run by {state_class} in a thread pool\"\"\"
+
+    __slots__ = ("_state", "_runner")
+
+    def __init__(self, state: "{state_class}", runner: _AsyncRunner):
+        self._state = state
+        self._runner = runner
+
+    async def read(self, read: typing.Callable[["{state_class}"], _R]) -> _R:
+        \"\"\"Await a read of the app's state in the thread pool, e.g.
+        `await client.state.read(lambda state: state.global_state.get_all())`
+        \"\"\"
+        return await self._runner.run(read, self._state)
+""")
+    yield Part.IncIndent
+    for state_type, snapshot_class in SNAPSHOT_STATE_TYPES.items():
+        if not getattr(context.app_spec.state.keys, state_type):
+            continue
+        yield Part.Gap1
+        if state_type == "local_state":
+            yield utils.indented(f"""
+async def local_state_snapshot(self, address: str) -> "{snapshot_class}":
+    \"\"\"Await a snapshot of the local state of address, read in a single request\"\"\"
+    return await self._runner.run(lambda: self._state.local_state(address).snapshot())
+""")
+        else:
+            yield utils.indented(f"""
+async def {state_type}_snapshot(self) -> "{snapshot_class}":
+    \"\"\"Await a snapshot of the {state_type.replace("_", " ")}, read in a single request\"\"\"
+    return await self._runner.run(lambda: self._state.{state_type}.snapshot())
+""")
+    yield Part.DecIndent
+
+
+def _generate_async_composer(context: GeneratorContext) -> DocumentParts:
+    composer_class = f"{context.contract_name}Composer"
+    yield utils.indented(f"""
+class {context.contract_name}AsyncComposer:
+    \"\"\"Composer for transaction groups of {context.contract_name} contract calls that are sent without blocking
+
+    Calls are added with the {composer_class} in `add`, whose methods can be chained, and the group is awaited with
+    `await group.send()`
+    \"\"\"
+
+    __slots__ = ("add", "_runner")
+
+    def __init__(self, composer: "{composer_class}", runner: _AsyncRunner):
+        self.add = composer
+        self._runner = runner
+
+    async def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(
+            self.add.simulate,
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    async def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return await self._runner.run(self.add.send, send_params)
+""")
+
+
+def _generate_async_readonly_batch(context: GeneratorContext) -> Iterator[DocumentParts]:
+    if not get_readonly_methods(context):
+        return
+    batch_class = f"{context.contract_name}ReadonlyBatch"
+    yield Part.Gap2
+    yield utils.indented(f"""
+class {context.contract_name}AsyncReadonlyBatch:
+    \"\"\"Readonly calls of the {context.app_spec.name} app, simulated in groups without blocking
+
+    Calls are queued with the {batch_class} in `add`, whose results have a value once the batch is awaited with
+    `await batch.simulate()`
+    \"\"\"
+
+    __slots__ = ("add", "_runner")
+
+    def __init__(self, batch: "{batch_class}", runner: _AsyncRunner):
+        self.add = batch
+        self._runner = runner
+
+    async def simulate(self) -> list[typing.Any]:
+        return await self._runner.run(self.add.simulate)
+""")
+
+
+def _generate_async_client_class(context: GeneratorContext) -> DocumentParts:
+    client_class = f"{context.contract_name}Client"
+    readonly_batch = (
+        f"""
+
+    def readonly_batch(self) -> "{context.contract_name}AsyncReadonlyBatch":
+        return {context.contract_name}AsyncReadonlyBatch(self.client.readonly_batch(), self._runner)"""
+        if get_readonly_methods(context)
+        else ""
+    )
+    yield utils.indented(f"""
+class {context.contract_name}AsyncClient:
+    \"\"\"Asyncio client for the {context.app_spec.name} app, awaiting the blocking calls of {client_class} in a
+    thread pool
+
+    At most max_concurrency calls (max_workers by default) are in flight at once. Pass an executor to share a thread
+    pool between clients, it isn't shut down by the client.
+    \"\"\"
+
+    __slots__ = ("client", "_runner", "_send", "_state")
+
+    def __init__(
+        self,
+        client: "{client_class}",
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        max_workers: int = 8,
+        max_concurrency: int | None = None,
+    ):
+        self.client = client
+        self._runner = _AsyncRunner(executor=executor, max_workers=max_workers, max_concurrency=max_concurrency)
+        # sub-clients are created on first access, like those of the sync client
+        self._send: "{context.contract_name}AsyncSend | None" = None
+        self._state: "{context.contract_name}AsyncState | None" = None
+
+    async def __aenter__(self) -> "{context.contract_name}AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    @property
+    def send(self) -> "{context.contract_name}AsyncSend":
+        if self._send is None:
+            self._send = {context.contract_name}AsyncSend(self.client.send, self._runner)
+        return self._send
+
+    @property
+    def state(self) -> "{context.contract_name}AsyncState":
+        if self._state is None:
+            self._state = {context.contract_name}AsyncState(self.client.state, self._runner)
+        return self._state
+
+    def new_group(self) -> "{context.contract_name}AsyncComposer":
+        return {context.contract_name}AsyncComposer(self.client.new_group(), self._runner){readonly_batch}
+
+    async def run(self, func: typing.Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        \"\"\"Await any other blocking call in the client's thread pool, e.g. of `client.algorand`\"\"\"
+        return await self._runner.run(func, *args, **kwargs)
+
+    async def map(
+        self, call: typing.Callable[[_A], typing.Awaitable[_R]], items: typing.Iterable[_A]
+    ) -> list[_R]:
+        \"\"\"Await call for each of items concurrently, returning the results in the order of items
+
+        e.g. `await client.map(client.send.hello, [("a",), ("b",)])`, calls beyond max_concurrency wait for a slot
+        \"\"\"
+        return list(await asyncio.gather(*(call(item) for item in items)))
+
+    def close(self) -> None:
+        \"\"\"Shut down the thread pool created by the client\"\"\"
+        self._runner.shutdown()
+""")
+
+
+def generate_async_client(context: GeneratorContext) -> DocumentParts:
+    """Generate the asyncio variant of the client, which awaits the calls of the sync client in a thread pool"""
+    yield _generate_async_runner()
+    yield Part.Gap2
+    yield _generate_async_send(context)
+    yield Part.Gap2
+    yield from _generate_async_state(context)
+    yield Part.Gap2
+    yield _generate_async_composer(context)
+    yield from _generate_async_readonly_batch(context)
+    yield Part.Gap2
+    yield _generate_async_client_class(context)
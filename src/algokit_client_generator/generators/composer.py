@@ -1,9 +1,19 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
-from algokit_client_generator.generators.typed_client import PropertyType, _generate_common_method_params
+from algokit_client_generator.generators.typed_client import (
+    MAX_GROUP_SIZE,
+    PropertyType,
+    _generate_common_method_params,
+    _get_args_type,
+    get_batch_methods,
+    get_batch_send_class_name,
+    get_cache_invalidate,
+    get_readonly_methods,
+    get_send_caches,
+)
 from algokit_client_generator.spec import ContractMethod
 
 OPERATION_TO_METHOD_CALL_PREFIX = {
@@ -35,6 +45,8 @@ def generate_operation_composer(
 
     yield utils.indented(f"""
 class {class_name}:
+    __slots__ = ("composer",)
+
     def __init__(self, composer: \"{context.contract_name}Composer\"):
         self.composer = composer
 """)
@@ -59,10 +71,8 @@ class {class_name}:
             {compilation_params}
         )
     )
-    self.composer._result_mappers.append(
-        lambda v: self.composer.client.decode_return_value(
-            "{method.abi.method.get_signature()}", v
-        )
+    self.composer._return_decoders.append(
+        ("{method.abi.method.get_signature()}", _RETURN_DECODERS["{method.abi.method.get_signature()}"])
     )
     return self.composer
 """)
@@ -98,17 +108,25 @@ def generate_composer(context: GeneratorContext) -> DocumentParts:
                 yield from class_name_gen
                 yield Part.Gap2
 
-    # Then generate main composer class
+    # Then generate main composer class, operation composers are created on first access and cached
+    slots = "".join(f', "_{operation}"' for operation in operation_class_names)
     yield utils.indented(f"""
 class {context.contract_name}Composer:
     \"\"\"Composer for creating transaction groups for {context.contract_name} contract calls\"\"\"
 
+    __slots__ = ("client", "_composer", "_return_decoders"{slots})
+
     def __init__(self, client: "{context.contract_name}Client"):
         self.client = client
         self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        # the signatures and return decoders of the queued method calls, in the order they were queued
+        self._return_decoders: list[tuple[str, _ReturnDecoder]] = []
 """)
     yield Part.IncIndent
+    yield Part.IncIndent
+    for operation, class_name in operation_class_names.items():
+        yield f'self._{operation}: "{class_name} | None" = None'
+    yield Part.DecIndent
 
     # Generate properties for operations
     for operation, class_name in operation_class_names.items():
@@ -116,7 +134,9 @@ class {context.contract_name}Composer:
         yield utils.indented(f"""
 @property
 def {operation}(self) -> "{class_name}":
-    return {class_name}(self)
+    if self._{operation} is None:
+        self._{operation} = {class_name}(self)
+    return self._{operation}
 """)
 
     # Generate methods for no_op ABI calls
@@ -140,15 +160,17 @@ def {operation}(self) -> "{class_name}":
             params=params,
         )
     )
-    self._result_mappers.append(
-        lambda v: self.client.decode_return_value(
-            "{method.abi.method.get_signature()}", v
-        )
+    self._return_decoders.append(
+        ("{method.abi.method.get_signature()}", _RETURN_DECODERS["{method.abi.method.get_signature()}"])
     )
     return self
 """)
 
     # Add utility methods
+    caches = get_send_caches(context)
+    invalidate_caches = (
+        get_cache_invalidate(caches, owner="self.client", result="result") + "\n    return result" if caches else ""
+    )
     yield Part.Gap1
     yield utils.indented(f"""
 def clear_state(
@@ -157,15 +179,10 @@ def clear_state(
     args: list[bytes] | None = None,
     params: algokit_utils.CommonAppCallParams | None = None,
 ) -> \"{context.contract_name}Composer\":
-    params=params or algokit_utils.CommonAppCallParams()
+    params = params or _DEFAULT_PARAMS
     self._composer.add_app_call(
         self.client.params.clear_state(
-            algokit_utils.AppClientBareCallParams(
-                **{{
-                    **dataclasses.asdict(params),
-                    "args": args
-                }}
-            )
+            algokit_utils.AppClientBareCallParams(**_params_fields(params), args=args)
         )
     )
     return self
@@ -179,6 +196,25 @@ def add_transaction(
 def composer(self) -> algokit_utils.TransactionComposer:
     return self._composer
 
+def _decode_returns(
+    self, result: algokit_utils.SendAtomicTransactionComposerResults
+) -> algokit_utils.SendAtomicTransactionComposerResults:
+    \"\"\"Decode the return values of the queued method calls into their typed values in place, in one pass\"\"\"
+    return_decoders = iter(self._return_decoders)
+    queued = next(return_decoders, None)
+    structs = self.client.app_spec.structs
+    for abi_return in result.returns:
+        if queued is None:
+            break
+        # returns of method calls passed as args of the queued calls precede their return, and are matched by
+        # signature as they may be calls of a method with the same name of another app
+        if abi_return.method is None or abi_return.method.get_signature() != queued[0]:
+            continue
+        if abi_return.decode_error is None:
+            abi_return.value = _decode_return(queued[1], abi_return, structs)
+        queued = next(return_decoders, None)
+    return result
+
 def simulate(
     self,
     allow_more_logs: bool | None = None,
@@ -189,20 +225,197 @@ def simulate(
     simulation_round: int | None = None,
     skip_signatures: bool | None = None,
 ) -> algokit_utils.SendAtomicTransactionComposerResults:
-    return self._composer.simulate(
-        allow_more_logs=allow_more_logs,
-        allow_empty_signatures=allow_empty_signatures,
-        allow_unnamed_resources=allow_unnamed_resources,
-        extra_opcode_budget=extra_opcode_budget,
-        exec_trace_config=exec_trace_config,
-        simulation_round=simulation_round,
-        skip_signatures=skip_signatures,
+    return self._decode_returns(
+        self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
     )
 
 def send(
     self,
     send_params: algokit_utils.SendParams | None = None
 ) -> algokit_utils.SendAtomicTransactionComposerResults:
-    return self._composer.send(send_params)
+    {"result = " if caches else "return "}self._decode_returns(self._composer.send(send_params)){invalidate_caches}
+""")
+    yield Part.DecIndent
+
+
+def generate_batch_send(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the class sending many calls of a method in atomic groups built by the composer, which is accessed by
+    the batch property of the send class"""
+    batch_methods = get_batch_methods(context)
+    if not batch_methods:
+        return
+    yield utils.indented(f"""
+class {get_batch_send_class_name(context)}:
+    \"\"\"Send many calls of a method, packed into atomic groups of up to group_size calls
+
+    The args are read lazily, one group at a time, and the next group is built while up to max_in_flight groups are
+    being sent. The decoded return values are returned in the order of the args.
+
+    If a group fails no further groups are sent, and its error is raised once the groups in flight are done. The groups
+    sent before it are confirmed, as may be the up to max_in_flight - 1 groups sent after it, whose return values
+    aren't returned. Send with max_in_flight=1 to stop at the failed group.
+    \"\"\"
+
+    __slots__ = ("client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient, client: "{context.contract_name}Client | None" = None):
+        # the groups are sent by composers of the owning client, which evict its caches once they're confirmed
+        self.client = client if client is not None else {context.contract_name}Client(app_client)
+
+    def _send_groups(
+        self,
+        add_call: typing.Callable[["{context.contract_name}Composer", typing.Any], object],
+        args: typing.Iterable[typing.Any],
+        send_params: algokit_utils.SendParams | None,
+        group_size: int,
+        max_in_flight: int,
+    ) -> list[typing.Any]:
+        if not 1 <= group_size <= {MAX_GROUP_SIZE}:
+            raise ValueError(f"group_size must be between 1 and {MAX_GROUP_SIZE}, got {{group_size}}")
+        import collections
+        import concurrent.futures
+        import itertools
+
+        args_iter = iter(args)
+        results: list[typing.Any] = []
+        in_flight: collections.deque[
+            concurrent.futures.Future[algokit_utils.SendAtomicTransactionComposerResults]
+        ] = collections.deque()
+
+        def collect_oldest() -> None:
+            response = in_flight.popleft().result()
+            results.extend(abi_return.value for abi_return in response.returns)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for group_args in iter(lambda: list(itertools.islice(args_iter, group_size)), []):
+                composer = self.client.new_group()
+                for method_args in group_args:
+                    add_call(composer, method_args)
+                if len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                in_flight.append(executor.submit(composer.send, send_params))
+            while in_flight:
+                collect_oldest()
+        return results
+""")
+    yield Part.IncIndent
+    for method in batch_methods:
+        assert method.abi
+        args_type = _get_args_type(context, method)
+        method_name = method.abi.client_method_name
+        yield Part.Gap1
+        yield utils.indented(f"""
+def {method_name}(
+    self,
+    args: typing.Iterable[{args_type}],
+    params: algokit_utils.CommonAppCallParams | None = None,
+    send_params: algokit_utils.SendParams | None = None,
+    *,
+    group_size: int = {MAX_GROUP_SIZE},
+    max_in_flight: int = 2,
+) -> list[{method.abi.python_type}]:
+    return self._send_groups(
+        lambda composer, method_args: composer.{method_name}(method_args, params=params),
+        args,
+        send_params,
+        group_size,
+        max_in_flight,
+    )
+""")
+    yield Part.DecIndent
+
+
+def generate_readonly_batch(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the builder simulating readonly calls in groups, with one simulate request per group"""
+    readonly_methods = get_readonly_methods(context)
+    if not readonly_methods:
+        return
+
+    batch_class = f"{context.contract_name}ReadonlyBatch"
+    yield utils.indented(f"""
+_ReturnType = typing.TypeVar("_ReturnType")
+
+
+class _ReadonlyResult(typing.Generic[_ReturnType]):
+    \"\"\"Return value of a call queued in a readonly batch, available once the batch is simulated\"\"\"
+
+    __slots__ = ("_value", "_done")
+
+    def __init__(self) -> None:
+        self._value: _ReturnType | None = None
+        self._done = False
+
+    @property
+    def value(self) -> _ReturnType:
+        if not self._done:
+            raise RuntimeError("The readonly batch hasn't been simulated, call simulate() first")
+        return typing.cast(_ReturnType, self._value)
+
+    def _set(self, value: _ReturnType) -> None:
+        self._value = value
+        self._done = True
+
+
+class {batch_class}:
+    \"\"\"Readonly calls of the {context.app_spec.name} app, simulated in groups of up to {MAX_GROUP_SIZE} calls
+
+    Each queued call returns a result whose value is available once `simulate()` is called, which sends one simulate
+    request per group rather than one per call
+    \"\"\"
+
+    __slots__ = ("client", "_calls")
+
+    def __init__(self, client: "{context.contract_name}Client"):
+        self.client = client
+        self._calls: list[
+            tuple[typing.Callable[["{context.contract_name}Composer"], object], _ReadonlyResult[typing.Any]]
+        ] = []
+
+    def _queue(
+        self, add_call: typing.Callable[["{context.contract_name}Composer"], object]
+    ) -> _ReadonlyResult[typing.Any]:
+        result: _ReadonlyResult[typing.Any] = _ReadonlyResult()
+        self._calls.append((add_call, result))
+        return result
+
+    def simulate(self) -> list[typing.Any]:
+        \"\"\"Simulate the queued calls, returning their decoded return values in the order they were queued\"\"\"
+        calls, self._calls = self._calls, []
+        values = []
+        for start in range(0, len(calls), {MAX_GROUP_SIZE}):
+            group = calls[start : start + {MAX_GROUP_SIZE}]
+            composer = self.client.new_group()
+            for add_call, _ in group:
+                add_call(composer)
+            response = composer.simulate(
+                allow_more_logs=True,
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                skip_signatures=True,
+            )
+            for (_, result), abi_return in zip(group, response.returns, strict=True):
+                result._set(abi_return.value)
+                values.append(result.value)
+        return values
+""")
+    yield Part.IncIndent
+    for method in readonly_methods:
+        assert method.abi
+        method_params, has_args = _generate_common_method_params(context, method, PropertyType.PARAMS)
+        method_params = method_params.rsplit(" ->", 1)[0] + f" -> _ReadonlyResult[{method.abi.python_type}]:"
+        yield Part.Gap1
+        yield utils.indented(f"""
+{method_params}
+    return self._queue(
+        lambda composer: composer.{method.abi.client_method_name}({"args, " if has_args else ""}params=params),
+    )
 """)
     yield Part.DecIndent
@@ -0,0 +1,581 @@
+from collections.abc import Iterator
+
+import algosdk
+
+from algokit_client_generator import utils
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.struct_codecs import (
+    MAX_APP_ARGS,
+    bytes_literal,
+    generate_struct_codecs,
+    get_struct_abi_type,
+    get_struct_from_bytes_name,
+    get_struct_from_tuple_name,
+)
+from algokit_client_generator.spec import ABIEvent, ABIStruct, ContractArg, ContractMethod
+
+# Functions resolving reference args from the index passed in their app arg
+_REFERENCE_ARG_RESOLVERS = {
+    algosdk.abi.ABIReferenceType.ACCOUNT: "_account_arg",
+    algosdk.abi.ABIReferenceType.ASSET: "_asset_arg",
+    algosdk.abi.ABIReferenceType.APPLICATION: "_application_arg",
+}
+
+
+def _get_args_class_name(context: GeneratorContext, method: ContractMethod) -> str:
+    assert method.abi
+    return f"{context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
+
+
+def get_args_from_app_args_name(method: ContractMethod) -> str:
+    """Name of the generated function decoding a method's args dataclass from the app args of its calls"""
+    assert method.abi
+    return f"_{utils.to_snake_case(method.abi.client_method_name)}_args_from_app_args"
+
+
+def _generate_event_class(event: ABIEvent) -> DocumentParts:
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True, slots=True)
+class {event.struct.struct_class_name}:
+    \"\"\"ARC-28 event {event.signature}\"\"\"
+""")
+    yield Part.IncIndent
+    for field in event.struct.fields:
+        yield f"{field.name}: {field.python_type}"
+    yield Part.DecIndent
+
+
+def _generate_event_decoders(context: GeneratorContext) -> DocumentParts:
+    event_types = " | ".join(event.struct.struct_class_name for event in context.events)
+    yield f"{context.event_type_name}: typing.TypeAlias = {event_types}"
+    yield Part.Gap1
+    yield "# Decoders of the ARC-28 events emitted by the app, by the selector prefixing their logs"
+    yield f"_EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], {context.event_type_name}]] = {{"
+    yield Part.IncIndent
+    for event in context.events:
+        decoder = get_struct_from_bytes_name(event.struct.struct_class_name)
+        yield f"{bytes_literal(event.selector)}: {decoder},  # {event.signature}"
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield utils.indented(f"""
+def decode_event(log: bytes) -> {context.event_type_name} | None:
+    \"\"\"Decode an ARC-28 event logged by the app, or None if the log is not one of the app's events
+
+    Raises algosdk.error.ABIEncodingError if the log starts with the selector of an event but isn't an encoding of it
+    \"\"\"
+    decoder = _EVENT_DECODERS.get(log[:4])
+    if decoder is None:
+        return None
+    try:
+        return decoder(log[4:])
+    except (IndexError, ValueError) as e:  # e.g. strings that aren't UTF-8
+        raise algosdk.error.ABIEncodingError(f"Invalid ABI encoding of event with selector {{log[:4].hex()}}") from e
+
+
+def decode_events(
+    logs: algokit_utils.SendAppTransactionResult | typing.Iterable[bytes],
+) -> list[{context.event_type_name}]:
+    \"\"\"Decode the ARC-28 events logged by the app, from the result of a sent app call or raw logs
+
+    Logs that are not one of the app's events are skipped, as are logs that start with the selector of an event but
+    aren't an encoding of it, since any log can start with those bytes. The events of a sent app call are read from
+    the logs of the call itself, its inner transactions are calls of other apps as an app can't be called re-entrantly.
+    \"\"\"
+    if isinstance(logs, algokit_utils.SendAppTransactionResult):
+        import base64
+
+        confirmation = logs.confirmation
+        logs = [base64.b64decode(log) for log in confirmation.get("logs", [])] if isinstance(confirmation, dict) else []
+    events = []
+    for log in logs:
+        try:
+            event = decode_event(log)
+        except algosdk.error.ABIEncodingError:
+            continue
+        if event is not None:
+            events.append(event)
+    return events
+""")
+
+
+def generate_events(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate a dataclass for each ARC-28 event of the app, and functions decoding them from logs by their selector"""
+    if not context.events:
+        return
+    for event in context.events:
+        yield _generate_event_class(event)
+        yield Part.Gap2
+        yield generate_struct_codecs(context, event.struct)
+        yield Part.Gap2
+    yield _generate_event_decoders(context)
+
+
+def _get_method_signatures(context: GeneratorContext) -> dict[bytes, str]:
+    return {
+        method.abi.method.get_selector(): method.abi.method.get_signature()
+        for method in context.methods.all_abi_methods
+        if method.abi
+    }
+
+
+def _generate_app_call_class(context: GeneratorContext) -> DocumentParts:
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True, slots=True)
+class {context.app_call_type_name}:
+    \"\"\"A call of the app extracted from a block or the transactions of the indexer\"\"\"
+    confirmed_round: int | None
+    tx_id: str | None
+    \"\"\"ID of the indexer transaction, or of the outer transaction of an inner call, None when read from blocks\"\"\"
+    sender: str
+    method: str | None
+    \"\"\"Signature of the called ABI method, or None for bare calls\"\"\"
+    app_args: list[bytes]
+""")
+    yield Part.IncIndent
+    yield f"args: {context.method_args_type_name} | None"
+    yield utils.indented("""
+\"\"\"Args of the called ABI method, None for bare calls and args that can't be decoded, e.g. transaction args of
+calls read from the indexer, whose group isn't converted into algosdk transactions\"\"\"
+""")
+    if context.events:
+        yield f"events: list[{context.event_type_name}]"
+    yield Part.DecIndent
+
+
+def _generate_decode_app_call_args(context: GeneratorContext) -> Iterator[DocumentParts]:
+    args = [arg for method in _get_abi_methods(context) if method.abi for arg in method.abi.args]
+    has_reference_args = any(arg.abi_type in _REFERENCE_ARG_RESOLVERS for arg in args)
+    has_transaction_args = any(algosdk.abi.is_abi_transaction_type(arg.abi_type) for arg in args)
+    statements = []
+    decode_app_call_args = ["app_args"]
+    if has_reference_args:
+        statements.append("""transaction = transactions[index]
+    if "txn" in transaction:
+        txn = transaction["txn"]
+        sender, app_id = algosdk.encoding.encode_address(txn["snd"]), txn.get("apid") or transaction.get("apid", 0)
+        accounts = [algosdk.encoding.encode_address(account) for account in txn.get("apat") or []]
+        foreign_apps, foreign_assets = txn.get("apfa"), txn.get("apas")
+    else:
+        application = transaction["application-transaction"]
+        sender = transaction["sender"]
+        app_id = application["application-id"] or transaction.get("created-application-index", 0)
+        accounts, foreign_apps = application.get("accounts"), application.get("foreign-apps")
+        foreign_assets = application.get("foreign-assets")
+    # only the sender, app ID and foreign arrays of the app call are read to resolve its reference args
+    app_call_transaction = algosdk.transaction.ApplicationCallTxn(
+        sender,
+        algosdk.transaction.SuggestedParams(0, 0, 0, "", flat_fee=True),
+        app_id,
+        OnComplete.NoOpOC,
+        accounts=accounts,
+        foreign_apps=foreign_apps,
+        foreign_assets=foreign_assets,
+    )""")
+        decode_app_call_args.append("transaction=app_call_transaction")
+    if has_transaction_args:
+        decode_app_call_args.append("group=_get_preceding_group_transactions(transactions, index)")
+        yield utils.indented("""
+def _get_preceding_group_transactions(
+    transactions: list[dict[str, typing.Any]], index: int
+) -> list[algosdk.transaction.Transaction]:
+    \"\"\"Get the transactions preceding a transaction of a block in its group, none for indexer transactions\"\"\"
+    group_id = transactions[index].get("txn", {}).get("grp")
+    start = index
+    while group_id is not None and start > 0 and transactions[start - 1].get("txn", {}).get("grp") == group_id:
+        start -= 1
+    # the transactions of a block omit the fields implied by the block, e.g. the genesis hash
+    return [
+        algosdk.transaction.Transaction.undictify({"lv": 0, **transaction["txn"]})
+        for transaction in transactions[start:index]
+    ]
+""")
+        yield Part.Gap2
+    body = "".join(f"{statement}\n    " for statement in statements)
+    indexer_transaction_args = ", or transaction args of indexer transactions" if has_transaction_args else ""
+    yield utils.indented(f"""
+def _decode_app_call_args(
+    app_args: list[bytes], transactions: list[dict[str, typing.Any]], index: int
+) -> {context.method_args_type_name} | None:
+    \"\"\"Decode the args of an app call by a transaction of a block or the indexer, or None if they can't be\"\"\"
+    if not app_args or app_args[0] not in _APP_ARGS_DECODERS:
+        return None
+    {body}try:
+        return decode_app_call({", ".join(decode_app_call_args)})
+    except (algosdk.error.ABIEncodingError, IndexError, ValueError):
+        # e.g. app args that aren't an encoding of the method's args{indexer_transaction_args}
+        return None
+""")
+
+
+def _generate_app_call_extractor(context: GeneratorContext) -> DocumentParts:
+    app_call = context.app_call_type_name
+    # logs are only read when the app has events to decode from them
+    events = "\n            events=decode_events(to_bytes(log) for log in logs)," if context.events else ""
+    block_logs, indexer_logs = (
+        ('logs = apply_data.get("lg") or []\n        ', 'logs = transaction.get("logs") or []\n        ')
+        if context.events
+        else ("", "")
+    )
+    yield "# Signatures of the ABI methods of the app, by the selector passed as the first app arg of their calls"
+    yield "_METHOD_SIGNATURES: dict[bytes, str] = {"
+    yield Part.IncIndent
+    for selector, signature in _get_method_signatures(context).items():
+        yield f'{bytes_literal(selector)}: "{signature}",'
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield _generate_decode_app_call_args(context)
+    yield Part.Gap2
+    yield utils.indented(f"""
+def _base64_to_bytes(value: str | bytes) -> bytes:
+    import base64
+
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def _msgpack_to_bytes(value: str | bytes) -> bytes:
+    # byte strings of blocks (e.g. logs) may be encoded as msgpack strings, which are decoded with surrogate escapes
+    return value.encode("utf-8", "surrogateescape") if isinstance(value, str) else value
+
+
+def _iter_app_calls(
+    transactions: list[dict[str, typing.Any]],
+    index: int,
+    app_id: int,
+    to_bytes: typing.Callable[[str | bytes], bytes],
+    confirmed_round: int | None = None,
+    tx_id: str | None = None,
+) -> typing.Iterator[{app_call}]:
+    \"\"\"Get the calls of the app by a transaction of a block or the indexer, including its inner transactions\"\"\"
+    transaction = transactions[index]
+    if "txn" in transaction:
+        # a transaction of a block, along with its apply data
+        txn, apply_data = transaction["txn"], transaction.get("dt") or {{}}
+        is_app_call = txn.get("type") == "appl"
+        called_app_id = txn.get("apid") or transaction.get("apid", 0)
+        sender, raw_app_args = txn.get("snd", b""), txn.get("apaa") or []
+        {block_logs}inner_transactions = apply_data.get("itx") or []
+    else:
+        # a transaction of the indexer
+        application = transaction.get("application-transaction") or {{}}
+        is_app_call = transaction.get("tx-type") == "appl"
+        called_app_id = application.get("application-id") or transaction.get("created-application-index", 0)
+        sender, raw_app_args = transaction.get("sender", ""), application.get("application-args") or []
+        {indexer_logs}inner_transactions = transaction.get("inner-txns") or []
+        confirmed_round = transaction.get("confirmed-round", confirmed_round)
+        tx_id = transaction.get("id", tx_id)
+    if is_app_call and called_app_id == app_id:
+        app_args = [to_bytes(arg) for arg in raw_app_args]
+        yield {app_call}(
+            confirmed_round=confirmed_round,
+            tx_id=tx_id,
+            sender=sender if isinstance(sender, str) else algosdk.encoding.encode_address(sender),
+            method=_METHOD_SIGNATURES.get(app_args[0]) if app_args else None,
+            app_args=app_args,
+            args=_decode_app_call_args(app_args, transactions, index),{events}
+        )
+    for inner_index in range(len(inner_transactions)):
+        yield from _iter_app_calls(inner_transactions, inner_index, app_id, to_bytes, confirmed_round, tx_id)
+
+
+def _extract_app_calls(item: dict[str, typing.Any] | bytes | str, app_id: int) -> list[{app_call}]:
+    \"\"\"Get the calls of the app by the transactions of a block, a page of indexer transactions or a transaction\"\"\"
+    to_bytes = _base64_to_bytes
+    data: dict[str, typing.Any]
+    if isinstance(item, bytes):
+        # msgpack is a dependency of algosdk
+        import msgpack  # type: ignore[import-untyped]
+
+        data = msgpack.unpackb(item, raw=False, strict_map_key=False, unicode_errors="surrogateescape")
+        to_bytes = _msgpack_to_bytes
+    elif isinstance(item, str):
+        import json
+
+        data = json.loads(item)
+    else:
+        data = item
+    block = data.get("block", data)
+    if "txns" in block or "rnd" in block:
+        round_number = block.get("rnd", 0)
+        transactions = block.get("txns") or []
+    else:
+        round_number = None
+        transactions = data.get("transactions", [data])
+    return [
+        app_call
+        for index in range(len(transactions))
+        for app_call in _iter_app_calls(transactions, index, app_id, to_bytes, round_number)
+    ]
+
+
+def _extract_app_calls_batch(items: list[dict[str, typing.Any] | bytes | str], app_id: int) -> list[{app_call}]:
+    return [app_call for item in items for app_call in _extract_app_calls(item, app_id)]
+
+
+def extract_app_calls(
+    items: typing.Iterable[dict[str, typing.Any] | bytes | str],
+    app_id: int,
+    *,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+) -> typing.Iterator[{app_call}]:
+    \"\"\"Extract the calls of the app, in order, from blocks or transactions
+
+    Items are blocks read from algod, as msgpack bytes or a dict, or transactions (or pages of transactions) read from
+    the indexer, as JSON or a dict. Calls by inner transactions are included.
+    With max_workers, items are decoded in batches of batch_size by a pool of processes, with at most 2 batches per
+    worker in flight, so items are read from the iterable as the calls are consumed.
+    \"\"\"
+    if not max_workers:
+        for item in items:
+            yield from _extract_app_calls(item, app_id)
+        return
+    import collections
+    import concurrent.futures
+    import itertools
+
+    remaining = iter(items)
+    batches = iter(lambda: list(itertools.islice(remaining, batch_size)), [])
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future[list[{app_call}]]] = collections.deque()
+        for batch in batches:
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_extract_app_calls_batch, batch, app_id))
+        while pending:
+            yield from pending.popleft().result()
+""")
+
+
+def _get_abi_methods(context: GeneratorContext) -> list[ContractMethod]:
+    """Get the ABI methods of the app, once per selector"""
+    methods: dict[bytes, ContractMethod] = {}
+    for method in context.methods.all_abi_methods:
+        if method.abi:
+            methods.setdefault(method.abi.method.get_selector(), method)
+    return list(methods.values())
+
+
+def _generate_empty_args_class(context: GeneratorContext, method: ContractMethod) -> DocumentParts:
+    """Generate the args dataclass of a method without args, which only has one for decoding its calls"""
+    assert method.abi
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class {_get_args_class_name(context, method)}:
+    \"\"\"Dataclass for {method.abi.client_method_name} arguments, of which it has none\"\"\"
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "{method.abi.method.get_signature()}"
+""")
+
+
+def _decode_app_arg(abi_type: algosdk.abi.ABIType, value: str) -> str:  # noqa: PLR0911
+    """Get the expression decoding an ABI value from the whole of an app arg"""
+    if isinstance(abi_type, algosdk.abi.UintType | algosdk.abi.UfixedType):
+        return f'int.from_bytes({value}, "big")'
+    if isinstance(abi_type, algosdk.abi.ByteType):
+        return f"{value}[0]"
+    if isinstance(abi_type, algosdk.abi.BoolType):
+        return f"bool({value}[0] & 0x80)"
+    if isinstance(abi_type, algosdk.abi.AddressType):
+        return f"algosdk.encoding.encode_address({value})"
+    if isinstance(abi_type, algosdk.abi.StringType):
+        return f"{value}[2:].decode()"
+    if isinstance(abi_type, algosdk.abi.ArrayDynamicType) and isinstance(abi_type.child_type, algosdk.abi.ByteType):
+        return f"{value}[2:]"
+    return f'_abi_type("{abi_type}").decode({value})'
+
+
+def _get_app_arg_check(abi_type: algosdk.abi.ABIType, value: str) -> str | None:
+    """Get the condition of a valid encoding of an app arg decoded by _decode_app_arg, values decoded by their ABI type
+    and structs are checked when they're decoded"""
+    if isinstance(abi_type, algosdk.abi.UintType | algosdk.abi.UfixedType | algosdk.abi.AddressType):
+        return f"len({value}) == {abi_type.byte_len()}"
+    if isinstance(abi_type, algosdk.abi.ByteType | algosdk.abi.BoolType):
+        return f"len({value}) == 1"
+    if isinstance(abi_type, algosdk.abi.StringType) or (
+        isinstance(abi_type, algosdk.abi.ArrayDynamicType) and isinstance(abi_type.child_type, algosdk.abi.ByteType)
+    ):
+        return f'int.from_bytes({value}[:2], "big") == len({value}) - 2'
+    return None
+
+
+def _decode_arg(arg: ContractArg, struct: ABIStruct | None, value: str, *, packed: bool) -> str:
+    """Get the expression decoding an arg from its app arg, or from its element of the tuple of packed args"""
+    if arg.abi_type in _REFERENCE_ARG_RESOLVERS:
+        index = value if packed else f"{value}[0]"
+        return f"{_REFERENCE_ARG_RESOLVERS[arg.abi_type]}({index}, transaction)"
+    if struct:
+        if packed:
+            return f"{get_struct_from_tuple_name(struct.struct_class_name)}({value})"
+        return f"{get_struct_from_bytes_name(struct.struct_class_name)}({value})"
+    return value if packed else _decode_app_arg(algosdk.abi.ABIType.from_string(arg.abi_type), value)
+
+
+def _get_packed_arg_type(context: GeneratorContext, arg: ContractArg, struct: ABIStruct | None) -> str:
+    if arg.abi_type in _REFERENCE_ARG_RESOLVERS:
+        return "uint8"
+    return get_struct_abi_type(context, struct) if struct else arg.abi_type
+
+
+def _generate_args_from_app_args(context: GeneratorContext, method: ContractMethod) -> DocumentParts:
+    """Generate a function decoding a method's args dataclass from the app args of its calls"""
+    assert method.abi
+    structs = {struct.struct_class_name: struct for struct in context.structs.values()}
+    data_class_name = _get_args_class_name(context, method)
+    transaction_args = [arg for arg in method.abi.args if algosdk.abi.is_abi_transaction_type(arg.abi_type)]
+    app_args = [arg for arg in method.abi.args if not algosdk.abi.is_abi_transaction_type(arg.abi_type)]
+    # when there are more args than app args, the args after the 14th are encoded as a tuple in the last app arg
+    packed_args = app_args[MAX_APP_ARGS - 1 :] if len(app_args) > MAX_APP_ARGS else []
+    # the selector is followed by an app arg for each arg, or by 14 app args and the tuple of packed args
+    app_args_count = MAX_APP_ARGS + 1 if packed_args else len(app_args) + 1
+    checks = [f"len(app_args) == {app_args_count}"]
+    for index, arg in enumerate(app_args[: len(app_args) - len(packed_args)], start=1):
+        if arg.abi_type in _REFERENCE_ARG_RESOLVERS:
+            checks.append(f"len(app_args[{index}]) == 1")
+        elif not structs.get(arg.python_type):
+            check = _get_app_arg_check(algosdk.abi.ABIType.from_string(arg.abi_type), f"app_args[{index}]")
+            checks.extend([check] if check else [])
+    signature = method.abi.method.get_signature()
+    conditions = "\n        and ".join(checks)
+    statements = [
+        f"if not (\n        {conditions}\n    ):" if len(checks) > 1 else f"if len(app_args) != {app_args_count}:",
+        f'    raise algosdk.error.ABIEncodingError("Invalid ABI encoding of the args of {signature}")',
+    ]
+    if packed_args:
+        packed_types = ",".join(_get_packed_arg_type(context, arg, structs.get(arg.python_type)) for arg in packed_args)
+        statements.append(f'packed_args = _abi_type("({packed_types})").decode(app_args[{MAX_APP_ARGS}])')
+    fields = []
+    for arg in method.abi.args:
+        struct = structs.get(arg.python_type)
+        if arg in transaction_args:
+            value = f"_transaction_arg(group, {len(transaction_args)}, {transaction_args.index(arg)})"
+        elif arg in packed_args:
+            value = _decode_arg(arg, struct, f"packed_args[{packed_args.index(arg)}]", packed=True)
+        else:
+            value = _decode_arg(arg, struct, f"app_args[{app_args.index(arg) + 1}]", packed=False)
+        fields.append(f"\n        {arg.name}={value},")
+    arguments = f"{''.join(fields)}\n    " if fields else ""
+    body = "\n    ".join([*statements, f"return {data_class_name}({arguments})"])
+    yield utils.indented(f"""
+def {get_args_from_app_args_name(method)}(
+    app_args: list[bytes],
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+    group: typing.Sequence[algosdk.transaction.Transaction],
+) -> {data_class_name}:
+    \"\"\"Decode the args of a call of {signature} from its app args\"\"\"
+    {body}
+""")
+
+
+def _generate_arg_resolvers(methods: list[ContractMethod]) -> Iterator[DocumentParts]:
+    args = [arg for method in methods if method.abi for arg in method.abi.args]
+    if any(arg.abi_type in _REFERENCE_ARG_RESOLVERS for arg in args):
+        yield utils.indented("""
+def _get_app_call_transaction(
+    transaction: algosdk.transaction.ApplicationCallTxn | None,
+) -> algosdk.transaction.ApplicationCallTxn:
+    if transaction is None:
+        raise ValueError("The app call transaction is needed to resolve the reference args of the call")
+    return transaction
+
+
+def _account_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> str:
+    transaction = _get_app_call_transaction(transaction)
+    return transaction.sender if index == 0 else (transaction.accounts or [])[index - 1]
+
+
+def _asset_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> int:
+    return (_get_app_call_transaction(transaction).foreign_assets or [])[index]
+
+
+def _application_arg(index: int, transaction: algosdk.transaction.ApplicationCallTxn | None) -> int:
+    transaction = _get_app_call_transaction(transaction)
+    return transaction.index if index == 0 else (transaction.foreign_apps or [])[index - 1]
+""")
+        yield Part.Gap2
+    if any(algosdk.abi.is_abi_transaction_type(arg.abi_type) for arg in args):
+        yield utils.indented("""
+def _transaction_arg(
+    group: typing.Sequence[algosdk.transaction.Transaction], count: int, position: int
+) -> algosdk.transaction.Transaction:
+    # transaction args are the transactions preceding the app call in its group
+    if len(group) < count:
+        raise ValueError(f"The {count} transactions preceding the app call are needed to resolve its transaction args")
+    return group[len(group) - count + position]
+""")
+        yield Part.Gap2
+
+
+def _generate_decode_app_call(context: GeneratorContext) -> Iterator[DocumentParts]:
+    methods = _get_abi_methods(context)
+    if not methods:
+        return
+    yield from _generate_arg_resolvers(methods)
+    for method in methods:
+        if method.abi and not method.abi.args:
+            yield _generate_empty_args_class(context, method)
+            yield Part.Gap2
+        yield _generate_args_from_app_args(context, method)
+        yield Part.Gap2
+    args_types = " | ".join(_get_args_class_name(context, method) for method in methods)
+    yield f"{context.method_args_type_name}: typing.TypeAlias = {args_types}"
+    yield Part.Gap1
+    yield utils.indented(f"""
+_AppArgsDecoder: typing.TypeAlias = typing.Callable[
+    [list[bytes], algosdk.transaction.ApplicationCallTxn | None, typing.Sequence[algosdk.transaction.Transaction]],
+    {context.method_args_type_name},
+]
+""")
+    yield Part.Gap1
+    yield "# Decoders of the args of calls of the app's ABI methods, by the selector passed as the first app arg"
+    yield "_APP_ARGS_DECODERS: dict[bytes, _AppArgsDecoder] = {"
+    yield Part.IncIndent
+    for method in methods:
+        assert method.abi
+        method_abi = method.abi.method
+        yield (
+            f"{bytes_literal(method_abi.get_selector())}: {get_args_from_app_args_name(method)},"
+            f"  # {method_abi.get_signature()}"
+        )
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield utils.indented(f"""
+def decode_app_call(
+    application_args: list[bytes],
+    *,
+    transaction: algosdk.transaction.ApplicationCallTxn | None = None,
+    group: typing.Sequence[algosdk.transaction.Transaction] = (),
+) -> {context.method_args_type_name} | None:
+    \"\"\"Decode the args dataclass of a call of one of the app's ABI methods from its app args, or None if the first
+    app arg isn't the selector of one of its methods (e.g. for bare calls). Methods without args have an empty one
+
+    Reference args are resolved from the foreign arrays of the app call transaction, and transaction args from the
+    transactions preceding the call in its group, which are only needed for calls of methods with args of those types.
+    Raises algosdk.error.ABIEncodingError if the app args aren't an encoding of the args of the method
+    \"\"\"
+    decoder = _APP_ARGS_DECODERS.get(application_args[0]) if application_args else None
+    if decoder is None:
+        return None
+    try:
+        return decoder(application_args, transaction, group)
+    except UnicodeDecodeError as e:
+        raise algosdk.error.ABIEncodingError("Invalid ABI encoding of a string arg, which isn't UTF-8") from e
+""")
+
+
+def generate_decoding(context: GeneratorContext) -> DocumentParts:
+    """Generate the decoders of the events and calls of the app, along with a function extracting its calls from
+    blocks or indexer transactions when it has ABI methods"""
+    yield generate_events(context)
+    yield Part.Gap2
+    yield _generate_decode_app_call(context)
+    if _get_abi_methods(context):
+        yield Part.Gap2
+        yield _generate_app_call_class(context)
+        yield Part.Gap2
+        yield _generate_app_call_extractor(context)
@@ -1,6 +1,8 @@
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts
 
+SPEC_HASH_COMMENT = "# spec-hash: "
+
 
 def disable_linting() -> DocumentParts:
     yield "# flake8: noqa"  # this works for flake8 and ruff
@@ -15,3 +17,5 @@ def generate_header_comments(context: GeneratorContext) -> DocumentParts:
     yield "# This file was automatically generated by algokit-client-generator."
     yield "# DO NOT MODIFY IT BY HAND."
     yield "# requires: algokit-utils@^3.0.0"
+    if context.spec_hash:
+        yield f"{SPEC_HASH_COMMENT}{context.spec_hash}"
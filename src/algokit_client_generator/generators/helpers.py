@@ -1,6 +1,7 @@
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.typed_client import generate_read_caches
 
 
 def generate_abi_args_parser(indent_size: int = 4) -> DocumentParts:
@@ -11,18 +12,19 @@ def generate_abi_args_parser(indent_size: int = 4) -> DocumentParts:
     """
     yield utils.indented(
         """
+def _convert_dataclass(value: object) -> object:
+    \"\"\"Helper to recursively convert dataclasses into the tuples expected by the ABI encoder\"\"\"
+    if dataclasses.is_dataclass(value):
+        return tuple(_convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_convert_dataclass(item) for item in value)
+    return value
+
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     \"\"\"Helper to parse ABI args into the format expected by underlying client\"\"\"
     if args is None:
         return None
 
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
     match args:
         case tuple():
             method_args = list(args)
@@ -32,7 +34,7 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
             raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
 
     return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        _convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
         for arg in method_args
     ] if method_args else None
 """,
@@ -40,26 +42,24 @@ def _parse_abi_args(args: object | None = None) -> list[object] | None:
     )
 
 
-def generate_dataclass_initializer(context: GeneratorContext) -> DocumentParts:
+def generate_params_helpers() -> DocumentParts:
+    """Generate the shared default params and the helper copying params into the params of the underlying client"""
     yield utils.indented(
         """
-def _init_dataclass(cls: type, data: dict) -> object:
-    \"\"\"
-    Recursively instantiate a dataclass of type `cls` from `data`.
+# Shared defaults for omitted params, the params dataclasses are frozen so a single instance can be reused
+_DEFAULT_PARAMS = algokit_utils.CommonAppCallParams()
+_DEFAULT_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+_PARAMS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    \"\"\"
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
-    """
+def _params_fields(
+    params: algokit_utils.CommonAppCallParams | algokit_utils.CommonAppCallCreateParams,
+) -> dict[str, typing.Any]:
+    \"\"\"Helper to shallow copy the fields of params, unlike `dataclasses.asdict` no values are deep copied\"\"\"
+    field_names = _PARAMS_FIELD_NAMES.get(type(params))
+    if field_names is None:
+        field_names = _PARAMS_FIELD_NAMES[type(params)] = tuple(field.name for field in dataclasses.fields(params))
+    return {name: getattr(params, name) for name in field_names}
+"""
     )
 
 
@@ -67,5 +67,6 @@ def generate_helpers(context: GeneratorContext) -> DocumentParts:
     yield Part.Gap1
     yield generate_abi_args_parser()
     yield Part.Gap1
-    yield generate_dataclass_initializer(context)
+    yield generate_params_helpers()
     yield Part.Gap1
+    yield generate_read_caches(context)
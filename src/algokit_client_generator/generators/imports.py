@@ -1,9 +1,18 @@
+from collections.abc import Iterator
+
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts
 
+# Imported by the asyncio variant of the client, only in the module it's generated into
+ASYNC_IMPORTS = """# async
+import asyncio
+import concurrent.futures
+import functools
+"""
+
 
-def generate_imports(context: GeneratorContext) -> DocumentParts:
+def generate_imports(context: GeneratorContext) -> Iterator[DocumentParts]:
     yield utils.lines("""
 # common
 import dataclasses
@@ -19,3 +28,5 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 """)
+    if context.async_client and not context.package:
+        yield utils.lines(ASYNC_IMPORTS)
@@ -0,0 +1,156 @@
+import ast
+import dataclasses
+from collections.abc import Callable
+
+from algokit_client_generator import utils
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.header_comments import generate_header_comments
+from algokit_client_generator.generators.imports import generate_imports
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PackageModule:
+    name: str
+    generate: Callable[[GeneratorContext], DocumentParts]
+    lazy: bool = False
+    """Lazy modules are only imported on first access of one of their symbols"""
+    imports: str = ""
+    """Imports only needed by this module, in addition to the common imports of every module"""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RenderedModule:
+    module: PackageModule
+    source: str
+    defined_names: list[str]
+
+
+def get_defined_names(source: str) -> list[str]:
+    """Get the names of all top level classes, functions and variables in source"""
+    names = []
+    for node in ast.parse(source).body:
+        match node:
+            case ast.ClassDef(name=name) | ast.FunctionDef(name=name):
+                names.append(name)
+            case ast.Assign(targets=targets):
+                names.extend(target.id for target in targets if isinstance(target, ast.Name))
+            case ast.AnnAssign(target=ast.Name(id=name)):
+                names.append(name)
+    return names
+
+
+def get_referenced_names(source: str) -> set[str]:
+    """Get all names referenced in source, including those in string (forward reference) annotations"""
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        match node:
+            case ast.Name(id=name):
+                names.add(name)
+            case ast.Constant(value=str() as value):
+                try:
+                    expression = ast.parse(value, mode="eval")
+                except SyntaxError:
+                    continue
+                names.update(n.id for n in ast.walk(expression) if isinstance(n, ast.Name))
+    return names
+
+
+def _generate_from_import(module_name: str, names: list[str]) -> DocumentParts:
+    yield f"from .{module_name} import ("
+    yield Part.IncIndent
+    for name in names:
+        yield f"{name},"
+    yield Part.DecIndent
+    yield ")"
+
+
+def generate_module(context: GeneratorContext, module: RenderedModule, modules: list[RenderedModule]) -> DocumentParts:
+    """Generate a package module, importing the symbols it references from the other modules of the package
+
+    Symbols from preceding eager modules are imported directly, all others are only imported when type checking
+    and the generated code is responsible for importing them on first use
+    """
+    referenced_names = get_referenced_names(module.source)
+    module_index = modules.index(module)
+    eager_imports: list[tuple[str, list[str]]] = []
+    type_checking_imports: list[tuple[str, list[str]]] = []
+    for index, other in enumerate(modules):
+        names = [name for name in other.defined_names if name in referenced_names]
+        if other is module or not names:
+            continue
+        if index < module_index and not other.module.lazy:
+            eager_imports.append((other.module.name, names))
+        else:
+            type_checking_imports.append((other.module.name, names))
+
+    yield generate_header_comments(context)
+    yield generate_imports(context)
+    if module.module.imports:
+        yield utils.lines(module.module.imports)
+    yield Part.Gap1
+    for module_name, names in eager_imports:
+        yield _generate_from_import(module_name, names)
+    if type_checking_imports:
+        yield "if typing.TYPE_CHECKING:"
+        yield Part.IncIndent
+        for module_name, names in type_checking_imports:
+            yield _generate_from_import(module_name, names)
+        yield Part.DecIndent
+    yield Part.Gap1
+    yield module.source.strip()
+
+
+def generate_package_init(context: GeneratorContext, modules: list[RenderedModule]) -> DocumentParts:
+    """Generate the package __init__, which exposes the public symbols of each module and imports lazy
+    modules on first access of one of their symbols"""
+    public_names = {
+        rendered.module.name: [name for name in rendered.defined_names if not name.startswith("_")]
+        for rendered in modules
+    }
+    lazy_imports = {
+        name: rendered.module.name
+        for rendered in modules
+        if rendered.module.lazy
+        for name in public_names[rendered.module.name]
+    }
+
+    yield generate_header_comments(context)
+    yield utils.lines("""
+import importlib
+import typing
+""")
+    yield Part.Gap1
+    for rendered in modules:
+        if not rendered.module.lazy and public_names[rendered.module.name]:
+            yield _generate_from_import(rendered.module.name, public_names[rendered.module.name])
+    yield Part.Gap1
+    yield "__all__ = ["
+    yield Part.IncIndent
+    for names in public_names.values():
+        for name in names:
+            yield f'"{name}",'
+    yield Part.DecIndent
+    yield "]"
+    yield Part.Gap1
+    yield "# Symbols that are imported from their module on first access"
+    yield "_LAZY_IMPORTS = {"
+    yield Part.IncIndent
+    for name, module_name in lazy_imports.items():
+        yield f'"{name}": ".{module_name}",'
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield utils.indented("""
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_LAZY_IMPORTS]
+""")
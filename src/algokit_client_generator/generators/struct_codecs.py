@@ -0,0 +1,340 @@
+import dataclasses
+import itertools
+from collections.abc import Iterator
+
+import algosdk
+
+from algokit_client_generator import utils
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts
+from algokit_client_generator.spec import ABIStruct, ABIStructField, ContractMethod
+
+# Consecutive bools are packed into a byte, from its most significant bit down
+_BOOLS_PER_BYTE = 8
+# ABI args of method calls after the selector, the args after the 14th are encoded as a tuple in the last app arg
+MAX_APP_ARGS = 15
+# Dynamic values are located by their offset in the head, and strings and byte arrays are prefixed by their length
+_OFFSET_LENGTH = 2
+
+
+def get_struct_to_tuple_name(struct_class_name: str) -> str:
+    """Name of the generated function converting a struct into the tuple expected by the ABI encoder"""
+    return f"_{utils.to_snake_case(struct_class_name)}_to_tuple"
+
+
+def get_struct_from_dict_name(struct_class_name: str) -> str:
+    """Name of the generated function constructing a struct from the dict the app client decodes it into"""
+    return f"_{utils.to_snake_case(struct_class_name)}_from_dict"
+
+
+def get_struct_from_tuple_name(struct_class_name: str) -> str:
+    """Name of the generated function constructing a struct from the tuple decoded by the ABI decoder"""
+    return f"_{utils.to_snake_case(struct_class_name)}_from_tuple"
+
+
+def get_struct_to_bytes_name(struct_class_name: str) -> str:
+    """Name of the generated function encoding a struct into its ABI encoding"""
+    return f"_{utils.to_snake_case(struct_class_name)}_to_bytes"
+
+
+def get_struct_from_bytes_name(struct_class_name: str) -> str:
+    """Name of the generated function constructing a struct from its ABI encoding"""
+    return f"_{utils.to_snake_case(struct_class_name)}_from_bytes"
+
+
+def get_nested_struct(context: GeneratorContext, field: ABIStructField) -> ABIStruct:
+    """Get the struct of a nested struct field, either declared implicitly or referenced by name"""
+    nested_struct = context.structs.get(field.python_type)
+    if nested_struct is None and isinstance(field.abi_type, str):
+        nested_struct = context.structs.get(field.abi_type)
+    if nested_struct is None:
+        nested_struct = next(
+            (s for s in context.structs.values() if s.struct_class_name == field.python_type),
+            None,
+        )
+    if nested_struct is None:
+        raise ValueError(f"Nested struct {field.python_type} not found in context")
+    return nested_struct
+
+
+def get_struct_abi_type(context: GeneratorContext, struct: ABIStruct) -> str:
+    """Get the ABI tuple type a struct is encoded as"""
+    field_types = (
+        get_struct_abi_type(context, get_nested_struct(context, field)) if field.is_nested else str(field.abi_type)
+        for field in struct.fields
+    )
+    return f"({','.join(field_types)})"
+
+
+@dataclasses.dataclass(kw_only=True)
+class _FieldLayout:
+    index: int
+    field: ABIStructField
+    abi_type: algosdk.abi.ABIType
+    type_string: str
+    nested: ABIStruct | None
+    offset: int
+    """Offset of the field's value in the head, or of the offset of its value in the tail for dynamic fields"""
+    bool_mask: int | None = None
+
+    @property
+    def size(self) -> int:
+        return self.abi_type.byte_len()
+
+
+def _get_layouts(context: GeneratorContext, struct: ABIStruct) -> tuple[list[_FieldLayout], int]:
+    """Get the layout of each field in the head of a struct's encoding, along with the length of the head"""
+    layouts = []
+    offset = 0
+    bools_in_byte = 0
+    for index, field in enumerate(struct.fields):
+        nested = get_nested_struct(context, field) if field.is_nested else None
+        type_string = get_struct_abi_type(context, nested) if nested else str(field.abi_type)
+        abi_type = algosdk.abi.ABIType.from_string(type_string)
+        if isinstance(abi_type, algosdk.abi.BoolType):
+            # consecutive bools are packed into a byte
+            if bools_in_byte in (0, _BOOLS_PER_BYTE):
+                bools_in_byte = 0
+                offset += 1
+            bool_mask = 0x80 >> bools_in_byte
+            bools_in_byte += 1
+            layouts.append(
+                _FieldLayout(
+                    index=index,
+                    field=field,
+                    abi_type=abi_type,
+                    type_string=type_string,
+                    nested=nested,
+                    offset=offset - 1,
+                    bool_mask=bool_mask,
+                )
+            )
+            continue
+        bools_in_byte = 0
+        layouts.append(
+            _FieldLayout(
+                index=index, field=field, abi_type=abi_type, type_string=type_string, nested=nested, offset=offset
+            )
+        )
+        offset += _OFFSET_LENGTH if abi_type.is_dynamic() else abi_type.byte_len()
+    return layouts, offset
+
+
+def needs_abi_type_codecs(context: GeneratorContext) -> bool:
+    """Whether any struct or event has fields, or any method args, without a specialized codec, which are encoded with
+    their ABI type"""
+    return any(
+        not _is_specialized(layout)
+        for struct in [*context.structs.values(), *(event.struct for event in context.events)]
+        for layout in _get_layouts(context, struct)[0]
+    ) or any(_needs_abi_type_codecs_for_args(context, method) for method in context.methods.all_abi_methods)
+
+
+def _needs_abi_type_codecs_for_args(context: GeneratorContext, method: ContractMethod) -> bool:
+    assert method.abi
+    struct_class_names = {struct.struct_class_name for struct in context.structs.values()}
+    app_args = [arg for arg in method.abi.args if not algosdk.abi.is_abi_transaction_type(arg.abi_type)]
+    # the args after the 14th are encoded as a tuple when they don't fit in the app args
+    return len(app_args) > MAX_APP_ARGS or any(
+        not is_specialized_type(algosdk.abi.ABIType.from_string(arg.abi_type))
+        for arg in app_args
+        if arg.python_type not in struct_class_names and not algosdk.abi.is_abi_reference_type(arg.abi_type)
+    )
+
+
+def _is_specialized(layout: _FieldLayout) -> bool:
+    return layout.nested is not None or is_specialized_type(layout.abi_type)
+
+
+def is_specialized_type(abi_type: algosdk.abi.ABIType) -> bool:
+    """Whether values of an ABI type are encoded and decoded by specialized expressions rather than their ABI type"""
+    return isinstance(
+        abi_type,
+        algosdk.abi.UintType
+        | algosdk.abi.UfixedType
+        | algosdk.abi.ByteType
+        | algosdk.abi.BoolType
+        | algosdk.abi.AddressType
+        | algosdk.abi.StringType,
+    ) or _is_dynamic_bytes(abi_type)
+
+
+def _is_dynamic_bytes(abi_type: algosdk.abi.ABIType) -> bool:
+    return isinstance(abi_type, algosdk.abi.ArrayDynamicType) and isinstance(abi_type.child_type, algosdk.abi.ByteType)
+
+
+def _is_static_bytes(abi_type: algosdk.abi.ABIType) -> bool:
+    return isinstance(abi_type, algosdk.abi.ArrayStaticType) and isinstance(abi_type.child_type, algosdk.abi.ByteType)
+
+
+def _decode_static(layout: _FieldLayout) -> str:  # noqa: PLR0911
+    """Get the expression decoding a static field from its precomputed offset"""
+    start, end = layout.offset, layout.offset + layout.size
+    abi_type = layout.abi_type
+    if layout.bool_mask is not None:
+        return f"bool(data[{start}] & {layout.bool_mask:#04x})"
+    if layout.nested:
+        return f"{get_struct_from_bytes_name(layout.nested.struct_class_name)}(data[{start}:{end}])"
+    if isinstance(abi_type, algosdk.abi.UintType | algosdk.abi.UfixedType):
+        return f'int.from_bytes(data[{start}:{end}], "big")'
+    if isinstance(abi_type, algosdk.abi.ByteType):
+        return f"data[{start}]"
+    if isinstance(abi_type, algosdk.abi.AddressType):
+        return f"algosdk.encoding.encode_address(data[{start}:{end}])"
+    if _is_static_bytes(abi_type):
+        return f"data[{start}:{end}]"
+    return f'_abi_type("{layout.type_string}").decode(data[{start}:{end}])'
+
+
+def _decode_dynamic(layout: _FieldLayout, value_slice: str) -> str:
+    """Get the expression decoding a dynamic field from its slice of the tail"""
+    if layout.nested:
+        return f"{get_struct_from_bytes_name(layout.nested.struct_class_name)}(data[{value_slice}])"
+    # strings and byte arrays are prefixed by their length, which is checked against the offset of the next field
+    start, _, end = value_slice.partition(":")
+    if isinstance(layout.abi_type, algosdk.abi.StringType):
+        return f"data[{start} + {_OFFSET_LENGTH}:{end}].decode()"
+    if _is_dynamic_bytes(layout.abi_type):
+        return f"data[{start} + {_OFFSET_LENGTH}:{end}]"
+    return f'_abi_type("{layout.type_string}").decode(data[{value_slice}])'
+
+
+def _encode_static(layout: _FieldLayout, value: str) -> str:
+    """Get the expression encoding a static field into its bytes in the head, static byte arrays are encoded by their
+    ABI type, which checks their length"""
+    abi_type = layout.abi_type
+    if layout.nested:
+        return f"{get_struct_to_bytes_name(layout.nested.struct_class_name)}({value})"
+    if isinstance(abi_type, algosdk.abi.UintType | algosdk.abi.UfixedType):
+        return f'{value}.to_bytes({layout.size}, "big")'
+    if isinstance(abi_type, algosdk.abi.ByteType):
+        return f"bytes(({value},))"
+    if isinstance(abi_type, algosdk.abi.AddressType):
+        return f"algosdk.encoding.decode_address({value})"
+    return f'_abi_type("{layout.type_string}").encode({value})'
+
+
+def _encode_dynamic(layout: _FieldLayout, value: str, tail: str) -> list[str]:
+    """Get the statements encoding a dynamic field into its bytes in the tail"""
+    if layout.nested:
+        return [f"{tail} = {get_struct_to_bytes_name(layout.nested.struct_class_name)}({value})"]
+    if isinstance(layout.abi_type, algosdk.abi.StringType):
+        encoded = f"{value}.encode()"
+    elif _is_dynamic_bytes(layout.abi_type):
+        encoded = f"bytes({value})"
+    else:
+        return [f'{tail} = _abi_type("{layout.type_string}").encode({value})']
+    return [f"{tail} = {encoded}", f'{tail} = len({tail}).to_bytes({_OFFSET_LENGTH}, "big") + {tail}']
+
+
+def _get_encoding_checks(dynamic: list[_FieldLayout], head_length: int, starts: dict[int, str]) -> list[str]:
+    """Get the conditions of a valid encoding with dynamic fields: their offsets follow the head in order, within the
+    data, and the length prefixes of strings and byte arrays match the length of their slice"""
+    ends = [*(starts[layout.index] for layout in dynamic[1:]), "len(data)"]
+    checks = [" <= ".join([f"{head_length} == {starts[dynamic[0].index]}", *ends])]
+    for layout, end in zip(dynamic, ends, strict=True):
+        if isinstance(layout.abi_type, algosdk.abi.StringType) or _is_dynamic_bytes(layout.abi_type):
+            start = starts[layout.index]
+            checks.append(
+                f'int.from_bytes(data[{start}:{start} + {_OFFSET_LENGTH}], "big") == {end} - {start} - {_OFFSET_LENGTH}'
+            )
+    return checks
+
+
+def _generate_from_bytes(struct: ABIStruct, layouts: list[_FieldLayout], head_length: int) -> list[str]:
+    dynamic = [layout for layout in layouts if layout.abi_type.is_dynamic()]
+    starts = {layout.index: f"start_{layout.index}" for layout in dynamic}
+    statements = [
+        f'{starts[layout.index]} = int.from_bytes(data[{layout.offset}:{layout.offset + _OFFSET_LENGTH}], "big")'
+        for layout in dynamic
+    ]
+    if dynamic:
+        checks = "\n        and ".join(_get_encoding_checks(dynamic, head_length, starts))
+        statements.append(f"if not (\n        {checks}\n    ):")
+    else:
+        statements.append(f"if len(data) != {head_length}:")
+    statements.append(f'    raise algosdk.error.ABIEncodingError("Invalid ABI encoding of {struct.struct_class_name}")')
+    ends = {layout.index: starts[following.index] for layout, following in itertools.pairwise(dynamic)}
+    field_values = [
+        _decode_dynamic(layout, f"{starts[layout.index]}:{ends.get(layout.index, '')}")
+        if layout.abi_type.is_dynamic()
+        else _decode_static(layout)
+        for layout in layouts
+    ]
+    fields = "".join(
+        f"\n        {layout.field.name}={value}," for layout, value in zip(layouts, field_values, strict=True)
+    )
+    return [*statements, f"return {struct.struct_class_name}({fields}\n    )"]
+
+
+def bytes_literal(value: bytes) -> str:
+    return 'b"' + "".join(f"\\x{byte:02x}" for byte in value) + '"'
+
+
+def _generate_to_bytes(layouts: list[_FieldLayout], head_length: int) -> list[str]:
+    statements: list[str] = []
+    head: list[str] = []
+    tails: list[str] = []
+    # index in the head of the byte each group of bools is packed into
+    bool_bytes: dict[int, int] = {}
+    for layout in layouts:
+        value = f"value.{layout.field.name}"
+        if layout.bool_mask is not None:
+            bit = f"({layout.bool_mask:#04x} if {value} else 0)"
+            if layout.offset in bool_bytes:
+                head[bool_bytes[layout.offset]] += f" | {bit}"
+            else:
+                bool_bytes[layout.offset] = len(head)
+                head.append(bit)
+        elif not layout.abi_type.is_dynamic():
+            head.append(_encode_static(layout, value))
+        else:
+            tail = f"tail_{layout.index}"
+            statements.extend(_encode_dynamic(layout, value, tail))
+            # the offset of the first dynamic value is the length of the head, so is precomputed
+            offsets = " + ".join([str(head_length), *(f"len({t})" for t in tails)])
+            head.append(
+                f'({offsets}).to_bytes({_OFFSET_LENGTH}, "big")'
+                if tails
+                else bytes_literal(head_length.to_bytes(_OFFSET_LENGTH, "big"))
+            )
+            tails.append(tail)
+    for index in bool_bytes.values():
+        head[index] = f"bytes(({head[index]},))"
+    parts = "".join(f"\n        {part}," for part in [*head, *tails])
+    return [*statements, f'return b"".join(({parts}\n    ))']
+
+
+def generate_struct_codecs(context: GeneratorContext, struct: ABIStruct) -> DocumentParts:
+    """Generate functions encoding a struct into its ABI encoding and constructing it from its ABI encoding, with the
+    offsets of its fields in the head of the encoding computed from the spec"""
+    layouts, head_length = _get_layouts(context, struct)
+    to_bytes = "\n    ".join(_generate_to_bytes(layouts, head_length))
+    from_bytes = "\n    ".join(_generate_from_bytes(struct, layouts, head_length))
+    yield utils.indented(f"""
+def {get_struct_to_bytes_name(struct.struct_class_name)}(value: {struct.struct_class_name}) -> bytes:
+    \"\"\"Encode a {struct.struct_class_name} into its ABI encoding\"\"\"
+    {to_bytes}
+
+
+def {get_struct_from_bytes_name(struct.struct_class_name)}(data: bytes) -> {struct.struct_class_name}:
+    \"\"\"Construct a {struct.struct_class_name} from its ABI encoding\"\"\"
+    {from_bytes}
+""")
+
+
+def generate_abi_type_codecs(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the lookup of the ABI types encoding struct fields without a specialized codec"""
+    if not needs_abi_type_codecs(context):
+        return
+    yield utils.indented("""
+# ABI types of struct fields encoded by the generic ABI encoder, parsed on first use
+_ABI_TYPES: dict[str, algosdk.abi.ABIType] = {}
+
+
+def _abi_type(type_string: str) -> algosdk.abi.ABIType:
+    abi_type = _ABI_TYPES.get(type_string)
+    if abi_type is None:
+        abi_type = _ABI_TYPES[type_string] = algosdk.abi.ABIType.from_string(type_string)
+    return abi_type
+""")
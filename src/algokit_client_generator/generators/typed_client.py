@@ -4,10 +4,21 @@ from collections.abc import Generator, Iterator
 from enum import Enum
 
 import algosdk
+from algokit_utils import StorageMap
 
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.app_spec import get_method_indexes
+from algokit_client_generator.generators.decoding import generate_decoding
+from algokit_client_generator.generators.struct_codecs import (
+    generate_abi_type_codecs,
+    generate_struct_codecs,
+    get_struct_from_bytes_name,
+    get_struct_from_dict_name,
+    get_struct_from_tuple_name,
+    get_struct_to_tuple_name,
+)
 from algokit_client_generator.spec import ABIStruct, ContractMethod
 
 APPL_TYPE_TXNS = [algosdk.abi.ABITransactionType.APPL, algosdk.abi.ABITransactionType.ANY]
@@ -48,7 +59,44 @@ OPERATION_TO_METHOD_CALL_PARAMS_TYPE = {
 }
 
 
-def _generate_common_method_params(  # noqa: C901
+def get_args_to_abi_name(method: ContractMethod) -> str:
+    """Name of the generated function converting a method's args into the list expected by the app client"""
+    assert method.abi
+    return f"_{utils.to_snake_case(method.abi.client_method_name)}_args_to_abi"
+
+
+def _get_args_type(context: GeneratorContext, method: ContractMethod) -> str | None:
+    """Get the type of the args accepted by a method, either a tuple or its args dataclass"""
+    if not method.abi or not method.abi.args:
+        return None
+
+    # Track if we've seen an appl arg to make previous txn args optional
+    has_appl_to_right = False
+
+    # Scan args from right to left
+    args_meta = []
+    for arg in reversed(method.abi.args):
+        # Make arg optional if it has default or is a transaction with appl to right
+        is_txn_type = algosdk.abi.is_abi_transaction_type(arg.abi_type)
+        is_appl_type = is_txn_type and arg.abi_type in APPL_TYPE_TXNS
+        is_optional = arg.has_default or (has_appl_to_right and is_txn_type)
+
+        arg_type = arg.python_type
+        if is_optional:
+            arg_type = f"{arg_type} | None"
+        args_meta.append(arg_type)
+
+        if not has_appl_to_right and is_appl_type:
+            has_appl_to_right = True
+
+    # Reverse back to original order
+    args_meta.reverse()
+
+    tuple_type = f"tuple[{', '.join(args_meta)}]"
+    return f"{tuple_type} | {context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
+
+
+def _generate_common_method_params(
     context: GeneratorContext,
     method: ContractMethod,
     property_type: PropertyType,
@@ -58,36 +106,10 @@ def _generate_common_method_params(  # noqa: C901
     if not method.abi:  # Add early return if no ABI
         return "", False
 
-    args_type = None
-    if method.abi.args:
-        # Track if we've seen an appl arg to make previous txn args optional
-        has_appl_to_right = False
-
-        # Scan args from right to left
-        args_meta = []
-        for arg in reversed(method.abi.args):
-            # Make arg optional if it has default or is a transaction with appl to right
-            is_txn_type = algosdk.abi.is_abi_transaction_type(arg.abi_type)
-            is_appl_type = is_txn_type and arg.abi_type in APPL_TYPE_TXNS
-            is_optional = arg.has_default or (has_appl_to_right and is_txn_type)
-
-            arg_type = arg.python_type
-            if is_optional:
-                arg_type = f"{arg_type} | None"
-            args_meta.append(arg_type)
-
-            if not has_appl_to_right and is_appl_type:
-                has_appl_to_right = True
-
-        # Reverse back to original order
-        args_meta.reverse()
-
-        tuple_type = f"tuple[{', '.join(args_meta)}]"
-        args_type = f"{tuple_type} | {context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
-
-        # Make entire args parameter optional if all args have defaults
-        if all(arg.has_default for arg in method.abi.args):
-            args_type = f"{args_type} | None = None"
+    args_type = _get_args_type(context, method)
+    # Make entire args parameter optional if all args have defaults
+    if args_type and all(arg.has_default for arg in method.abi.args):
+        args_type = f"{args_type} | None = None"
 
     # Build parameters list
     params = []
@@ -124,6 +146,68 @@ def {method.abi.client_method_name}(
     return params_def, args_type is not None
 
 
+def get_send_caches(context: GeneratorContext) -> list[str]:
+    """Get the read caches that send classes evict once their transactions are confirmed, the state cache of apps with
+    state and the readonly cache of apps with readonly methods"""
+    return [
+        *(["state_cache"] if has_state_accessors(context) else []),
+        *(["readonly_cache"] if get_readonly_methods(context) else []),
+    ]
+
+
+def _get_cache_params(caches: list[str]) -> str:
+    return ', caches: "_ReadCaches | None" = None' if caches else ""
+
+
+def _get_cache_init(caches: list[str]) -> str:
+    return "\n        self._caches = caches" if caches else ""
+
+
+def _get_cache_slots(caches: list[str]) -> str:
+    return ' "_caches",' if caches else ""
+
+
+def _get_cache_args(caches: list[str]) -> str:
+    return ", self._caches" if caches else ""
+
+
+def get_cache_invalidate(
+    caches: list[str], *, owner: str = "self", result: str = "response", indent: str = "    "
+) -> str:
+    """Get the code evicting the caches once the transactions of result are confirmed"""
+    if not caches:
+        return ""
+    return f"""
+{indent}if {owner}._caches is not None:
+{indent}    {owner}._caches.invalidate({result}.confirmations)"""
+
+
+def generate_read_caches(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the holder of the read caches enabled on a client, which is shared with its sub-clients"""
+    caches = get_send_caches(context)
+    if not caches:
+        return
+    slots = ", ".join(f'"{cache}"' for cache in caches)
+    caches_init = "".join(f'\n        self.{cache}: "_StateCache | None" = None' for cache in caches)
+    caches_invalidate = "".join(
+        f"\n        if self.{cache} is not None:\n            self.{cache}.invalidate(confirmations)"
+        for cache in caches
+    )
+    yield utils.indented(f"""
+class _ReadCaches:
+    \"\"\"The read caches enabled on a client, shared with its sub-clients so a cache enabled after they were created
+    is used by all of them\"\"\"
+
+    __slots__ = ({slots}{"," if len(caches) == 1 else ""})
+
+    def __init__(self) -> None:{caches_init}
+
+    def invalidate(self, confirmations: typing.Iterable[object]) -> None:
+        \"\"\"Evict the enabled caches once transactions with these confirmations are confirmed\"\"\"
+        confirmations = list(confirmations){caches_invalidate}
+""")
+
+
 def _generate_method_body(
     context: GeneratorContext,
     method: ContractMethod,
@@ -133,8 +217,8 @@ def _generate_method_body(
     include_args: bool = False,
 ) -> str:
     """Generate the common method body shared across different generator methods"""
-    body = "    method_args = _parse_abi_args(args)" if include_args else ""
-    body += "\n    params = params or algokit_utils.CommonAppCallParams()"
+    body = f"    method_args = {get_args_to_abi_name(method)}(args)" if include_args else ""
+    body += "\n    params = params or _DEFAULT_PARAMS"
     if operation == "update":
         body += "\n    compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()"
     method_sig = method.abi.method.get_signature() if method.abi else ""
@@ -151,20 +235,20 @@ def _generate_method_body(
         if method.abi and method.abi.result_struct:
             return (
                 f"dataclasses.replace(response, "
-                f"abi_return=_init_dataclass({method.abi.result_struct.struct_class_name}, "
+                f"abi_return={get_struct_from_dict_name(method.abi.result_struct.struct_class_name)}("
                 f"typing.cast(dict, response.abi_return))) # type: ignore"
             )
         return "response"
 
-    call_params = f"""algokit_utils.AppClientMethodCallParams(**{{
-        **dataclasses.asdict(params),
-        "method": "{method_sig}",{
+    call_params = f"""algokit_utils.AppClientMethodCallParams(
+        **_params_fields(params),
+        method="{method_sig}",{
         '''
-        "args": method_args, '''
+        args=method_args,'''
         if include_args
         else ""
     }
-    }})"""
+    )"""
     send_params = ", send_params=send_params" if property_type == PropertyType.SEND else ""
     compilation_params = ", compilation_params=compilation_params" if operation == "update" else ""
 
@@ -172,13 +256,19 @@ def _generate_method_body(
         return f"{body}\n    return self.app_client.params.{operation}({call_params})"
     elif property_type == PropertyType.CREATE_TRANSACTION:
         return f"{body}\n    return self.app_client.create_transaction.{operation}({call_params})"
+    elif operation == "call" and method in get_readonly_methods(context):
+        response_code = f"""
+    response = self._call_readonly({call_params}, send_params)"""
     else:
         response_code = f"""
-    response = self.app_client.send.{operation}({call_params}{send_params}{compilation_params})
+    response = self.app_client.send.{operation}({call_params}{send_params}{compilation_params}){
+            get_cache_invalidate(get_send_caches(context))
+        }"""
+    response_code += f"""
     parsed_response = {parse_struct_if_needed(method)}
     return typing.cast({alogkit_return_type(operation, method)}, parsed_response)
 """
-        return f"{body}{response_code}"
+    return f"{body}{response_code}"
 
 
 def generate_operation_class(
@@ -198,10 +288,13 @@ def generate_operation_class(
     elif property_type == PropertyType.SEND:
         class_name += "Send"
 
+    caches = get_send_caches(context) if property_type == PropertyType.SEND else []
     yield utils.indented(f"""
 class {class_name}:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    __slots__ = ("app_client",{_get_cache_slots(caches)})
+
+    def __init__(self, app_client: algokit_utils.AppClient{_get_cache_params(caches)}):
+        self.app_client = app_client{_get_cache_init(caches)}
 """)
     yield Part.IncIndent
 
@@ -228,11 +321,12 @@ def bare(
     send_params: algokit_utils.SendParams | None = None,
     {"compilation_params: algokit_utils.AppClientCompilationParams | None = None" if operation == "update" else ""}
 ) -> algokit_utils.SendAppTransactionResult:
-    return self.app_client.send.bare.{operation}(
+    response = self.app_client.send.bare.{operation}(
         params=params,
         send_params=send_params,
         {"compilation_params=compilation_params" if operation == "update" else ""}
-    )
+    ){get_cache_invalidate(caches)}
+    return response
 """)
 
     # Generate ABI methods
@@ -260,6 +354,26 @@ def bare(
     return class_name
 
 
+# Transactions in an atomic group are limited by the protocol
+MAX_GROUP_SIZE = 16
+
+
+def get_batch_methods(context: GeneratorContext) -> list[ContractMethod]:
+    """Get the no-op ABI methods that can be sent in batches, i.e. those with args and without transaction args"""
+    return [
+        method
+        for method in context.methods.all_abi_methods
+        if method.abi
+        and "no_op" in method.on_complete
+        and method.abi.args
+        and not any(algosdk.abi.is_abi_transaction_type(arg.abi_type) for arg in method.abi.args)
+    ]
+
+
+def get_batch_send_class_name(context: GeneratorContext) -> str:
+    return f"_{context.contract_name}BatchSend"
+
+
 def _generate_class_methods(
     context: GeneratorContext,
     class_name: str,
@@ -292,14 +406,6 @@ def _generate_class_methods(
                 yield part
             yield Part.Gap2
 
-    # Then generate the main class with properties
-    yield utils.indented(f"""
-class {class_name}:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-""")
-    yield Part.IncIndent
-
     # Generate properties for each operation
     postfix = (
         "Transaction"
@@ -308,24 +414,59 @@ class {class_name}:
         if property_type == PropertyType.SEND
         else ""
     )
+    operation_classes = {
+        operation: operation_class_names.get(
+            operation, f"_{context.contract_name}{context.sanitizer.make_safe_type_identifier(operation)}{postfix}"
+        )
+        for operation, methods in operations.items()
+        if methods
+    }
 
-    for operation, methods in operations.items():
-        if not methods:
-            continue
+    # Calls of the send class can also be sent in batches, by a class generated with the composer
+    if property_type == PropertyType.SEND and get_batch_methods(context):
+        operation_classes["batch"] = get_batch_send_class_name(context)
+
+    # Readonly calls sent by the main class can be cached
+    yield from _generate_readonly_cache_key(context, property_type)
+
+    # Then generate the main class, operation objects are created on first access and cached
+    caches = get_send_caches(context) if property_type == PropertyType.SEND else []
+    # batches are sent by composers of the owning client, which evict its caches
+    has_batch = "batch" in operation_classes
+    slot_names = ["app_client", *(["_caches"] if caches else []), *(["_client"] if has_batch else [])]
+    slots = ", ".join(f'"{name}"' for name in [*slot_names, *(f"_{operation}" for operation in operation_classes)])
+    client_param = f', client: "{context.contract_name}Client | None" = None' if has_batch else ""
+    client_init = "\n        self._client = client" if has_batch else ""
+    yield utils.indented(f"""
+class {class_name}:
+    __slots__ = ({slots}{"," if len(slot_names) + len(operation_classes) == 1 else ""})
 
-        yield Part.Gap1
+    def __init__(self, app_client: algokit_utils.AppClient{_get_cache_params(caches)}{client_param}):
+        self.app_client = app_client{_get_cache_init(caches)}{client_init}
+""")
+    yield Part.IncIndent
+    yield Part.IncIndent
+    for operation, operation_class in operation_classes.items():
+        yield f'self._{operation}: "{operation_class} | None" = None'
+    yield Part.DecIndent
 
-        default_class_name = (
-            f"_{context.contract_name}{context.sanitizer.make_safe_type_identifier(operation)}{postfix}"
+    cache_args, batch_args = _get_cache_args(caches), ", self._client"
+    for operation, operation_class in operation_classes.items():
+        # the batch class is in the composer module, which is only imported on first use
+        batch_import = (
+            f"\n        from .composer import {operation_class}" if context.package and operation == "batch" else ""
         )
-        operation_class = operation_class_names.get(operation, default_class_name)
-
+        yield Part.Gap1
         yield utils.indented(f"""
 @property
 def {operation}(self) -> "{operation_class}":
-    return {operation_class}(self.app_client)
+    if self._{operation} is None:{batch_import}
+        self._{operation} = {operation_class}(self.app_client{batch_args if operation == "batch" else cache_args})
+    return self._{operation}
 """)
 
+    yield from _generate_call_readonly(context, property_type)
+
     # Generate method for each ABI method
     for method in context.methods.all_abi_methods:
         if not method.abi or "no_op" not in method.on_complete:
@@ -356,15 +497,83 @@ def clear_state(
     params: algokit_utils.AppClientBareCallParams | None = None,
     {"send_params: algokit_utils.SendParams | None = None" if property_type == PropertyType.SEND else ""}
 ) -> {CLEAR_STATE_PROPERTY_TO_RETURN_CLASS[property_type]}:
-    return self.app_client.{property_type.value}.bare.clear_state(
+    {"response = " if caches else "return "}self.app_client.{property_type.value}.bare.clear_state(
         params,
         {"send_params=send_params," if property_type == PropertyType.SEND else ""}
-    )
+    ){get_cache_invalidate(caches) + chr(10) + "    return response" if caches else ""}
 """)
 
     yield Part.DecIndent
 
 
+# Reference args are passed to readonly calls by address or id
+_REFERENCE_ARG_TYPES = {
+    algosdk.abi.ABIReferenceType.ACCOUNT: "address",
+    algosdk.abi.ABIReferenceType.ASSET: "uint64",
+    algosdk.abi.ABIReferenceType.APPLICATION: "uint64",
+}
+
+
+def _generate_readonly_cache_key(context: GeneratorContext, property_type: PropertyType) -> Iterator[DocumentParts]:
+    """Generate the function keying readonly calls in the readonly cache, used by the send class"""
+    if property_type != PropertyType.SEND or not get_readonly_methods(context):
+        return
+    yield "# ABI types canonically encoding the args of each readonly method, parsed on first use"
+    yield "_READONLY_ARGS_TYPES = {"
+    yield Part.IncIndent
+    for method in get_readonly_methods(context):
+        assert method.abi
+        arg_types = ",".join(_REFERENCE_ARG_TYPES.get(str(arg.type), str(arg.type)) for arg in method.abi.method.args)
+        yield f'"{method.abi.method.get_signature()}": "({arg_types})",'
+    yield Part.DecIndent
+    yield "}"
+    yield "_READONLY_ARGS_CODECS: dict[str, algosdk.abi.ABIType] = {}"
+    yield Part.Gap2
+    yield utils.indented("""
+def _readonly_cache_key(params: algokit_utils.AppClientMethodCallParams) -> typing.Hashable | None:
+    \"\"\"Key a readonly call by its method signature, canonically encoded args and sender
+
+    Calls with args that can't be encoded, e.g. omitted args filled in with default values by the app client, aren't
+    cached
+    \"\"\"
+    codec = _READONLY_ARGS_CODECS.get(params.method)
+    if codec is None:
+        codec = _READONLY_ARGS_CODECS[params.method] = algosdk.abi.ABIType.from_string(
+            _READONLY_ARGS_TYPES[params.method]
+        )
+    try:
+        encoded_args = codec.encode(params.args or [])
+    except (algosdk.error.ABIEncodingError, IndexError, TypeError, ValueError):
+        return None
+    return params.method, encoded_args, params.sender
+""")
+    yield Part.Gap2
+
+
+def _generate_call_readonly(context: GeneratorContext, property_type: PropertyType) -> Iterator[DocumentParts]:
+    """Generate the method of the send class calling readonly methods through the readonly cache"""
+    if property_type != PropertyType.SEND or not get_readonly_methods(context):
+        return
+    yield Part.Gap1
+    yield utils.indented("""
+def _call_readonly(
+    self, params: algokit_utils.AppClientMethodCallParams, send_params: algokit_utils.SendParams | None
+) -> algokit_utils.SendAppTransactionResult[algokit_utils.Arc56ReturnValueType]:
+    \"\"\"Simulate a readonly call, reusing the result of an earlier call with the same args and sender while it's
+    cached\"\"\"
+    cache = self._caches.readonly_cache if self._caches is not None else None
+    key = _readonly_cache_key(params) if cache is not None else None
+    if cache is None or key is None:
+        return self.app_client.send.call(params, send_params=send_params)
+    return cache.get(
+        key,
+        lambda: self.app_client.send.call(params, send_params=send_params),
+        # readonly calls are simulated against the round the transaction is valid from
+        round_of=lambda response: response.transaction.raw.first_valid_round,
+    )
+""")
+
+
 def generate_structs_for_args(context: GeneratorContext) -> DocumentParts:
     """Generate dataclasses for each method's arguments"""
     for method in context.methods.all_abi_methods:
@@ -391,7 +600,7 @@ def generate_structs_for_args(context: GeneratorContext) -> DocumentParts:
         data_class_name = f"{context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
 
         yield utils.indented(f"""
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class {data_class_name}:
     \"\"\"Dataclass for {method.abi.client_method_name} arguments\"\"\"
 """)
@@ -408,6 +617,46 @@ class {data_class_name}:
         return "{method.abi.method.get_signature()}"
 """
         yield Part.DecIndent
+        yield Part.Gap2
+        yield _generate_args_to_abi(context, method, data_class_name)
+
+
+def _has_tuple_type(abi_type: str) -> bool:
+    """Whether values of an ABI type can contain tuples, which may be passed as structs"""
+    return "(" in abi_type
+
+
+def _generate_args_to_abi(context: GeneratorContext, method: ContractMethod, data_class_name: str) -> DocumentParts:
+    """Generate a function building the positional ABI args for a method from its args dataclass or tuple"""
+    assert method.abi
+    struct_class_names = {struct.struct_class_name for struct in context.structs.values()}
+    args_type = _get_args_type(context, method)
+    if all(arg.has_default for arg in method.abi.args):
+        args_type = f"{args_type} | None"
+    # Struct values are converted to tuples, and structs nested in array or tuple values are converted by the
+    # generic converter, all other values are already in the form expected by the ABI encoder
+    dataclass_args = ", ".join(
+        f"{get_struct_to_tuple_name(arg.python_type)}(args.{arg.name})"
+        if arg.python_type in struct_class_names
+        else f"_convert_dataclass(args.{arg.name})"
+        if _has_tuple_type(arg.abi_type)
+        else f"args.{arg.name}"
+        for arg in method.abi.args
+    )
+    has_struct_args = any(
+        arg.python_type in struct_class_names or _has_tuple_type(arg.abi_type) for arg in method.abi.args
+    )
+    # Tuples of args may be partial (with the app client filling in default values), so fall back to the generic
+    # parser when they may contain structs
+    tuple_args = "_parse_abi_args(args)" if has_struct_args else "[*args] if args else None"
+
+    yield utils.indented(f"""
+def {get_args_to_abi_name(method)}(args: {args_type}) -> list[typing.Any] | None:
+    \"\"\"Convert {method.abi.client_method_name} args into the list of ABI args expected by the app client\"\"\"
+    if isinstance(args, {data_class_name}):
+        return [{dataclass_args}]
+    return {tuple_args}
+""")
 
 
 ## Main app client
@@ -415,9 +664,12 @@ class {data_class_name}:
 
 def generate_class_definition(context: GeneratorContext) -> DocumentParts:
     """Generate the class definition and docstring"""
+    cache_slots = ', "_caches"' if get_send_caches(context) else ""
     yield utils.indented(f"""
 class {context.contract_name}Client:
     \"\"\"Client for interacting with {context.app_spec.name} smart contract\"\"\"
+
+    __slots__ = ("app_client", "_params", "_create_transaction", "_send", "_state"{cache_slots})
 """)
 
 
@@ -444,6 +696,19 @@ def __init__(
 
 def generate_constructor(context: GeneratorContext) -> DocumentParts:
     """Generate the actual constructor implementation"""
+    params_class = f"{context.contract_name}Params"
+    create_transaction_class = f"{context.contract_name}CreateTransactionParams"
+    send_class = f"{context.contract_name}Send"
+    state_class = f"{context.contract_name}State"
+    # state is imported on first use when generating a package
+    state_import = f"from .state import {state_class}\n        " if context.package else ""
+    state_cache = has_state_accessors(context)
+    caches = get_send_caches(context)
+    # the caches are enabled on the holder shared with the sub-clients, so sub-clients already created use them
+    caches_init = "\n    self._caches = _ReadCaches()" if caches else ""
+    state_cache_arg = ", self._caches" if state_cache else ""
+    send_client_arg = ", client=self" if get_batch_methods(context) else ""
+
     yield utils.indented(f"""
 def __init__(
     self,
@@ -475,10 +740,64 @@ def __init__(
     else:
         raise ValueError("Either app_client or algorand and app_id must be provided")
 
-    self.params = {context.contract_name}Params(self.app_client)
-    self.create_transaction = {context.contract_name}CreateTransactionParams(self.app_client)
-    self.send = {context.contract_name}Send(self.app_client)
-    self.state = {context.contract_name}State(self.app_client)
+    # sub-clients are created on first access, as most clients only use some of them
+    self._params: {params_class} | None = None
+    self._create_transaction: {create_transaction_class} | None = None
+    self._send: {send_class} | None = None
+    self._state: "{state_class} | None" = None{caches_init}
+
+@property
+def params(self) -> {params_class}:
+    if self._params is None:
+        self._params = {params_class}(self.app_client)
+    return self._params
+
+@property
+def create_transaction(self) -> {create_transaction_class}:
+    if self._create_transaction is None:
+        self._create_transaction = {create_transaction_class}(self.app_client)
+    return self._create_transaction
+
+@property
+def send(self) -> {send_class}:
+    if self._send is None:
+        self._send = {send_class}(self.app_client{_get_cache_args(caches)}{send_client_arg})
+    return self._send
+
+@property
+def state(self) -> "{state_class}":
+    if self._state is None:
+        {state_import}self._state = {state_class}(self.app_client{state_cache_arg})
+    return self._state
+""")
+    state_cache_import = "from .state import _StateCache\n    " if context.package else ""
+    if state_cache:
+        yield Part.Gap1
+        yield utils.indented(f"""
+def enable_state_cache(self, *, max_entries: int = 1024, ttl: float = 3.0) -> None:
+    \"\"\"Cache the state read through `state`, in an LRU of up to max_entries reads
+
+    Reads are cached for ttl seconds or until a later round is observed (e.g. by a state snapshot), and are evicted
+    when a transaction sent through `send` or `new_group()` is confirmed
+    \"\"\"
+    {state_cache_import}self._caches.state_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+""")
+    if get_readonly_methods(context):
+        yield Part.Gap1
+        yield utils.indented(f"""
+def enable_readonly_cache(self, *, max_entries: int = 256, ttl: float = 60.0) -> None:
+    \"\"\"Cache the results of readonly methods called through `send`, in an LRU of up to max_entries results
+
+    Results are keyed by method, args and sender, and are cached for ttl seconds or until a later round is observed.
+    They're evicted when a transaction sent through `send` or `new_group()` is confirmed, or by
+    `readonly_cache.invalidate()`
+    \"\"\"
+    {state_cache_import}self._caches.readonly_cache = _StateCache(max_entries=max_entries, ttl=ttl)
+
+@property
+def readonly_cache(self) -> "_StateCache | None":
+    \"\"\"The cache of readonly method results with its hit and miss counts, if enabled\"\"\"
+    return self._caches.readonly_cache
 """)
 
 
@@ -641,18 +960,10 @@ def decode_return_value(
     if return_value is None:
         return None
 
-    arc56_method = self.app_spec.get_arc56_method(method)
-    decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-
-    # If method returns a struct, convert the dict to appropriate dataclass
-    if (arc56_method and
-        arc56_method.returns and
-        arc56_method.returns.struct and
-        isinstance(decoded, dict)):
-        struct_class = globals().get(arc56_method.returns.struct)
-        if struct_class:
-            return struct_class(**typing.cast(dict, decoded))
-    return decoded
+    return_decoder = _RETURN_DECODERS.get(method)
+    if return_decoder is None:
+        return return_value.get_arc56_value(self.app_spec.get_arc56_method(method), self.app_spec.structs)
+    return typing.cast({return_union}, _decode_return(return_decoder, return_value, self.app_spec.structs))
 """
 
     # Yield all the overloads first
@@ -668,16 +979,44 @@ def decode_return_value(
 
 def generate_new_group(context: GeneratorContext) -> DocumentParts:
     """Generate new_group method for creating transaction groups"""
+    composer_import = f"\n    from .composer import {context.contract_name}Composer" if context.package else ""
     yield utils.indented(f"""
-def new_group(self) -> "{context.contract_name}Composer":
+def new_group(self) -> "{context.contract_name}Composer":{composer_import}
     return {context.contract_name}Composer(self)
 """)
 
 
+def get_readonly_methods(context: GeneratorContext) -> list[ContractMethod]:
+    """Get the readonly no-op ABI methods that can be simulated in a readonly batch, i.e. those without transaction
+    args"""
+    return [
+        method
+        for method in context.methods.all_abi_methods
+        if method.abi
+        and method.abi.readonly
+        and "no_op" in method.on_complete
+        and not any(algosdk.abi.is_abi_transaction_type(arg.abi_type) for arg in method.abi.args)
+    ]
+
+
+def generate_readonly_batch_method(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate readonly_batch method for simulating readonly calls in groups"""
+    if not get_readonly_methods(context):
+        return
+    batch_class = f"{context.contract_name}ReadonlyBatch"
+    batch_import = f"\n    from .composer import {batch_class}" if context.package else ""
+    yield Part.Gap1
+    yield utils.indented(f"""
+def readonly_batch(self) -> "{batch_class}":{batch_import}
+    return {batch_class}(self)
+""")
+
+
 def generate_structs(context: GeneratorContext) -> DocumentParts:  # noqa: C901
     """Generate struct classes for ABI structs"""
     # Track generated structs by their class name to avoid duplicates
     generated_structs: set[str] = set()
+    yield generate_abi_type_codecs(context)
 
     for method in context.methods.all_abi_methods:
         if not method.abi:
@@ -694,10 +1033,10 @@ def generate_structs(context: GeneratorContext) -> DocumentParts:  # noqa: C901
                         raise ValueError(f"Nested struct {field.python_type} not found in context")
                     # Only generate if we haven't seen this nested struct before
                     if nested_struct.struct_class_name not in generated_structs:
-                        yield Part.Gap1
+                        yield Part.Gap2
                         generated_structs.add(nested_struct.struct_class_name)
                         yield utils.indented(f"""
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class {nested_struct.struct_class_name}:
     \"\"\"Struct for {nested_struct.abi_name}\"\"\"
 """)
@@ -705,14 +1044,20 @@ class {nested_struct.struct_class_name}:
                         for nested_field in nested_struct.fields:
                             yield f"{nested_field.name}: {nested_field.python_type}"
                         yield Part.DecIndent
-                        yield Part.Gap1
+                        yield Part.Gap2
+                        yield _generate_struct_to_tuple(nested_struct)
+                        yield Part.Gap2
+                        yield _generate_struct_from_abi(nested_struct)
+                        yield Part.Gap2
+                        yield generate_struct_codecs(context, nested_struct)
+                        yield Part.Gap2
 
             # Then generate the main struct class if we haven't already
             if struct.struct_class_name not in generated_structs:
-                yield Part.Gap1
+                yield Part.Gap2
                 generated_structs.add(struct.struct_class_name)
                 yield utils.indented(f"""
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class {struct.struct_class_name}:
     \"\"\"Struct for {struct.abi_name}\"\"\"
 """)
@@ -723,6 +1068,65 @@ class {struct.struct_class_name}:
                     else:
                         yield f"{field.name}: {field.python_type}"
                 yield Part.DecIndent
+                yield Part.Gap2
+                yield _generate_struct_to_tuple(struct)
+                yield Part.Gap2
+                yield _generate_struct_from_abi(struct)
+                yield Part.Gap2
+                yield generate_struct_codecs(context, struct)
+
+
+def _generate_struct_to_tuple(struct: ABIStruct) -> DocumentParts:
+    """Generate a function converting a struct into the (nested) tuple expected by the ABI encoder"""
+    # nested struct fields are converted recursively, all other fields are already ABI values
+    fields = "".join(
+        f"{get_struct_to_tuple_name(field.python_type)}(value.{field.name}), "
+        if field.is_nested
+        else f"value.{field.name}, "
+        for field in struct.fields
+    )
+    fields = fields.removesuffix(", ") if len(struct.fields) > 1 else fields.removesuffix(" ")
+    yield utils.indented(f"""
+def {get_struct_to_tuple_name(struct.struct_class_name)}(value: object) -> object:
+    \"\"\"Convert a {struct.struct_class_name} into the tuple expected by the ABI encoder\"\"\"
+    if isinstance(value, {struct.struct_class_name}):
+        return ({fields})
+    return _convert_dataclass(value)
+""")
+
+
+def _generate_struct_from_abi(struct: ABIStruct) -> DocumentParts:
+    """Generate functions constructing a struct from the dict or tuple its ABI value is decoded into"""
+    from_dict_fields = []
+    from_tuple_fields = []
+    for index, field in enumerate(struct.fields):
+        # nested struct fields are constructed recursively when the decoded value has the expected shape
+        if field.is_nested:
+            from_dict_fields.append(
+                f"{field.name}={get_struct_from_dict_name(field.python_type)}(_{field.name}) "
+                f'if isinstance(_{field.name} := data["{field.name}"], dict) else _{field.name}'
+            )
+            from_tuple_fields.append(
+                f"{field.name}={get_struct_from_tuple_name(field.python_type)}(value[{index}]) "
+                f"if isinstance(value[{index}], (tuple, list)) else value[{index}]"
+            )
+        else:
+            from_dict_fields.append(f'{field.name}=data["{field.name}"]')
+            from_tuple_fields.append(f"{field.name}=value[{index}]")
+    from_dict_args = "".join(f"\n        {field}," for field in from_dict_fields)
+    from_tuple_args = "".join(f"\n        {field}," for field in from_tuple_fields)
+    yield utils.indented(f"""
+def {get_struct_from_dict_name(struct.struct_class_name)}(data: dict) -> {struct.struct_class_name}:
+    \"\"\"Construct a {struct.struct_class_name} from the dict the app client decodes it into\"\"\"
+    return {struct.struct_class_name}({from_dict_args}
+    )
+
+
+def {get_struct_from_tuple_name(struct.struct_class_name)}(value: tuple | list) -> {struct.struct_class_name}:
+    \"\"\"Construct a {struct.struct_class_name} from the tuple decoded by the ABI decoder\"\"\"
+    return {struct.struct_class_name}({from_tuple_args}
+    )
+""")
 
 
 def _generate_state_typeddict(
@@ -743,6 +1147,130 @@ class {class_name}(typing.TypedDict):
     yield Part.DecIndent
 
 
+# State types whose keys can all be read from a single response of algod, along with a round
+SNAPSHOT_STATE_TYPES = {"global_state": "GlobalStateSnapshot", "local_state": "LocalStateSnapshot"}
+
+
+def _get_snapshot_fields(keys: dict) -> dict[str, str]:
+    """Get the snapshot field name of each key, keys are named like their state accessor properties"""
+    fields = {}
+    for key_name in keys:
+        field_name = utils.get_method_name(key_name)
+        # the round field of the snapshot takes precedence
+        fields[key_name] = f"{field_name}_" if field_name == "round" else field_name
+    return fields
+
+
+def _generate_state_snapshot_class(
+    state_type: str, keys: dict, class_name: str, structs: dict[str, "ABIStruct"]
+) -> Iterator[DocumentParts]:
+    """Generate an immutable snapshot of the values of every key of a specific state type"""
+    if state_type == "local_state":
+        round_doc = "Round of the ledger the values were read from"
+    else:
+        round_doc = "Latest round before the values were read, they include every transaction confirmed by then"
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class {class_name}:
+    \"\"\"Values of every {state_type} state key read from a single response of algod, along with a round they are
+    at least as recent as\"\"\"
+
+    round: int
+    \"\"\"{round_doc}\"\"\"""")
+    yield Part.IncIndent
+    for key_name, field_name in _get_snapshot_fields(keys).items():
+        python_type = utils.map_abi_type_to_python(keys[key_name].value_type, utils.IOType.OUTPUT, structs)
+        yield f"{field_name}: {python_type}"
+    yield Part.DecIndent
+
+
+def _generate_snapshot_method(context: GeneratorContext, state_type: str, keys: dict) -> DocumentParts:
+    """Generate the method reading every key of a state type from a single response of algod"""
+    if state_type == "local_state":
+        read_state = """
+    app_info = typing.cast(dict, algod.account_application_info(self.address, self.app_client.app_id))
+    current_round = app_info["round"]
+    key_values = app_info.get("app-local-state", {}).get("key-value", [])"""
+    else:
+        # algod doesn't return the round with the app's global state, so it is read just before. The state may be newer
+        # than that round but not older, so a snapshot whose round is at least the confirmed round of a transaction
+        # includes its changes, and the cache only evicts the snapshot early rather than keeping it past its round
+        read_state = """
+    current_round = typing.cast(dict, algod.status())["last-round"]
+    app_info = typing.cast(dict, algod.application_info(self.app_client.app_id))
+    key_values = app_info["params"].get("global-state", [])"""
+    class_name = SNAPSHOT_STATE_TYPES[state_type]
+    yield Part.Gap1
+    yield Part.IncIndent
+    yield utils.indented(f"""
+def snapshot(self) -> {class_name}:
+    \"\"\"Get the current value of every key in {state_type} state, all read from the same response of algod\"\"\"
+    return self._read(("snapshot",), self._read_snapshot, lambda snapshot: snapshot.round)
+
+def _read_snapshot(self) -> {class_name}:
+    algod = self.app_client.algorand.client.algod{read_state}
+    state = {{value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}}
+    return {class_name}(
+        round=current_round,""")
+    yield Part.IncIndent
+    yield Part.IncIndent
+    for key_name, field_name in _get_snapshot_fields(keys).items():
+        key_info = keys[key_name]
+        python_type = utils.map_abi_type_to_python(key_info.value_type, utils.IOType.OUTPUT, context.structs)
+        value_struct = context.structs.get(key_info.value_type)
+        struct_from_bytes = f", {get_struct_from_bytes_name(value_struct.struct_class_name)}" if value_struct else ""
+        yield (
+            f"{field_name}=typing.cast({python_type}, "
+            f'_decode_state_value(state.get("{key_info.key}"), "{key_info.value_type}"{struct_from_bytes})),'
+        )
+    yield Part.DecIndent
+    yield ")"
+    yield Part.DecIndent
+    yield Part.DecIndent
+
+
+def _generate_map_property(  # noqa: PLR0913
+    context: GeneratorContext,
+    state_type: str,
+    map_name: str,
+    map_info: StorageMap,
+    map_decoders: dict[str, str],
+    extra_params: str,
+) -> Iterator[DocumentParts]:
+    """Generate the property accessing a state map, box maps can also be iterated"""
+    key_type = utils.map_abi_type_to_python(map_info.key_type, utils.IOType.INPUT, context.structs)
+    value_type = utils.map_abi_type_to_python(map_info.value_type, utils.IOType.OUTPUT, context.structs)
+    is_box_map = state_type == "box"
+    map_args = [
+        "self.app_client"
+        if is_box_map
+        else f"self.app_client.state.{state_type}{'(self.address)' if extra_params else ''}",
+        f'"{map_name}"',
+        map_decoders.get(map_name, "None"),
+    ]
+    if map_info.key_type in context.structs:
+        key_struct_name = context.structs[map_info.key_type].struct_class_name
+        map_args.append(f"key_to_abi={get_struct_to_tuple_name(key_struct_name)}")
+        if is_box_map:
+            map_args.append(f"key_from_bytes={get_struct_from_bytes_name(key_struct_name)}")
+    map_args.append("cached_read=self._read")
+    map_class = "_BoxMapState" if is_box_map else "_MapState"
+    yield Part.Gap1
+    yield Part.IncIndent
+    yield utils.indented(f"""
+@property
+def {utils.get_method_name(map_name)}(self) -> "{map_class}[{key_type}, {value_type}]":
+    \"\"\"Get values from the {map_name} map in {state_type} state\"\"\"
+    return {map_class}(""")
+    yield Part.IncIndent
+    yield Part.IncIndent
+    yield from (f"{arg}," for arg in map_args)
+    yield Part.DecIndent
+    yield ")"
+    yield Part.DecIndent
+    yield Part.DecIndent
+
+
 def _generate_state_class(  # noqa: PLR0913
     context: GeneratorContext,
     state_type: str,
@@ -754,88 +1282,364 @@ def _generate_state_class(  # noqa: PLR0913
 ) -> Iterator[DocumentParts]:
     """Generate a state access class with typed methods"""
 
-    # Pre-generate the struct mapping for this state type
-    struct_mapping = {}
+    # Constructors of the struct values of each key and map, so values are converted without traversing the spec
+    key_decoders = {
+        key_name: get_struct_from_dict_name(context.structs[key_info.value_type].struct_class_name)
+        for key_name, key_info in keys.items()
+        if key_info.value_type in context.structs
+    }
+    map_decoders = {
+        map_name: get_struct_from_dict_name(context.structs[map_info.value_type].struct_class_name)
+        for map_name, map_info in maps.items()
+        if map_info.value_type in context.structs
+    }
 
-    # Check keys for structs
-    for key_info in keys.values():
-        if key_info.value_type in context.structs:
-            struct_mapping[key_info.value_type] = context.structs[key_info.value_type].struct_class_name
+    # Generate the key mapping as a module level constant, so it is only built once
+    key_decoders_name = f"_{state_type.upper()}_KEY_DECODERS"
+    if key_decoders:
+        yield utils.indented(f"""
+# Mapping of keys with struct values to the function constructing them from their decoded value
+{key_decoders_name}: dict[str, typing.Callable[[dict], typing.Any]] = {{""")
+        yield Part.IncIndent
+        for key_name, struct_from_dict in key_decoders.items():
+            yield f'"{key_name}": {struct_from_dict},'
+        yield Part.DecIndent
+        yield "}"
+        yield Part.Gap2
 
-    # Check maps for structs
-    for map_info in maps.values():
-        if map_info.value_type in context.structs:
-            struct_mapping[map_info.value_type] = context.structs[map_info.value_type].struct_class_name
+    return_type = value_type_name or "dict[str, typing.Any]"
+    if key_decoders:
+        convert_result = f"""
+        if not result:
+            return {"typing.cast(" + value_type_name + ", {})" if value_type_name else "{}"}
 
-    # Generate the struct mapping as a class variable
-    struct_mapping_str = (
-        "{\n            " + ",\n            ".join(f'"{k}": {v}' for k, v in struct_mapping.items()) + "\n        }"
-        if struct_mapping
-        else "{}"
-    )
+        converted = {{}}
+        for key, value in result.items():
+            struct_from_dict = {key_decoders_name}.get(key)
+            converted[key] = struct_from_dict(value) if struct_from_dict and isinstance(value, dict) else value
+        return {"typing.cast(" + value_type_name + ", converted)" if value_type_name else "converted"}"""
+    else:
+        convert_result = f"""
+        return {"typing.cast(" + value_type_name + ", result)" if value_type_name else "result"}"""
 
+    address_init = "\n        self.address = address" if extra_params else ""
+    state_accessor = f"self.app_client.state.{state_type}{'(self.address)' if extra_params else ''}"
     yield utils.indented(f"""
 class {class_name}:
-    def __init__(self, app_client: algokit_utils.AppClient{extra_params}):
-        self.app_client = app_client
-        {"self.address = address" if extra_params else ""}
-        # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {struct_mapping_str}
+    __slots__ = ("app_client",{' "address",' if extra_params else ""} "_caches")
 
-    def get_all(self) -> {value_type_name or "dict[str, typing.Any]"}:
-        \"\"\"Get all current keyed values from {state_type} state\"\"\"
-        result = self.app_client.state.{state_type}{"(self.address)" if extra_params else ""}.get_all()
-        if not result:
-            return {"typing.cast(" + value_type_name + ", {})" if value_type_name else "{}"}
+    def __init__(self, app_client: algokit_utils.AppClient{extra_params}, caches: "_ReadCaches | None" = None):
+        self.app_client = app_client{address_init}
+        self._caches = caches
 
-        converted = {{}}
-        for key, value in result.items():
-            key_info = self.app_client.app_spec.state.keys.{state_type}.get(key)
-            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
-            converted[key] = (
-                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
-                else value
-            )
-        return {"typing.cast(" + value_type_name + ", converted)" if value_type_name else "converted"}
+    def _read(
+        self, key: tuple, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        cache = self._caches.state_cache if self._caches is not None else None
+        if cache is None:
+            return read()
+        return cache.get(("{state_type}",{" self.address," if extra_params else ""} *key), read, round_of)
+
+    def get_all(self) -> {return_type}:
+        \"\"\"Get all current keyed values from {state_type} state\"\"\"
+        result = self._read(("get_all",), {state_accessor}.get_all){convert_result}
 """)
 
+    if keys and state_type in SNAPSHOT_STATE_TYPES:
+        yield _generate_snapshot_method(context, state_type, keys)
+
     # Generate methods for individual keys
     if keys:
         for key_name, key_info in keys.items():
             python_type = utils.map_abi_type_to_python(key_info.value_type, utils.IOType.OUTPUT, context.structs)
+            parse_struct = (
+                f"""
+        if isinstance(value, dict):
+            return {key_decoders[key_name]}(value)"""
+                if key_name in key_decoders
+                else ""
+            )
             yield Part.Gap1
             yield Part.IncIndent
             yield (
                 f"""@property
     def {utils.get_method_name(key_name)}(self) -> {python_type}:
         \"\"\"Get the current value of the {key_name} key in {state_type} state\"\"\"
-        value = self.app_client.state.{state_type}{"(self.address)" if extra_params else ""}.get_value("{key_name}")
-        if isinstance(value, dict) and "{key_info.value_type}" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["{key_info.value_type}"], value)  # type: ignore
+        value = self._read(("key", "{key_name}"), lambda: {state_accessor}.get_value("{key_name}")){parse_struct}
         return typing.cast({python_type}, value)
 """
             )
             yield Part.DecIndent
 
     # Generate methods for maps
-    if maps:
-        for map_name, map_info in maps.items():
-            key_type = utils.map_abi_type_to_python(map_info.key_type, utils.IOType.INPUT, context.structs)
-            value_type = utils.map_abi_type_to_python(map_info.value_type, utils.IOType.OUTPUT, context.structs)
-            is_value_struct = map_info.value_type in context.structs
-            yield Part.Gap1
-            yield Part.IncIndent
-            yield utils.indented(f"""
-@property
-def {utils.get_method_name(map_name)}(self) -> "_MapState[{key_type}, {value_type}]":
-    \"\"\"Get values from the {map_name} map in {state_type} state\"\"\"
-    return _MapState(
-        self.app_client.state.{state_type}{"(self.address)" if extra_params else ""},
-        "{map_name}",
-        {f'self._struct_classes.get("{map_info.value_type}")' if is_value_struct else "None"}
+    for map_name, map_info in maps.items():
+        yield from _generate_map_property(context, state_type, map_name, map_info, map_decoders, extra_params)
+
+
+def _generate_state_snapshots(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate snapshots of the state types that can be read in a single request"""
+    snapshot_keys = {
+        state_type: keys
+        for state_type in SNAPSHOT_STATE_TYPES
+        if (keys := getattr(context.app_spec.state.keys, state_type))
+    }
+    for state_type, keys in snapshot_keys.items():
+        yield from _generate_state_snapshot_class(state_type, keys, SNAPSHOT_STATE_TYPES[state_type], context.structs)
+        yield Part.Gap2
+    if snapshot_keys:
+        yield utils.indented("""
+def _decode_state_value(
+    value: algokit_utils.AppState | None,
+    value_type: str,
+    struct_from_bytes: typing.Callable[[bytes], typing.Any] | None = None,
+) -> typing.Any:
+    \"\"\"Decode a state value read from algod the same way as the app client's state accessors, struct values are
+    constructed directly from their encoding\"\"\"
+    if value is None:
+        return None
+    if not value.value_raw:
+        return value.value
+    if struct_from_bytes is not None:
+        return struct_from_bytes(value.value_raw)
+    return algokit_utils.get_abi_decoded_value(value.value_raw, value_type, APP_SPEC.structs)
+""")
+        yield Part.Gap2
+
+
+def _generate_map_state_classes(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the classes accessing state maps"""
+    maps = context.app_spec.state.maps
+    if not (maps.global_state or maps.local_state or maps.box):
+        return
+
+    yield utils.indented("""
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    \"\"\"Generic class for accessing state maps with strongly typed keys and values\"\"\"
+
+    __slots__ = ("_state_accessor", "_map_name", "_struct_from_dict", "_key_to_abi", "_cached_read")
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                 struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                 *, key_to_abi: typing.Callable[[object], object] | None = None,
+                 cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_from_dict = struct_from_dict
+        self._key_to_abi = key_to_abi
+        self._cached_read = cached_read
+
+    def _cached(self, key: tuple, read: typing.Callable[[], typing.Any]) -> typing.Any:
+        return self._cached_read(("map", self._map_name, *key), read) if self._cached_read else read()
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        \"\"\"Get all current values in the map\"\"\"
+        result = self._cached(("get_map",), lambda: self._state_accessor.get_map(self._map_name))
+        if self._struct_from_dict and result:
+            struct_from_dict = self._struct_from_dict
+            return {k: struct_from_dict(v) if isinstance(v, dict) else v
+                    for k, v in result.items()}
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        \"\"\"Get a value from the map by key\"\"\"
+        return self._read_value(self._key_to_abi(key) if self._key_to_abi else key)
+
+    def get_values(self, keys: typing.Iterable[_KeyType], *, max_workers: int = 8) -> list[_ValueType | None]:
+        \"\"\"Get the values of many keys from the map, reading up to max_workers values concurrently
+
+        Values are returned in the order of keys, with None for keys that aren't in the map
+        \"\"\"
+        # only imported when used, so importing the client stays cheap
+        import concurrent.futures
+
+        key_values = [self._key_to_abi(key) if self._key_to_abi else key for key in keys]
+        if max_workers <= 1 or len(key_values) <= 1:
+            return [self._read_value_or_none(key_value) for key_value in key_values]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(key_values))) as executor:
+            return list(executor.map(self._read_value_or_none, key_values))
+
+    def _read_value(self, key_value: object) -> _ValueType | None:
+        value = self._cached(
+            ("get_value", key_value), lambda: self._state_accessor.get_map_value(self._map_name, key_value)
+        )
+        if value is not None and self._struct_from_dict and isinstance(value, dict):
+            return self._struct_from_dict(value)
+        return typing.cast(_ValueType | None, value)
+
+    def _read_value_or_none(self, key_value: object) -> _ValueType | None:
+        try:
+            return self._read_value(key_value)
+        except algosdk.error.AlgodHTTPError as e:
+            # each box map value is stored in its own box, which doesn't exist for keys that aren't in the map
+            if e.code == 404:
+                return None
+            raise
+""")
+    if maps.box:
+        yield Part.Gap2
+        yield utils.indented("""
+class _BoxMapState(_MapState[_KeyType, _ValueType]):
+    \"\"\"Box map, whose entries can be iterated without reading the whole map into memory\"\"\"
+
+    __slots__ = ("_app_client", "_key_from_bytes")
+
+    def __init__(self, app_client: algokit_utils.AppClient, map_name: str,
+                 struct_from_dict: typing.Callable[[dict], _ValueType] | None = None,
+                 *, key_to_abi: typing.Callable[[object], object] | None = None,
+                 key_from_bytes: typing.Callable[[bytes], _KeyType] | None = None,
+                 cached_read: typing.Callable[[tuple, typing.Callable[[], typing.Any]], typing.Any] | None = None):
+        super().__init__(
+            app_client.state.box, map_name, struct_from_dict, key_to_abi=key_to_abi, cached_read=cached_read
+        )
+        self._app_client = app_client
+        self._key_from_bytes = key_from_bytes
+
+    def iter_items(self, *, prefetch: int = 2, batch_size: int = 16) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        \"\"\"Iterate over the entries of the map, reading values in batches of batch_size
+
+        The box names of the app are listed once, then up to prefetch batches beyond the one being iterated are
+        read in the background, so at most (prefetch + 1) * batch_size values are held in memory. Entries whose box
+        is deleted during iteration are skipped.
+        \"\"\"
+        # only imported when used, so importing the client stays cheap
+        import base64
+        import collections
+        import concurrent.futures
+
+        metadata = self._app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        boxes = typing.cast(dict, self._app_client.algorand.client.algod.application_boxes(self._app_client.app_id))
+        names = (base64.b64decode(box["name"]) for box in boxes["boxes"])
+        encoded_keys = [name[len(prefix):] for name in names if name.startswith(prefix)]
+
+        batch_size = max(batch_size, 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            pending: collections.deque[list[tuple[bytes, concurrent.futures.Future[_ValueType | None]]]] = (
+                collections.deque()
+            )
+            batches = (encoded_keys[i:i + batch_size] for i in range(0, len(encoded_keys), batch_size))
+            for batch in batches:
+                pending.append([(key, executor.submit(self._read_value_or_none, key)) for key in batch])
+                if len(pending) > prefetch:
+                    yield from self._decode_batch(pending.popleft(), metadata.key_type)
+            while pending:
+                yield from self._decode_batch(pending.popleft(), metadata.key_type)
+
+    def _decode_batch(
+        self, batch: list[tuple[bytes, typing.Any]], key_type: str
+    ) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        structs = self._app_client.app_spec.structs
+        for encoded_key, future in batch:
+            value: _ValueType | None = future.result()
+            if value is None:
+                continue
+            if self._key_from_bytes:
+                yield self._key_from_bytes(encoded_key), value
+            else:
+                key = algokit_utils.get_abi_decoded_value(encoded_key, key_type, structs)
+                yield typing.cast(_KeyType, key), value
+""")
+
+
+def has_state_accessors(context: GeneratorContext) -> bool:
+    """Whether the app has any state keys or maps, which are read through the generated state accessors"""
+    state = context.app_spec.state
+    return any(
+        getattr(state.keys, state_type) or getattr(state.maps, state_type)
+        for state_type in ("global_state", "local_state", "box")
     )
+
+
+def _generate_state_cache(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate the cache of state reads and readonly method results, which are enabled per client"""
+    if not get_send_caches(context):
+        return
+    yield utils.indented("""
+_T = typing.TypeVar("_T")
+
+
+class _StateCache:
+    \"\"\"Bounded LRU cache of reads, entries expire after ttl seconds or once a later round is observed\"\"\"
+
+    __slots__ = ("_max_entries", "_ttl", "_clock", "_lock", "_round", "_entries", "hits", "misses")
+
+    def __init__(self, *, max_entries: int, ttl: float):
+        # only imported when the cache is enabled, so importing the client stays cheap
+        import collections
+        import threading
+        import time
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._round = 0
+        self._entries: collections.OrderedDict[typing.Hashable, tuple[typing.Any, float, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: typing.Hashable, read: typing.Callable[[], _T], round_of: typing.Callable[[_T], int] | None = None
+    ) -> _T:
+        \"\"\"Get the result of read cached for key, reading it if there's no current entry
+
+        round_of gets the round that values carrying one are at least as recent as, which is observed
+        \"\"\"
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # keys with unhashable parts, e.g. map keys given as lists, aren't cached
+                self.misses += 1
+                return read()
+            read_round = self._round
+            if entry is not None and entry[1] > self._clock() and entry[2] == read_round:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return typing.cast(_T, entry[0])
+            self.misses += 1
+        value = read()
+        with self._lock:
+            if round_of is not None:
+                value_round = round_of(value)
+                self._observe_round(value_round)
+                read_round = max(read_round, value_round)
+            self._entries[key] = (value, self._clock() + self._ttl, read_round)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def observe_round(self, round_number: int) -> None:
+        \"\"\"Evict every entry if round_number is later than the latest round observed so far\"\"\"
+        with self._lock:
+            self._observe_round(round_number)
+
+    def _observe_round(self, round_number: int) -> None:
+        if round_number > self._round:
+            self._round = round_number
+            self._entries.clear()
+
+    def invalidate(self, confirmations: typing.Iterable[object] = ()) -> None:
+        \"\"\"Evict every entry, as confirmed transactions may have changed the app's state\"\"\"
+        with self._lock:
+            self._entries.clear()
+            for confirmation in confirmations:
+                if isinstance(confirmation, dict):
+                    self._observe_round(confirmation.get("confirmed-round", 0))
 """)
-            yield Part.DecIndent
+    yield Part.Gap2
 
 
 def generate_state_methods(context: GeneratorContext) -> DocumentParts:
@@ -856,37 +1660,62 @@ def generate_state_methods(context: GeneratorContext) -> DocumentParts:
             yield from _generate_state_typeddict(state_type, keys, value_type, context.structs)
             yield Part.Gap1
 
+    yield from _generate_state_snapshots(context)
+
+    yield from _generate_state_cache(context)
+
+    state_accessors = [
+        (state_type, class_name)
+        for state_type, _, class_name, _ in state_configs
+        if getattr(context.app_spec.state.keys, state_type) or getattr(context.app_spec.state.maps, state_type)
+    ]
+    # global and box state accessors are cached, local state accessors are created per address
+    cached_accessors = [
+        (state_type, class_name) for state_type, class_name in state_accessors if state_type != "local_state"
+    ]
+    slot_names = ["app_client", *(["_caches"] if state_accessors else []), *(f"_{s}" for s, _ in cached_accessors)]
+    slots = ", ".join(f'"{name}"' for name in slot_names)
+    cache_param = ', caches: "_ReadCaches | None" = None' if state_accessors else ""
+
     # Generate main state class
     yield utils.indented(f"""
 class {context.contract_name}State:
     \"\"\"Methods to access state for the current {context.app_spec.name} app\"\"\"
 
-    def __init__(self, app_client: algokit_utils.AppClient):
+    __slots__ = ({slots}{"," if not cached_accessors else ""})
+
+    def __init__(self, app_client: algokit_utils.AppClient{cache_param}):
         self.app_client = app_client
 """)
     yield Part.IncIndent
+    yield Part.IncIndent
+    if state_accessors:
+        yield "self._caches = caches"
+    for state_type, class_name in cached_accessors:
+        yield f'self._{state_type}: "{class_name} | None" = None'
+    yield Part.DecIndent
 
     # Generate state accessors
-    for state_type, _, class_name, _ in state_configs:
-        keys = getattr(context.app_spec.state.keys, state_type)
-        maps = getattr(context.app_spec.state.maps, state_type)
-
-        if not keys and not maps:
-            continue
-
+    for state_type, class_name in state_accessors:
         yield Part.Gap1
-        decorator = "@property" if state_type != "local_state" else ""
-        yield utils.indented(f"""
-    {decorator}
-def {state_type.split("_")[0]}{"_state" if state_type != "box" else ""}(
-    self{", address: str" if state_type == "local_state" else ""}
-) -> "{class_name}":
-        \"\"\"Methods to access {state_type} for the current app\"\"\"
-        return {class_name}(self.app_client{", address" if state_type == "local_state" else ""})
+        if state_type == "local_state":
+            yield utils.indented(f"""
+def local_state(self, address: str) -> "{class_name}":
+    \"\"\"Methods to access {state_type} for the current app\"\"\"
+    return {class_name}(self.app_client, address, self._caches)
+""")
+        else:
+            yield utils.indented(f"""
+@property
+def {state_type}(self) -> "{class_name}":
+    \"\"\"Methods to access {state_type} for the current app\"\"\"
+    if self._{state_type} is None:
+        self._{state_type} = {class_name}(self.app_client, self._caches)
+    return self._{state_type}
 """)
 
     yield Part.DecIndent
-    yield Part.Gap1
+    yield Part.Gap2
 
     # Generate state helper classes
     for state_type, value_type, class_name, extra_params in state_configs:
@@ -905,70 +1734,75 @@ def {state_type.split("_")[0]}{"_state" if state_type != "box" else ""}(
             value_type_name=value_type if keys else None,
             extra_params=extra_params,
         )
-        yield Part.Gap1
+        yield Part.Gap2
 
-    # Generate MapState class if needed
-    if any(bool(getattr(context.app_spec.state.maps, t)) for t in ["global_state", "local_state", "box"]):
-        yield utils.indented("""
-_KeyType = typing.TypeVar("_KeyType")
-_ValueType = typing.TypeVar("_ValueType")
+    yield from _generate_map_state_classes(context)
 
-class _AppClientStateMethodsProtocol(typing.Protocol):
-    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
-        ...
-    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
-        ...
 
-class _MapState(typing.Generic[_KeyType, _ValueType]):
-    \"\"\"Generic class for accessing state maps with strongly typed keys and values\"\"\"
+def generate_params_classes(context: GeneratorContext) -> DocumentParts:
+    """Generate the classes for building app call params"""
+    yield from _generate_class_methods(context, f"{context.contract_name}Params", PropertyType.PARAMS)
 
-    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                 struct_class: typing.Type[_ValueType] | None = None):
-        self._state_accessor = state_accessor
-        self._map_name = map_name
-        self._struct_class = struct_class
 
-    def get_map(self) -> dict[_KeyType, _ValueType]:
-        \"\"\"Get all current values in the map\"\"\"
-        result = self._state_accessor.get_map(self._map_name)
-        if self._struct_class and result:
-            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
-                    for k, v in result.items()}  # type: ignore
-        return typing.cast(dict[_KeyType, _ValueType], result or {})
+def generate_create_transaction_classes(context: GeneratorContext) -> DocumentParts:
+    """Generate the classes for creating app call transactions"""
+    yield from _generate_class_methods(
+        context, f"{context.contract_name}CreateTransactionParams", PropertyType.CREATE_TRANSACTION
+    )
 
-    def get_value(self, key: _KeyType) -> _ValueType | None:
-        \"\"\"Get a value from the map by key\"\"\"
-        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
-        value = self._state_accessor.get_map_value(self._map_name, key_value)
-        if value is not None and self._struct_class and isinstance(value, dict):
-            return _init_dataclass(self._struct_class, value)  # type: ignore
-        return typing.cast(_ValueType | None, value)
-""")
 
+def generate_send_classes(context: GeneratorContext) -> DocumentParts:
+    """Generate the classes for sending app calls"""
+    yield from _generate_class_methods(context, f"{context.contract_name}Send", PropertyType.SEND)
 
-def generate_typed_client(context: GeneratorContext) -> DocumentParts:
-    """Generate the complete typed client class"""
 
-    # Generate structs
-    yield Part.Gap2
-    yield generate_structs(context)
+def generate_return_decoders(context: GeneratorContext) -> DocumentParts:
+    """Generate the table used by decode_return_value to look up a method and its struct return value constructor"""
+    method_indexes = get_method_indexes(context)
+    entries = []
+    for method in context.methods.all_abi_methods:
+        if not method.abi:
+            continue
+        signature = method.abi.method.get_signature()
+        result_struct = method.abi.result_struct
+        struct_from_tuple = get_struct_from_tuple_name(result_struct.struct_class_name) if result_struct else "None"
+        decoder = f"(APP_SPEC.methods[{method_indexes[signature]}], {struct_from_tuple})"
+        entries.append(f'"{signature}": {decoder},')
+        if method_indexes.get(method.abi.method.name) == method_indexes[signature]:
+            entries.append(f'"{method.abi.method.name}": {decoder},')
 
-    # Generate supporting classes
-    yield Part.Gap2
-    yield generate_structs_for_args(context)
-    yield Part.Gap2
-    yield from _generate_class_methods(context, f"{context.contract_name}Params", PropertyType.PARAMS)
-    yield Part.Gap2
-    yield from _generate_class_methods(
-        context, f"{context.contract_name}CreateTransactionParams", PropertyType.CREATE_TRANSACTION
-    )
-    yield Part.Gap2
-    yield from _generate_class_methods(context, f"{context.contract_name}Send", PropertyType.SEND)
-    yield Part.Gap2
-    yield generate_state_methods(context)
+    yield utils.indented(f"""
+# An ARC-56 method and the function constructing its struct return value from the tuple decoded by the ABI decoder
+_ReturnDecoder: typing.TypeAlias = tuple[
+    algokit_utils.applications.Method, typing.Callable[[tuple | list], typing.Any] | None
+]
+
+# Mapping of method signatures (and names, when unique) to their return decoder
+_RETURN_DECODERS: dict[str, _ReturnDecoder] = {{{"" if entries else "}"}""")
+    if entries:
+        yield Part.IncIndent
+        yield from entries
+        yield Part.DecIndent
+        yield "}"
     yield Part.Gap2
+    yield utils.indented("""
+def _decode_return(
+    return_decoder: _ReturnDecoder,
+    return_value: algokit_utils.ABIReturn,
+    structs: dict[str, list[algokit_utils.applications.StructField]],
+) -> typing.Any:
+    arc56_method, struct_from_tuple = return_decoder
+    # struct return values are constructed directly from the tuple they're decoded into, rather than from a dict
+    if struct_from_tuple and return_value.decode_error is None and isinstance(return_value.value, tuple | list):
+        return struct_from_tuple(return_value.value)
+    return return_value.get_arc56_value(arc56_method, structs)
+""")
 
-    # Generate main client class
+
+def generate_client_class(context: GeneratorContext) -> DocumentParts:
+    """Generate the main client class"""
+    yield generate_return_decoders(context)
+    yield Part.Gap2
     yield generate_class_definition(context)
     yield Part.Gap1
     yield Part.IncIndent
@@ -983,6 +1817,33 @@ def generate_typed_client(context: GeneratorContext) -> DocumentParts:
     yield generate_clone_method(context)
     yield Part.Gap1
     yield generate_new_group(context)
+    yield generate_readonly_batch_method(context)
     yield Part.Gap1
     yield generate_decode_return_value(context)
     yield Part.DecIndent
+
+
+def generate_typed_client(context: GeneratorContext) -> DocumentParts:
+    """Generate the complete typed client class"""
+
+    # Generate structs
+    yield Part.Gap2
+    yield generate_structs(context)
+
+    # Generate supporting classes
+    yield Part.Gap2
+    yield generate_structs_for_args(context)
+    yield Part.Gap2
+    yield generate_decoding(context)
+    yield Part.Gap2
+    yield generate_params_classes(context)
+    yield Part.Gap2
+    yield generate_create_transaction_classes(context)
+    yield Part.Gap2
+    yield generate_send_classes(context)
+    yield Part.Gap2
+    yield generate_state_methods(context)
+    yield Part.Gap2
+
+    # Generate main client class
+    yield generate_client_class(context)
@@ -5,6 +5,7 @@ from typing import Literal
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.typed_client import get_args_to_abi_name
 from algokit_client_generator.spec import ContractMethod
 
 # Constants
@@ -73,14 +74,12 @@ def _generate_abi_method(context: GeneratorContext, method: ContractMethod, oper
     yield utils.indented(f"""
 {method_params} -> algokit_utils.App{operation.title()}{"MethodCall" if method.abi else ""}Params:
     \"\"\"Creates a new instance using the {method_sig} ABI method\"\"\"
-    params = params or algokit_utils.CommonAppCallCreateParams()
+    params = params or _DEFAULT_CREATE_PARAMS
     return self.app_factory.params.{operation}(
         algokit_utils.AppFactoryCreateMethodCallParams(
-            **{{
-            **dataclasses.asdict(params),
-            "method": "{method_sig}",
-            "args": {"_parse_abi_args(args)" if args_type != "None" else "None"},
-            }}
+            **_params_fields(params),
+            method="{method_sig}",
+            args={f"{get_args_to_abi_name(method)}(args)" if args_type != "None" else "None"},
         ),
         {"compilation_params=compilation_params" if operation == "create" else ""}
     )
@@ -111,14 +110,12 @@ def _generate_abi_send_method(method: ContractMethod, context: GeneratorContext)
     yield utils.indented(f"""
     {method_params} -> tuple[{context.contract_name}Client, algokit_utils.AppFactoryCreateMethodCallResult[{return_type}]]:
         \"\"\"Creates and sends a transaction using the {method.abi.method.get_signature()} ABI method\"\"\"
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         client, result = self.app_factory.send.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
-                **{{
-                **dataclasses.asdict(params),
-                "method": "{method.abi.method.get_signature()}",
-                "args": {"_parse_abi_args(args)" if args_type != "None" else "None"},
-                }}
+                **_params_fields(params),
+                method="{method.abi.method.get_signature()}",
+                args={f"{get_args_to_abi_name(method)}(args)" if args_type != "None" else "None"},
             ),
             send_params=send_params,
             compilation_params=compilation_params
@@ -152,6 +149,8 @@ def _generate_operation_params_class(context: GeneratorContext, operation: str)
 class {class_name}:
     \"\"\"Parameters for '{operation}' operations of {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -162,9 +161,9 @@ class {class_name}:
         {"compilation_params: algokit_utils.AppClientCompilationParams | None = None" if operation == "create" else ""}
     ) -> algokit_utils.App{operation.title()}Params:
         \"\"\"{operation.title()}s an instance using a bare call\"\"\"
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.params.bare.{method_name}(
-            algokit_utils.{bare_params_class}(**dataclasses.asdict(params)),
+            algokit_utils.{bare_params_class}(**_params_fields(params)),
             {"compilation_params=compilation_params" if operation == "create" else ""})
 """)
 
@@ -491,6 +490,8 @@ def generate_factory_params(context: GeneratorContext) -> Iterator[DocumentParts
 class {context.contract_name}FactoryParams:
     \"\"\"Parameters for creating transactions for {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory", "create", "update", "delete")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = {context.contract_name}FactoryCreateParams(app_factory)
@@ -510,6 +511,8 @@ def _generate_factory_create_transaction(context: GeneratorContext) -> Iterator[
 class {context.contract_name}FactoryCreateTransaction:
     \"\"\"Create transactions for {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = {context.contract_name}FactoryCreateTransactionCreate(app_factory)
@@ -522,6 +525,8 @@ def _generate_factory_send(context: GeneratorContext) -> Iterator[DocumentParts]
 class {context.contract_name}FactorySend:
     \"\"\"Send calls to {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory", "create")
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = {context.contract_name}FactorySendCreate(app_factory)
@@ -534,6 +539,8 @@ def _generate_create_transaction_class(context: GeneratorContext) -> Iterator[Do
 class {context.contract_name}FactoryCreateTransactionCreate:
     \"\"\"Create new instances of {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -542,9 +549,9 @@ class {context.contract_name}FactoryCreateTransactionCreate:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
     ) -> Transaction:
         \"\"\"Creates a new instance using a bare call\"\"\"
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
         )
 """)
 
@@ -555,6 +562,8 @@ def _generate_send_class(context: GeneratorContext) -> Iterator[DocumentParts]:
 class {context.contract_name}FactorySendCreate:
     \"\"\"Send create calls to {context.contract_name} contract\"\"\"
 
+    __slots__ = ("app_factory",)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
 
@@ -566,9 +575,9 @@ class {context.contract_name}FactorySendCreate:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
     ) -> tuple[{context.contract_name}Client, algokit_utils.SendAppCreateTransactionResult]:
         \"\"\"Creates a new instance using a bare call\"\"\"
-        params = params or algokit_utils.CommonAppCallCreateParams()
+        params = params or _DEFAULT_CREATE_PARAMS
         result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            algokit_utils.AppFactoryCreateParams(**_params_fields(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
@@ -8,6 +8,7 @@ from pathlib import Path
 from algokit_utils import Arc32Contract, Arc56Contract, CallEnum, CreateEnum, StructField
 from algokit_utils import Method as Arc56Method
 from algosdk.abi import Method
+from algosdk.encoding import checksum
 
 from algokit_client_generator import utils
 
@@ -37,6 +38,15 @@ class ABIStruct:
     fields: list[ABIStructField]
 
 
+@dataclasses.dataclass(kw_only=True)
+class ABIEvent:
+    signature: str
+    selector: bytes
+    """First 4 bytes of the SHA-512/256 hash of the signature, prefixing the logs of the event"""
+    struct: ABIStruct
+    """Struct of the event's args, which are logged as an ABI tuple after the selector"""
+
+
 @dataclasses.dataclass(kw_only=True)
 class ABIContractMethod:
     method: Method
@@ -255,6 +265,40 @@ def get_all_structs(  # noqa: C901
     return dict(sorted(structs.items(), key=lambda x: x[0]))
 
 
+def get_all_events(
+    app_spec: Arc56Contract,
+    structs: dict[str, ABIStruct],
+    used_module_symbols: set[str],
+) -> list[ABIEvent]:
+    """Extract the ARC-28 events emitted by the app, declared by the app spec or any of its methods"""
+    events: dict[str, ABIEvent] = {}
+    for event in [*(app_spec.events or []), *(e for method in app_spec.methods for e in method.events or [])]:
+        signature = f"{event.name}({','.join(arg.type for arg in event.args)})"
+        if signature in events:
+            continue
+        struct_class_name = utils.get_unique_symbol_by_incrementing(
+            used_module_symbols, utils.get_class_name(event.name, "Event")
+        )
+        fields = [
+            process_struct_field(
+                StructField(
+                    name=arg.name or f"arg{idx}",
+                    type=arg.struct if arg.struct in structs else arg.type,
+                ),
+                used_module_symbols,
+                struct_class_name,
+                structs=structs,
+            )
+            for idx, arg in enumerate(event.args)
+        ]
+        events[signature] = ABIEvent(
+            signature=signature,
+            selector=checksum(signature.encode())[:4],  # type: ignore[no-untyped-call]
+            struct=ABIStruct(abi_name=event.name, struct_class_name=struct_class_name, fields=fields),
+        )
+    return list(events.values())
+
+
 def get_contract_methods(
     app_spec: Arc56Contract,
     structs: dict[str, ABIStruct],
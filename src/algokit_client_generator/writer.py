@@ -1,28 +1,156 @@
+import hashlib
+import importlib.metadata
 import logging
 from pathlib import Path
 
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, RenderContext, convert_part
-from algokit_client_generator.generator import generate
+from algokit_client_generator.generator import generate, get_package_modules
+from algokit_client_generator.generators.header_comments import SPEC_HASH_COMMENT
+from algokit_client_generator.generators.package import (
+    RenderedModule,
+    generate_module,
+    generate_package_init,
+    get_defined_names,
+)
 from algokit_client_generator.spec import load_from_json
 
 logger = logging.getLogger(__name__)
 
+# the spec hash is written as part of the header comments, so only the first few lines need to be read
+_SPEC_HASH_MAX_LINE = 10
 
-def generate_client(input_path: Path, output_path: Path, *, preserve_names: bool = False) -> None:
+try:
+    GENERATOR_VERSION = importlib.metadata.version("algokit-client-generator")
+except importlib.metadata.PackageNotFoundError:  # running from a source checkout that isn't installed
+    GENERATOR_VERSION = "0.0.0"
+
+
+def generate_client(
+    input_path: Path,
+    output_path: Path,
+    *,
+    preserve_names: bool = False,
+    package: bool = False,
+    async_client: bool = False,
+) -> None:
     """Given a path to an ARC-32 application.json, output a typed python client
 
     :param Path input_path: Path to an ARC-32 application.json
     :param Path output_path: Path to write a typed python client to
     :param bool preserve_names: Preserve original names for structs and methods
+    :param bool package: Output a package directory with a module for each part of the client instead of a single
+        module, the state, factory and composer modules are only imported when first used
+    :param bool async_client: Also output the asyncio variant of the client, which awaits the calls of the client in a
+        thread pool
     """
     app_spec = load_from_json(input_path)
-    context = GeneratorContext(app_spec, preserve_names=preserve_names)
-    output = render(generate(context))
-    output_path.write_text(output, encoding="utf-8")
-    logger.info(f"Output typed client for {app_spec.name} to {output_path}")
+    context = GeneratorContext(
+        app_spec,
+        preserve_names=preserve_names,
+        spec_hash=get_spec_hash(input_path, preserve_names=preserve_names, package=package, async_client=async_client),
+        package=package,
+        async_client=async_client,
+    )
+    if package:
+        package_path = get_package_path(output_path)
+        package_path.mkdir(parents=True, exist_ok=True)
+        for file_name, output in render_package(context).items():
+            (package_path / file_name).write_text(output, encoding="utf-8")
+        logger.info(f"Output typed client package for {app_spec.name} to {package_path}")
+    else:
+        output_path.write_text(render(generate(context)), encoding="utf-8")
+        logger.info(f"Output typed client for {app_spec.name} to {output_path}")
+
+
+def check_client(  # noqa: PLR0913
+    input_path: Path,
+    output_path: Path,
+    *,
+    preserve_names: bool = False,
+    use_spec_hash: bool = False,
+    package: bool = False,
+    async_client: bool = False,
+) -> bool:
+    """Check if the typed python client at output_path is up-to-date with the given application.json
+
+    Nothing is written to disk, the client is generated in memory and compared to the existing file.
+
+    :param Path input_path: Path to an ARC-32 application.json
+    :param Path output_path: Path of the previously generated typed python client
+    :param bool preserve_names: Preserve original names for structs and methods
+    :param bool use_spec_hash: Skip generation if the spec hash stored in the existing client matches the
+        application.json, the hash also covers the generator version and the options the client was output with
+    :param bool package: The client was output as a package
+    :param bool async_client: The client was output with its asyncio variant
+    :return: True if the existing client matches what would be generated
+    """
+    existing_path = get_package_path(output_path) / "__init__.py" if package else output_path
+    if not existing_path.is_file():
+        return False
+    spec_hash = get_spec_hash(input_path, preserve_names=preserve_names, package=package, async_client=async_client)
+    if use_spec_hash and read_spec_hash(existing_path) == spec_hash:
+        return True
+
+    context = GeneratorContext(
+        load_from_json(input_path),
+        preserve_names=preserve_names,
+        spec_hash=spec_hash,
+        package=package,
+        async_client=async_client,
+    )
+    if not package:
+        return output_path.read_text(encoding="utf-8") == render(generate(context))
+    package_path = get_package_path(output_path)
+    return all(
+        (package_path / file_name).is_file() and (package_path / file_name).read_text(encoding="utf-8") == output
+        for file_name, output in render_package(context).items()
+    )
+
+
+def get_package_path(output_path: Path) -> Path:
+    """The directory a client package is output to, any .py suffix is removed so the package can be imported"""
+    return output_path.with_suffix("") if output_path.suffix == ".py" else output_path
+
+
+def get_spec_hash(
+    input_path: Path, *, preserve_names: bool = False, package: bool = False, async_client: bool = False
+) -> str:
+    """Hash of an application spec file, the generator version and the options that affect the generated output"""
+    spec_hash = hashlib.sha256(input_path.read_bytes())
+    spec_hash.update(f"algokit-client-generator@{GENERATOR_VERSION}".encode())
+    if preserve_names:
+        spec_hash.update(b"preserve_names")
+    if package:
+        spec_hash.update(b"package")
+    if async_client:
+        spec_hash.update(b"async_client")
+    return spec_hash.hexdigest()
+
+
+def read_spec_hash(output_path: Path) -> str | None:
+    """Read the spec hash from the header comments of a previously generated client"""
+    with output_path.open(encoding="utf-8") as output:
+        for line_number, line in enumerate(output):
+            if line_number >= _SPEC_HASH_MAX_LINE:
+                break
+            if line.startswith(SPEC_HASH_COMMENT):
+                return line.removeprefix(SPEC_HASH_COMMENT).strip()
+    return None
 
 
 def render(parts: DocumentParts) -> str:
     context = RenderContext(indent_inc="    ")
     return "".join(convert_part(parts, context))
+
+
+def render_package(context: GeneratorContext) -> dict[str, str]:
+    """Render each module of a client package, keyed by file name"""
+    modules = []
+    for module in get_package_modules(context):
+        source = render(module.generate(context))
+        modules.append(RenderedModule(module=module, source=source, defined_names=get_defined_names(source)))
+
+    outputs = {f"{m.module.name}.py": render(generate_module(context, m, modules)) for m in modules}
+    outputs["__init__.py"] = render(generate_package_init(context, modules))
+    return outputs
@@ -0,0 +1,41 @@
+import types
+import typing
+
+import algokit_utils
+import pytest
+
+from helpers import FakeAppClient, QueuedMethodCalls
+
+
+@pytest.fixture
+def fake_app_client() -> FakeAppClient:
+    """Build a stand-in for an AppClient from the members a test uses, keyed by their dotted path
+    (e.g. `fake_app_client({"send.bare.clear_state": clear_state})`)"""
+
+    def build(members: dict[str, object]) -> algokit_utils.AppClient:
+        app_client = types.SimpleNamespace()
+        for path, value in members.items():
+            *parents, name = path.split(".")
+            owner = app_client
+            for parent in parents:
+                owner = vars(owner).setdefault(parent, types.SimpleNamespace())
+            setattr(owner, name, value)
+        return typing.cast(algokit_utils.AppClient, app_client)
+
+    return build
+
+
+@pytest.fixture
+def queued_method_calls(monkeypatch: pytest.MonkeyPatch) -> QueuedMethodCalls:
+    """Record the method calls queued in each TransactionComposer, so stand-ins for send and simulate can answer them"""
+    queued: QueuedMethodCalls = {}
+    add_app_call_method_call = algokit_utils.TransactionComposer.add_app_call_method_call
+
+    def record(
+        self: algokit_utils.TransactionComposer, params: algokit_utils.AppCallMethodCallParams
+    ) -> algokit_utils.TransactionComposer:
+        queued.setdefault(self, []).append(params)
+        return add_app_call_method_call(self, params)
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "add_app_call_method_call", record)
+    return queued
@@ -0,0 +1,120 @@
+import dataclasses
+import itertools
+import pathlib
+import random
+import types
+import typing
+
+import algokit_utils
+import algosdk
+from algosdk.atomic_transaction_composer import ABIResult
+
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.generators.struct_codecs import get_struct_abi_type
+from algokit_client_generator.utils import to_snake_case
+
+ARTIFACTS = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+CLIENT_MODULES = [
+    ".".join(path.relative_to(ARTIFACTS.parent.parent.parent).with_suffix("").parts)
+    for path in sorted(ARTIFACTS.glob("*/*_client.py"))
+]
+
+# builds a stand-in for an app client from the members a test uses, see the fake_app_client fixture
+FakeAppClient: typing.TypeAlias = typing.Callable[[dict[str, object]], algokit_utils.AppClient]
+# the method calls queued in each composer, see the queued_method_calls fixture
+QueuedMethodCalls: typing.TypeAlias = dict[
+    algokit_utils.TransactionComposer, list[algokit_utils.AppCallMethodCallParams]
+]
+
+
+def build_dataclass(cls: type, values: typing.Iterator[object] | None = None) -> typing.Any:  # noqa: ANN401
+    """Build an instance of a generated dataclass, with nested dataclasses for dataclass fields and unique values for
+    all other fields"""
+    values = values if values is not None else itertools.count()
+    hints = typing.get_type_hints(cls)
+    return cls(
+        **{
+            field.name: build_dataclass(hints[field.name], values)
+            if dataclasses.is_dataclass(hints[field.name])
+            else next(values)
+            for field in dataclasses.fields(cls)
+        }
+    )
+
+
+def get_struct_converters(
+    module: types.ModuleType, suffix: str = "to_tuple"
+) -> list[tuple[typing.Callable[[typing.Any], object], type]]:
+    """Get the generated struct converters (e.g. `_vector_to_tuple` or `_vector_from_dict`) of a client module
+    along with their struct class"""
+    converters = []
+    for value in vars(module).values():
+        if dataclasses.is_dataclass(value) and isinstance(value, type) and value.__module__ == module.__name__:
+            converter = vars(module).get(f"_{to_snake_case(value.__name__)}_{suffix}")
+            if converter is not None:
+                converters.append((converter, value))
+    return converters
+
+
+def get_args_converters(module: types.ModuleType) -> list[tuple[typing.Callable[[object], object], type]]:
+    """Get the generated args converters of a client module along with their args dataclass"""
+    converters = []
+    for name, value in vars(module).items():
+        if name.startswith("_") and name.endswith("_args_to_abi"):
+            args_type = typing.get_type_hints(value)["args"]
+            args_class = next(
+                t for t in typing.get_args(args_type) if isinstance(t, type) and dataclasses.is_dataclass(t)
+            )
+            converters.append((value, args_class))
+    return converters
+
+
+def random_abi_value(abi_type: algosdk.abi.ABIType, rng: random.Random) -> typing.Any:  # noqa: ANN401, PLR0911
+    """Build a random value of an ABI type, as it is decoded by the ABI decoder (byte arrays as lists of ints)"""
+    if isinstance(abi_type, algosdk.abi.TupleType):
+        return [random_abi_value(child, rng) for child in abi_type.child_types]
+    if isinstance(abi_type, algosdk.abi.ArrayStaticType):
+        return [random_abi_value(abi_type.child_type, rng) for _ in range(abi_type.static_length)]
+    if isinstance(abi_type, algosdk.abi.ArrayDynamicType):
+        return [random_abi_value(abi_type.child_type, rng) for _ in range(rng.randint(0, 4))]
+    if isinstance(abi_type, algosdk.abi.UintType | algosdk.abi.UfixedType):
+        return rng.getrandbits(abi_type.bit_size)
+    if isinstance(abi_type, algosdk.abi.ByteType):
+        return rng.getrandbits(8)
+    if isinstance(abi_type, algosdk.abi.BoolType):
+        return bool(rng.getrandbits(1))
+    if isinstance(abi_type, algosdk.abi.AddressType):
+        return algosdk.encoding.encode_address(rng.randbytes(32))  # type: ignore[no-untyped-call]
+    if isinstance(abi_type, algosdk.abi.StringType):
+        return "".join(rng.choice("abcxyz é€😀") for _ in range(rng.randint(0, 8)))
+    raise NotImplementedError(f"No random values for ABI type {abi_type}")
+
+
+def get_struct_codecs(module: types.ModuleType) -> list[tuple[type, algosdk.abi.ABIType]]:
+    """Get the struct classes of a client module that have generated bytes codecs (e.g. `_vector_to_bytes`) along with
+    the ABI type they are encoded as"""
+    context = GeneratorContext(module.APP_SPEC)
+    codecs = []
+    for struct in context.structs.values():
+        struct_class = vars(module).get(struct.struct_class_name)
+        if struct_class is not None and f"_{to_snake_case(struct.struct_class_name)}_to_bytes" in vars(module):
+            codecs.append((struct_class, algosdk.abi.ABIType.from_string(get_struct_abi_type(context, struct))))
+    return codecs
+
+
+def abi_return(method: str | algosdk.abi.Method, value: object) -> algokit_utils.ABIReturn:
+    """Build the return of a method call, as decoded from its logs"""
+    if isinstance(method, str):
+        method = algosdk.abi.Method.from_signature(method)
+    return algokit_utils.ABIReturn(
+        ABIResult(tx_id="", raw_value=b"", return_value=value, decode_error=None, tx_info={}, method=method)
+    )
+
+
+def bytes_to_lists(value: object) -> object:
+    """Convert the bytes in a value to lists of ints, as byte arrays are decoded by the ABI decoder"""
+    if isinstance(value, bytes):
+        return list(value)
+    if isinstance(value, tuple | list):
+        return [bytes_to_lists(v) for v in value]
+    return value
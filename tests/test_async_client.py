@@ -0,0 +1,269 @@
+import asyncio
+import base64
+import concurrent.futures
+import importlib
+import pathlib
+import threading
+import types
+
+import algokit_utils
+import pytest
+from algosdk.constants import ZERO_ADDRESS
+
+from algokit_client_generator import generate_client
+from helpers import ARTIFACTS, FakeAppClient, QueuedMethodCalls, abi_return
+
+
+def _in_pool() -> bool:
+    return threading.current_thread().name.startswith("algokit-client")
+
+
+def test_async_client_fans_out_calls_with_bounded_concurrency(fake_app_client: FakeAppClient) -> None:
+    import time
+
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_async_client import (
+        HelloWorldAsyncClient,
+        HelloWorldClient,
+    )
+
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def call(params: algokit_utils.AppClientMethodCallParams, send_params: object) -> types.SimpleNamespace:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return types.SimpleNamespace(abi_return=params.args)
+
+    client = HelloWorldClient(fake_app_client({"send.call": call}))
+    names = [f"name {i}" for i in range(8)]
+
+    async def fan_out() -> list[object]:
+        async with HelloWorldAsyncClient(client, max_workers=4, max_concurrency=2) as async_client:
+            results = await async_client.map(async_client.send.hello, [(name,) for name in names])
+        return [result.abi_return for result in results]
+
+    # results are returned in the order of the calls, with at most max_concurrency calls in flight
+    assert asyncio.run(fan_out()) == [[name] for name in names]
+    assert max_in_flight[0] == 2
+
+
+def test_async_state_awaits_reads_and_snapshots_in_the_pool(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.state.state_arc56_async_client import (
+        GlobalStateSnapshot,
+        LocalStateSnapshot,
+        StateAsyncClient,
+        StateClient,
+    )
+
+    threads: list[bool] = []
+
+    def get_value(name: str) -> int:
+        threads.append(_in_pool())
+        return 5
+
+    def status() -> dict:
+        threads.append(_in_pool())
+        return {"last-round": 42}
+
+    def application_info(app_id: int) -> dict:
+        key_values = [{"key": base64.b64encode(b"int1").decode(), "value": {"type": 2, "bytes": "", "uint": 5}}]
+        return {"params": {"global-state": key_values}}
+
+    def account_application_info(address: str, app_id: int) -> dict:
+        threads.append(_in_pool())
+        key_values = [{"key": base64.b64encode(b"local_int1").decode(), "value": {"type": 2, "bytes": "", "uint": 7}}]
+        return {"round": 43, "app-local-state": {"key-value": key_values}}
+
+    client = StateClient(
+        fake_app_client(
+            {
+                "app_id": 1,
+                "state.global_state.get_value": get_value,
+                "algorand.client.algod.status": status,
+                "algorand.client.algod.application_info": application_info,
+                "algorand.client.algod.account_application_info": account_application_info,
+            }
+        )
+    )
+
+    async def read() -> tuple[int, GlobalStateSnapshot, LocalStateSnapshot]:
+        async with StateAsyncClient(client, max_workers=2) as async_client:
+            # sub-clients are created once, like those of the sync client
+            assert async_client.state is async_client.state
+            assert async_client.send is async_client.send
+            return (
+                await async_client.state.read(lambda state: state.global_state.int1),
+                await async_client.state.global_state_snapshot(),
+                await async_client.state.local_state_snapshot(ZERO_ADDRESS),
+            )
+
+    value, global_snapshot, local_snapshot = asyncio.run(read())
+
+    assert value == 5
+    assert global_snapshot == GlobalStateSnapshot(
+        round=42,
+        value=None,  # type: ignore[arg-type]
+        bytes1=None,  # type: ignore[arg-type]
+        bytes2=None,  # type: ignore[arg-type]
+        bytes_not_in_snake_case=None,  # type: ignore[arg-type]
+        int1=5,
+        int2=None,  # type: ignore[arg-type]
+    )
+    assert (local_snapshot.round, local_snapshot.local_int1) == (43, 7)
+    assert threads == [True, True, True]
+
+
+def test_async_composer_simulates_and_sends_groups_in_the_pool(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_async_client import (
+        HelloWorldAsyncClient,
+        HelloWorldClient,
+    )
+
+    requests: list[tuple[str, int, bool]] = []
+
+    def respond(request: str, composer: algokit_utils.TransactionComposer) -> types.SimpleNamespace:
+        calls = queued_method_calls.pop(composer)
+        requests.append((request, len(calls), _in_pool()))
+        returns = [abi_return("hello(string)string", f"Hello, {call.args[0]!s}") for call in calls]  # type: ignore[index]
+        return types.SimpleNamespace(returns=returns, confirmations=[])
+
+    def simulate(self: algokit_utils.TransactionComposer, **kwargs: object) -> types.SimpleNamespace:
+        return respond("simulate", self)
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        return respond("send", self)
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "simulate", simulate)
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = HelloWorldClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+
+    async def send_groups() -> tuple[list[object], list[object], list[str]]:
+        async with HelloWorldAsyncClient(client, max_workers=2) as async_client:
+            group = async_client.new_group()
+            group.add.hello(("a",)).hello(("b",))
+            simulated = await group.simulate(skip_signatures=True)
+            group = async_client.new_group()
+            group.add.hello(("c",))
+            sent = await group.send()
+            batch = await async_client.send.batch.hello([("d",), ("e",), ("f",)], group_size=2)
+        return [r.value for r in simulated.returns], [r.value for r in sent.returns], batch
+
+    assert asyncio.run(send_groups()) == (["Hello, a", "Hello, b"], ["Hello, c"], ["Hello, d", "Hello, e", "Hello, f"])
+    # the groups of a batch are sent by threads of the batch, which is awaited in the pool
+    assert requests == [
+        ("simulate", 2, True),
+        ("send", 1, True),
+        ("send", 2, False),
+        ("send", 1, False),
+    ]
+
+
+def test_async_readonly_batch_simulates_queued_calls_in_the_pool(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.state.state_arc56_async_client import StateAsyncClient, StateClient
+
+    threads: list[bool] = []
+
+    def simulate(self: algokit_utils.TransactionComposer, **kwargs: object) -> types.SimpleNamespace:
+        threads.append(_in_pool())
+        calls = queued_method_calls.pop(self)
+        return types.SimpleNamespace(returns=[abi_return(call.method, call.args[0]) for call in calls])  # type: ignore[index]
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "simulate", simulate)
+    client = StateClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+
+    async def simulate_batch() -> tuple[list[object], str]:
+        async with StateAsyncClient(client, max_workers=1) as async_client:
+            batch = async_client.readonly_batch()
+            result = batch.add.call_abi(("a",))
+            batch.add.default_value_int((42,))
+            return await batch.simulate(), result.value
+
+    assert asyncio.run(simulate_batch()) == (["a", 42], "a")
+    assert threads == [True]
+
+
+def test_async_client_only_shuts_down_the_executor_it_created(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_async_client import (
+        HelloWorldAsyncClient,
+        HelloWorldClient,
+    )
+
+    client = HelloWorldClient(fake_app_client({"app_id": 1}))
+
+    async def run(async_client: HelloWorldAsyncClient) -> int:
+        return await async_client.run(lambda: async_client.app_id)
+
+    owning_client = HelloWorldAsyncClient(client, max_workers=1)
+    assert asyncio.run(run(owning_client)) == 1
+    owning_client.close()
+    with pytest.raises(RuntimeError, match="shutdown"):
+        asyncio.run(run(owning_client))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        sharing_client = HelloWorldAsyncClient(client, executor=executor)
+        assert asyncio.run(run(sharing_client)) == 1
+        sharing_client.close()
+        # a shared executor is left running for its other users
+        assert asyncio.run(run(sharing_client)) == 1
+        assert executor.submit(lambda: 2).result() == 2
+
+
+def test_async_client_of_a_package_awaits_calls_in_the_pool(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, fake_app_client: FakeAppClient
+) -> None:
+    generate_client(
+        ARTIFACTS / "structs" / "Structs.arc56.json",
+        tmp_path / "structs_async_package",
+        package=True,
+        async_client=True,
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = importlib.import_module("structs_async_package")
+
+    def call(params: algokit_utils.AppClientMethodCallParams, send_params: object) -> types.SimpleNamespace:
+        return types.SimpleNamespace(
+            abi_return=f"Hello, {params.args[0] if params.args else ''!s}", in_pool=_in_pool(), confirmations=[]
+        )
+
+    def status() -> dict:
+        return {"last-round": 42}
+
+    def application_info(app_id: int) -> dict:
+        return {"params": {"global-state": []}}
+
+    client = package.StructsClient(
+        fake_app_client(
+            {
+                "app_id": 1,
+                "send.call": call,
+                "algorand.client.algod.status": status,
+                "algorand.client.algod.application_info": application_info,
+            }
+        )
+    )
+
+    async def use() -> tuple[object, object]:
+        async with package.StructsAsyncClient(client, max_workers=2) as async_client:
+            assert type(async_client.send).__module__ == "structs_async_package.async_client"
+            return await async_client.send.hello(("World",)), await async_client.state.global_state_snapshot()
+
+    response, snapshot = asyncio.run(use())
+
+    assert (response.abi_return, response.in_pool) == ("Hello, World", True)  # type: ignore[attr-defined]
+    assert snapshot == package.GlobalStateSnapshot(
+        round=42, my_struct=None, my_nested_struct=None, struct_with_name_variations=None
+    )
+    assert type(snapshot).__module__ == "structs_async_package.state"
@@ -0,0 +1,177 @@
+import types
+
+import algokit_utils
+from algosdk.constants import ZERO_ADDRESS
+
+from helpers import FakeAppClient
+
+
+def test_state_cache_evicts_by_size_ttl_and_round() -> None:
+    from examples.smart_contracts.artifacts.structs import structs_arc56_client
+
+    now = 0.0
+    cache = vars(structs_arc56_client)["_StateCache"](max_entries=2, ttl=3.0)
+    cache._clock = lambda: now  # noqa: SLF001
+    reads: list[object] = []
+
+    def read(key: object) -> None:
+        def read_value() -> object:
+            reads.append(key)
+            return key
+
+        assert cache.get(key, read_value) == key
+
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        read(key)
+    # c evicts b, the least recently used entry, then b evicts c
+    assert reads == ["a", "b", "c", "b"]
+
+    reads.clear()
+    now = 3.0
+    read("a")
+    read("a")
+    assert reads == ["a"]
+
+    reads.clear()
+    cache.observe_round(5)
+    read("a")
+    cache.observe_round(4)
+    read("a")
+    assert reads == ["a"]
+
+    reads.clear()
+    cache.invalidate([{"confirmed-round": 9}, b"not a confirmation"])
+    read("a")
+    cache.observe_round(9)
+    read("a")
+    assert reads == ["a"]
+
+    # values carrying the round they were read at are cached at that round, evicting older entries
+    assert cache.get("snapshot", lambda: 12, round_of=lambda value: value) == 12
+    assert cache.get("snapshot", lambda: 13, round_of=lambda value: value) == 12
+    reads.clear()
+    read("a")
+    assert reads == ["a"]
+
+    # keys that can't be hashed are read every time
+    reads.clear()
+    read(("map", ["unhashable"]))
+    read(("map", ["unhashable"]))
+    assert len(reads) == 2
+
+
+def test_state_cache_is_evicted_by_sent_transactions(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import StructsClient, Vector
+
+    reads: list[str] = []
+
+    def get_value(name: str) -> dict:
+        reads.append(name)
+        return {"x": "1", "y": "2"}
+
+    def clear_state(params: object, send_params: object) -> types.SimpleNamespace:
+        return types.SimpleNamespace(confirmations=[{"confirmed-round": 7}])
+
+    client = StructsClient(
+        fake_app_client({"state.global_state.get_value": get_value, "send.bare.clear_state": clear_state})
+    )
+
+    # sub-clients taken before the cache is enabled use it too
+    global_state, send = client.state.global_state, client.send
+    assert global_state.my_struct == Vector(x="1", y="2")
+    client.enable_state_cache()
+    assert global_state.my_struct == Vector(x="1", y="2")
+    assert client.state.global_state.my_struct == Vector(x="1", y="2")
+    assert reads == ["my_struct", "my_struct"]
+
+    send.clear_state()
+
+    assert global_state.my_struct == Vector(x="1", y="2")
+    assert reads == ["my_struct", "my_struct", "my_struct"]
+
+
+def test_readonly_cache_memoizes_results_by_args_and_sender(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.state.state_arc56_client import StateClient
+
+    calls: list[tuple[object, object]] = []
+    first_valid_round = 5
+
+    def call(params: algokit_utils.AppClientMethodCallParams, send_params: object) -> types.SimpleNamespace:
+        calls.append((params.args, params.sender))
+        return types.SimpleNamespace(
+            abi_return=f"{params.args}",
+            transaction=types.SimpleNamespace(raw=types.SimpleNamespace(first_valid_round=first_valid_round)),
+        )
+
+    def clear_state(params: object, send_params: object) -> types.SimpleNamespace:
+        return types.SimpleNamespace(confirmations=[{"confirmed-round": 6}])
+
+    client = StateClient(fake_app_client({"send.call": call, "send.bare.clear_state": clear_state}))
+
+    client.send.call_abi(("a",))
+    client.send.call_abi(("a",))
+    assert len(calls) == 2
+
+    calls.clear()
+    client.enable_readonly_cache(max_entries=8)
+    cache = client.readonly_cache
+    assert cache is not None
+    assert client.send.call_abi(("a",)).abi_return == "['a']"
+    assert client.send.call_abi(("a",)).abi_return == "['a']"
+    client.send.call_abi(("b",))
+    client.send.call_abi(("a",), algokit_utils.CommonAppCallParams(sender=ZERO_ADDRESS))
+    client.send.default_value_int((1,))
+    # args that can't be encoded, e.g. omitted args with default values, aren't cached
+    client.send.default_value_int()
+    client.send.default_value_int()
+    assert calls == [
+        (["a"], None),
+        (["b"], None),
+        (["a"], ZERO_ADDRESS),
+        ([1], None),
+        (None, None),
+        (None, None),
+    ]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    calls.clear()
+    client.send.clear_state()
+    client.send.call_abi(("a",))
+    cache.invalidate()
+    client.send.call_abi(("a",))
+    first_valid_round = 7
+    cache.observe_round(7)
+    client.send.call_abi(("a",))
+    client.send.call_abi(("a",))
+    assert calls == [(["a"], None)] * 3
+
+
+def test_readonly_cache_is_used_by_sub_clients_created_before_it(fake_app_client: FakeAppClient) -> None:
+    import asyncio
+
+    from examples.smart_contracts.artifacts.state.state_arc56_async_client import StateAsyncClient, StateClient
+
+    calls: list[object] = []
+
+    def call(params: algokit_utils.AppClientMethodCallParams, send_params: object) -> types.SimpleNamespace:
+        calls.append(params.args)
+        return types.SimpleNamespace(
+            abi_return=f"{params.args}",
+            transaction=types.SimpleNamespace(raw=types.SimpleNamespace(first_valid_round=1)),
+        )
+
+    client = StateClient(fake_app_client({"send.call": call}))
+    send = client.send
+    async_client = StateAsyncClient(client, max_workers=1)
+
+    client.enable_readonly_cache()
+    send.call_abi(("a",))
+    send.call_abi(("a",))
+
+    async def call_async() -> None:
+        async with async_client:
+            await async_client.send.call_abi(("a",))
+            await async_client.send.call_abi(("b",))
+
+    asyncio.run(call_async())
+    assert calls == [["a"], ["b"]]
@@ -0,0 +1,81 @@
+import pathlib
+import shutil
+
+import pytest
+
+from algokit_client_generator import cli, writer
+from algokit_client_generator.writer import check_client, generate_client, read_spec_hash
+
+ARTIFACTS = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+
+
+@pytest.fixture
+def app_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    app_path = tmp_path / "hello_world"
+    app_path.mkdir()
+    shutil.copy(ARTIFACTS / "hello_world" / "HelloWorld.arc32.json", app_path / "application.json")
+    return app_path
+
+
+def run_cli(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr("sys.argv", ["algokitgen-py", *args])
+    try:
+        cli.main()
+    except SystemExit as ex:
+        return int(ex.code or 0)
+    return 0
+
+
+def test_check_client_detects_changes(app_dir: pathlib.Path) -> None:
+    spec_path = app_dir / "application.json"
+    output_path = app_dir / "client.py"
+    assert not check_client(spec_path, output_path)
+
+    generate_client(spec_path, output_path)
+    assert check_client(spec_path, output_path)
+
+    output_path.write_text(output_path.read_text() + "\n# modified\n")
+    assert not check_client(spec_path, output_path)
+    # the spec hash is unchanged, so the modification is not detected when short-circuiting
+    assert check_client(spec_path, output_path, use_spec_hash=True)
+
+    spec_path.write_text(spec_path.read_text().replace("hello", "goodbye"))
+    assert not check_client(spec_path, output_path, use_spec_hash=True)
+
+
+def test_check_client_detects_generator_changes(monkeypatch: pytest.MonkeyPatch, app_dir: pathlib.Path) -> None:
+    spec_path = app_dir / "application.json"
+    output_path = app_dir / "client.py"
+    monkeypatch.setattr(writer, "GENERATOR_VERSION", "1.0.0")
+    generate_client(spec_path, output_path)
+    assert check_client(spec_path, output_path, use_spec_hash=True)
+
+    monkeypatch.setattr(writer, "GENERATOR_VERSION", "1.1.0")
+    assert not check_client(spec_path, output_path, use_spec_hash=True)
+
+    generate_client(spec_path, output_path, package=True)
+    (writer.get_package_path(output_path) / "__init__.py").write_text(output_path.read_text())
+    assert not check_client(spec_path, output_path, use_spec_hash=True, package=True)
+
+
+def test_check_walk_does_not_write(monkeypatch: pytest.MonkeyPatch, app_dir: pathlib.Path) -> None:
+    output_path = app_dir / "client.py"
+    app_spec = str(app_dir.parent)
+
+    assert run_cli(monkeypatch, "--app_spec", app_spec, "--output", "client.py", "--walk", "--check") == 1
+    assert not output_path.exists()
+
+    assert run_cli(monkeypatch, "--app_spec", app_spec, "--output", "client.py", "--walk") == 0
+    assert read_spec_hash(output_path) is not None
+    assert run_cli(monkeypatch, "--app_spec", app_spec, "--output", "client.py", "--walk", "--check") == 0
+
+
+def test_check_single_file(monkeypatch: pytest.MonkeyPatch, app_dir: pathlib.Path) -> None:
+    spec_path = app_dir / "application.json"
+    output_path = app_dir / "client.py"
+    generate_client(spec_path, output_path)
+    original = output_path.read_text()
+    output_path.write_text(original.replace("HelloWorldClient", "GoodbyeWorldClient"))
+
+    assert run_cli(monkeypatch, "--app_spec", str(spec_path), "--output", str(output_path), "--check") == 1
+    assert "GoodbyeWorldClient" in output_path.read_text()
@@ -0,0 +1,180 @@
+import threading
+import types
+
+import algokit_utils
+import pytest
+from algosdk.constants import ZERO_ADDRESS
+
+from helpers import QueuedMethodCalls, abi_return
+
+
+def test_composer_decodes_returns_of_queued_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import (
+        NestedStruct,
+        RootStruct,
+        StructsClient,
+        Vector,
+    )
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        return types.SimpleNamespace(
+            returns=[
+                # the return of a method call passed as an arg isn't decoded by the composer
+                abi_return("other()(string,string)", ["3", "4"]),
+                # nor is the return of a method of another app with the same name as a queued call
+                abi_return("give_me_root_struct(uint64)(((string,string)))", [[["5", "6"]]]),
+                abi_return("give_me_root_struct()(((string,string)))", [[["1", "2"]]]),
+                abi_return("hello(string)string", "Hello, World"),
+            ],
+            confirmations=[],
+        )
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = StructsClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+
+    result = client.new_group().give_me_root_struct().hello(("World",)).send()
+
+    assert [r.value for r in result.returns] == [
+        ["3", "4"],
+        [[["5", "6"]]],
+        RootStruct(nested=NestedStruct(content=Vector(x="1", y="2"))),
+        "Hello, World",
+    ]
+
+
+def test_send_batch_packs_calls_into_groups_in_order(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client import HelloWorldClient
+
+    group_sizes: list[int] = []
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        calls = queued_method_calls.pop(self)
+        group_sizes.append(len(calls))
+        returns = [abi_return("hello(string)string", f"Hello, {call.args[0] if call.args else ''!s}") for call in calls]
+        return types.SimpleNamespace(returns=returns, confirmations=[])
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = HelloWorldClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+    names = (f"name {i}" for i in range(35))
+
+    results = client.send.batch.hello(((name,) for name in names), max_in_flight=1)
+
+    assert results == [f"Hello, name {i}" for i in range(35)]
+    assert group_sizes == [16, 16, 3]
+    with pytest.raises(ValueError, match="group_size"):
+        client.send.batch.hello([("a",)], group_size=17)
+
+
+def test_send_batch_pipelines_groups(monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls) -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client import HelloWorldClient
+
+    # each pair of groups is only sent once both are in flight
+    in_flight = threading.Barrier(2, timeout=5)
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        calls = queued_method_calls.pop(self)
+        in_flight.wait()
+        returns = [abi_return("hello(string)string", f"Hello, {call.args[0] if call.args else ''!s}") for call in calls]
+        return types.SimpleNamespace(returns=returns, confirmations=[])
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = HelloWorldClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+
+    results = client.send.batch.hello([(f"name {i}",) for i in range(8)], group_size=2, max_in_flight=2)
+
+    assert results == [f"Hello, name {i}" for i in range(8)]
+
+
+def test_send_batch_stops_sending_after_a_failed_group(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client import HelloWorldClient
+
+    sent_groups: set[int] = set()
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        group = int(str(queued_method_calls.pop(self)[0].args[0]))  # type: ignore[index]
+        sent_groups.add(group)
+        if group == 1:
+            raise RuntimeError("group 1 failed")
+        return types.SimpleNamespace(returns=[abi_return("hello(string)string", "")], confirmations=[])
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = HelloWorldClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+
+    with pytest.raises(RuntimeError, match="group 1 failed"):
+        client.send.batch.hello([(str(i),) for i in range(6)], group_size=1, max_in_flight=2)
+
+    # the group after the failed group was already in flight when the failure was collected
+    assert sent_groups == {0, 1, 2}
+
+
+def test_readonly_batch_simulates_calls_in_groups(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.state.state_arc56_client import StateClient
+
+    simulations: list[dict[str, object]] = []
+
+    def simulate(self: algokit_utils.TransactionComposer, **kwargs: object) -> types.SimpleNamespace:
+        calls = queued_method_calls.pop(self)
+        simulations.append({"calls": len(calls), **kwargs})
+        returns = [abi_return(call.method, call.args[0] if call.args else None) for call in calls]
+        return types.SimpleNamespace(returns=returns)
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "simulate", simulate)
+    client = StateClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+    batch = client.readonly_batch()
+    strings = [batch.call_abi((f"value {i}",)) for i in range(20)]
+    number = batch.default_value_int((42,))
+
+    with pytest.raises(RuntimeError, match="simulate"):
+        _ = number.value
+    values = batch.simulate()
+
+    assert values == [*(f"value {i}" for i in range(20)), 42]
+    assert [result.value for result in strings] == [f"value {i}" for i in range(20)]
+    assert number.value == 42
+    assert [simulation["calls"] for simulation in simulations] == [16, 5]
+    assert all(simulation["skip_signatures"] and simulation["allow_empty_signatures"] for simulation in simulations)
+    # queued calls are cleared once simulated
+    assert batch.simulate() == []
+
+
+def test_send_batch_evicts_the_caches_of_its_client(
+    monkeypatch: pytest.MonkeyPatch, queued_method_calls: QueuedMethodCalls
+) -> None:
+    from examples.smart_contracts.artifacts.state.state_arc56_client import StateClient
+
+    def send(self: algokit_utils.TransactionComposer, params: object = None) -> types.SimpleNamespace:
+        calls = queued_method_calls.pop(self)
+        returns = [abi_return("call_abi(string)string", f"Hello, {call.args[0]!s}") for call in calls]  # type: ignore[index]
+        return types.SimpleNamespace(returns=returns, confirmations=[{"confirmed-round": 6}])
+
+    monkeypatch.setattr(algokit_utils.TransactionComposer, "send", send)
+    client = StateClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+    client.enable_readonly_cache()
+    cache = client.readonly_cache
+    assert cache is not None
+    assert cache.get("key", lambda: "read before the batch") == "read before the batch"
+
+    results = client.send.batch.call_abi([("a",), ("b",)], group_size=1)
+
+    assert results == ["Hello, a", "Hello, b"]
+    # the groups are sent by composers of the client, so confirming them evicts its caches
+    assert client.send.batch.client is client
+    assert cache.get("key", lambda: "read after the batch") == "read after the batch"
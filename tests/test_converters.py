@@ -0,0 +1,130 @@
+import dataclasses
+import importlib
+
+import algokit_utils
+import pytest
+from algosdk.atomic_transaction_composer import EmptySigner
+from algosdk.constants import ZERO_ADDRESS
+
+from helpers import CLIENT_MODULES, abi_return, build_dataclass, get_args_converters, get_struct_converters
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_struct_converters_match_generic_conversion(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    convert_dataclass = vars(module)["_convert_dataclass"]
+    for to_tuple, struct_class in get_struct_converters(module):
+        value = build_dataclass(struct_class)
+        assert to_tuple(value) == convert_dataclass(value)
+        # values that are already tuples are passed through
+        assert to_tuple(convert_dataclass(value)) == convert_dataclass(value)
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_struct_constructors_round_trip(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    convert_dataclass = vars(module)["_convert_dataclass"]
+    for from_dict, struct_class in get_struct_converters(module, "from_dict"):
+        value = build_dataclass(struct_class)
+        assert from_dict(dataclasses.asdict(value)) == value
+    for from_tuple, struct_class in get_struct_converters(module, "from_tuple"):
+        value = build_dataclass(struct_class)
+        assert from_tuple(convert_dataclass(value)) == value
+        assert from_tuple(list(convert_dataclass(value))) == value
+
+
+def test_struct_constructors_require_every_field() -> None:
+    from examples.smart_contracts.artifacts.structs import structs_arc56_client
+
+    vector_from_dict = vars(structs_arc56_client)["_vector_from_dict"]
+    root_struct_from_dict = vars(structs_arc56_client)["_root_struct_from_dict"]
+
+    # decoded struct values always contain every field, so a missing field is an error rather than None
+    with pytest.raises(KeyError, match="y"):
+        vector_from_dict({"x": "1"})
+    with pytest.raises(KeyError, match="content"):
+        root_struct_from_dict({"nested": {}})
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_args_converters_match_parse_abi_args(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    parse_abi_args = vars(module)["_parse_abi_args"]
+    for to_abi, args_class in get_args_converters(module):
+        args = build_dataclass(args_class)
+        assert to_abi(args) == parse_abi_args(args)
+        args_tuple = tuple(getattr(args, field.name) for field in dataclasses.fields(args_class))
+        assert to_abi(args_tuple) == parse_abi_args(args_tuple)
+        # partial tuples are passed on, so the app client can fill in default values
+        assert to_abi(args_tuple[:1]) == parse_abi_args(args_tuple[:1])
+
+
+def test_args_converters_convert_structs_nested_in_array_args() -> None:
+    from examples.smart_contracts.artifacts.zero_coupon_bond import zero_coupon_bond_arc56_client
+    from examples.smart_contracts.artifacts.zero_coupon_bond.zero_coupon_bond_arc56_client import AssetConfigArgs
+
+    @dataclasses.dataclass(frozen=True)
+    class TimePeriod:
+        start: int
+        end: int
+
+    to_abi = vars(zero_coupon_bond_arc56_client)["_asset_config_args_to_abi"]
+    args = AssetConfigArgs(
+        denomination_asset_id=1,
+        settlement_asset_id=2,
+        principal=3,
+        minimum_denomination=4,
+        day_count_convention=5,
+        interest_rate=6,
+        coupon_rates=[7],
+        time_events=[8],
+        time_periods=[TimePeriod(9, 10)],  # type: ignore[list-item]
+    )
+    args_tuple = tuple(getattr(args, field.name) for field in dataclasses.fields(AssetConfigArgs))
+
+    assert to_abi(args) == to_abi(args_tuple) == [1, 2, 3, 4, 5, 6, [7], [8], [(9, 10)]]
+
+
+def test_params_are_passed_without_deep_copying() -> None:
+    from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client import HelloWorldClient
+
+    client = HelloWorldClient(
+        algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=ZERO_ADDRESS
+    )
+    signer = EmptySigner()
+    box_reference = algokit_utils.BoxReference(app_id=0, name=b"box")
+    params = algokit_utils.CommonAppCallParams(signer=signer, note=b"note", box_references=[box_reference])
+
+    call_params = client.params.hello(("World",), params=params)
+
+    assert call_params.signer is signer
+    assert call_params.box_references == [box_reference]
+    assert call_params.note == b"note"
+    assert call_params.args == ["World"]
+
+
+@pytest.mark.parametrize(
+    "method", ["give_me_struct_with_name_variations()(string,string,string)", "give_me_struct_with_name_variations"]
+)
+def test_decode_return_value_constructs_renamed_structs(method: str) -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import (
+        StructsClient,
+        StructWithNameVariations,
+    )
+
+    client = StructsClient(algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1)
+    return_value = abi_return("give_me_struct_with_name_variations()(string,string,string)", ["a", "b", "c"])
+
+    decoded: object = client.decode_return_value(method, return_value)
+    assert decoded == StructWithNameVariations("a", "b", "c")
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_app_spec_resolves_methods_like_arc56_contract(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    plain_app_spec = algokit_utils.Arc56Contract.from_json(vars(module)["_APP_SPEC_JSON"])
+    for method_name_or_signature in vars(module)["_METHOD_INDEXES"]:
+        assert module.APP_SPEC.get_arc56_method(method_name_or_signature) == plain_app_spec.get_arc56_method(
+            method_name_or_signature
+        )
+    assert vars(module.APP_SPEC) == vars(plain_app_spec)
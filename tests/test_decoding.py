@@ -0,0 +1,315 @@
+import base64
+import dataclasses
+import functools
+import importlib
+import json
+import pathlib
+import random
+import types
+import typing
+
+import algokit_utils
+import algosdk
+import pytest
+from algosdk.constants import ZERO_ADDRESS
+
+from algokit_client_generator.context import GeneratorContext
+from helpers import CLIENT_MODULES, bytes_to_lists, get_args_converters, random_abi_value
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "examples.smart_contracts.artifacts.nfd.nfd_arc56_client",
+        "examples.smart_contracts.artifacts.reti.reti_arc56_client",
+    ],
+)
+def test_decode_events_by_selector(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    rng = random.Random(module_name)
+    events = GeneratorContext(module.APP_SPEC).events
+    assert events
+    logs, expected = [], []
+    for event in events:
+        abi_type = algosdk.abi.ABIType.from_string(event.signature[event.signature.index("(") :])
+        # ARC-28 selectors hash the signature of the event, which has no return type
+        selector = algosdk.encoding.checksum(event.signature.encode())[:4]  # type: ignore[no-untyped-call]
+        value = random_abi_value(abi_type, rng)
+        logs.append(selector + abi_type.encode(value))
+        expected.append(vars(module)[event.struct.struct_class_name](*value))
+        assert module.decode_event(logs[-1]) == expected[-1]
+    # logs that aren't events of the app, e.g. the return value of a method, are skipped
+    logs.insert(1, b"\x15\x1f\x7c\x75" + bytes(8))
+    assert module.decode_event(logs[1]) is None
+    assert module.decode_events(logs) == expected
+    result: algokit_utils.SendAppTransactionResult = algokit_utils.SendAppTransactionResult(
+        transaction=None,  # type: ignore[arg-type]
+        confirmation={"logs": [base64.b64encode(log).decode() for log in logs]},
+        group_id="",
+        tx_ids=[],
+        transactions=[],
+        confirmations=[],
+    )
+    assert module.decode_events(result) == expected
+
+
+def test_decode_events_skips_logs_that_are_not_encodings_of_their_event() -> None:
+    from examples.smart_contracts.artifacts.nfd.nfd_arc56_client import (
+        NfdSaleCancelledEvent,
+        decode_event,
+        decode_events,
+    )
+
+    selector = algosdk.encoding.checksum(b"nfd_saleCancelled(uint64,string)")[:4]  # type: ignore[no-untyped-call]
+    log = selector + algosdk.abi.ABIType.from_string("(uint64,string)").encode([1, "abcdef"])
+    malformed_logs = [
+        selector + b"\x00",
+        log + b"\x00",
+        log[:-1],
+        # the name is prefixed with a length of 1 rather than 6
+        log[:14] + b"\x00\x01" + log[16:],
+        # the name isn't UTF-8
+        log[:-1] + b"\xff",
+    ]
+
+    for malformed_log in malformed_logs:
+        with pytest.raises(algosdk.error.ABIEncodingError):
+            decode_event(malformed_log)
+    assert decode_events([*malformed_logs, log]) == [NfdSaleCancelledEvent(appId=1, name="abcdef")]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_extract_app_calls_from_blocks_and_indexer_transactions(max_workers: int | None) -> None:
+    from examples.smart_contracts.artifacts.nfd.nfd_arc56_client import (
+        CancelSaleArgs,
+        NfdInstanceAppCall,
+        NfdOfferForSaleEvent,
+        NfdPurchasedEvent,
+        NfdSaleCancelledEvent,
+        OfferForSaleArgs,
+        PurchaseArgs,
+        extract_app_calls,
+    )
+
+    # a block of algod and the page of indexer transactions of app 1012 in it: a purchase paid by the preceding payment
+    # of its group, an offer for sale, a bare opt-in, a call of app 1020 cancelling the sale by an inner call of the
+    # app, and a call with a string arg that is not UTF-8
+    block = (FIXTURES / "nfd_block.msgpack").read_bytes()
+    page = (FIXTURES / "nfd_indexer_transactions.json").read_text()
+    purchase, offer, opt_in, outer, malformed = json.loads(page)["transactions"]
+    buyer, seller, owner = purchase["sender"], offer["sender"], opt_in["sender"]
+    purchase_selector = algosdk.abi.Method.from_signature("purchase(pay)void").get_selector()
+    cancel_selector = algosdk.abi.Method.from_signature("cancelSale()void").get_selector()
+    purchased = NfdPurchasedEvent(
+        appId=1012,
+        name="silvio.algo",
+        seller=seller,
+        buyer=buyer,
+        sellAmount=5_000_000,
+        offerAmount=5_000_000,
+        overpaymentRefund=0,
+        convFeeAddr=owner,
+        convFeeAmount=250_000,
+    )
+    offered = NfdOfferForSaleEvent(appId=1012, name="silvio.algo", seller=seller, amount=5_000_000, reservedFor=buyer)
+    offer_args = OfferForSaleArgs(sellAmount=5_000_000, reservedFor=buyer)
+    cancelled = NfdSaleCancelledEvent(appId=1012, name="silvio.algo")
+
+    offer_app_args = [base64.b64decode(arg) for arg in offer["application-transaction"]["application-args"]]
+    malformed_app_args = [base64.b64decode(arg) for arg in malformed["application-transaction"]["application-args"]]
+    inner_sender = algosdk.logic.get_application_address(1020)
+
+    def expected(tx_ids: list[str | None], purchase_args: PurchaseArgs | None) -> list[NfdInstanceAppCall]:
+        app_call = functools.partial(NfdInstanceAppCall, confirmed_round=5123)
+        return [
+            app_call(
+                tx_id=tx_ids[0],
+                sender=buyer,
+                method="purchase(pay)void",
+                app_args=[purchase_selector],
+                args=purchase_args,
+                events=[purchased],
+            ),
+            app_call(
+                tx_id=tx_ids[1],
+                sender=seller,
+                method="offerForSale(uint64,address)void",
+                app_args=offer_app_args,
+                args=offer_args,
+                events=[offered],
+            ),
+            app_call(tx_id=tx_ids[2], sender=owner, method=None, app_args=[], args=None, events=[]),
+            # inner calls have the ID of their outer transaction
+            app_call(
+                tx_id=tx_ids[3],
+                sender=inner_sender,
+                method="cancelSale()void",
+                app_args=[cancel_selector],
+                args=CancelSaleArgs(),
+                events=[cancelled],
+            ),
+            app_call(
+                tx_id=tx_ids[4],
+                sender=owner,
+                method="updateSegmentCount(string,uint64)void",
+                app_args=malformed_app_args,
+                args=None,
+                events=[],
+            ),
+        ]
+
+    indexer_tx_ids: list[str | None] = [
+        transaction["id"] for transaction in (purchase, offer, opt_in, outer, malformed)
+    ]
+    items = [block, page, json.loads(page), offer] * 2
+
+    app_calls = list(extract_app_calls(items, 1012, max_workers=max_workers, batch_size=1))
+
+    # the payment of a purchase is only resolved from blocks, the indexer only returns the transactions of the app
+    purchase_args = app_calls[0].args
+    assert isinstance(purchase_args, PurchaseArgs)
+    assert isinstance(purchase_args.payment, algosdk.transaction.PaymentTxn)
+    assert purchase_args.payment.sender == buyer
+    assert purchase_args.payment.receiver == algosdk.logic.get_application_address(1012)
+    assert purchase_args.payment.amt == 5_000_000
+    block_calls = expected([None] * 5, purchase_args)
+    indexer_calls = expected(indexer_tx_ids, None)
+    assert app_calls == [*block_calls, *indexer_calls, *indexer_calls, indexer_calls[1]] * 2
+
+
+def test_extract_app_calls_of_apps_without_events() -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import (
+        HelloArgs,
+        OptInArgs,
+        StructsAppCall,
+        extract_app_calls,
+    )
+
+    # a page of indexer transactions of app 1044: a call of hello("world") and an opt-in by a call of opt_in()
+    page = (FIXTURES / "structs_indexer_transactions.json").read_text()
+    hello, opt_in = json.loads(page)["transactions"]
+    sender = hello["sender"]
+
+    app_calls = list(extract_app_calls([page], 1044))
+
+    assert app_calls == [
+        StructsAppCall(
+            confirmed_round=7301,
+            tx_id=hello["id"],
+            sender=sender,
+            method="hello(string)string",
+            app_args=[bytes.fromhex("02bece11"), b"\x00\x05world"],
+            args=HelloArgs(name="world"),
+        ),
+        StructsAppCall(
+            confirmed_round=7301,
+            tx_id=opt_in["id"],
+            sender=sender,
+            method="opt_in()void",
+            app_args=[bytes.fromhex("30c6d58a")],
+            args=OptInArgs(),
+        ),
+    ]
+    assert not hasattr(app_calls[0], "events")
+
+
+# reference args are encoded as the index of the account, asset or app in the foreign arrays of the transaction
+_REFERENCE_ACCOUNT = algosdk.logic.get_application_address(1)
+_REFERENCES = {"account": (1, _REFERENCE_ACCOUNT), "asset": (0, 5), "application": (1, 9)}
+
+
+def _app_call_transaction() -> algosdk.transaction.ApplicationCallTxn:
+    sp = algosdk.transaction.SuggestedParams(fee=0, first=1, last=2, gh=base64.b64encode(bytes(32)).decode())  # type: ignore[no-untyped-call]
+    return algosdk.transaction.ApplicationCallTxn(  # type: ignore[no-untyped-call]
+        ZERO_ADDRESS, sp, 3, 0, accounts=[_REFERENCE_ACCOUNT], foreign_assets=[5], foreign_apps=[9]
+    )
+
+
+def _encode_app_args(
+    method: algosdk.abi.Method, rng: random.Random
+) -> tuple[list[bytes], list[object], list[types.SimpleNamespace]]:
+    """Encode random args of a method as the app args of a call, along with the expected args and the transaction
+    args preceding the call in its group"""
+    app_args = [method.get_selector()]
+    packed: list[tuple[algosdk.abi.ABIType, object]] = []
+    expected: list[object] = []
+    transaction_args = []
+    for index, arg in enumerate(method.args):
+        if algosdk.abi.is_abi_transaction_type(arg.type):
+            transaction_args.append(types.SimpleNamespace(position=index))
+            expected.append(transaction_args[-1])
+            continue
+        if algosdk.abi.is_abi_reference_type(arg.type):
+            reference_index, value = _REFERENCES[str(arg.type)]
+            abi_type, abi_value = algosdk.abi.ABIType.from_string("uint8"), reference_index
+        else:
+            abi_type = typing.cast(algosdk.abi.ABIType, arg.type)
+            abi_value = value = random_abi_value(abi_type, rng)
+        expected.append(value)
+        if len(app_args) < 15:
+            app_args.append(abi_type.encode(abi_value))
+        else:
+            packed.append((abi_type, abi_value))
+    if packed:
+        tuple_type = algosdk.abi.TupleType([abi_type for abi_type, _ in packed])
+        app_args.append(tuple_type.encode([abi_value for _, abi_value in packed]))
+    return app_args, expected, transaction_args
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_decode_app_call_decodes_args_by_selector(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    if not hasattr(module, "decode_app_call"):
+        pytest.skip("app has no ABI methods")
+    rng = random.Random(module_name)
+    args_to_abi = {args_class: to_abi for to_abi, args_class in get_args_converters(module)}
+    transaction = _app_call_transaction()
+    for method in GeneratorContext(module.APP_SPEC).methods.all_abi_methods:
+        assert method.abi
+        app_args, expected, transaction_args = _encode_app_args(method.abi.method, rng)
+
+        args = module.decode_app_call(app_args, transaction=transaction, group=transaction_args)
+
+        assert args.abi_method_signature == method.abi.method.get_signature()
+        if method.abi.args:
+            assert bytes_to_lists(args_to_abi[type(args)](args)) == bytes_to_lists(expected)
+        else:
+            # calls of methods without args are decoded into an empty args dataclass
+            assert not dataclasses.fields(args)
+    assert module.decode_app_call([]) is None
+    assert module.decode_app_call([bytes(4)]) is None
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_decode_app_call_rejects_malformed_app_args(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    if not hasattr(module, "decode_app_call"):
+        pytest.skip("app has no ABI methods")
+    rng = random.Random(module_name)
+    transaction = _app_call_transaction()
+    for method in GeneratorContext(module.APP_SPEC).methods.all_abi_methods:
+        assert method.abi
+        app_args, _, transaction_args = _encode_app_args(method.abi.method, rng)
+        # an extra or missing app arg, or an app arg with a byte too few or too many
+        malformed = [[*app_args, b"\x00"]]
+        for index in range(1, len(app_args)):
+            malformed.append(app_args[:index] + app_args[index + 1 :])
+            malformed.append([*app_args[:index], app_args[index][:-1], *app_args[index + 1 :]])
+            malformed.append([*app_args[:index], app_args[index] + b"\x00", *app_args[index + 1 :]])
+        for malformed_app_args in malformed:
+            with pytest.raises(algosdk.error.ABIEncodingError):
+                module.decode_app_call(malformed_app_args, transaction=transaction, group=transaction_args)
+
+
+def test_decode_app_call_rejects_strings_that_are_not_utf8() -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import decode_app_call
+
+    selector = algosdk.abi.Method.from_signature("hello(string)string").get_selector()
+
+    with pytest.raises(algosdk.error.ABIEncodingError):
+        decode_app_call([selector, b"\x00\x02\xff\xfe"])
+    # the length prefix says the name has 9 bytes
+    with pytest.raises(algosdk.error.ABIEncodingError):
+        decode_app_call([selector, b"\x00\x09abc"])
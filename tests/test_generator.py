@@ -1,11 +1,18 @@
 import pathlib
+import subprocess
+import sys
 from itertools import chain, product
 
 import pytest
 
-from algokit_client_generator import generate_client
+from algokit_client_generator import generate_client, writer
 from algokit_client_generator.utils import to_pascal_case, to_snake_case
-from scripts._helpers import enable_mypy
+from scripts._helpers import APPROVED_GENERATOR_VERSION, enable_mypy
+
+
+@pytest.fixture(autouse=True)
+def _approved_generator_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(writer, "GENERATOR_VERSION", APPROVED_GENERATOR_VERSION)
 
 
 @pytest.mark.parametrize(
@@ -44,3 +51,83 @@ def test_generate_clients(app: str, extension: str) -> None:
     generate_client(app_spec, generated_path)
     enable_mypy(generated_path)
     assert generated_path.read_text() == approved_path.read_text()
+
+
+@pytest.mark.parametrize(("app", "extension"), [("life_cycle", "arc32"), ("structs", "arc56")])
+def test_generate_client_packages(app: str, extension: str, tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    app_path = artifacts / app
+    app_spec = app_path / f"{to_pascal_case(app)}.{extension}.json"
+    generated_path = tmp_path / "client_generated"
+    approved_path = app_path / f"{to_snake_case(app)}_{extension}_client_package"
+    generate_client(app_spec, generated_path, package=True)
+    for module_path in generated_path.glob("*.py"):
+        enable_mypy(module_path)
+    assert sorted(p.name for p in generated_path.glob("*.py")) == sorted(p.name for p in approved_path.glob("*.py"))
+    for module_path in generated_path.glob("*.py"):
+        assert module_path.read_text() == (approved_path / module_path.name).read_text()
+
+
+@pytest.mark.parametrize(("app", "extension"), [("hello_world", "arc32"), ("state", "arc56")])
+def test_generate_async_clients(app: str, extension: str) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    app_path = artifacts / app
+    app_spec = app_path / f"{to_pascal_case(app)}.{extension}.json"
+    generated_path = app_path / f"client_generated_{extension}_async.py"
+    approved_path = app_path / f"{to_snake_case(app)}_{extension}_async_client.py"
+    generate_client(app_spec, generated_path, async_client=True)
+    enable_mypy(generated_path)
+    assert generated_path.read_text() == approved_path.read_text()
+
+
+def test_client_package_lazily_imports_modules(tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    generate_client(artifacts / "structs" / "Structs.arc56.json", tmp_path / "structs_client", package=True)
+    probe = """
+import sys
+import algokit_utils
+import algosdk
+import structs_client
+
+def loaded():
+    return {m.removeprefix("structs_client.") for m in sys.modules if m.startswith("structs_client.")}
+
+client = structs_client.StructsClient(
+    algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=algosdk.constants.ZERO_ADDRESS
+)
+client.params.give_me_root_struct()
+assert not loaded() & {"state", "factory", "composer"}, loaded()
+client.state
+client.new_group()
+structs_client.StructsFactory
+assert {"state", "factory", "composer"} <= loaded(), loaded()
+"""
+    subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, check=True)
+
+
+def test_client_package_lazily_imports_async_client(tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    generate_client(
+        artifacts / "structs" / "Structs.arc56.json", tmp_path / "structs_client", package=True, async_client=True
+    )
+    probe = """
+import asyncio
+import sys
+import algokit_utils
+import algosdk
+import structs_client
+
+client = structs_client.StructsClient(
+    algorand=algokit_utils.AlgorandClient.default_localnet(), app_id=1, default_sender=algosdk.constants.ZERO_ADDRESS
+)
+assert "structs_client.async_client" not in sys.modules
+async_client = structs_client.StructsAsyncClient(client, max_workers=2)
+assert "structs_client.async_client" in sys.modules
+
+async def main():
+    async with async_client:
+        return await async_client.run(lambda: client.app_id)
+
+assert asyncio.run(main()) == 1
+"""
+    subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, check=True)
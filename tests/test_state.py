@@ -0,0 +1,153 @@
+import base64
+import dataclasses
+import types
+
+import algokit_utils
+import algosdk
+import pytest
+
+from helpers import FakeAppClient
+
+
+def test_state_get_all_constructs_struct_values_by_key(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.structs import structs_arc56_client
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import NestedStruct, RootStruct, Vector
+
+    state = {
+        "my_struct": {"x": "1", "y": "2"},
+        "my_nested_struct": {"nested": {"content": {"x": "3", "y": "4"}}},
+        "unknown": {"x": "5"},
+    }
+    app_client = fake_app_client({"state.global_state.get_all": lambda: state})
+
+    global_state = vars(structs_arc56_client)["_GlobalState"](app_client)
+
+    assert global_state.get_all() == {
+        "my_struct": Vector(x="1", y="2"),
+        "my_nested_struct": RootStruct(nested=NestedStruct(content=Vector(x="3", y="4"))),
+        "unknown": {"x": "5"},
+    }
+
+
+def test_global_state_snapshot_reads_state_once(fake_app_client: FakeAppClient) -> None:
+    from examples.smart_contracts.artifacts.structs import structs_arc56_client
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import GlobalStateSnapshot, Vector
+
+    encoded_struct = algosdk.abi.ABIType.from_string("(string,string)").encode(["1", "2"])
+    requests: list[str] = []
+
+    def application_info(app_id: int) -> dict:
+        requests.append(f"application_info {app_id}")
+        key_values = [
+            {
+                "key": base64.b64encode(b"my_struct").decode(),
+                "value": {"type": 1, "bytes": base64.b64encode(encoded_struct).decode(), "uint": 0},
+            }
+        ]
+        return {"params": {"global-state": key_values}}
+
+    def status() -> dict:
+        requests.append("status")
+        return {"last-round": 42}
+
+    app_client = fake_app_client(
+        {
+            "app_id": 1,
+            "algorand.client.algod.application_info": application_info,
+            "algorand.client.algod.status": status,
+        }
+    )
+
+    snapshot = vars(structs_arc56_client)["_GlobalState"](app_client).snapshot()
+
+    assert snapshot == GlobalStateSnapshot(
+        round=42,
+        my_struct=Vector(x="1", y="2"),
+        my_nested_struct=None,  # type: ignore[arg-type]
+        struct_with_name_variations=None,  # type: ignore[arg-type]
+    )
+    # the round is read before the state, so the state is at least as recent as the round of the snapshot
+    assert requests == ["status", "application_info 1"]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.round = 43
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_map_get_values_reads_keys_concurrently_in_order(max_workers: int) -> None:
+    from examples.smart_contracts.artifacts.arc56_test import arc56_test_arc56_client
+    from examples.smart_contracts.artifacts.arc56_test.arc56_test_arc56_client import (
+        Inputs,
+        InputsAdd,
+        InputsSubtract,
+        Outputs,
+    )
+
+    boxes = {((1, 2), (3, 4)): {"sum": 3, "difference": 1}, ((5, 6), (7, 8)): {"sum": 11, "difference": 2}}
+
+    def get_map_value(map_name: str, key: tuple) -> dict:
+        assert map_name == "boxMap"
+        if key not in boxes:
+            raise algosdk.error.AlgodHTTPError("box not found", code=404)  # type: ignore[no-untyped-call]
+        return boxes[key]
+
+    box_map = vars(arc56_test_arc56_client)["_MapState"](
+        types.SimpleNamespace(get_map_value=get_map_value),
+        "boxMap",
+        vars(arc56_test_arc56_client)["_outputs_from_dict"],
+        key_to_abi=vars(arc56_test_arc56_client)["_inputs_to_tuple"],
+    )
+
+    keys = [
+        Inputs(add=InputsAdd(a=1, b=2), subtract=InputsSubtract(a=3, b=4)),
+        ((9, 9), (9, 9)),
+        Inputs(add=InputsAdd(a=5, b=6), subtract=InputsSubtract(a=7, b=8)),
+    ]
+
+    values = box_map.get_values(keys, max_workers=max_workers)
+
+    assert values == [Outputs(sum=3, difference=1), None, Outputs(sum=11, difference=2)]
+
+
+def test_map_get_values_raises_other_errors() -> None:
+    from examples.smart_contracts.artifacts.arc56_test import arc56_test_arc56_client
+
+    def get_map_value(map_name: str, key: bytes) -> bytes:
+        raise algosdk.error.AlgodHTTPError("unavailable", code=503)  # type: ignore[no-untyped-call]
+
+    box_map = vars(arc56_test_arc56_client)["_MapState"](types.SimpleNamespace(get_map_value=get_map_value), "boxMap")
+
+    with pytest.raises(algosdk.error.AlgodHTTPError):
+        box_map.get_values([b"a", b"b"])
+
+
+@pytest.mark.parametrize(("prefetch", "batch_size"), [(0, 1), (2, 2), (8, 16)])
+def test_box_map_iter_items_reads_values_lazily(prefetch: int, batch_size: int) -> None:
+    from examples.smart_contracts.artifacts.structs.structs_arc56_client import StructsClient, Vector
+
+    uint64 = algosdk.abi.ABIType.from_string("uint64")
+    vector = algosdk.abi.ABIType.from_string("(string,string)")
+    boxes = {b"my_boxmap_struct" + uint64.encode(i): vector.encode([str(i), str(-i)]) for i in range(5)}
+    # boxes of other maps and a box deleted after the names were listed are skipped
+    names = [b"other" + uint64.encode(1), *boxes, b"my_boxmap_struct" + uint64.encode(9)]
+    reads: list[bytes] = []
+
+    def application_boxes(app_id: int) -> dict:
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in names]}
+
+    def application_box_by_name(app_id: int, name: bytes) -> dict:
+        reads.append(name)
+        if name not in boxes:
+            raise algosdk.error.AlgodHTTPError("box not found", code=404)  # type: ignore[no-untyped-call]
+        return {"name": base64.b64encode(name).decode(), "value": base64.b64encode(boxes[name]).decode()}
+
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    algorand.client.algod.application_boxes = application_boxes  # type: ignore[method-assign, assignment]
+    algorand.client.algod.application_box_by_name = application_box_by_name  # type: ignore[method-assign, assignment]
+    client = StructsClient(algorand=algorand, app_id=1)
+
+    items = client.state.box.my_boxmap_struct.iter_items(prefetch=prefetch, batch_size=batch_size)
+    first = next(items)
+
+    assert first == (0, Vector(x="0", y="0"))
+    assert len(reads) <= (prefetch + 1) * batch_size
+    assert [first, *items] == [(i, Vector(x=str(i), y=str(-i))) for i in range(5)]
@@ -0,0 +1,94 @@
+import importlib
+import importlib.util
+import pathlib
+import random
+import sys
+import types
+
+import algosdk
+import pytest
+
+from algokit_client_generator import generate_client
+from algokit_client_generator.utils import to_snake_case
+from helpers import CLIENT_MODULES, bytes_to_lists, get_struct_codecs, random_abi_value
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+
+def _assert_codecs_match_generic_abi_encoding(module: types.ModuleType) -> None:
+    rng = random.Random(module.__name__)
+    for struct_class, abi_type in get_struct_codecs(module):
+        name = to_snake_case(struct_class.__name__)
+        to_bytes, from_bytes = vars(module)[f"_{name}_to_bytes"], vars(module)[f"_{name}_from_bytes"]
+        to_tuple, from_tuple = vars(module)[f"_{name}_to_tuple"], vars(module)[f"_{name}_from_tuple"]
+        for _ in range(50):
+            encoded = abi_type.encode(random_abi_value(abi_type, rng))
+            value = from_bytes(encoded)
+            assert isinstance(value, struct_class)
+            assert bytes_to_lists(to_tuple(value)) == bytes_to_lists(abi_type.decode(encoded))
+            assert to_bytes(value) == encoded
+            assert to_bytes(from_tuple(abi_type.decode(encoded))) == encoded
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_struct_codecs_match_generic_abi_encoding(module_name: str) -> None:
+    _assert_codecs_match_generic_abi_encoding(importlib.import_module(module_name))
+
+
+@pytest.mark.parametrize("module_name", CLIENT_MODULES)
+def test_struct_codecs_reject_truncated_and_trailing_data(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+    rng = random.Random(module_name)
+    for struct_class, abi_type in get_struct_codecs(module):
+        from_bytes = vars(module)[f"_{to_snake_case(struct_class.__name__)}_from_bytes"]
+        encoded = abi_type.encode(random_abi_value(abi_type, rng))
+        for malformed in (encoded[:-1], encoded + b"\x00", b""):
+            with pytest.raises(algosdk.error.ABIEncodingError):
+                from_bytes(malformed)
+
+
+def test_struct_codecs_check_length_prefixes() -> None:
+    from examples.smart_contracts.artifacts.nfd.nfd_arc56_client import (
+        NfdSaleCancelledEvent,
+        _nfd_sale_cancelled_event_from_bytes,
+    )
+
+    encoded = algosdk.abi.ABIType.from_string("(uint64,string)").encode([1, "abcdef"])
+
+    assert _nfd_sale_cancelled_event_from_bytes(encoded) == NfdSaleCancelledEvent(appId=1, name="abcdef")
+    for malformed in (
+        b"\x00",
+        # the name is prefixed with a length of 1 rather than 6
+        encoded[:10] + b"\x00\x01" + encoded[12:],
+        # the offset of the name points into the head
+        encoded[:8] + b"\x00\x08" + encoded[10:],
+    ):
+        with pytest.raises(algosdk.error.ABIEncodingError):
+            _nfd_sale_cancelled_event_from_bytes(malformed)
+
+
+def test_struct_codecs_pack_consecutive_bools(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client_path = tmp_path / "packed_bools_client.py"
+    generate_client(FIXTURES / "PackedBools.arc56.json", client_path)
+    spec = importlib.util.spec_from_file_location("packed_bools_client", client_path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+
+    # the 9th of the leading bools spills into a second byte, and each bool after another field starts a new byte
+    flags = module.Flags(
+        **{f"flag_{i}": i == 8 for i in range(9)},
+        level=7,
+        enabled=True,
+        label="label",
+        archived=False,
+        hidden=True,
+        data=b"\x01",
+    )
+    encoded = module._flags_to_bytes(flags)  # noqa: SLF001
+    assert encoded[:4] == b"\x00\x80\x07\x80"
+    assert encoded[6] == 0x40
+    assert module._flags_from_bytes(encoded) == flags  # noqa: SLF001
+    _assert_codecs_match_generic_abi_encoding(module)